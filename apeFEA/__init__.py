@@ -12,15 +12,18 @@ Public API shortcut imports for convenience:
 from .core.node import Node
 from .core.nodal_load import NodalLoad
 from .core.restraints import Restraints
+from .core.damping import RayleighDamping
 from .core.model import Model
 
 # Material imports
 from .materials.linear_elastic import LinearElastic
 from .materials.elasto_plastic import EPP
 from .materials.concrete01 import Concrete01
+from .materials.batch import LinearElasticBatch, EPPBatch, Concrete01Batch
 
 # Section imports
 from .sections.section import Section
+from .sections.fiber_section import FiberSection
 
 # Transformation imports
 from .elements.one_dimension.transformations.linear_transformation import LinearTransformation
@@ -30,15 +33,34 @@ from .elements.one_dimension.transformations.pdelta_transformation_op import PDe
 
 # Frame elements import
 from .elements.one_dimension.frame_element import FrameElement
+from .elements.one_dimension.force_based_frame_element import ForceBasedFrameElement
+from .elements.one_dimension.frame_element_block import FrameElementBlock
 
 # TimeSeries models
-from .timeseries import ConstantTimeSeries, LinearRampTimeSeries
+from .timeseries import ConstantTimeSeries, LinearRampTimeSeries, PathTimeSeries
 
 # Solver imports
 from .solver.newton_raphson import NewtonRaphsonSolver
+from .solver.quasi_newton import BFGSSolver, BroydenSolver, KrylovNewtonSolver
+from .solver.line_search import BisectionLineSearch, SecantLineSearch, RegulaFalsiLineSearch
+from .solver.linear_solver import DenseLinearSolver, SparseDirectSolver, IterativeLinearSolver, AutoLinearSolver
 
 # Integrator imports
 from .integrator.load_control import LoadControl
+from .integrator.displacement_control import DisplacementControl
+from .integrator.arc_length import ArcLength
+from .integrator.transient import TransientIntegrator, Newmark, HHT, GeneralizedAlpha
+from .integrator.central_difference import CentralDifference
+from .integrator.modal_superposition import ModalSuperposition
+
+# Analyses
+from .analysis import ModalAnalysis
+
+# Recorders
+from .recorder import NodeRecorder, ElementForceRecorder, ConvergenceRecorder, read_recorder
+
+# DOF numberers
+from .numberer import PlainNumberer, RCMNumberer, MinimumDegreeNumberer
 
 # Meshing utilities
 from .mesh.mesh import MeshBuilder
@@ -49,17 +71,51 @@ __all__ = [
     "Restraints",
     "ConstantTimeSeries",
     "LinearRampTimeSeries",
+    "PathTimeSeries",
     "LinearElastic",
     "EPP",
     "Concrete01",
+    "LinearElasticBatch",
+    "EPPBatch",
+    "Concrete01Batch",
     "Section",
+    "FiberSection",
     "LinearTransformation",
     "CorotationalTransformation2D",
     "PDeltaTransformation2D",
     "PDeltaTransformation2D_OP",
     "FrameElement",
+    "ForceBasedFrameElement",
+    "FrameElementBlock",
     "Model",
+    "RayleighDamping",
     "NewtonRaphsonSolver",
+    "BFGSSolver",
+    "BroydenSolver",
+    "KrylovNewtonSolver",
+    "BisectionLineSearch",
+    "SecantLineSearch",
+    "RegulaFalsiLineSearch",
+    "DenseLinearSolver",
+    "SparseDirectSolver",
+    "IterativeLinearSolver",
+    "AutoLinearSolver",
     "LoadControl",
-    "MeshBuilder"
+    "DisplacementControl",
+    "ArcLength",
+    "TransientIntegrator",
+    "Newmark",
+    "HHT",
+    "GeneralizedAlpha",
+    "CentralDifference",
+    "ModalSuperposition",
+    "ModalAnalysis",
+    "NodeRecorder",
+    "ElementForceRecorder",
+    "ConvergenceRecorder",
+    "read_recorder",
+    "MeshBuilder",
+    "PlainNumberer",
+    "RCMNumberer",
+    "MinimumDegreeNumberer"
 ]
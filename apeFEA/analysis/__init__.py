@@ -0,0 +1,5 @@
+from .modal_analysis import ModalAnalysis
+
+__all__ = [
+    "ModalAnalysis"
+]
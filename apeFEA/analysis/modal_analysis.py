@@ -0,0 +1,248 @@
+import numpy as np
+import matplotlib.pyplot as plt
+import scipy.linalg
+from numpy import ndarray
+from scipy import sparse
+from scipy.sparse.linalg import eigsh, LinearOperator
+
+from apeFEA.core.model import Model
+from apeFEA.core.node import Node
+from apeFEA.solver.factorization import Factorization
+
+
+class ModalAnalysis:
+    """
+    Undamped free vibration modes of a model about its committed state,
+
+        K_ff φ = ω² M_ff φ
+
+    over the free DOFs, with K the tangent stiffness at the committed state (so
+    geometric stiffness of a loaded model is included) and M the element and nodal
+    masses (`Model.get_mass_matrix`).
+
+    The lowest `n_modes` modes are computed with
+
+    - 'sparse': `scipy.sparse.linalg.eigsh` in shift-invert mode about `sigma`,
+      with (K_ff - σ M_ff) factored once by SuperLU (`Factorization`). Only the
+      sparse factors and a few Lanczos vectors are stored, so the cost grows
+      roughly linearly with the number of DOFs of a frame (use a model with
+      `assembly='sparse'` for large models).
+    - 'dense': `scipy.linalg.eigh` on the dense matrices, for small models. DOFs
+      without mass (e.g. rotations with lumped mass) are statically condensed
+      first, since eigh needs a positive definite mass.
+    - 'auto': dense up to `dense_max` free DOFs, sparse beyond.
+
+    Shapes are normalized to unit generalized mass (φᵀ M φ = 1) with their largest
+    component positive, and mapped back to the nodes. For the translational global
+    directions d the participation factors, effective modal masses and their ratios
+    to the total (free DOF) mass are
+
+        Γ_d = φᵀ M r_d,    M*_d = Γ_d²,    M*_d / (r_dᵀ M r_d)
+
+    with r_d the unit rigid-body translation in direction d.
+
+    Parameters
+    ----------
+    model : Model
+        Model to analyse.
+    n_modes : int
+        Number of modes.
+    method : str
+        'auto', 'sparse' or 'dense'.
+    sigma : float
+        Shift (in ω²) of the sparse solver, the modes closest to it are found.
+        Must not be an eigenvalue; use a small negative value for a model with
+        rigid-body modes.
+    dense_max : int
+        Largest number of free DOFs solved densely by 'auto'.
+    tol : float
+        Relative accuracy of the sparse eigenvalues (0: machine precision).
+
+    Attributes
+    ----------
+    eigenvalues : ndarray
+        (n_modes,) ω², ascending.
+    omega, frequencies, periods : ndarray
+        (n_modes,) circular frequencies, frequencies and periods.
+    shapes : ndarray
+        (system_ndof, n_modes) mass-normalized mode shapes (zero on restrained DOFs).
+    node_shapes : ndarray
+        (n_modes, number_of_nodes, ndof) shapes by node, in the order of `model.nodes`.
+    participation_factors, effective_masses, effective_mass_ratios : ndarray
+        (n_modes, ndof - 1) values per mode and translational direction.
+    total_mass : ndarray
+        (ndof - 1,) translational mass of the free DOFs per direction.
+    method_used : str
+        'sparse' or 'dense'.
+    """
+
+    METHODS = ('auto', 'sparse', 'dense')
+
+    def __init__(
+        self,
+        model: Model,
+        n_modes: int = 10,
+        method: str = 'auto',
+        sigma: float = 0.0,
+        dense_max: int = 500,
+        tol: float = 0.0,
+    ):
+        if method not in self.METHODS:
+            raise ValueError(f"Unsupported eigen solver method: {method}")
+        if n_modes < 1:
+            raise ValueError("The number of modes must be positive")
+
+        self.model = model
+        self.n_modes = n_modes
+        self.method = method
+        self.sigma = sigma
+        self.dense_max = dense_max
+        self.tol = tol
+
+        self.method_used: str | None = None
+        self.eigenvalues: ndarray | None = None
+        self.shapes: ndarray | None = None
+
+    # ---------------------------------------------------
+    # Eigen solvers
+    def _system(self) -> tuple:
+        """Free-free stiffness at the committed state and mass, sparse CSR or dense."""
+        model = self.model
+        free = model.free_indices
+        model.reset_trial()
+        K = model.get_stiffness_matrix()
+        M = model.get_mass_matrix()
+        if sparse.issparse(K):
+            K, M = K.tocsr(), M.tocsr()
+            return K[free][:, free], M[free][:, free]
+        return K[np.ix_(free, free)], M[np.ix_(free, free)]
+
+    def _solve_sparse(self, K_ff, M_ff) -> tuple[ndarray, ndarray]:
+        K_ff, M_ff = sparse.csc_matrix(K_ff), sparse.csc_matrix(M_ff)
+        shifted = Factorization((K_ff - self.sigma * M_ff).tocsc())
+        OPinv = LinearOperator(K_ff.shape, matvec=shifted.solve, dtype=float)
+        return eigsh(K_ff, k=self.n_modes, M=M_ff, sigma=self.sigma, which='LM', OPinv=OPinv, tol=self.tol)
+
+    def _solve_dense(self, K_ff, M_ff) -> tuple[ndarray, ndarray]:
+        K_ff = K_ff.toarray() if sparse.issparse(K_ff) else K_ff
+        M_ff = M_ff.toarray() if sparse.issparse(M_ff) else M_ff
+
+        # Static condensation of the DOFs without mass: K_rr φ_r = -K_rm φ_m
+        massless = ~np.any(M_ff, axis=1)
+        m, r = np.flatnonzero(~massless), np.flatnonzero(massless)
+        if len(r):
+            K_rm = K_ff[np.ix_(r, m)]
+            condensation = -scipy.linalg.solve(K_ff[np.ix_(r, r)], K_rm, assume_a='sym')
+            K_c = K_ff[np.ix_(m, m)] + K_rm.T @ condensation
+        else:
+            K_c = K_ff
+        eigenvalues, phi_m = scipy.linalg.eigh(K_c, M_ff[np.ix_(m, m)], subset_by_index=[0, self.n_modes - 1])
+
+        phi = np.zeros((len(K_ff), self.n_modes))
+        phi[m] = phi_m
+        if len(r):
+            phi[r] = condensation @ phi_m
+        return eigenvalues, phi
+
+    # ---------------------------------------------------
+    # Analysis
+    def run(self) -> None:
+        """Compute the modes and their participation."""
+        model = self.model
+        K_ff, M_ff = self._system()
+        n_free = K_ff.shape[0]
+
+        n_massive = np.count_nonzero(abs(M_ff).sum(axis=1))
+        if self.n_modes > n_massive:
+            raise ValueError(f"{self.n_modes} modes requested, the model has {n_massive} free DOFs with mass")
+
+        # ARPACK needs fewer modes than DOFs
+        method = self.method
+        if method == 'auto':
+            method = 'dense' if n_free <= self.dense_max or self.n_modes >= n_free - 1 else 'sparse'
+        elif method == 'sparse' and self.n_modes >= n_free - 1:
+            raise ValueError(f"The sparse eigen solver needs fewer modes than {n_free - 1}, use method='dense'")
+        eigenvalues, phi = self._solve_sparse(K_ff, M_ff) if method == 'sparse' else self._solve_dense(K_ff, M_ff)
+        self.method_used = method
+
+        order = np.argsort(eigenvalues)
+        eigenvalues, phi = eigenvalues[order], phi[:, order]
+
+        # Unit generalized mass, largest component positive
+        phi /= np.sqrt(np.einsum('ij,ij->j', phi, M_ff @ phi))
+        largest = np.argmax(np.abs(phi), axis=0)
+        phi *= np.sign(phi[largest, np.arange(phi.shape[1])])
+
+        self.eigenvalues = eigenvalues
+        self.omega = np.sqrt(np.maximum(eigenvalues, 0.0))
+        self.frequencies = self.omega / (2 * np.pi)
+        with np.errstate(divide='ignore'):
+            self.periods = np.where(self.omega > 0.0, 2 * np.pi / self.omega, np.inf)
+
+        self.shapes = np.zeros((model.system_ndof, self.n_modes))
+        self.shapes[model.free_indices] = phi
+        idx = np.array([node.idx for node in model.nodes])
+        self.node_shapes = self.shapes[idx].transpose(2, 0, 1)
+
+        # Participation in the translational directions
+        r = np.zeros((model.system_ndof, model.ndof - 1))
+        for d in range(model.ndof - 1):
+            r[idx[:, d], d] = 1.0
+        r_f = r[model.free_indices]
+        M_r = M_ff @ r_f
+        self.total_mass = np.einsum('id,id->d', r_f, M_r)
+        self.participation_factors = phi.T @ M_r
+        self.effective_masses = self.participation_factors**2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.effective_mass_ratios = np.where(self.total_mass > 0.0, self.effective_masses / self.total_mass, 0.0)
+
+    # ---------------------------------------------------
+    # Results
+    def get_mode_shape(self, mode: int, node: Node) -> ndarray:
+        """Return the (ndof,) shape of mode `mode` (0 for the first) at `node`."""
+        return self.shapes[node.idx, mode]
+
+    def print_summary(self) -> None:
+        """Print periods, frequencies and effective modal mass ratios of the modes."""
+        directions = ['x', 'y', 'z'][:self.model.ndof - 1]
+        print('=================================================')
+        print(f"Modal Analysis ({self.method_used}): {self.n_modes} modes")
+        header = "".join(f"{'M*' + d + '/M':>10}" for d in directions) + "".join(f"{'Σ' + d:>8}" for d in directions)
+        print(f"{'Mode':>4} {'Period':>12} {'Frequency':>12}{header}")
+        cumulative = np.cumsum(self.effective_mass_ratios, axis=0)
+        for k in range(self.n_modes):
+            ratios = "".join(f"{v:>10.4f}" for v in self.effective_mass_ratios[k])
+            sums = "".join(f"{v:>8.3f}" for v in cumulative[k])
+            print(f"{k + 1:>4} {self.periods[k]:>12.5g} {self.frequencies[k]:>12.5g}{ratios}{sums}")
+        print('==================================================')
+
+    def plot_mode(self, mode: int, scale: float | None = None, ax: plt.Axes | None = None) -> tuple:
+        """
+        Plot the undeformed model and the shape of mode `mode` (0 for the first),
+        drawn as straight element chords. `scale` defaults to 10 % of the model
+        size for the largest translation.
+        """
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(6, 6))
+        else:
+            fig = ax.figure
+
+        coords = np.array([node.coords for node in self.model.nodes], dtype=float)
+        translations = self.node_shapes[mode][:, :coords.shape[1]]
+        if scale is None:
+            size = np.ptp(coords, axis=0).max()
+            scale = 0.1 * size / max(np.abs(translations).max(), 1e-300)
+        position = {id(node): k for k, node in enumerate(self.model.nodes)}
+
+        for element in self.model.elements:
+            ends = [position[id(node)] for node in element.nodes]
+            ax.plot(*coords[ends].T, color='lightgray', linewidth=1.0)
+            ax.plot(*(coords[ends] + scale * translations[ends]).T, color='tab:blue', linewidth=2.0)
+
+        ax.set_title(f"Mode {mode + 1}: T = {self.periods[mode]:.4g}")
+        ax.set_aspect('equal')
+        ax.grid(True)
+        plt.tight_layout()
+        plt.show()
+
+        return fig, ax
@@ -2,10 +2,13 @@
 from .node import Node
 from .nodal_load import NodalLoad
 from .restraints import Restraints
+from .damping import RayleighDamping
 from .model import Model
 
 __all__ = [
     "Node",
     "NodalLoad",
-    "Restraints"
+    "Restraints",
+    "RayleighDamping",
+    "Model"
 ]
\ No newline at end of file
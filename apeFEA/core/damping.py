@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class RayleighDamping:
+    """
+    Rayleigh (proportional) viscous damping
+
+        C = alpha_m M + beta_k K_t + beta_k_init K_0
+
+    with M the mass matrix, K_t the current tangent stiffness and K_0 the tangent
+    at the start of the transient analysis.
+
+    Parameters
+    ----------
+    alpha_m : float
+        Mass proportional coefficient.
+    beta_k : float
+        Current tangent stiffness proportional coefficient.
+    beta_k_init : float
+        Initial stiffness proportional coefficient.
+    """
+    alpha_m: float = 0.0
+    beta_k: float = 0.0
+    beta_k_init: float = 0.0
+
+    @classmethod
+    def from_frequencies(cls, zeta: float, omega_i: float, omega_j: float, initial_stiffness: bool = False) -> "RayleighDamping":
+        """
+        Coefficients giving the damping ratio `zeta` at the circular frequencies
+        omega_i and omega_j (rad/s), proportional to the initial stiffness if
+        `initial_stiffness` else to the current tangent.
+        """
+        alpha_m = 2 * zeta * omega_i * omega_j / (omega_i + omega_j)
+        beta = 2 * zeta / (omega_i + omega_j)
+        if initial_stiffness:
+            return cls(alpha_m=alpha_m, beta_k_init=beta)
+        return cls(alpha_m=alpha_m, beta_k=beta)
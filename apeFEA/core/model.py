@@ -1,8 +1,12 @@
 import numpy as np
 from numpy import ndarray
+from scipy import sparse
 
 from apeFEA.core.node import Node
+from apeFEA.core.damping import RayleighDamping
 from apeFEA.elements.one_dimension.frame_element import FrameElement
+from apeFEA.elements.one_dimension.frame_element_block import build_element_blocks
+from apeFEA.numberer.dof_numberer import DOFNumberer, make_numberer
 from apeFEA.timeseries.timeseries_abstraction import TimeSeries
 from apeFEA.timeseries.timeseries import LinearRampTimeSeries
 
@@ -16,43 +20,94 @@ class Model:
     time series. It also maintains trial, committed, and reset states across 
     nonlinear iterations.
 
+    The node states become views into the model's global state vectors and the
+    nodes are renumbered, so a node can belong to a single model: building a
+    second `Model` from elements sharing nodes with an existing one raises a
+    `ValueError` (it would silently rebind and renumber them under the first model).
+
     Attributes:
         elements (list[FrameElement]): List of frame elements in the model.
-        timeseries (TimeSeries): Time-dependent scaling function for loads.
+        timeseries (TimeSeries): Time-dependent scaling function for loads (a TimeSeries
+            instance, or a class instantiated without arguments).
         ndof (int): Number of degrees of freedom per node (default: 3).
-        nodes (list[Node]): Unique list of all nodes in the model.
+        nodes (list[Node]): Unique list of all nodes in the model, in equation order.
+        numberer (DOFNumberer): Equation numberer used to assign the global DOF indices.
         number_of_nodes (int): Total number of nodes.
         number_of_elements (int): Total number of elements.
         system_ndof (int): Total number of DOFs in the global system.
         free_indices (ndarray): Indices of free DOFs.
+        u_trial (ndarray): Global trial displacement vector (system_ndof, 1). Every node's
+            `u_trial` is a view into it, so nodal reads and writes share the same memory.
+        u_committed (ndarray): Global committed displacement vector (system_ndof, 1),
+            viewed by every node's `u_committed` in the same way.
+        node_state (ndarray): Global node state (4, system_ndof, 1), rows u_trial, u_committed,
+            f_internal and f_external; every node's state is a view into it.
+        f_internal, f_external (ndarray): Views of the resisting and external force rows of
+            node_state, holding the forces of the last evaluation (reactions are their
+            difference at the restrained DOFs once a step has converged).
+        dynamic_state (ndarray): Global velocities and accelerations (4, system_ndof, 1), rows
+            v_trial, v_committed, a_trial and a_committed (set by transient integrators).
+        v_trial, v_committed, a_trial, a_committed (ndarray): Views of the rows of dynamic_state.
+        damping (RayleighDamping): Rayleigh damping used by transient integrators (None if undamped).
         restrained_indices (ndarray): Indices of restrained DOFs.
+        assembly (str): Global stiffness storage, 'dense' (ndarray) or 'sparse' (CSR).
+        vectorized (bool): If True, FrameElements are evaluated in batched element blocks.
+        element_blocks (list[FrameElementBlock]): Struct-of-arrays element blocks (vectorized mode).
+        incremental (bool): If True, only elements whose displacements changed are re-evaluated
+            and only the entries of changed tangents are summed again in a cached global stiffness.
+        assembly_history (list[dict]): Elements re-evaluated per evaluation (incremental mode).
 
     Methods:
         get_resistance_force(): Assembles global internal resisting force vector.
+        get_reference_load(): Assembles the unscaled nodal load vector.
         get_external_force(t): Computes external force vector at pseudotime t.
         calculate_residual(t): Returns residual vector R = F_ext - F_int at time t.
         residual_norm(t, norm_type): Returns norm (L2 or inf) of the residual.
+        evaluate(t, norm_type): Returns residual, tangent and residual norm in one element pass.
         update_trial_state(u): Updates nodal trial states with displacement vector u.
         commit_state(): Commits current trial state for all nodes and elements.
         reset_trial(): Resets all trial states to last committed state.
         revert_to_start(): Reverts all states to initial zero configuration.
         get_stiffness_matrix(): Assembles and returns the global tangent stiffness matrix.
-        _assemble_displacement_vector_committed(): Gathers u_committed from all nodes.
+        get_mass_matrix(): Assembles (once) the global mass matrix from element and nodal masses.
+        tangent_changed(): Whether any element tangent may differ from the last assembled one.
+        get_reevaluation_fractions(): Fractions of elements re-evaluated per evaluation (incremental mode).
+        _build_sparse_pattern(): Precomputes the CSR pattern and element scatter map.
+        _bind_node_states(): Makes the node displacements views into the global vectors.
+        _assemble_displacement_vector_committed(): Copy of the committed displacement vector.
+        _assemble_displacement_vector_trial(): Copy of the trial displacement vector.
         print_trial_committed_state(): Prints trial and committed states of all nodes.
         print_summary(): Prints a structural summary of the model setup.
     """
     def __init__(self, 
                  elements: list[FrameElement], 
-                 timeseries: TimeSeries = LinearRampTimeSeries, 
+                 timeseries: TimeSeries | type[TimeSeries] = LinearRampTimeSeries, 
                  ndof: int = 3, 
+                 assembly: str = 'dense',
+                 vectorized: bool = False,
+                 numberer: str | DOFNumberer = 'plain',
+                 incremental: bool = False,
+                 damping: RayleighDamping | None = None,
                  print_summary: bool = False):
         
+        if assembly not in ('dense', 'sparse'):
+            raise ValueError(f"Unsupported assembly type: {assembly}")
+        
         self.elements = elements
-        self.timeseries = timeseries()
+        self.timeseries = timeseries() if isinstance(timeseries, type) else timeseries
         self.ndof = ndof
+        self.assembly = assembly
+        self.vectorized = vectorized
+        self.incremental = incremental
+        self.damping = damping
         
-        # Get the list of nodes from elements
-        self.nodes = self._get_nodes_list()
+        # Get the list of nodes from elements, numbered compactly (node and element idx)
+        nodes = self._get_nodes_list()
+        bound = sorted(node.id for node in nodes if node.is_bound)
+        if bound:
+            raise ValueError(f"Nodes {bound} already belong to another Model, build a new model from new nodes")
+        self.numberer = make_numberer(numberer)
+        self.nodes = self.numberer.number(nodes, self.elements, self.ndof)
 
         # Get info for assembly
         self.number_of_nodes = len(self.nodes)
@@ -60,17 +115,63 @@ class Model:
         self.system_ndof = self.number_of_nodes * self.ndof
         self.free_indices, self.restrained_indices = self._get_mapping_indices()
         
+        # Global displacement vectors, the node displacements are views into them
+        self._bind_node_states()
+        
+        # Velocities and accelerations for transient analysis
+        self.dynamic_state = np.zeros((4, self.system_ndof, 1))
+        self.v_trial, self.v_committed, self.a_trial, self.a_committed = self.dynamic_state
+        self._mass_matrix = None
+        
+        # Batched element blocks, elements that cannot be blocked are looped one by one
+        if self.vectorized:
+            self.element_blocks, self._scalar_elements = build_element_blocks(self.elements)
+        else:
+            self.element_blocks, self._scalar_elements = [], self.elements
+        
+        # Sparsity pattern is fixed by the connectivity, build it once
+        if self.assembly == 'sparse':
+            self._build_sparse_pattern()
+        
+        # Cached element contributions for incremental (dirty-tracking) assembly
+        self.assembly_history: list[dict] = []
+        if self.incremental:
+            self._build_incremental_cache()
+        
         if print_summary:
             self.print_summary()
 
+    def _bind_node_states(self) -> None:
+        """
+        Allocate the contiguous global node state and make every node's state a
+        view into it, so that `u_trial`/`u_committed` of all nodes are the global
+        displacement vectors and state updates, commits and resets are single
+        vector operations.
+
+        The DOFs of a node are consecutive equations (see `Node.set_indices`), so
+        each node maps to a slice. Must be called after numbering.
+        """
+        self.node_state = np.zeros((4, self.system_ndof, 1))
+        self.u_trial = self.node_state[0]
+        self.u_committed = self.node_state[1]
+        self.f_internal = self.node_state[2]
+        self.f_external = self.node_state[3]
+        for node in self.nodes:
+            first = node.idx[0]
+            node.bind_state(self.node_state[:, first:first + node.ndof])
+
     def _get_nodes_list(self) -> list[Node]:
         return list({node for element in self.elements for node in element.nodes})
     
-    def _get_restrained_indices(self) -> np.ndarray:
-        nodeIndex = np.empty(self.system_ndof, dtype=str)
+    def _get_restrained_mask(self) -> np.ndarray:
+        """Boolean mask of the restrained DOFs, in equation order."""
+        mask = np.empty(self.system_ndof, dtype=bool)
         for node in self.nodes:
-            nodeIndex[node.idx] = node.restraints.restraints 
-        return nodeIndex
+            mask[node.idx] = node.restraints.restrained
+        return mask
+    
+    def _get_restrained_indices(self) -> np.ndarray:
+        return np.where(self._get_restrained_mask(), 'r', 'f')
     
     def _get_mapping_indices(self) -> list[int]:
         """Get the free and restrain mapping indices for the model.
@@ -78,9 +179,9 @@ class Model:
         Returns:
             list[int]: _description_
         """
-        nodeIndex=self._get_restrained_indices()
-        free_indices = np.where(nodeIndex == 'f')[0]
-        restrained_indices = np.where(nodeIndex == 'r')[0]
+        restrained = self._get_restrained_mask()
+        free_indices = np.flatnonzero(~restrained)
+        restrained_indices = np.flatnonzero(restrained)
         
         return free_indices, restrained_indices
     
@@ -91,31 +192,54 @@ class Model:
         Returns:
             np.ndarray: _description_
         """
+        if self.incremental:
+            Fr = self._incremental_state(tangent=False)[0]
+            self.f_internal[:] = Fr
+            return Fr
+        
         Fr= np.zeros((self.system_ndof, 1))
-        for element in self.elements:
+        for element in self._scalar_elements:
             idx = element.idx
             forces, _ =element.force_recovery()
             Fr[idx] += forces
-            
+        
+        if self.element_blocks:
+            u = self.u_trial
+            for block in self.element_blocks:
+                block.update_trial(u)
+                forces, _ = block.force_recovery()
+                Fr[:, 0] += np.bincount(block.idx_rows.ravel(), weights=forces.T.ravel(), minlength=self.system_ndof)
+        
+        self.f_internal[:] = Fr
         return Fr
 
-    def get_external_force(self, t:float) -> ndarray:
+    def get_reference_load(self) -> ndarray:
+        """
+        Assemble the unscaled nodal load vector (load factor 1).
+
+        Returns:
+            ndarray: Reference global force vector of shape (system_ndof, 1)
+        """
+        P = np.zeros((self.system_ndof, 1))
+        for node in self.nodes:
+            for load in node.loads:
+                P[node.idx] += load.load_pattern.reshape((3, 1))
+        return P
+
+    def get_external_force(self, t:float, load_factor: float | None = None) -> ndarray:
         """
         Assemble the external force vector at pseudotime `t`.
 
         Args:
             t (float): Current pseudo-time (used for scaling loads)
+            load_factor (float, optional): Load factor applied instead of the time
+                series factor (used by displacement and arc-length control).
 
         Returns:
             ndarray: External global force vector of shape (system_ndof, 1)
         """
-        lam=self.timeseries.get_factor(t)
-        Fe = np.zeros((self.system_ndof, 1))
-        for node in self.nodes:
-            for load in node.loads:
-                f = lam * load.load_pattern 
-                Fe[node.idx] += f.reshape((3, 1))
-        return Fe
+        lam = self.timeseries.get_factor(t) if load_factor is None else load_factor
+        return lam * self.get_reference_load()
 
     def calculate_residual(self, t: float) -> np.ndarray:
         """
@@ -139,6 +263,9 @@ class Model:
         
     def residual_norm(self, t: float, norm_type: str = 'L2') -> float:
         R = self.calculate_residual(t)
+        return self._free_norm(R, norm_type)
+    
+    def _free_norm(self, R: ndarray, norm_type: str = 'L2') -> float:
         R_free = R[self.free_indices]  # Only consider free DOFs
         if norm_type == 'L2':
             return np.linalg.norm(R_free)
@@ -146,6 +273,63 @@ class Model:
             return np.linalg.norm(R_free, ord=np.inf)
         else:
             raise ValueError(f"Unsupported norm type: {norm_type}")
+    
+    def evaluate(self, t: float, norm_type: str = 'L2', tangent: bool = True, load_factor: float | None = None) -> tuple[ndarray, ndarray | sparse.csr_matrix | None, float]:
+        """
+        Evaluate the residual, the tangent stiffness and the residual norm in a single
+        pass over the elements.
+
+        Each element (or element block) updates its transformation state exactly once
+        and returns its resisting force and tangent together, so one Newton iteration
+        does not repeat the element state determination for `calculate_residual`,
+        `get_stiffness_matrix` and `residual_norm`. Results are identical to calling
+        those three methods.
+
+        Args:
+            t (float): Current pseudo-time
+            norm_type (str): 'L2' or 'inf', norm of the residual over the free DOFs
+            tangent (bool): If False, only the residual is evaluated and K is None
+                (used by solution strategies that reuse a factorized tangent).
+            load_factor (float, optional): Load factor applied instead of the time
+                series factor at `t`.
+
+        Returns:
+            tuple: (R, K, norm_R) with R of shape (system_ndof, 1) and K dense or CSR
+            according to `assembly`.
+        """
+        if self.incremental:
+            Fr, K = self._incremental_state(tangent)
+            F_ext = self.get_external_force(t, load_factor)
+            self.f_internal[:], self.f_external[:] = Fr, F_ext
+            R = F_ext - Fr
+            return R, K, self._free_norm(R, norm_type)
+        
+        Fr = np.zeros((self.system_ndof, 1))
+        element_matrices = []
+        for element in self._scalar_elements:
+            if tangent:
+                forces, Ke = element.state_determination()
+                element_matrices.append(Ke)
+            else:
+                forces, _ = element.force_recovery()
+            Fr[element.idx] += forces
+        
+        block_matrices = []
+        if self.element_blocks:
+            u = self.u_trial
+            for block in self.element_blocks:
+                block.update_trial(u)
+                forces, results = block.force_recovery()
+                Fr[:, 0] += np.bincount(block.idx_rows.ravel(), weights=forces.T.ravel(), minlength=self.system_ndof)
+                if tangent:
+                    block_matrices.append(block.get_global_stiffness_matrix(results['Fb']))
+        
+        F_ext = self.get_external_force(t, load_factor)
+        self.f_internal[:], self.f_external[:] = Fr, F_ext
+        R = F_ext - Fr
+        K = self._assemble_stiffness(element_matrices, block_matrices) if tangent else None
+        
+        return R, K, self._free_norm(R, norm_type)
         
     def update_trial_state(
         self,
@@ -154,6 +338,7 @@ class Model:
         verbose: bool = False,
         print_elements: bool = False,
         precision: int = 6,
+        update_elements: bool = True,
     ) -> None:
         """
         Map a global displacement vector `u` into every node's `u_trial`
@@ -170,6 +355,9 @@ class Model:
             and corotational angle β after the update.
         precision : int, optional
             NumPy print precision for nicer output.
+        update_elements : bool, optional
+            If False, only the nodes are updated and the element transformations are
+            left for the next `evaluate` call, which updates them once.
         """
         np.set_printoptions(suppress=True, precision=precision, linewidth=160)
 
@@ -177,21 +365,26 @@ class Model:
         if verbose:
             print("\n─── Updating node trial displacements ─────────────────────────────")
 
-        for node in self.nodes:
-            u_old = node.u_trial.copy()          # (3,1)
-            u_new = u[node.idx, 0].reshape(3, 1)
+        if verbose:
+            u_old = self.u_trial.copy()
 
-            node.u_trial[:] = u_new
+        # The node displacements are views, a single copy updates all of them
+        self.u_trial[:] = np.asarray(u).reshape(-1, 1)
 
-            if verbose:
-                du = (u_new - u_old).flatten()
+        if verbose:
+            for node in self.nodes:
+                u_new = node.u_trial.flatten()
+                du = u_new - u_old[node.idx, 0]
                 print(
                     f"Node {node.id:>3}:  "
-                    f"u_old = {u_old.flatten()},  "
-                    f"u_new = {u_new.flatten()},  "
+                    f"u_old = {u_old[node.idx, 0]},  "
+                    f"u_new = {u_new},  "
                     f"Δu = {du}"
                 )
 
+        if not update_elements:
+            return
+
         # --- ELEMENT LOOP ----------------------------------------------------
         if verbose and print_elements:
             print("\n─── Updating element transformations ─────────────────────────────")
@@ -209,48 +402,301 @@ class Model:
                 )
 
     
+    def _build_incremental_cache(self) -> None:
+        """
+        Allocate the cached element forces/tangents and the cached global stiffness.
+
+        The cached global stiffness is always the sum of the cached element tangents,
+        so it stays consistent whatever subset of elements is re-evaluated. The
+        position in the global stiffness (dense entry or CSR `data` index) of every
+        element tangent entry, and its inverse map, are stored so that the entries
+        touched by changed tangents can be summed again in assembly order.
+        """
+        n = len(self._scalar_elements)
+        n_e = len(self._scalar_elements[0].idx) if n else 0
+        self._scalar_idx = np.array([element.idx for element in self._scalar_elements], dtype=int).reshape(n, n_e)
+        self._cache_u = np.full((n, n_e), np.nan)
+        self._cache_F = np.zeros((n, n_e))
+        self._cache_K = np.zeros((n, n_e, n_e))
+        self._cache_results: list[dict | None] = [None] * n
+        self._tangent_stale = np.ones(n, dtype=bool)
+        self._cache_block_K = [np.zeros((block.n, 6, 6)) for block in self.element_blocks]
+        
+        if self.assembly == 'sparse':
+            self._K_cached = np.zeros(self._sparse_nnz)
+            self._entry_scatter = self._sparse_scatter
+        else:
+            self._K_cached = np.zeros((self.system_ndof, self.system_ndof))
+            idx = [self._scalar_idx] + [block.idx for block in self.element_blocks]
+            self._entry_scatter = np.concatenate(
+                [(i[:, :, None] * self.system_ndof + i[:, None, :]).ravel() for i in idx])
+        
+        # Element tangent entries contributing to every global entry, in assembly order
+        self._entry_order = np.argsort(self._entry_scatter, kind='stable')
+        self._entry_ptr = np.zeros(self._K_cached.size + 1, dtype=int)
+        np.cumsum(np.bincount(self._entry_scatter, minlength=self._K_cached.size), out=self._entry_ptr[1:])
+        self._block_entry_start = np.cumsum([n * n_e * n_e] + [block.n * 36 for block in self.element_blocks])
+    
+    def _invalidate_incremental_cache(self) -> None:
+        """Force the re-evaluation of every element force (after the element states were reset)."""
+        if self.incremental:
+            self._cache_u[:] = np.nan
+    
+    def _rebuild_cached_stiffness(self) -> None:
+        """Reassemble the cached global stiffness from all cached element tangents."""
+        K = self._assemble_stiffness(list(self._cache_K), self._cache_block_K)
+        self._K_cached = K.data if self.assembly == 'sparse' else K
+    
+    def _reassemble_entries(self, entries: ndarray) -> None:
+        """
+        Sum the global stiffness `entries` (dense flat or CSR `data` indices) again
+        from the cached element tangents.
+
+        The contributions are added in assembly order, so the cached stiffness stays
+        bit-identical to a full assembly (patching with tangent differences would
+        not, and the round-off would drift through the Newton iterations).
+        """
+        entries = np.unique(entries)
+        counts = self._entry_ptr[entries + 1] - self._entry_ptr[entries]
+        first = np.repeat(self._entry_ptr[entries] - np.cumsum(counts) + counts, counts)
+        contributions = np.sort(self._entry_order[first + np.arange(counts.sum())])
+        
+        if self.element_blocks:
+            values = np.concatenate([self._cache_K.ravel()] + [Kb.ravel() for Kb in self._cache_block_K])
+        else:
+            values = self._cache_K.reshape(-1)
+        K = self._K_cached.reshape(-1)
+        K[entries] = 0.0
+        np.add.at(K, self._entry_scatter[contributions], values[contributions])
+    
+    def _incremental_state(self, tangent: bool = True) -> tuple[ndarray, ndarray | sparse.csr_matrix | None]:
+        """
+        Resisting force and (optionally) tangent with dirty tracking.
+
+        Only elements whose displacements changed since their last evaluation recover
+        their forces, and only elements reporting `tangent_changed()` recompute their
+        tangent, whose global stiffness entries are summed again. Element blocks are
+        always re-evaluated (vectorized) but only reassembled when their tangent
+        changed. The counts are appended to `assembly_history`.
+        """
+        u = self.u_trial
+        n_elements = len(self._scalar_elements) + sum(block.n for block in self.element_blocks)
+        n_forces = n_tangents = 0
+        
+        if len(self._scalar_elements):
+            u_e = u[self._scalar_idx, 0]
+            changed = np.flatnonzero(np.any(u_e != self._cache_u, axis=1))
+            for k in changed:
+                forces, results = self._scalar_elements[k].force_recovery()
+                self._cache_F[k] = forces[:, 0]
+                self._cache_results[k] = results
+            self._cache_u[changed] = u_e[changed]
+            self._tangent_stale[changed] = True
+            n_forces += len(changed)
+            
+            if tangent:
+                dirty = [k for k in np.flatnonzero(self._tangent_stale) if self._scalar_elements[k].tangent_changed()]
+                new_K = [self._scalar_elements[k].get_trial_tangent(self._cache_results[k]) for k in dirty]
+                if dirty:
+                    self._cache_K[dirty] = new_K
+                if 2 * len(dirty) > len(self._scalar_elements):
+                    # Most tangents changed: a full vectorized reassembly is cheaper than patching
+                    self._rebuild_cached_stiffness()
+                elif dirty:
+                    size = self._cache_K[0].size
+                    self._reassemble_entries(np.concatenate(
+                        [self._entry_scatter[k * size:(k + 1) * size] for k in dirty]))
+                self._tangent_stale[:] = False
+                n_tangents += len(dirty)
+            
+            Fr = np.bincount(self._scalar_idx.ravel(), weights=self._cache_F.ravel(), minlength=self.system_ndof)
+        else:
+            Fr = np.zeros(self.system_ndof)
+        
+        for b, block in enumerate(self.element_blocks):
+            block.update_trial(u)
+            forces, results = block.force_recovery()
+            Fr += np.bincount(block.idx_rows.ravel(), weights=forces.T.ravel(), minlength=self.system_ndof)
+            n_forces += block.n
+            if tangent and block.tangent_changed():
+                self._cache_block_K[b] = block.get_global_stiffness_matrix(results['Fb'])
+                self._reassemble_entries(self._entry_scatter[self._block_entry_start[b]:self._block_entry_start[b + 1]])
+                n_tangents += block.n
+        
+        self.assembly_history.append({'elements': n_elements, 'forces': n_forces, 'tangents': n_tangents if tangent else None})
+        
+        K = None
+        if tangent:
+            if self.assembly == 'sparse':
+                K = sparse.csr_matrix(
+                    (self._K_cached.copy(), self._sparse_indices, self._sparse_indptr),
+                    shape=(self.system_ndof, self.system_ndof),
+                )
+            else:
+                K = self._K_cached.copy()
+        
+        return Fr.reshape(-1, 1), K
+    
+    def get_reevaluation_fractions(self) -> tuple[ndarray, ndarray]:
+        """
+        Fractions of the elements whose force and whose tangent were re-evaluated,
+        for every evaluation recorded in `assembly_history` (tangent fraction is NaN
+        for residual-only evaluations).
+        """
+        forces = np.array([h['forces'] / h['elements'] for h in self.assembly_history])
+        tangents = np.array([np.nan if h['tangents'] is None else h['tangents'] / h['elements'] for h in self.assembly_history])
+        return forces, tangents
+    
     def commit_state(self):
-        for node in self.nodes:
-            node.commit_state()
-        for element in self.elements:
+        self.u_committed[:] = self.u_trial
+        self.dynamic_state[1::2] = self.dynamic_state[0::2]
+        # Blocked elements keep their state in the element blocks
+        for element in self._scalar_elements:
             element.commit_state()
+        for block in self.element_blocks:
+            block.commit_state()
             
     def reset_trial(self):
-        for node in self.nodes:
-            node.reset_trial()
-        for element in self.elements:
+        self._invalidate_incremental_cache()
+        self.u_trial[:] = self.u_committed
+        self.dynamic_state[0::2] = self.dynamic_state[1::2]
+        for element in self._scalar_elements:
             element.reset_trial()
+        for block in self.element_blocks:
+            block.reset_trial()
 
     def revert_to_start(self):
-        for node in self.nodes:
-            node.revert_to_start()
-        for element in self.elements:
+        self._invalidate_incremental_cache()
+        self.node_state[:] = 0.0
+        self.dynamic_state[:] = 0.0
+        for element in self._scalar_elements:
             element.revert_to_start()
+        for block in self.element_blocks:
+            block.revert_to_start()
     
-    def get_stiffness_matrix(self) -> np.ndarray:
+    def _build_sparse_pattern(self) -> None:
+        """
+        Build the CSR sparsity pattern of the global stiffness matrix and the
+        element-to-nonzero scatter map.
+
+        Every element contributes a dense (n_e × n_e) block. The (row, col) pairs
+        of all blocks are reduced to the unique nonzeros in CSR order, and for each
+        element the position of its block entries inside the CSR `data` array is
+        stored, so assembly only has to accumulate values.
+        """
+        n = self.system_ndof
+        rows = [np.repeat(element.idx, len(element.idx)) for element in self._scalar_elements]
+        cols = [np.tile(element.idx, len(element.idx)) for element in self._scalar_elements]
+        for block in self.element_blocks:
+            rows.append(np.repeat(block.idx, block.idx.shape[1], axis=1).ravel())
+            cols.append(np.tile(block.idx, (1, block.idx.shape[1])).ravel())
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+
+        keys, scatter = np.unique(rows.astype(np.int64) * n + cols, return_inverse=True)
+
+        self._sparse_indices = (keys % n).astype(np.int32)
+        self._sparse_indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(keys // n, minlength=n), out=self._sparse_indptr[1:])
+        self._sparse_scatter = scatter.ravel()
+        self._sparse_nnz = len(keys)
+
+    def get_stiffness_matrix(self) -> np.ndarray | sparse.csr_matrix:
         """
         Assemble the global tangent stiffness matrix K for the model at the trial state.
+
+        Returns a dense ndarray for `assembly='dense'` and a CSR matrix sharing the
+        precomputed sparsity pattern for `assembly='sparse'`.
         """
+        if self.incremental:
+            return self._incremental_state(tangent=True)[1]
+        
+        element_matrices = [element.get_assembly_stiffness_matrix() for element in self._scalar_elements]
         
+        return self._assemble_stiffness(element_matrices, self._get_block_stiffness_matrices())
+    
+    def get_mass_matrix(self) -> np.ndarray | sparse.csr_matrix:
+        """
+        Assemble the global mass matrix from the element mass matrices and the
+        nodal masses, dense or CSR according to `assembly`.
+
+        The mass is evaluated in the undeformed configuration, so it is assembled
+        once and cached.
+        """
+        if self._mass_matrix is None:
+            element_matrices = [element.get_mass_matrix() for element in self._scalar_elements]
+            block_matrices = [np.array([element.get_mass_matrix() for element in block.elements]) for block in self.element_blocks]
+            M = self._assemble_stiffness(element_matrices, block_matrices)
+            
+            nodal_mass = np.zeros(self.system_ndof)
+            for node in self.nodes:
+                nodal_mass[node.idx] = node.mass
+            if self.assembly == 'sparse':
+                M = (M + sparse.diags(nodal_mass)).tocsr()
+            else:
+                M[np.diag_indices_from(M)] += nodal_mass
+            self._mass_matrix = M
+        return self._mass_matrix
+    
+    def tangent_changed(self) -> bool:
+        """
+        Whether the tangent of any element (or element block) may differ from the one
+        of its last assembled tangent, e.g. False while a model with linear
+        transformations stays elastic.
+        """
+        return (any(element.tangent_changed() for element in self._scalar_elements)
+                or any(block.tangent_changed() for block in self.element_blocks))
+    
+    def _assemble_stiffness(self, element_matrices: list[ndarray], block_matrices: list[ndarray]) -> np.ndarray | sparse.csr_matrix:
+        """
+        Assemble element tangents (one per scalar element, one (n, 6, 6) stack per block)
+        into the global dense or CSR stiffness matrix.
+        """
+        if self.assembly == 'sparse':
+            values = [Ke.ravel() for Ke in element_matrices] + [Ke.ravel() for Ke in block_matrices]
+            data = np.bincount(self._sparse_scatter, weights=np.concatenate(values), minlength=self._sparse_nnz)
+            
+            return sparse.csr_matrix(
+                (data, self._sparse_indices, self._sparse_indptr),
+                shape=(self.system_ndof, self.system_ndof),
+            )
         
         K = np.zeros((self.number_of_nodes * self.ndof, self.number_of_nodes * self.ndof))
         
-        for element in self.elements:
-            Ke=element.get_assembly_stiffness_matrix()
+        for element, Ke in zip(self._scalar_elements, element_matrices):
             idx=element.idx
             K[np.ix_(idx, idx)] += Ke
+        
+        for block, Ke in zip(self.element_blocks, block_matrices):
+            np.add.at(K, (block.idx[:, :, None], block.idx[:, None, :]), Ke)
             
         return K
     
+    def _get_block_stiffness_matrices(self) -> list[ndarray]:
+        """
+        Evaluate the (n, 6, 6) global stiffness stacks of all element blocks at the trial state.
+        """
+        if not self.element_blocks:
+            return []
+        u = self.u_trial
+        stacks = []
+        for block in self.element_blocks:
+            block.update_trial(u)
+            stacks.append(block.get_global_stiffness_matrix())
+        return stacks
+    
     def _assemble_displacement_vector_committed(self) -> ndarray:
         """
-        Assemble the committed displacement vector from all nodes.
+        Copy of the committed displacement vector of the model.
         This is used to get the committed state of the model.
         """
-        u = np.zeros((self.system_ndof, 1))
-        for node in self.nodes:
-            u[node.idx] = node.u_committed  # Assumes (3, 1) shape
-        return u
+        return self.u_committed.copy()
+    
+    def _assemble_displacement_vector_trial(self) -> ndarray:
+        """
+        Copy of the trial displacement vector of the model.
+        """
+        return self.u_trial.copy()
     
     def print_trial_committed_state(self) -> None:
         for node in self.nodes:
@@ -266,7 +712,13 @@ class Model:
         print(f"Model Summary:")
         print(f"Number of Nodes: {self.number_of_nodes}")
         print(f"Number of Elements: {self.number_of_elements}")
-        print(f"System DOF: {self.system_ndof}\n")
+        print(f"System DOF: {self.system_ndof}")
+        print(f"Assembly: {self.assembly}")
+        print(f"Incremental assembly: {self.incremental}")
+        print(f"Element Blocks: {self.element_blocks}\n")
+        
+        self.numberer.print_report()
+        print()
         
         print(f'Model Restraints:')
         print(f"Node Indices: {self._get_restrained_indices()}\n")
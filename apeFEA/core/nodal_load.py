@@ -24,6 +24,7 @@ class NodalLoad:
     load_pattern : ndarray
         Array of force values for each degree of freedom.
     """
+    __slots__ = ('node', 'load_pattern')
 
     def __init__(self, node: "Node", load_pattern: List[float]):
         self.node: Node = node
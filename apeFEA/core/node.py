@@ -20,20 +20,30 @@ class Node:
     ndof : int
         Number of degrees of freedom at this node.
     u_trial : ndarray
-        Current trial displacements.
+        Current trial displacements, a (ndof, 1) view into the node state.
     u_committed : ndarray
-        Last committed displacements.
+        Last committed displacements (view into the node state).
     f_internal : ndarray
-        Internal force vector.
+        Internal force vector (view into the node state).
     f_external : ndarray
-        External force vector.
+        External force vector (view into the node state).
     idx : ndarray
-        Global DOF indices.
+        Global DOF indices, consecutive from the first DOF index.
     restraints : Restraints
         Restraint information including boundary conditions and prescribed displacements.
     loads : list of NodalLoad
         External nodal loads acting on the node.
+    mass : ndarray
+        Lumped nodal mass per DOF (zeros unless set with `set_mass`).
+
+    Notes
+    -----
+    The class is slotted and the four state vectors are rows of a single (4, ndof, 1)
+    array. Once the node belongs to a `Model` that array is a view into the model's
+    global node state, so assigning to a state vector copies the values in place.
+    A node can therefore belong to a single `Model`.
     """
+    __slots__ = ('id', 'coords', 'ndof', '_state', '_first_dof', 'restraints', 'loads', '_mass')
 
     def __init__(
         self,
@@ -60,17 +70,59 @@ class Node:
         self.coords: ndarray = np.array(coords, dtype=float)
         self.ndof: int = ndof
 
-        self.u_trial: ndarray = np.zeros((self.ndof, 1))
-        self.u_committed: ndarray = np.zeros((self.ndof, 1))
+        # Rows: u_trial, u_committed, f_internal, f_external
+        self._state: ndarray = np.zeros((4, self.ndof, 1))
 
-        self.f_internal: ndarray = np.zeros((self.ndof, 1))
-        self.f_external: ndarray = np.zeros((self.ndof, 1))
-
-        self.idx: ndarray = self.set_indices(start_index=self.id)
-        self.dof: List[int] = []
+        self.idx = self.set_indices(start_index=self.id)
 
         self.restraints = Restraints(node=self, restrain_list=restrain_list)
         self.loads: List[NodalLoad] = []
+        self._mass: Optional[ndarray] = None
+
+    # ---------------------------------------------------
+    # State vectors (views into the node state)
+    @property
+    def u_trial(self) -> ndarray:
+        return self._state[0]
+
+    @u_trial.setter
+    def u_trial(self, value: ndarray) -> None:
+        self._state[0] = value
+
+    @property
+    def u_committed(self) -> ndarray:
+        return self._state[1]
+
+    @u_committed.setter
+    def u_committed(self, value: ndarray) -> None:
+        self._state[1] = value
+
+    @property
+    def f_internal(self) -> ndarray:
+        return self._state[2]
+
+    @f_internal.setter
+    def f_internal(self, value: ndarray) -> None:
+        self._state[2] = value
+
+    @property
+    def f_external(self) -> ndarray:
+        return self._state[3]
+
+    @f_external.setter
+    def f_external(self, value: ndarray) -> None:
+        self._state[3] = value
+
+    @property
+    def idx(self) -> ndarray:
+        return np.arange(self._first_dof, self._first_dof + self.ndof)
+
+    @idx.setter
+    def idx(self, idx: ndarray) -> None:
+        idx = np.asarray(idx)
+        if not np.array_equal(idx, np.arange(idx[0], idx[0] + self.ndof)):
+            raise ValueError(f"Node {self.id} DOF indices must be {self.ndof} consecutive equations, got {idx}")
+        self._first_dof = int(idx[0])
 
     # ---------------------------------------------------
     def set_node_id(self, id: int) -> None:
@@ -92,6 +144,20 @@ class Node:
         """Set fixed/free restraints for each DOF ('r' or 'f')."""
         self.restraints.apply_BC(restraints)
 
+    # ---------------------------------------------------
+    # Mass
+    def set_mass(self, mass: List[float]) -> None:
+        """Set the lumped nodal mass per DOF (e.g. [m, m, 0] for a translational mass)."""
+        if len(mass) != self.ndof:
+            raise ValueError("Mass length must match node's degrees of freedom")
+        self._mass = np.array(mass, dtype=float)
+
+    @property
+    def mass(self) -> ndarray:
+        if self._mass is None:
+            return np.zeros(self.ndof)
+        return self._mass
+
     # ---------------------------------------------------
     # Load Handling
     def add_load(self, load: List[float]) -> None:
@@ -111,16 +177,27 @@ class Node:
 
     def revert_to_start(self) -> None:
         """Zero out all displacements and forces (restart state)."""
-        self.u_trial[:] = 0.0
-        self.u_committed[:] = 0.0
-        self.f_internal[:] = 0.0
-        self.f_external[:] = 0.0
+        self._state[:] = 0.0
+
+    def bind_state(self, state: ndarray) -> None:
+        """
+        Store the state vectors in `state` (4, ndof, 1), usually a view into the
+        global node state of a `Model`. The current values are copied over.
+        """
+        state[:] = self._state
+        self._state = state
+
+    @property
+    def is_bound(self) -> bool:
+        """True once the node state is a view into the global node state of a `Model`."""
+        return self._state.base is not None
 
     # ---------------------------------------------------
     # Indexing
     def set_indices(self, start_index: int) -> ndarray:
-        """Return array of global DOF indices based on node ID."""
-        return np.arange(self.ndof) + self.ndof * (self.id - 1)
+        """Return array of global DOF indices for the 1-based equation position `start_index`
+        (the node ID by default; a DOFNumberer passes the compact position instead)."""
+        return np.arange(self.ndof) + self.ndof * (start_index - 1)
 
     # ---------------------------------------------------
     # Getters
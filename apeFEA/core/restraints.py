@@ -1,10 +1,20 @@
 import numpy as np
+from functools import lru_cache
+from numpy import ndarray
 from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .node import Node
 
 
+@lru_cache(maxsize=None)
+def _restraint_mask(flags: tuple[bool, ...]) -> ndarray:
+    """Read-only boolean mask, shared by every node with the same restraint pattern."""
+    mask = np.array(flags, dtype=bool)
+    mask.flags.writeable = False
+    return mask
+
+
 class Restraints:
     """
     Manages degrees of freedom (DOFs) restraints and single-point (SP) prescribed displacements for a Node.
@@ -24,11 +34,15 @@ class Restraints:
 
     Attributes
     ----------
+    restrained : ndarray of bool
+        Read-only mask, True for restrained DOFs. Nodes with the same boundary
+        conditions share the same mask array.
     restraints : ndarray of str
-        Boundary conditions for each DOF ('r' or 'f').
+        Boundary conditions for each DOF ('r' or 'f'), derived from the mask.
     displacements : ndarray of float
-        Prescribed displacements for each DOF.
+        Prescribed displacements for each DOF (zeros unless prescribed).
     """
+    __slots__ = ('node', '_restrained', '_displacements')
 
     def __init__(
         self,
@@ -38,8 +52,22 @@ class Restraints:
     ):
         self.node = node
 
-        self.restraints = np.array(restrain_list) if restrain_list else np.array(['f'] * node.ndof)
-        self.displacements = np.array(restrain_displacement) if restrain_displacement else np.zeros(node.ndof)
+        self._restrained = _restraint_mask(tuple(flag == 'r' for flag in restrain_list or ['f'] * node.ndof))
+        self._displacements = np.array(restrain_displacement, dtype=float) if restrain_displacement else None
+
+    @property
+    def restrained(self) -> ndarray:
+        return self._restrained
+
+    @property
+    def restraints(self) -> ndarray:
+        return np.where(self._restrained, 'r', 'f')
+
+    @property
+    def displacements(self) -> ndarray:
+        if self._displacements is None:
+            return np.zeros(self.node.ndof)
+        return self._displacements
 
     def apply_BC(self, boundary_condition: List[str]) -> None:
         """
@@ -56,7 +84,7 @@ class Restraints:
             If the list length does not match the node's DOF count.
         """
         assert len(boundary_condition) == self.node.ndof, "Boundary condition length mismatch"
-        self.restraints = np.array(boundary_condition)
+        self._restrained = _restraint_mask(tuple(flag == 'r' for flag in boundary_condition))
 
     def apply_SP_displacements(self, SP_displacements: List[float]) -> None:
         """
@@ -73,4 +101,4 @@ class Restraints:
             If the list length does not match the node's DOF count.
         """
         assert len(SP_displacements) == self.node.ndof, "Displacement length mismatch"
-        self.displacements = np.array(SP_displacements)
+        self._displacements = np.array(SP_displacements, dtype=float)
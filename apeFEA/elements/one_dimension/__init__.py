@@ -1,3 +1,5 @@
 from .frame_element import FrameElement
+from .force_based_frame_element import ForceBasedFrameElement, gauss_lobatto
+from .frame_element_block import FrameElementBlock, build_element_blocks
 
-__all__ = ['FrameElement']
\ No newline at end of file
+__all__ = ['FrameElement', 'ForceBasedFrameElement', 'gauss_lobatto', 'FrameElementBlock', 'build_element_blocks']
\ No newline at end of file
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import copy
+import numpy as np
+from numpy import ndarray
+from numpy.polynomial import legendre
+
+from apeFEA.core.node import Node
+from .frame_element import FrameElement
+from apeFEA.elements.one_dimension.transformations.transformation import Transformation
+from apeFEA.elements.one_dimension.transformations.linear_transformation import LinearTransformation
+
+
+def gauss_lobatto(n: int) -> tuple[ndarray, ndarray]:
+    """
+    Gauss–Lobatto integration points and weights on [0, 1].
+
+    The end points are included, the interior points are the roots of P'_{n-1}
+    (exact for polynomials up to degree 2n - 3).
+
+    Parameters
+    ----------
+    n : int
+        Number of points (>= 2).
+    """
+    if n < 2:
+        raise ValueError("Gauss–Lobatto integration needs at least 2 points")
+    P = np.zeros(n)
+    P[-1] = 1.0  # Legendre polynomial P_{n-1}
+    x = np.concatenate([[-1.0], np.sort(legendre.legroots(legendre.legder(P))), [1.0]])
+    w = 2.0 / (n * (n - 1) * legendre.legval(x, P) ** 2)
+    return 0.5 * (x + 1.0), 0.5 * w
+
+
+class ForceBasedFrameElement(FrameElement):
+    """
+    2D force-based (flexibility) beam-column element.
+
+    The section forces follow exactly from the basic forces q = [N, Mi, Mj]
+    through the equilibrium interpolation
+        s(ξ) = b(ξ) q,   b(ξ) = [[1, 0, 0], [0, ξ - 1, ξ]]
+    and the element flexibility is integrated with Gauss–Lobatto points,
+        F = L Σ w bᵀ fs b,   K_basic = F⁻¹,
+    each point holding its own copy of the section. Because equilibrium is exact,
+    one element per member captures spread plasticity that needs a chain of many
+    displacement-based `FrameElement`s.
+
+    The state determination iterates at element level (Neuenhofer & Filippou):
+    the basic force is corrected with K_basic (v - v_r), where v_r are the basic
+    deformations compatible with the section deformations plus their linearized
+    unbalance, until the energy norm |Δvᵀ Δq| is below `tolerance` times |vᵀ q|.
+
+    A section whose fibers have all yielded has a zero (singular) tangent, so
+    the section flexibilities are computed from the tangent plus `regularization`
+    times the initial section tangent. This only changes the iteration matrix and
+    the element tangent, not the converged forces.
+
+    The transformation plug-ins, geometric stiffness and assembly are those of
+    `FrameElement`; only the basic force and stiffness differ. Sections must provide
+    the section state interface (`set_trial_deformation`, `get_resultants`,
+    `get_tangent_matrix`, commit/reset/revert), e.g. `Section` or `FiberSection`.
+
+    Parameters
+    ----------
+    id : int
+        Unique element identifier.
+    nodes : list[Node]
+        List of two Node objects defining the element ends.
+    section : Section or FiberSection
+        Section copied to every integration point.
+    transformation : type[Transformation], optional
+        Transformation class, default is LinearTransformation.
+    n_ip : int
+        Number of Gauss–Lobatto integration points.
+    max_iterations : int
+        Maximum number of element state determination iterations.
+    tolerance : float
+        Relative energy tolerance of the element iterations.
+    regularization : float
+        Fraction of the initial section tangent added before inverting it.
+    mass : float
+        Mass per unit length.
+    mass_type : str
+        'lumped' or 'consistent' mass matrix (see `FrameElement`).
+
+    Attributes
+    ----------
+    sections : list
+        Section of every integration point.
+    xi, weights : ndarray
+        Integration points (on [0, 1]) and weights.
+    iterations : int
+        Element iterations used by the last state determination.
+    """
+
+    displacement_based = False
+
+    def __init__(self,
+                 id: int,
+                 nodes: list[Node],
+                 section,
+                 transformation: type[Transformation] = LinearTransformation,
+                 n_ip: int = 5,
+                 max_iterations: int = 20,
+                 tolerance: float = 1e-12,
+                 regularization: float = 1e-9,
+                 mass: float = 0.0,
+                 mass_type: str = 'lumped'):
+
+        super().__init__(id, nodes, section, transformation, mass, mass_type)
+
+        self.n_ip = n_ip
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        self.regularization = regularization
+        self.xi, self.weights = gauss_lobatto(n_ip)
+        self.sections = [copy.deepcopy(section) for _ in range(n_ip)]
+
+        # Force interpolation matrices (n_ip, 2, 3) and integration weights times L
+        self._b = np.zeros((n_ip, 2, 3))
+        self._b[:, 0, 0] = 1.0
+        self._b[:, 1, 1] = self.xi - 1.0
+        self._b[:, 1, 2] = self.xi
+        self._wL = self.weights * self.transformation.get_L0()
+        self._ks0 = np.array([s.get_tangent_matrix() for s in self.sections])
+
+        self.iterations = 0
+        self.revert_to_start()
+
+    @property
+    def integration_points(self) -> ndarray:
+        """Distance of the integration points from node i."""
+        return self.xi * self.transformation.get_L0()
+
+    def _section_flexibility(self, k: int) -> ndarray:
+        """Regularized flexibility of the section at integration point `k`."""
+        return np.linalg.inv(self.sections[k].get_tangent_matrix() + self.regularization * self._ks0[k])
+
+    def _integrate_flexibility(self) -> ndarray:
+        """F = L Σ w bᵀ fs b from the current section flexibilities."""
+        return np.einsum('k,kai,kab,kbj->ij', self._wL, self._b, self._fs, self._b)
+
+    def get_basic_stiffness_matrix(self) -> ndarray:
+        """Basic tangent stiffness F⁻¹ at the last state determination."""
+        return self._K_trial
+
+    def get_basic_force(self, u_basic: ndarray) -> ndarray:
+        """
+        Element state determination for the basic deformations `u_basic`.
+
+        Raises
+        ------
+        RuntimeError
+            If the element iterations do not converge or meet a singular flexibility.
+        """
+        v = np.asarray(u_basic, dtype=float).reshape(3, 1)
+        if np.array_equal(v, self._v_trial):
+            return self._q_trial.copy()
+
+        q = self._q_trial + self._K_trial @ (v - self._v_trial)
+
+        try:
+            for iteration in range(1, self.max_iterations + 1):
+                # Section deformations from the force increment, then their unbalance
+                s_target = (self._b @ q)[..., 0]
+                self._e_trial += (self._fs @ (s_target - self._s_trial)[..., None])[..., 0]
+                for k, section in enumerate(self.sections):
+                    section.set_trial_deformation(self._e_trial[k])
+                    self._s_trial[k] = section.get_resultants()
+                    self._fs[k] = self._section_flexibility(k)
+                e_residual = (self._fs @ (s_target - self._s_trial)[..., None])[..., 0]
+
+                F = self._integrate_flexibility()
+                v_r = np.einsum('k,kai,ka->i', self._wL, self._b, self._e_trial + e_residual)[:, None]
+                K = np.linalg.inv(F)
+                dv = v - v_r
+                dq = K @ dv
+                q = q + dq
+
+                if abs(np.vdot(dv, dq)) <= self.tolerance * abs(np.vdot(v, q)):
+                    break
+            else:
+                raise RuntimeError(f"Force-based element {self.id} state determination did not converge")
+        except np.linalg.LinAlgError as e:
+            raise RuntimeError(f"Force-based element {self.id} state determination failed: {e}") from e
+
+        self.iterations = iteration
+        self._v_trial = v.copy()
+        self._q_trial = q
+        self._K_trial = K
+        return q.copy()
+
+    def get_section_forces(self) -> ndarray:
+        """Section resultants [N, M] at every integration point, shape (n_ip, 2)."""
+        return self._s_trial.copy()
+
+    def get_section_deformations(self) -> ndarray:
+        """Section deformations [ε0, κ] at every integration point, shape (n_ip, 2)."""
+        return self._e_trial.copy()
+
+    def commit_state(self) -> None:
+        super().commit_state()
+        for section in self.sections:
+            section.commit_state()
+        self._committed = tuple(a.copy() for a in self._trial_state())
+
+    def reset_trial(self) -> None:
+        super().reset_trial()
+        for section in self.sections:
+            section.reset_trial()
+        self._restore(self._committed)
+
+    def revert_to_start(self) -> None:
+        super().revert_to_start()
+        for section in self.sections:
+            section.revert_to_start()
+
+        self._fs = np.array([self._section_flexibility(k) for k in range(self.n_ip)])
+        self._restore((
+            np.zeros((3, 1)),
+            np.zeros((3, 1)),
+            np.linalg.inv(self._integrate_flexibility()),
+            np.zeros((self.n_ip, 2)),
+            np.zeros((self.n_ip, 2)),
+            self._fs,
+        ))
+        self._committed = tuple(a.copy() for a in self._trial_state())
+
+    def _trial_state(self) -> tuple[ndarray, ...]:
+        return self._v_trial, self._q_trial, self._K_trial, self._e_trial, self._s_trial, self._fs
+
+    def _restore(self, state: tuple[ndarray, ...]) -> None:
+        v, q, K, e, s, fs = (a.copy() for a in state)
+        self._v_trial, self._q_trial, self._K_trial, self._e_trial, self._s_trial, self._fs = v, q, K, e, s, fs
+
+    def __str__(self):
+        return f"ForceBasedFrameElement {self.id}: Node {self.node_i.id} → Node {self.node_j.id} ({self.n_ip} IPs)"
@@ -1,7 +1,9 @@
 from __future__ import annotations  # if using forward type hints (Python <3.10)
 
+import copy
 import numpy as np
 from numpy import ndarray
+from numpy.polynomial import legendre
 import matplotlib.pyplot as plt
 
 from apeFEA.core.node import Node
@@ -18,6 +20,16 @@ class FrameElement(Element):
     It supports corotational or linear geometric transformations and nonlinear section behavior
     through a material-based `Section` object.
 
+    A `Section` contributes its current EA and EI (kb = [[EA/L, 0, 0], [0, 4EI/L, 2EI/L],
+    [0, 2EI/L, 4EI/L]]). Sections whose response follows from their deformations
+    (`deformation_driven`, e.g. `FiberSection`) are integrated as a displacement-based
+    element instead: every Gauss–Legendre point holds its own copy of the section,
+    driven by the section deformations
+        e(ξ) = B(ξ) ub,   B(ξ) = [[1/L, 0, 0], [0, (6ξ - 4)/L, (6ξ - 2)/L]]
+    (constant axial strain, linear curvature), and
+        q = L Σ w Bᵀ s,   kb = L Σ w Bᵀ ks B
+    with the section resultants s and the full 2×2 section tangent ks.
+
     Parameters
     ----------
     id : int
@@ -28,6 +40,13 @@ class FrameElement(Element):
         Cross-sectional object defining stiffness via material behavior.
     transformation : type[Transformation], optional
         Transformation class (e.g., Linear, Corotational), default is LinearTransformation.
+    mass : float, optional
+        Mass per unit length (default 0, massless).
+    mass_type : str, optional
+        'lumped' (half of the translational mass at each node) or 'consistent'
+        (cubic Hermitian / linear interpolation), default 'lumped'.
+    n_ip : int, optional
+        Number of Gauss–Legendre points for deformation-driven sections (default 5).
 
     Attributes
     ----------
@@ -38,35 +57,85 @@ class FrameElement(Element):
     idx : ndarray
         Global DOF indices for this element.
     restraints : ndarray
-        DOF restraint flags (e.g., 'r' or 'f').
+        DOF restraint mask (True for restrained DOFs).
     transformation : Transformation
         Instantiated transformation object for this element.
+    ip_sections : list or None
+        Section of every integration point (None for `Section`s used through EA, EI).
     """
+    __slots__ = ('node_i', 'node_j', 'section', 'transformation', '_kb_assembled', 'mass', 'mass_type',
+                 'ip_sections', '_ip_B', '_ip_wL', '_q_trial', '_kb_trial')
+
+    MASS_TYPES = ('lumped', 'consistent')
+
+    # Integrates deformation-driven sections along the element (the force-based
+    # subclass drives its own sections)
+    displacement_based = True
     
     def __init__(self, 
                  id: int, 
                  nodes: list[Node], 
                  section: Section, 
-                 transformation: type[Transformation]=LinearTransformation):
+                 transformation: type[Transformation]=LinearTransformation,
+                 mass: float = 0.0,
+                 mass_type: str = 'lumped',
+                 n_ip: int = 5):
+        
+        if mass_type not in self.MASS_TYPES:
+            raise ValueError(f"Unsupported mass type: {mass_type}")
         
         super().__init__(id, nodes)
 
         self.node_i = nodes[0]
         self.node_j = nodes[1]
         self.section = section
+        self.mass = mass
+        self.mass_type = mass_type
         
         # Get indices and restraints
         self.idx, self.restraints = self._elementIndices()
 
         self.transformation = transformation(element=self)
+        
+        # Basic stiffness of the last assembled tangent (dirty tracking)
+        self._kb_assembled: ndarray | None = None
+
+        self.ip_sections = None
+        if self.displacement_based and getattr(section, 'deformation_driven', False):
+            self._setup_integration(n_ip)
 
 
+    def _setup_integration(self, n_ip: int) -> None:
+        """Integration point sections, strain-displacement matrices and weights."""
+        if n_ip < 1:
+            raise ValueError("A frame element needs at least 1 integration point")
+        x, w = legendre.leggauss(n_ip)
+        xi = 0.5 * (x + 1.0)
+        L = self.transformation.get_L0()
+
+        self.ip_sections = [copy.deepcopy(self.section) for _ in range(n_ip)]
+        self._ip_B = np.zeros((n_ip, 2, 3))
+        self._ip_B[:, 0, 0] = 1.0 / L
+        self._ip_B[:, 1, 1] = (6 * xi - 4) / L
+        self._ip_B[:, 1, 2] = (6 * xi - 2) / L
+        self._ip_wL = 0.5 * w * L
+        self._integrate_sections()
+
+    def _integrate_sections(self) -> None:
+        """Basic force and stiffness from the current state of the integration point sections."""
+        s = np.array([section.get_resultants() for section in self.ip_sections])
+        ks = np.array([section.get_tangent_matrix() for section in self.ip_sections])
+        self._q_trial = np.einsum('k,kai,ka->i', self._ip_wL, self._ip_B, s)[:, None]
+        self._kb_trial = np.einsum('k,kai,kab,kbj->ij', self._ip_wL, self._ip_B, ks, self._ip_B)
+
     def _elementIndices(self):
         idx=np.concatenate([self.node_i.idx,self.node_j.idx])
-        restraints=np.concatenate([self.node_i.restraints.restraints, self.node_j.restraints.restraints])
+        restraints=np.concatenate([self.node_i.restraints.restrained, self.node_j.restraints.restrained])
         return idx, restraints
     
     def get_basic_stiffness_matrix(self) -> ndarray:
+        if self.ip_sections is not None:
+            return self._kb_trial
         EA, EI = self.section.get_stiffness_matrix()
         # L = self.transformation.get_length()
         L = self.transformation.get_L0()
@@ -79,10 +148,59 @@ class FrameElement(Element):
 
         return kb
     
+    def get_mass_matrix(self) -> ndarray:
+        """
+        Global mass matrix (6, 6) in the undeformed configuration.
+
+        The lumped matrix holds m L / 2 on the translations of each node and no
+        rotational inertia; the consistent one is the classical frame mass matrix
+        (linear axial, cubic Hermitian transverse interpolation).
+        """
+        L = self.transformation.get_L0()
+        mL = self.mass * L
+        if self.mass_type == 'lumped':
+            return np.diag([mL / 2, mL / 2, 0.0, mL / 2, mL / 2, 0.0])
+
+        ml = np.zeros((6, 6))
+        ml[np.ix_([0, 3], [0, 3])] = mL / 6 * np.array([[2, 1], [1, 2]])
+        ml[np.ix_([1, 2, 4, 5], [1, 2, 4, 5])] = mL / 420 * np.array([
+            [156, 22*L, 54, -13*L],
+            [22*L, 4*L**2, 13*L, -3*L**2],
+            [54, 13*L, 156, -22*L],
+            [-13*L, -3*L**2, -22*L, 4*L**2],
+        ])
+        Tlg = self.transformation.get_Tlg()
+        return Tlg.T @ ml @ Tlg
+    
+    def get_basic_force(self, u_basic: ndarray) -> ndarray:
+        """
+        Basic forces [N, Mi, Mj] for the basic deformations `u_basic` (3, 1).
+
+        Deformation-driven sections are set to the trial section deformations
+        B(ξ) u_basic first, which also updates the basic stiffness.
+        """
+        if self.ip_sections is not None:
+            e = self._ip_B @ np.asarray(u_basic, dtype=float).reshape(3)
+            for section, e_ip in zip(self.ip_sections, e):
+                section.set_trial_deformation(e_ip)
+            self._integrate_sections()
+            return self._q_trial.copy()
+        return self.get_basic_stiffness_matrix() @ u_basic
+    
     def get_local_stiffness_matrix(self) -> ndarray:
         
         self.transformation.update_trial()
         
+        # Get the geometric stiffness matrix        
+        _, results = self._recover_forces()
+        
+        return self._get_local_stiffness_matrix(results['Fb'])
+    
+    def _get_local_stiffness_matrix(self, Fb: ndarray) -> ndarray:
+        """
+        Local tangent stiffness at the current transformation state for basic forces `Fb`.
+        Does not update the transformation.
+        """
         # Get the transformation matrices
         Tbl = self.transformation.get_Tbl()
         
@@ -90,13 +208,8 @@ class FrameElement(Element):
         kb_material = self.get_basic_stiffness_matrix()
         kl_material = Tbl.T @ kb_material @ Tbl
         
-        # Get the geometric stiffness matrix        
-        _, results = self.force_recovery()
-        Fb = results['Fb']
         T_geo_Fb1, T_geo_Fb2 = self.transformation.geometric_transformation_matrix()
         
-        # print(f'From element: {self.id} - Fb: {Fb[1,0]+Fb[2,0]}')
-        
         kl_geometric = Fb[0,0] * T_geo_Fb1  + (Fb[1,0]+Fb[2,0]) * T_geo_Fb2
         
         # Tangent stiffness matrix
@@ -124,14 +237,19 @@ class FrameElement(Element):
         """
         self.transformation.update_trial()
         
+        return self._recover_forces()
+    
+    def _recover_forces(self) -> tuple[ndarray, dict]:
+        """
+        Force recovery at the current transformation state (no transformation update).
+        """
         u_global = np.vstack([self.node_i.u_trial, self.node_j.u_trial])
         Tlg = self.transformation.get_Tlg()
         u_local = Tlg @ u_global
         Tbl = self.transformation.get_Tbl()
         u_basic = self.transformation.get_basic_trial_disp()
 
-        kb = self.get_basic_stiffness_matrix()
-        Fb = kb @ u_basic
+        Fb = self.get_basic_force(u_basic)
         Fl = Tbl.T @ Fb
         Fg = Tlg.T @ Fl
 
@@ -148,14 +266,110 @@ class FrameElement(Element):
 
         return F_assembly, results
     
+    def state_determination(self) -> tuple[ndarray, ndarray]:
+        """
+        Single-pass element state determination at the trial state.
+
+        The transformation is updated once and the same basic forces are used for
+        both the resisting force and the tangent (material + geometric) stiffness.
+
+        Returns:
+            F_assembly: Global resisting force vector (6, 1)
+            K_assembly: Global tangent stiffness matrix (6, 6)
+        """
+        self.transformation.update_trial()
+        
+        F_assembly, results = self._recover_forces()
+        K_assembly = self.get_trial_tangent(results)
+        
+        return F_assembly, K_assembly
+    
+    def get_trial_tangent(self, results: dict) -> ndarray:
+        """
+        Global tangent stiffness at the current transformation state for the basic
+        forces in `results` (no transformation update).
+        """
+        Tlg = self.transformation.get_Tlg()
+        kl = self._get_local_stiffness_matrix(results['Fb'])
+        self._kb_assembled = self.get_basic_stiffness_matrix().copy()
+        
+        return Tlg.T @ kl @ Tlg
+    
+    def tangent_changed(self) -> bool:
+        """
+        Under a linear transformation the tangent only depends on the basic stiffness,
+        so it is unchanged while kb equals the one of the last assembled tangent
+        (e.g. linear elastic sections, or force-based elements still elastic).
+        Geometrically nonlinear transformations always report a change.
+        """
+        if not self.transformation.linear_geometry or self._kb_assembled is None:
+            return True
+        return not np.array_equal(self.get_basic_stiffness_matrix(), self._kb_assembled)
+
+    def check_tangent(self, h: float = 1e-6) -> tuple[ndarray, ndarray, float]:
+        """
+        Compare the global tangent at the current node trial displacements with a
+        central finite difference of the global resisting force.
+
+        Every end DOF is perturbed by ±h (model units, also for rotations); the node
+        displacements and the element trial state are restored afterwards.
+
+        Parameters
+        ----------
+        h : float
+            Displacement perturbation.
+
+        Returns
+        -------
+        K : ndarray
+            Global tangent stiffness (6, 6) from `state_determination`.
+        K_fd : ndarray
+            Finite difference tangent (6, 6).
+        error : float
+            max |K - K_fd| relative to max |K| (0 if K vanishes).
+        """
+        nodes = (self.node_i, self.node_j)
+        u0 = [node.u_trial.copy() for node in nodes]
+        ub_previous = self.transformation.ub_previous.copy()
+
+        _, K = self.state_determination()
+        K_fd = np.zeros_like(K)
+        for col in range(K.shape[1]):
+            node, dof = nodes[col // 3], col % 3
+            F = []
+            for sign in (1.0, -1.0):
+                node.u_trial[dof, 0] = u0[col // 3][dof, 0] + sign * h
+                F.append(self.force_recovery()[0])
+            node.u_trial[:] = u0[col // 3]
+            K_fd[:, col] = ((F[0] - F[1]) / (2 * h))[:, 0]
+
+        self.transformation.update_trial()
+        self._recover_forces()
+        self.transformation.ub_previous[:] = ub_previous
+
+        scale = np.max(np.abs(K))
+        error = float(np.max(np.abs(K - K_fd)) / scale) if scale > 0.0 else 0.0
+        return K, K_fd, error
+
     def commit_state(self) -> None:
         self.transformation.commit_state()
+        if self.ip_sections is not None:
+            for section in self.ip_sections:
+                section.commit_state()
 
     def reset_trial(self) -> None:
         self.transformation.reset_trial()
+        if self.ip_sections is not None:
+            for section in self.ip_sections:
+                section.reset_trial()
+            self._integrate_sections()
 
     def revert_to_start(self) -> None:
         self.transformation.revert_to_start()
+        if self.ip_sections is not None:
+            for section in self.ip_sections:
+                section.revert_to_start()
+            self._integrate_sections()
     
     def plot(self, ax: plt.Axes, color: str = "black", linewidth: float = 2.0, show_id: bool = True, **kwargs) -> None:
         xi = self.node_i.coords
@@ -0,0 +1,441 @@
+from __future__ import annotations
+
+import numpy as np
+from numpy import ndarray
+
+from .frame_element import FrameElement
+from apeFEA.elements.one_dimension.transformations.linear_transformation import LinearTransformation
+from apeFEA.elements.one_dimension.transformations.corrotational_transformation import CorotationalTransformation2D
+from apeFEA.elements.one_dimension.transformations.pdelta_transformation import PDeltaTransformation2D
+from apeFEA.elements.one_dimension.transformations.pdelta_transformation_op import PDeltaTransformation2D_OP
+
+
+# ----------------------------------------------------------------------------- #
+#                      Batched transformation kernels                           #
+# ----------------------------------------------------------------------------- #
+# Each kinematic kernel receives the (n,) undeformed lengths and the (6, n) local
+# displacements and returns
+#   ub         : (3, n) basic deformations
+#   a, b, d, e : (n,)   coefficients of the local → basic transformation
+#
+#       Tbl = [[-a, -b, 0, a,  b, 0],
+#              [-d,  e, 1, d, -e, 0],
+#              [-d,  e, 0, d, -e, 1]]
+#
+# so that forces are recovered with a few vector operations. Each geometric kernel
+# returns T1, T2 : (n, 6, 6) geometric pattern matrices multiplying Fb[0] and
+# Fb[1]+Fb[2] (None if zero) and is only evaluated for tangents. Together they
+# reproduce the per-element transformation classes entry by entry.
+
+_GEO_PDELTA_OP = np.array([
+    [1, 0, 0, -1, 0, 0],
+    [0, 1, 0, 0, -1, 0],
+    [0, 0, 0, 0, 0, 0],
+    [-1, 0, 0, 1, 0, 0],
+    [0, -1, 0, 0, 1, 0],
+    [0, 0, 0, 0, 0, 0]
+], dtype=float)
+
+_GEO_PDELTA_1 = np.array([
+    [0, 0, 0, 0, 0, 0],
+    [0, 1, 0, 0, -1, 0],
+    [0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0],
+    [0, -1, 0, 0, 1, 0],
+    [0, 0, 0, 0, 0, 0]
+], dtype=float)
+
+_GEO_PDELTA_2 = np.array([
+    [0, 0, 0, 0, 0, 0],
+    [0, 2, 1, 0, -2, -1],
+    [0, 1, 2, 0, -1, -2],
+    [0, 0, 0, 0, 0, 0],
+    [0, -2, -1, 0, 2, 1],
+    [0, -1, -2, 0, 1, 2],
+], dtype=float)
+
+
+def _basic_transformation(a: ndarray, b: ndarray, d: ndarray, e: ndarray) -> ndarray:
+    """Build the (n, 3, 6) Tbl stack from its coefficients."""
+    Tbl = np.zeros((len(a), 3, 6))
+    Tbl[:, 0, 0], Tbl[:, 0, 1], Tbl[:, 0, 3], Tbl[:, 0, 4] = -a, -b, a, b
+    for row in (1, 2):
+        Tbl[:, row, 0], Tbl[:, row, 1] = -d, e
+        Tbl[:, row, 3], Tbl[:, row, 4] = d, -e
+    Tbl[:, 1, 2] = 1.0
+    Tbl[:, 2, 5] = 1.0
+    return Tbl
+
+
+def _linear_kinematics(L0: ndarray, u_local: ndarray):
+    chord = (u_local[1] - u_local[4]) / L0
+    ub = np.empty((3, len(L0)))
+    ub[0] = u_local[3] - u_local[0]
+    ub[1] = u_local[2] + chord
+    ub[2] = u_local[5] + chord
+    return ub, 1.0, 0.0, 0.0, 1.0 / L0
+
+
+def _pdelta_kinematics(L0: ndarray, u_local: ndarray):
+    delta_y = u_local[4] - u_local[1]
+
+    ub = np.empty((3, len(L0)))
+    ub[0] = u_local[3] - u_local[0] + delta_y**2 / (2 * L0)
+    ub[1] = u_local[2] - delta_y / L0
+    ub[2] = u_local[5] - delta_y / L0
+    return ub, 1.0, delta_y / L0, 0.0, 1.0 / L0
+
+
+def _corotational_chord(L0: ndarray, u_local: ndarray):
+    Lx = L0 + u_local[3] - u_local[0]
+    Ly = u_local[4] - u_local[1]
+    Ln = np.sqrt(Lx**2 + Ly**2)
+    return Ln, np.arctan2(Ly, Lx), Lx / Ln, Ly / Ln
+
+
+def _corotational_kinematics(L0: ndarray, u_local: ndarray):
+    Ln, beta, c, s = _corotational_chord(L0, u_local)
+
+    ub = np.empty((3, len(L0)))
+    ub[0] = Ln - L0
+    ub[1] = u_local[2] - beta
+    ub[2] = u_local[5] - beta
+    return ub, c, s, s / Ln, c / Ln
+
+
+def _linear_geometry(L0: ndarray, u_local: ndarray):
+    return None, None
+
+
+def _pdelta_op_geometry(L0: ndarray, u_local: ndarray):
+    return _GEO_PDELTA_OP[None, :, :] / L0[:, None, None], None
+
+
+def _pdelta_geometry(L0: ndarray, u_local: ndarray):
+    return _GEO_PDELTA_1[None, :, :] / L0[:, None, None], _GEO_PDELTA_2[None, :, :] / L0[:, None, None]**2
+
+
+def _corotational_geometry(L0: ndarray, u_local: ndarray):
+    Ln, _, c, s = _corotational_chord(L0, u_local)
+
+    # Translational 4×4 blocks of the geometric patterns (rotations have no entries)
+    a1 = np.array([[s**2, -s * c], [-s * c, c**2]]).transpose(2, 0, 1) / Ln[:, None, None]
+    a2 = np.array([[-2 * c * s, c**2 - s**2], [c**2 - s**2, 2 * c * s]]).transpose(2, 0, 1) / Ln[:, None, None]**2
+    T1 = np.zeros((len(L0), 6, 6))
+    T2 = np.zeros((len(L0), 6, 6))
+    for i, j, sign in ((0, 0, 1), (0, 3, -1), (3, 0, -1), (3, 3, 1)):
+        T1[:, i:i + 2, j:j + 2] = sign * a1
+        T2[:, i:i + 2, j:j + 2] = sign * a2
+    return T1, T2
+
+
+_KINEMATICS = {
+    LinearTransformation: (_linear_kinematics, _linear_geometry),
+    PDeltaTransformation2D_OP: (_linear_kinematics, _pdelta_op_geometry),
+    PDeltaTransformation2D: (_pdelta_kinematics, _pdelta_geometry),
+    CorotationalTransformation2D: (_corotational_kinematics, _corotational_geometry),
+}
+
+
+# ----------------------------------------------------------------------------- #
+#                              Element block                                    #
+# ----------------------------------------------------------------------------- #
+
+class FrameElementBlock:
+    """
+    Struct-of-arrays representation of `FrameElement`s sharing one transformation type.
+
+    Instead of looping over element objects, the block keeps the constant geometry
+    (L0, direction cosines, Tlg), the section stiffness (EA, EI) and the basic
+    deformations of all its elements in contiguous arrays, and evaluates `kb`, `Fb`,
+    `kl` and `kg` for the whole block with batched NumPy operations over
+    `(n_elem, 6, 6)` stacks. Forces are recovered from component-major `(6, n_elem)`
+    arrays with plain vector operations, without forming any stack, which keeps
+    residual-only evaluations (e.g. explicit time integration) cheap. Results match
+    the per-element `FrameElement.get_global_stiffness_matrix` / `force_recovery`.
+
+    The block owns the transformation state of its elements: the element objects
+    themselves are not updated, committed or reset by a vectorized `Model`. Elements
+    with deformation-driven sections (`FrameElement.ip_sections`, e.g. fiber sections)
+    are the exception: their basic force and stiffness are integrated one element at
+    a time from their integration point sections, which the block drives, commits
+    and resets.
+
+    Parameters
+    ----------
+    elements : list[FrameElement]
+        Elements of the block, all using the same transformation class.
+
+    Attributes
+    ----------
+    elements : list[FrameElement]
+        Elements represented by the block (order defines the block rows).
+    transformation_type : type[Transformation]
+        Shared transformation class.
+    idx : ndarray
+        (n, 6) global DOF indices.
+    idx_rows : ndarray
+        (6, n) contiguous transpose of `idx`, matching the component-major layout of
+        the force arrays (`forces.T.ravel()` scatters to `idx_rows.ravel()` without copies).
+    L0, c, s : ndarray
+        (n,) undeformed lengths and direction cosines.
+    Tlg : ndarray
+        (n, 6, 6) global → local transformation matrices.
+    EA, EI : ndarray
+        (n,) current section stiffness (unused for rows with integration point sections).
+    ub_trial, ub_commit : ndarray
+        (n, 3) trial and committed basic deformations.
+    """
+
+    def __init__(self, elements: list[FrameElement]):
+        transformation_type = type(elements[0].transformation)
+        if any(type(element.transformation) is not transformation_type for element in elements):
+            raise ValueError("All elements in a FrameElementBlock must share the transformation type")
+        if transformation_type not in _KINEMATICS:
+            raise ValueError(f"Unsupported transformation for FrameElementBlock: {transformation_type.__name__}")
+
+        self.elements = elements
+        self.transformation_type = transformation_type
+        self._kinematics, self._geometry = _KINEMATICS[transformation_type]
+        self.n = len(elements)
+
+        self.idx = np.array([element.idx for element in elements])
+
+        # Undeformed geometry
+        xi = np.array([element.node_i.coords for element in elements], dtype=float)
+        xj = np.array([element.node_j.coords for element in elements], dtype=float)
+        delta = xj - xi
+        self.L0 = np.linalg.norm(delta, axis=1)
+        self.c = delta[:, 0] / self.L0
+        self.s = delta[:, 1] / self.L0
+
+        self.Tlg = np.zeros((self.n, 6, 6))
+        for k in (0, 3):
+            self.Tlg[:, k, k] = self.c
+            self.Tlg[:, k, k + 1] = self.s
+            self.Tlg[:, k + 1, k] = -self.s
+            self.Tlg[:, k + 1, k + 1] = self.c
+            self.Tlg[:, k + 2, k + 2] = 1.0
+
+        # Shared sections are evaluated once
+        sections = {}
+        for element in elements:
+            sections.setdefault(id(element.section), element.section)
+        position = {key: i for i, key in enumerate(sections)}
+        self._sections = list(sections.values())
+        self._section_index = np.array([position[id(element.section)] for element in elements])
+        self.EA = np.zeros(self.n)
+        self.EI = np.zeros(self.n)
+
+        # Rows integrated from their integration point sections
+        self._ip_rows = np.array([r for r, element in enumerate(elements) if element.ip_sections is not None], dtype=int)
+        self._ip_elements = [elements[r] for r in self._ip_rows]
+        self._Fb_ip = np.zeros((len(self._ip_rows), 3))
+        self._kb_ip = np.array([element.get_basic_stiffness_matrix() for element in self._ip_elements]).reshape(-1, 3, 3)
+
+        # Basic system state, stored component-major (ub_trial/ub_commit are (n, 3)
+        # views), Tbl is kept as its (a, b, d, e) coefficients
+        self._ub = np.zeros((2, 3, self.n))
+        self.ub_trial = self._ub[0].T
+        self.ub_commit = self._ub[1].T
+        self.idx_rows = np.ascontiguousarray(self.idx.T)
+        self._u_local = np.zeros((6, self.n))
+        self._Tbl_coefficients = (1.0, 0.0, 0.0, 1.0 / self.L0)
+        
+        # Section stiffness of the last assembled tangent (dirty tracking)
+        self._stiffness_assembled: ndarray | None = None
+
+    # ---------------------------------------------------
+    # State determination
+    def update_section_stiffness(self) -> None:
+        """Gather EA and EI from the (unique) sections at their current tangent."""
+        if len(self._sections) == 1:
+            self.EA[:], self.EI[:] = self._sections[0].get_stiffness_matrix()[:2]
+            return
+        stiffness = np.array([section.get_stiffness_matrix() for section in self._sections], dtype=float)
+        self.EA[:] = stiffness[self._section_index, 0]
+        self.EI[:] = stiffness[self._section_index, 1]
+
+    def update_trial(self, u: ndarray) -> None:
+        """
+        Update the basic deformations of every element from a global displacement vector.
+
+        Parameters
+        ----------
+        u : ndarray
+            Global trial displacement vector, shape (system_ndof, 1) or (system_ndof,).
+        """
+        # Component-major (6, n) layout, every component is a contiguous row
+        u_global = np.asarray(u).reshape(-1)[self.idx_rows]
+        u_local = self._u_local
+        for k in (0, 3):
+            u_local[k] = self.c * u_global[k] + self.s * u_global[k + 1]
+            u_local[k + 1] = self.c * u_global[k + 1] - self.s * u_global[k]
+            u_local[k + 2] = u_global[k + 2]
+        self._ub[0], *self._Tbl_coefficients = self._kinematics(self.L0, u_local)
+        self.update_section_stiffness()
+        self._update_ip_sections()
+
+    def _update_ip_sections(self) -> None:
+        """Drive the integration point sections with the trial basic deformations."""
+        ub = self._ub[0]
+        for k, (row, element) in enumerate(zip(self._ip_rows, self._ip_elements)):
+            self._Fb_ip[k] = element.get_basic_force(ub[:, row])[:, 0]
+            self._kb_ip[k] = element.get_basic_stiffness_matrix()
+
+    def get_basic_stiffness_matrix(self) -> ndarray:
+        """Return the (n, 3, 3) stack of basic stiffness matrices."""
+        kb = np.zeros((self.n, 3, 3))
+        kb[:, 0, 0] = self.EA / self.L0
+        kb[:, 1, 1] = kb[:, 2, 2] = 4 * self.EI / self.L0
+        kb[:, 1, 2] = kb[:, 2, 1] = 2 * self.EI / self.L0
+        kb[self._ip_rows] = self._kb_ip
+        return kb
+
+    def get_basic_force(self) -> ndarray:
+        """Return the (n, 3) basic forces Fb = kb @ ub."""
+        ub = self._ub[0]
+        k_flexural = 2 * self.EI / self.L0
+        Fb = np.empty((3, self.n))
+        Fb[0] = self.EA / self.L0 * ub[0]
+        Fb[1] = k_flexural * (2 * ub[1] + ub[2])
+        Fb[2] = k_flexural * (ub[1] + 2 * ub[2])
+        Fb[:, self._ip_rows] = self._Fb_ip.T
+        return Fb.T
+
+    def get_Tbl(self) -> ndarray:
+        """Return the (n, 3, 6) local → basic transformation stack at the trial state."""
+        a, b, d, e = np.broadcast_arrays(*self._Tbl_coefficients, self.L0)[:4]
+        return _basic_transformation(a, b, d, e)
+
+    def force_recovery(self) -> tuple[ndarray, dict]:
+        """
+        Recover the element forces with vector operations over the block
+        (Fl = Tblᵀ Fb, Fg = Tlgᵀ Fl written out component by component),
+        without forming any (n, 6, 6) stack.
+
+        Returns:
+            Fg: (n, 6) global element force vectors
+            results: Dictionary with the intermediate (n, ·) arrays
+        """
+        Fb = self.get_basic_force()
+        N, M1, M2 = Fb.T
+        a, b, d, e = self._Tbl_coefficients
+        moment = M1 + M2
+
+        Fl = np.empty((6, self.n))
+        Fl[0] = -a * N - d * moment
+        Fl[1] = -b * N + e * moment
+        Fl[2] = M1
+        Fl[3] = -Fl[0]
+        Fl[4] = -Fl[1]
+        Fl[5] = M2
+
+        Fg = np.empty((6, self.n))
+        for k in (0, 3):
+            Fg[k] = self.c * Fl[k] - self.s * Fl[k + 1]
+            Fg[k + 1] = self.s * Fl[k] + self.c * Fl[k + 1]
+            Fg[k + 2] = Fl[k + 2]
+        Fl, Fg = Fl.T, Fg.T
+
+        results = {
+            'Fb': Fb,
+            'Fl': Fl,
+            'Fg': Fg,
+            'u_basic': self.ub_trial,
+        }
+        return Fg, results
+
+    def get_local_stiffness_matrix(self, Fb: ndarray | None = None) -> ndarray:
+        """Return the (n, 6, 6) local tangent stiffness (material + geometric)."""
+        kb = self.get_basic_stiffness_matrix()
+        if Fb is None:
+            Fb = self.get_basic_force()
+
+        Tbl = self.get_Tbl()
+        kl = Tbl.transpose(0, 2, 1) @ kb @ Tbl
+        T1, T2 = self._geometry(self.L0, self._u_local)
+        if T1 is not None:
+            kl += Fb[:, 0, None, None] * T1
+        if T2 is not None:
+            kl += (Fb[:, 1] + Fb[:, 2])[:, None, None] * T2
+        return kl
+
+    def get_global_stiffness_matrix(self, Fb: ndarray | None = None) -> ndarray:
+        """Return the (n, 6, 6) global tangent stiffness stack."""
+        kl = self.get_local_stiffness_matrix(Fb)
+        self._stiffness_assembled = self._stiffness_state()
+        return self.Tlg.transpose(0, 2, 1) @ kl @ self.Tlg
+    
+    def tangent_changed(self) -> bool:
+        """
+        Whether the tangent stack may differ from the last assembled one. Only a
+        block with a linear transformation and unchanged EA/EI (and integrated basic
+        stiffness) reports False.
+        """
+        if not self.transformation_type.linear_geometry or self._stiffness_assembled is None:
+            return True
+        return not np.array_equal(self._stiffness_state(), self._stiffness_assembled)
+
+    def _stiffness_state(self) -> ndarray:
+        return np.concatenate([self.EA, self.EI, self._kb_ip.ravel()])
+
+    # ---------------------------------------------------
+    # State management
+    def commit_state(self) -> None:
+        self._ub[1] = self._ub[0]
+        for element in self._ip_elements:
+            for section in element.ip_sections:
+                section.commit_state()
+
+    def reset_trial(self) -> None:
+        self._ub[0] = self._ub[1]
+        self._restore_ip_sections('reset_trial')
+
+    def revert_to_start(self) -> None:
+        self._ub[:] = 0.0
+        self._restore_ip_sections('revert_to_start')
+
+    def _restore_ip_sections(self, method: str) -> None:
+        for k, element in enumerate(self._ip_elements):
+            for section in element.ip_sections:
+                getattr(section, method)()
+            element._integrate_sections()
+            self._Fb_ip[k] = element._q_trial[:, 0]
+            self._kb_ip[k] = element.get_basic_stiffness_matrix()
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __str__(self):
+        return f"FrameElementBlock: {self.n} elements, {self.transformation_type.__name__}"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def build_element_blocks(elements: list) -> tuple[list[FrameElementBlock], list]:
+    """
+    Group elements into `FrameElementBlock`s by transformation type.
+
+    Only plain `FrameElement`s with a supported transformation are blocked; any
+    other element is returned unchanged so it can be processed one at a time.
+
+    Returns
+    -------
+    blocks : list[FrameElementBlock]
+        One block per transformation type present in `elements`.
+    remaining : list
+        Elements that could not be blocked.
+    """
+    groups: dict[type, list[FrameElement]] = {}
+    remaining = []
+    for element in elements:
+        transformation_type = type(getattr(element, 'transformation', None))
+        if type(element) is FrameElement and transformation_type in _KINEMATICS:
+            groups.setdefault(transformation_type, []).append(element)
+        else:
+            remaining.append(element)
+
+    blocks = [FrameElementBlock(group) for group in groups.values()]
+    return blocks, remaining
@@ -19,7 +19,12 @@ class Element(ABC):
         Unique element identifier.
     nodes : list
         List of connected node objects.
+    idx : ndarray
+        Global DOF indices.
+    restraints : ndarray
+        DOF restraint mask (True for restrained DOFs).
     """
+    __slots__ = ('id', 'nodes', 'idx', 'restraints')
 
     def __init__(self, id: int, nodes: List):
         self.id: int = id
@@ -74,18 +79,57 @@ class Element(ABC):
         """
         ...
 
+    def state_determination(self) -> Tuple[ndarray, ndarray]:
+        """
+        Return the resisting force vector and the tangent stiffness matrix
+        for assembly, evaluated together at the trial state.
+
+        Subclasses should override this to avoid evaluating their state twice.
+
+        Returns
+        -------
+        tuple
+            (F_assembly, K_assembly)
+        """
+        F_assembly, _ = self.force_recovery()
+        return F_assembly, self.get_assembly_stiffness_matrix()
+
+    def get_trial_tangent(self, results: dict) -> ndarray:
+        """
+        Return the assembly tangent at the state of the last `force_recovery`,
+        whose intermediate `results` are passed back (used by incremental assembly).
+
+        Subclasses should override this to avoid evaluating their state again.
+        """
+        return self.get_assembly_stiffness_matrix()
+
+    def tangent_changed(self) -> bool:
+        """
+        Whether the tangent at the current trial state may differ from the one
+        returned by the last `get_trial_tangent` call. Elements that cannot tell
+        return True and are always reassembled.
+        """
+        return True
+
     @abstractmethod
     def _elementIndices(self) -> Tuple[ndarray, ndarray]:
         """
-        Return the global DOF indices and their associated restraint flags.
+        Return the global DOF indices and their restraint mask (True if restrained).
 
         Returns
         -------
         tuple
-            (global_dof_indices, restraint_flags)
+            (global_dof_indices, restraint_mask)
         """
         ...
 
+    def update_indices(self) -> None:
+        """
+        Re-derive the global DOF indices and restraint mask from the element nodes,
+        e.g. after the nodes have been renumbered by a DOFNumberer.
+        """
+        self.idx, self.restraints = self._elementIndices()
+
     @abstractmethod
     def plot(self, ax: plt.Axes, **kwargs) -> None:
         """
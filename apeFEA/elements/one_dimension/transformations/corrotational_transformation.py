@@ -1,3 +1,4 @@
+import math
 import numpy as np
 from numpy import ndarray
 from typing import TYPE_CHECKING
@@ -32,93 +33,88 @@ class CorotationalTransformation2D(Transformation):
     ub_previous : ndarray
         Basic deformation from previous iteration (for ΔΔu).
     """
-    def __init__(self, element: "FrameElement"):
-        self.element = element
-        self.node_i = element.node_i
-        self.node_j = element.node_j
-        
-        # State vectors for basic system
-        self.ub_trial = np.zeros((3,1))
-        self.ub_commit = np.zeros((3,1))
-        self.ub_previous = np.zeros((3,1))
-
-    def _trans(self, u_trial: np.ndarray) -> np.ndarray:
-        return u_trial[:2, 0]
+    __slots__ = ('_Delta_ul_x', '_Delta_ul_y', '_Ln', '_beta', '_Tbl', '_T_geo_Fb1', '_T_geo_Fb2')
 
-    def _pos(self, node) -> np.ndarray:
-        return node.coords + self._trans(node.u_trial)
+    def __init__(self, element: "FrameElement"):
+        # Element, nodes and state vectors for basic system
+        self._init_state(element)
+
+        self._init_reference_geometry()
+        self._update_geometry(np.zeros(6))
+
+    def _update_geometry(self, u_local: ndarray) -> None:
+        """
+        Cache the corotated chord (Ln, β), Tbl and the geometric matrices for the
+        local displacements `u_local`; everything below is evaluated once per update.
+        """
+        u1, u2, _, u4, u5, _ = u_local.tolist()
+        self._Delta_ul_x = u4 - u1
+        self._Delta_ul_y = u5 - u2
+        Lx = self._L0 + self._Delta_ul_x
+        Ly = self._Delta_ul_y
+        L = self._Ln = math.hypot(Lx, Ly)
+        self._beta = math.atan2(Ly, Lx)
+        c = Lx / L
+        s = Ly / L
+
+        # Chord direction m = ∂Ln/∂u_local and normal n = -Ln ∂β/∂u_local
+        m = np.array([-c, -s, 0.0, c, s, 0.0])
+        n = np.array([-s, c, 0.0, s, -c, 0.0])
+
+        # Tbl = [[-c, -s, 0, c, s, 0], [-s/L, c/L, 1, s/L, -c/L, 0], [-s/L, c/L, 0, s/L, -c/L, 1]]
+        self._Tbl = np.empty((3, 6))
+        self._Tbl[0] = m
+        self._Tbl[1:] = n / L
+        self._Tbl[1, 2] = 1.0
+        self._Tbl[2, 5] = 1.0
+
+        # Geometric patterns: T1 = n nᵀ / L, T2 = -(m nᵀ + n mᵀ) / L²
+        self._T_geo_Fb1 = n[:, None] * (n / L)
+        mn = m[:, None] * (n / L**2)
+        self._T_geo_Fb2 = -(mn + mn.T)
 
     def get_L0(self) -> float:
-        return np.linalg.norm(self.node_j.coords - self.node_i.coords)
+        return self._L0
 
     def get_length(self) -> float:
-        return np.linalg.norm(self._pos(self.node_j) - self._pos(self.node_i))
+        """Deformed chord length at the last `update_trial`."""
+        return self._Ln
 
     def _get_corrotational_parameters(self):
-        L0 = self.get_L0()
-        Delta_ul_x = u_trial_local[3, 0] - u_trial_local[0, 0]
-        Delta_ul_y = u_trial_local[4, 0] - u_trial_local[1, 0]
-        Lx = L0 + Delta_ul_x
-        Ly = Delta_ul_y
-        Ln= np.sqrt(Lx**2 + Ly**2)
-        beta = np.arctan2(Delta_ul_y, Ln)
-        return beta, Delta_ul_x, Delta_ul_y
-
-    def get_cosine_director(self) -> tuple[float, float]:
-        delta = self.node_j.coords - self.node_i.coords
-        L = self.get_L0()
-        alpha = np.arctan2(delta[1], delta[0])
-        c = np.cos(alpha)
-        s = np.sin(alpha)
-        return c, s, L
+        return self._beta, self._Delta_ul_x, self._Delta_ul_y
+
+    def get_cosine_director(self) -> tuple[float, float, float]:
+        return self._c, self._s, self._L0
 
     def get_Tbl(self) -> ndarray:
-        L = self.get_length()
-        beta, _, _ = self._get_corrotational_parameters()
-        c = np.cos(beta)
-        s = np.sin(beta)
-        return np.array([
-            [-c, -s, 0,  c,  s, 0],
-            [-s/L,  c/L, 1,  s/L, -c/L, 0],
-            [-s/L,  c/L, 0,  s/L, -c/L, 1]
-        ])
+        return self._Tbl
 
     def get_Tlg(self) -> ndarray:
-        c, s, L = self.get_cosine_director()
-        return np.array([
-            [ c,  s, 0, 0, 0, 0],
-            [-s,  c, 0, 0, 0, 0],
-            [ 0,  0, 1, 0, 0, 0],
-            [ 0,  0, 0,  c,  s, 0],
-            [ 0,  0, 0, -s,  c, 0],
-            [ 0,  0, 0,  0,  0, 1]
-        ])
+        return self._Tlg
 
     def update_trial(self):
-        """Update the basic deformation ub_trial."""
-        L0 = self.get_L0()
-        Ln = self.get_length()
-        beta, _, _ = self._get_corrotational_parameters()
+        """Update the basic deformation ub_trial (and the cached deformed geometry)."""
+        self._update_geometry(self._get_local_trial_disp())
 
         theta_i = self.node_i.u_trial[2, 0]
         theta_j = self.node_j.u_trial[2, 0]
 
-        self.ub_previous[:] = self.ub_trial
-        self.ub_trial[0, 0] = Ln - L0
-        self.ub_trial[1, 0] = theta_i - beta
-        self.ub_trial[2, 0] = theta_j - beta
+        ub = self._ub
+        ub[2] = ub[0]
+        ub[0, 0, 0] = self._Ln - self._L0
+        ub[0, 1, 0] = theta_i - self._beta
+        ub[0, 2, 0] = theta_j - self._beta
 
     def commit_state(self):
-        self.ub_commit[:] = self.ub_trial
+        self._ub[1] = self._ub[0]
 
     def reset_trial(self):
-        self.ub_trial[:] = self.ub_commit
-        self.ub_previous[:] = self.ub_commit
+        self._ub[0] = self._ub[2] = self._ub[1]
+        self._update_geometry(self._get_local_trial_disp())
 
     def revert_to_start(self):
-        self.ub_trial[:] = 0.0
-        self.ub_commit[:] = 0.0
-        self.ub_previous[:] = 0.0
+        self._ub[:] = 0.0
+        self._update_geometry(np.zeros(6))
 
     def get_basic_trial_disp(self) -> ndarray:
         return self.ub_trial
@@ -130,27 +126,4 @@ class CorotationalTransformation2D(Transformation):
         return self.ub_trial - self.ub_previous
 
     def geometric_transformation_matrix(self) -> tuple[ndarray, ndarray]:
-        L = self.get_length()
-        beta, _, _ = self._get_corrotational_parameters()
-        c = np.cos(beta)
-        s = np.sin(beta)
-
-        T_geo_Fb1 = (1/L) * np.array([
-            [ s**2, -s*c, 0, -s**2,  s*c, 0],
-            [-s*c,  c**2, 0,  s*c, -c**2, 0],
-            [0, 0, 0, 0, 0, 0],
-            [-s**2,  s*c, 0,  s**2, -s*c, 0],
-            [ s*c, -c**2, 0, -s*c,  c**2, 0],
-            [0, 0, 0, 0, 0, 0]
-        ])
-        
-        T_geo_Fb2 = (1/L**2) * np.array([
-            [-2*c*s,  c**2 - s**2, 0,  2*c*s, -c**2 + s**2, 0],
-            [ c**2 - s**2,  2*c*s, 0, -c**2 + s**2, -2*c*s, 0],
-            [0, 0, 0, 0, 0, 0],
-            [ 2*c*s, -c**2 + s**2, 0, -2*c*s,  c**2 - s**2, 0],
-            [-c**2 + s**2, -2*c*s, 0,  c**2 - s**2,  2*c*s, 0],
-            [0, 0, 0, 0, 0, 0]
-        ])
-        
-        return T_geo_Fb1, T_geo_Fb2
+        return self._T_geo_Fb1, self._T_geo_Fb2
@@ -2,7 +2,7 @@ import numpy as np
 from numpy import ndarray
 from typing import TYPE_CHECKING
 
-from .transformation import Transformation
+from .transformation import Transformation, linear_basic_matrix, ZERO_6x6
 from apeFEA.core.node import Node
 
 if TYPE_CHECKING:
@@ -37,83 +37,50 @@ class LinearTransformation(Transformation):
     ub_previous : ndarray
         Basic deformation from previous iteration (for ΔΔu).
     """
+    __slots__ = ('_Tbl',)
+
+    linear_geometry = True
+    
     def __init__(self, element: "FrameElement"):
-        self.element = element
-        self.node_i = element.node_i
-        self.node_j = element.node_j
-        
-        # State vectors for basic system
-        self.ub_trial = np.zeros((3,1))
-        self.ub_commit = np.zeros((3,1))
-        self.ub_previous = np.zeros((3,1))
+        # Element, nodes and state vectors for basic system
+        self._init_state(element)
+
+        # Constant geometry: Tlg and Tbl (the geometric matrices are zero)
+        self._init_reference_geometry()
+        self._Tbl = linear_basic_matrix(self._L0)
 
     def get_length(self) -> float:
-        return np.linalg.norm(self.node_j.coords - self.node_i.coords)
+        return self._L0
     
     def get_L0(self) -> float:
-        return np.linalg.norm(self.node_j.coords - self.node_i.coords)
+        return self._L0
 
     def get_cosine_director(self) -> tuple[float, float, float]:
-        delta_vector = self.node_j.coords - self.node_i.coords
-        length = np.linalg.norm(delta_vector)
-        unit_vector = delta_vector / length if length > 0 else np.zeros_like(delta_vector)
-        c = unit_vector[0]
-        s = unit_vector[1]
-        return c, s, length
+        return self._c, self._s, self._L0
 
     def get_Tbl(self) -> ndarray:
-        L = self.get_length()
-        Tbl = np.array([
-            [-1,  0, 0,  1,  0, 0],
-            [ 0, 1/L, 1,  0, -1/L, 0],
-            [ 0, 1/L, 0,  0, -1/L, 1],
-        ])
-        return Tbl
+        return self._Tbl
 
     def get_Tlg(self) -> ndarray:
-        c, s, _ = self.get_cosine_director()
-        Tlg = np.array([
-            [ c,  s, 0,  0, 0, 0],
-            [-s,  c, 0,  0, 0, 0],
-            [ 0,  0, 1,  0, 0, 0],
-            [ 0,  0, 0,  c, s, 0],
-            [ 0,  0, 0, -s, c, 0],
-            [ 0,  0, 0,  0, 0, 1],
-        ])
-        return Tlg
+        return self._Tlg
 
     def geometric_transformation_matrix(self) -> ndarray:
         """Return geometric stiffness for linear transformation (classical axial P–Δ only)."""
-        L = self.get_length()
-        c, s, _ = self.get_cosine_director()
-
-        T1=np.zeros((6, 6))  # Initialize T1 as a zero matrix
-
-        T2 = np.zeros((6, 6))  # Initialize T2 as a zero matrix
-
-        return T1, T2
+        return ZERO_6x6, ZERO_6x6
     
     def reset_trial(self):
-        self.ub_trial[:] = self.ub_commit
-        self.ub_previous[:] = self.ub_commit
+        self._ub[0] = self._ub[2] = self._ub[1]
         
     def update_trial(self):
         """
         Updates the basic trial displacement `ub_trial` assuming small displacements.
         """
-        self.ub_previous[:] = self.ub_trial
-
-        u_global = np.vstack([self.node_i.u_trial, self.node_j.u_trial])  # 6x1
-        Tlg = self.get_Tlg()  # 6x6
-        u_local = Tlg @ u_global  # transform to local coords
-
-        Tbl = self.get_Tbl()  # 3x6
-        self.ub_trial[:] = Tbl @ u_local  # basic system update
+        ub = self._ub
+        ub[2] = ub[0]
+        ub[0, :, 0] = self._Tbl @ self._get_local_trial_disp()  # basic system update
         
     def revert_to_start(self):
-        self.ub_trial[:] = 0.0
-        self.ub_commit[:] = 0.0
-        self.ub_previous[:] = 0.0
+        self._ub[:] = 0.0
 
     def get_basic_trial_disp(self) -> ndarray:
         return self.ub_trial
@@ -125,4 +92,4 @@ class LinearTransformation(Transformation):
         return self.ub_trial - self.ub_previous
     
     def commit_state(self):
-        self.ub_commit[:] = self.ub_trial
+        self._ub[1] = self._ub[0]
@@ -1,13 +1,38 @@
+import math
 import numpy as np
+from functools import lru_cache
 from numpy import ndarray
 from typing import TYPE_CHECKING
 
-from .transformation import Transformation
+from .transformation import Transformation, read_only
 from apeFEA.core.node import Node
 
 if TYPE_CHECKING:
     from apeFEA.elements.one_dimension.frame_element import FrameElement
 
+
+@lru_cache(maxsize=1024)
+def _pdelta_geometric_matrices(L0: float) -> tuple[ndarray, ndarray]:
+    """Read-only geometric pattern matrices for the length L0, shared by equal-length elements."""
+    T_geo_Fb1 = (1 / L0) * np.array([
+        [0, 0, 0, 0, 0, 0],
+        [0, 1, 0, 0, -1, 0],
+        [0, 0, 0, 0, 0, 0],
+        [0, 0, 0, 0, 0, 0],
+        [0, -1, 0, 0, 1, 0],
+        [0, 0, 0, 0, 0, 0]
+    ])
+    T_geo_Fb2 = (1 / L0**2) * np.array([
+        [0, 0, 0, 0, 0, 0],
+        [0, 2, 1, 0, -2, -1],
+        [0, 1, 2, 0, -1, -2],
+        [0, 0, 0, 0, 0, 0],
+        [0, -2, -1, 0, 2, 1],
+        [0, -1, -2, 0, 1, 2],
+    ])
+    return read_only(T_geo_Fb1), read_only(T_geo_Fb2)
+
+
 class PDeltaTransformation2D(Transformation):
     """
     P–Δ geometric transformation for 2D frame elements (consistent formulation).
@@ -32,52 +57,30 @@ class PDeltaTransformation2D(Transformation):
     ub_previous : ndarray
         Basic deformation vector from previous iteration (ΔΔu computation).
     """
-    def __init__(self, element: "FrameElement"):
-        self.element = element
-        self.node_i = element.node_i
-        self.node_j = element.node_j
-        
-        # State vectors for basic system
-        self.ub_trial = np.zeros((3,1))
-        self.ub_commit = np.zeros((3,1))
-        self.ub_previous = np.zeros((3,1))
-
-    def _trans(self, u_trial: np.ndarray) -> np.ndarray:
-        return u_trial[:2, 0]
-
-    def _pos(self, node) -> np.ndarray:
-        return node.coords + self._trans(node.u_trial)
-
-    def get_L0(self) -> float:
-        return np.linalg.norm(self.node_j.coords - self.node_i.coords)
-
-    def get_length(self) -> float:
-        self.get_L0
-
-    def _get_corrotational_parameters(self):
-        L0 = self.get_L0()
-        u_trial_global = np.vstack((self.node_i.u_trial, self.node_j.u_trial))
-        u_trial_local = self.get_Tlg() @ u_trial_global
-        Delta_ul_x = u_trial_local[3, 0] - u_trial_local[0, 0]
-        Delta_ul_y = u_trial_local[4, 0] - u_trial_local[1, 0]
-        beta = np.arctan2(Delta_ul_y, (L0 + Delta_ul_x))
-        return beta, Delta_ul_x, Delta_ul_y
-
-    def get_cosine_director(self) -> tuple[float, float]:
-        delta = self.node_j.coords - self.node_i.coords
-        L = self.get_L0()
-        alpha = np.arctan2(delta[1], delta[0])
-        c = np.cos(alpha)
-        s = np.sin(alpha)
-        return c, s, L
+    __slots__ = ('_Delta_ul_x', '_Delta_ul_y', '_Ln', '_beta', '_Tbl', '_T_geo_Fb1', '_T_geo_Fb2')
 
-    def get_Tbl(self) -> ndarray:
-        L0 = self.get_L0()
-        _, _, Delta_ul_y = self._get_corrotational_parameters()
-        
-        Tbl= np.array(
+    def __init__(self, element: "FrameElement"):
+        # Element, nodes and state vectors for basic system
+        self._init_state(element)
+
+        # Constant geometry and geometric pattern matrices
+        self._init_reference_geometry()
+        self._T_geo_Fb1, self._T_geo_Fb2 = _pdelta_geometric_matrices(self._L0)
+        self._update_geometry(np.zeros(6))
+
+    def _update_geometry(self, u_local: ndarray) -> None:
+        """Cache the chord components, Ln, β and Tbl for the local displacements `u_local`."""
+        L0 = self._L0
+        u1, u2, _, u4, u5, _ = u_local.tolist()
+        self._Delta_ul_x = u4 - u1
+        self._Delta_ul_y = u5 - u2
+        self._Ln = math.hypot(L0 + self._Delta_ul_x, self._Delta_ul_y)
+        self._beta = math.atan2(self._Delta_ul_y, L0 + self._Delta_ul_x)
+
+        d = self._Delta_ul_y / L0
+        self._Tbl = np.array(
             [
-                [-1, -Delta_ul_y/L0, 0, 1, Delta_ul_y/L0, 0],
+                [-1, -d, 0, 1, d, 0],
                 [0, 1/L0, 1, 0, -1/L0, 0],
                 [0, 1/L0, 0, 0, -1/L0, 1]
             ]
@@ -90,52 +93,49 @@ class PDeltaTransformation2D(Transformation):
         #         [-Delta_ul_y/L0**2, 1/L0, 0, Delta_ul_y/L0**2, -1/L0, 1]
         #     ]
         # )
-        
-        
-        return Tbl
+
+    def get_L0(self) -> float:
+        return self._L0
+
+    def get_length(self) -> float:
+        """Deformed chord length at the last `update_trial`."""
+        return self._Ln
+
+    def _get_corrotational_parameters(self):
+        return self._beta, self._Delta_ul_x, self._Delta_ul_y
+
+    def get_cosine_director(self) -> tuple[float, float, float]:
+        return self._c, self._s, self._L0
+
+    def get_Tbl(self) -> ndarray:
+        return self._Tbl
 
     def get_Tlg(self) -> ndarray:        
-        c, s, L = self.get_cosine_director()
-        
-        return np.array([
-            [ c,  s, 0, 0, 0, 0],
-            [-s,  c, 0, 0, 0, 0],
-            [ 0,  0, 1, 0, 0, 0],
-            [ 0,  0, 0,  c,  s, 0],
-            [ 0,  0, 0, -s,  c, 0],
-            [ 0,  0, 0,  0,  0, 1]
-        ])
+        return self._Tlg
 
     def update_trial(self):
-        
-        # self.ub_previous[:] = self.ub_trial
-        # Tbl = self.get_Tbl()
-        # u_trial_global = np.vstack((self.node_i.u_trial, self.node_j.u_trial))
-        # u_trial_local = self.get_Tlg() @ u_trial_global
-        # self.ub_trial[:] = Tbl @ u_trial_local  # basic system update
-        
         """Update the basic deformation ub_trial."""
-        L0 = self.get_L0()
-        L = self.get_length()
-        _, Delta_ul_x, Delta_ul_y = self._get_corrotational_parameters()
+        self._update_geometry(self._get_local_trial_disp())
+        L0 = self._L0
+        Delta_ul_x, Delta_ul_y = self._Delta_ul_x, self._Delta_ul_y
 
-        self.ub_previous[:] = self.ub_trial
-        self.ub_trial[0, 0] = Delta_ul_x + Delta_ul_y**2/(2*L0)
-        self.ub_trial[1, 0] = self.node_i.u_trial[2, 0] - Delta_ul_y/L0
-        self.ub_trial[2, 0] = self.node_j.u_trial[2, 0] - Delta_ul_y/L0
+        ub = self._ub
+        ub[2] = ub[0]
+        ub[0, 0, 0] = Delta_ul_x + Delta_ul_y**2/(2*L0)
+        ub[0, 1, 0] = self.node_i.u_trial[2, 0] - Delta_ul_y/L0
+        ub[0, 2, 0] = self.node_j.u_trial[2, 0] - Delta_ul_y/L0
 
 
     def commit_state(self):
-        self.ub_commit[:] = self.ub_trial
+        self._ub[1] = self._ub[0]
 
     def reset_trial(self):
-        self.ub_trial[:] = self.ub_commit
-        self.ub_previous[:] = self.ub_commit
+        self._ub[0] = self._ub[2] = self._ub[1]
+        self._update_geometry(self._get_local_trial_disp())
 
     def revert_to_start(self):
-        self.ub_trial[:] = 0.0
-        self.ub_commit[:] = 0.0
-        self.ub_previous[:] = 0.0
+        self._ub[:] = 0.0
+        self._update_geometry(np.zeros(6))
 
     def get_basic_trial_disp(self) -> ndarray:
         return self.ub_trial
@@ -147,25 +147,4 @@ class PDeltaTransformation2D(Transformation):
         return self.ub_trial - self.ub_previous
 
     def geometric_transformation_matrix(self) -> tuple[ndarray, ndarray]:
-        L = self.get_length()
-        L0 = self.get_L0()
-
-        T_geo_Fb1 = (1 / L0) * np.array([
-            [0, 0, 0, 0, 0, 0],
-            [0, 1, 0, 0, -1, 0],
-            [0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0],
-            [0, -1, 0, 0, 1, 0],
-            [0, 0, 0, 0, 0, 0]
-        ])
-        
-        T_geo_Fb2 = (1 / L0**2) * np.array([
-            [0, 0, 0, 0, 0, 0],
-            [0, 2, 1, 0, -2, -1],
-            [0, 1, 2, 0, -1, -2],
-            [0, 0, 0, 0, 0, 0],
-            [0, -2, -1, 0, 2, 1],
-            [0, -1, -2, 0, 1, 2],
-        ])
-        
-        return T_geo_Fb1, T_geo_Fb2
+        return self._T_geo_Fb1, self._T_geo_Fb2
@@ -1,13 +1,27 @@
 import numpy as np
+from functools import lru_cache
 from numpy import ndarray
 from typing import TYPE_CHECKING, Tuple
 
-from .transformation import Transformation
+from .transformation import Transformation, linear_basic_matrix, read_only, ZERO_6x6
 
 if TYPE_CHECKING:
     from apeFEA.elements.one_dimension.frame_element import FrameElement
 
 
+@lru_cache(maxsize=1024)
+def _pdelta_op_geometric_matrix(L: float) -> ndarray:
+    """Read-only P–Δ pattern matrix for the length L, shared by equal-length elements."""
+    return read_only((1 / L) * np.array([
+        [1, 0, 0, -1, 0, 0],
+        [0, 1, 0, 0, -1, 0],
+        [0, 0, 0, 0, 0, 0],
+        [-1, 0, 0, 1, 0, 0],
+        [0, -1, 0, 0, 1, 0],
+        [0, 0, 0, 0, 0, 0]
+    ]))
+
+
 class PDeltaTransformation2D_OP(Transformation):
     """
     OpenSees-style P–Δ transformation (linear kinematics + geometric stiffness).
@@ -17,23 +31,32 @@ class PDeltaTransformation2D_OP(Transformation):
     - Transformation matrix is linear (based on initial geometry)
     - Geometric nonlinearity is captured through ul14 and P–Δ force/stiffness
     """
+    __slots__ = ('ul14', '_Tbl', '_T_geo_Fb1')
 
     def __init__(self, element: "FrameElement"):
-        self.element = element
-        self.node_i = element.node_i
-        self.node_j = element.node_j
-
-        # Reference geometry
-        delta = self.node_j.coords - self.node_i.coords
-        self.L0 = np.linalg.norm(delta)
-        self.cos_theta = delta[0] / self.L0
-        self.sin_theta = delta[1] / self.L0
-
-        self.ub_trial = np.zeros((3, 1))
-        self.ub_commit = np.zeros((3, 1))
-        self.ub_previous = np.zeros((3, 1))
+        # Element, nodes and state vectors for basic system
+        self._init_state(element)
         self.ul14 = 0.0  # for leaning-column effect
 
+        # Reference geometry (constant)
+        self._init_reference_geometry()
+
+        # Linear kinematics: Tbl and the geometric pattern matrix are constant
+        self._Tbl = linear_basic_matrix(self._L0)
+        self._T_geo_Fb1 = _pdelta_op_geometric_matrix(self._L0)
+
+    @property
+    def L0(self) -> float:
+        return self._L0
+
+    @property
+    def cos_theta(self) -> float:
+        return self._c
+
+    @property
+    def sin_theta(self) -> float:
+        return self._s
+
     def get_L0(self) -> float:
         return self.L0
 
@@ -44,55 +67,31 @@ class PDeltaTransformation2D_OP(Transformation):
         return self.cos_theta, self.sin_theta, self.L0
 
     def get_Tlg(self) -> ndarray:
-        c, s = self.cos_theta, self.sin_theta
-        return np.array([
-            [ c,  s, 0, 0, 0, 0],
-            [-s,  c, 0, 0, 0, 0],
-            [ 0,  0, 1, 0, 0, 0],
-            [ 0,  0, 0,  c,  s, 0],
-            [ 0,  0, 0, -s,  c, 0],
-            [ 0,  0, 0,  0,  0, 1]
-        ])
+        return self._Tlg
 
     def get_Tbl(self) -> np.ndarray:
         """
         Transformation matrix from local DOFs to basic DOFs
         for OpenSees-style linear PDelta transformation (constant matrix).
         """
-        L = self.get_length()  # or self.L0 for fixed geometry
-        delta_ul_y = 0  # vertical displacement difference
-        Tbl = np.array([
-            [-1,  -delta_ul_y/L,  0,   1,   delta_ul_y/L,  0],     # axial deformation (u_jx - u_ix)
-            [ 0,  1/L,  1,   0,  -1/L,  0],     # curvature at node i
-            [ 0,  1/L,  0,   0,  -1/L,  1],     # curvature at node j
-        ])
-        
-        return Tbl
+        return self._Tbl
 
     def update_trial(self):
         """
         Updates the basic trial displacement `ub_trial` assuming small displacements.
         """
-        self.ub_previous[:] = self.ub_trial
-
-        u_global = np.vstack([self.node_i.u_trial, self.node_j.u_trial])  # 6x1
-        Tlg = self.get_Tlg()  # 6x6
-        u_local = Tlg @ u_global  # transform to local coords
-
-        Tbl = self.get_Tbl()  # 3x6
-        self.ub_trial[:] = Tbl @ u_local  # basic system update
+        ub = self._ub
+        ub[2] = ub[0]
+        ub[0, :, 0] = self._Tbl @ self._get_local_trial_disp()  # basic system update
 
     def commit_state(self) -> None:
-        self.ub_commit[:] = self.ub_trial
+        self._ub[1] = self._ub[0]
 
     def reset_trial(self) -> None:
-        self.ub_trial[:] = self.ub_commit
-        self.ub_previous[:] = self.ub_commit
+        self._ub[0] = self._ub[2] = self._ub[1]
 
     def revert_to_start(self) -> None:
-        self.ub_trial[:] = 0.0
-        self.ub_commit[:] = 0.0
-        self.ub_previous[:] = 0.0
+        self._ub[:] = 0.0
 
     def get_basic_trial_disp(self) -> ndarray:
         return self.ub_trial
@@ -113,18 +112,4 @@ class PDeltaTransformation2D_OP(Transformation):
         These are used in the element as:
             K_geo = Fb[0] * T_geo_Fb1 + (Fb[1] + Fb[2]) * T_geo_Fb2
         """
-        L = self.get_L0()
-
-        T_geo_Fb1 = (1 / L) * np.array([
-            [1, 0, 0, -1, 0, 0],
-            [0, 1, 0, 0, -1, 0],
-            [0, 0, 0, 0, 0, 0],
-            [-1, 0, 0, 1, 0, 0],
-            [0, -1, 0, 0, 1, 0],
-            [0, 0, 0, 0, 0, 0]
-        ])
-
-        # T_geo_Fb1 = np.zeros((6, 6))
-        T_geo_Fb2 = np.zeros((6, 6))  # not used in OpenSees PDelta
-
-        return T_geo_Fb1, T_geo_Fb2
+        return self._T_geo_Fb1, ZERO_6x6  # T_geo_Fb2 is not used in OpenSees PDelta
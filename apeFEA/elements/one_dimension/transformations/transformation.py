@@ -1,6 +1,44 @@
+import numpy as np
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from numpy import ndarray
-from typing import Tuple
+from typing import Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from apeFEA.elements.one_dimension.frame_element import FrameElement
+
+
+def read_only(matrix: ndarray) -> ndarray:
+    """Mark `matrix` read-only (so that it can be shared between elements) and return it."""
+    matrix.flags.writeable = False
+    return matrix
+
+
+@lru_cache(maxsize=1024)
+def global_to_local_matrix(c: float, s: float) -> ndarray:
+    """Read-only 6×6 Tlg for the direction cosines (c, s), shared by parallel elements."""
+    return read_only(np.array([
+        [ c,  s, 0, 0, 0, 0],
+        [-s,  c, 0, 0, 0, 0],
+        [ 0,  0, 1, 0, 0, 0],
+        [ 0,  0, 0,  c,  s, 0],
+        [ 0,  0, 0, -s,  c, 0],
+        [ 0,  0, 0,  0,  0, 1]
+    ]))
+
+
+@lru_cache(maxsize=1024)
+def linear_basic_matrix(L: float) -> ndarray:
+    """Read-only 3×6 small-displacement Tbl for the length L, shared by equal-length elements."""
+    return read_only(np.array([
+        [-1,  0,  0,   1,   0,  0],     # axial deformation (u_jx - u_ix)
+        [ 0,  1/L,  1,   0,  -1/L,  0],     # rotation at node i
+        [ 0,  1/L,  0,   0,  -1/L,  1],     # rotation at node j
+    ]))
+
+
+ZERO_6x6 = read_only(np.zeros((6, 6)))
+
 
 class Transformation(ABC):
     """
@@ -12,8 +50,72 @@ class Transformation(ABC):
     - local (element-aligned) coordinates
     - basic deformation modes
     
-    Concrete subclasses must implement all transformation logic.
+    Concrete subclasses must implement all transformation logic. The undeformed
+    geometry (L0, direction cosines and Tlg) is constant and is computed once by
+    `_init_reference_geometry`; quantities of the deformed configuration are
+    computed once per `update_trial` and cached by the subclasses.
+
+    The classes are slotted. The basic deformations ub_trial, ub_commit and
+    ub_previous are the rows of one (3, 3, 1) array, and constant matrices are
+    read-only and shared between elements with the same geometry.
+
+    Attributes:
+        linear_geometry (bool): True if Tbl and Tlg are constant and there is no
+            geometric stiffness, so the element tangent only changes with the
+            basic stiffness (used for dirty tracking in incremental assembly).
     """
+    __slots__ = ('element', 'node_i', 'node_j', '_L0', '_c', '_s', '_Tlg', '_ub')
+
+    linear_geometry: bool = False
+
+    def _init_state(self, element: "FrameElement") -> None:
+        """Store the element and its end nodes and zero the basic deformations."""
+        self.element = element
+        self.node_i = element.node_i
+        self.node_j = element.node_j
+        self._ub = np.zeros((3, 3, 1))
+
+    @property
+    def ub_trial(self) -> ndarray:
+        """Trial basic deformation [ΔL, θ_i, θ_j]ᵀ (3, 1)."""
+        return self._ub[0]
+
+    @ub_trial.setter
+    def ub_trial(self, value: ndarray) -> None:
+        self._ub[0] = value
+
+    @property
+    def ub_commit(self) -> ndarray:
+        """Committed (last converged) basic deformation (3, 1)."""
+        return self._ub[1]
+
+    @ub_commit.setter
+    def ub_commit(self, value: ndarray) -> None:
+        self._ub[1] = value
+
+    @property
+    def ub_previous(self) -> ndarray:
+        """Basic deformation of the previous iteration (3, 1), for ΔΔu."""
+        return self._ub[2]
+
+    @ub_previous.setter
+    def ub_previous(self, value: ndarray) -> None:
+        self._ub[2] = value
+
+    def _init_reference_geometry(self) -> None:
+        """
+        Compute the undeformed length, direction cosines and the (read-only)
+        global → local matrix Tlg from the node coordinates.
+        """
+        delta = np.asarray(self.node_j.coords, dtype=float) - np.asarray(self.node_i.coords, dtype=float)
+        self._L0 = float(np.hypot(delta[0], delta[1]))
+        c, s = (delta / self._L0) if self._L0 > 0 else (0.0, 0.0)
+        self._c, self._s = float(c), float(s)
+        self._Tlg = global_to_local_matrix(self._c, self._s)
+
+    def _get_local_trial_disp(self) -> ndarray:
+        """Local trial displacements (6,) of the element end nodes."""
+        return self._Tlg @ np.concatenate((self.node_i.u_trial[:, 0], self.node_j.u_trial[:, 0]))
 
     @abstractmethod
     def get_length(self) -> float:
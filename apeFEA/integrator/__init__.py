@@ -1,5 +1,20 @@
 from .load_control import LoadControl
+from .path_following import PathFollowingIntegrator
+from .displacement_control import DisplacementControl
+from .arc_length import ArcLength
+from .transient import TransientIntegrator, Newmark, HHT, GeneralizedAlpha
+from .central_difference import CentralDifference
+from .modal_superposition import ModalSuperposition
 
 __all__ = [
-    "LoadControl"
+    "LoadControl",
+    "PathFollowingIntegrator",
+    "DisplacementControl",
+    "ArcLength",
+    "TransientIntegrator",
+    "Newmark",
+    "HHT",
+    "GeneralizedAlpha",
+    "CentralDifference",
+    "ModalSuperposition"
 ]
\ No newline at end of file
@@ -0,0 +1,108 @@
+import numpy as np
+
+from apeFEA.core.model import Model
+from apeFEA.recorder.recorder_abstraction import Recorder
+from apeFEA.solver.newton_raphson import NewtonRaphsonSolver
+from .path_following import PathFollowingIntegrator
+
+
+class ArcLength(PathFollowingIntegrator):
+    """
+    Arc-length (Riks/Crisfield) static analysis.
+
+    Every step moves a fixed distance Δs along the equilibrium path in the
+    (displacement, load factor) space, so both load and displacement limit points
+    (snap-through, snap-back) can be passed. The constraint is
+
+        Δuᵀ Δu + ψ² Δλ² Pᵀ P = Δs²
+
+    with ψ = `psi` for the spherical and ψ = 0 for the cylindrical constraint.
+    With δu = δu_R + δλ δu_P it becomes a quadratic in δλ, solved every iteration.
+    The predictor takes the root whose direction follows the previous step
+    (sign of Δu_prevᵀ δu_P); correctors take the root closest to the current
+    increment. Complex roots fail the step, which is then retried with a
+    smaller arc length.
+
+    Parameters
+    ----------
+    model : Model
+        Model to analyse.
+    solver : NewtonRaphsonSolver
+        Solver providing the tolerance, iteration limit and tangent factorizations.
+    arc_length : float
+        Arc length Δs of a step.
+    steps : int
+        Number of converged steps.
+    constraint : str
+        'spherical' or 'cylindrical'.
+    psi : float
+        Load term scaling of the spherical constraint.
+    cutback, growth, min_scale : float
+        Step size control after failed and converged steps (see `PathFollowingIntegrator`).
+    recorders : list[Recorder], optional
+        Recorders called after every converged step (see `PathFollowingIntegrator`).
+    store_history : bool
+        Keep the full per-step histories in memory (see `PathFollowingIntegrator`).
+    """
+
+    CONSTRAINTS = ('spherical', 'cylindrical')
+
+    def __init__(
+        self,
+        model: Model,
+        solver: NewtonRaphsonSolver,
+        arc_length: float,
+        steps: int,
+        constraint: str = 'cylindrical',
+        psi: float = 1.0,
+        cutback: float = 0.5,
+        growth: float = 2.0,
+        min_scale: float = 1 / 1024,
+        recorders: list[Recorder] | None = None,
+        store_history: bool = True,
+    ):
+        if constraint not in self.CONSTRAINTS:
+            raise ValueError(f"Unsupported arc-length constraint: {constraint}")
+
+        super().__init__(model, solver, steps, cutback, growth, min_scale, recorders, store_history)
+        self.arc_length = arc_length
+        self.constraint = constraint
+        self.psi = psi if constraint == 'spherical' else 0.0
+
+        P_free = self.reference_load[model.free_indices]
+        self._load_weight = self.psi ** 2 * float(np.vdot(P_free, P_free))
+        self._last_du: np.ndarray | None = None
+        self._last_dlam: float = 1.0
+
+    def _load_factor_increment(self, scale, du_step, dlam_step, du_R, du_P):
+        ds = scale * self.arc_length
+        w = self._load_weight
+        du_0 = du_step + du_R
+
+        a = float(np.vdot(du_P, du_P)) + w
+        b = 2.0 * (float(np.vdot(du_P, du_0)) + w * dlam_step)
+        c = float(np.vdot(du_0, du_0)) + w * dlam_step ** 2 - ds ** 2
+
+        disc = b * b - 4.0 * a * c
+        if disc < 0.0:
+            raise np.linalg.LinAlgError("Arc-length constraint has no real root")
+        sq = np.sqrt(disc)
+        roots = ((-b + sq) / (2.0 * a), (-b - sq) / (2.0 * a))
+
+        if dlam_step == 0.0 and not du_step.any():
+            # Predictor: keep moving in the direction of the previous step
+            if self._last_du is None:
+                sign = np.sign(self._last_dlam)
+            else:
+                sign = np.sign(float(np.vdot(self._last_du, du_P)) + w * self._last_dlam) or 1.0
+            return max(roots) if sign > 0 else min(roots)
+
+        # Corrector: smallest angle between the new and the current step increment
+        def alignment(dlam):
+            return float(np.vdot(du_step, du_0 + dlam * du_P)) + w * dlam_step * (dlam_step + dlam)
+
+        return max(roots, key=alignment)
+
+    def _accept_step(self, du_step, dlam_step):
+        self._last_du = du_step.copy()
+        self._last_dlam = dlam_step
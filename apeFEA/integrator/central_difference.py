@@ -0,0 +1,305 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from scipy import sparse
+from typing import List
+
+from apeFEA.core.model import Model
+from apeFEA.recorder.recorder_abstraction import Recorder
+from apeFEA.timeseries.timeseries_abstraction import TimeSeries
+
+
+# Steps whose load factors and ground accelerations are sampled at once
+_SAMPLE_CHUNK = 4096
+
+
+class CentralDifference:
+    """
+    Explicit central difference integration of the equations of motion
+
+        M a + C v + F_int(u) = λ(t) P - M r a_g(t)
+
+    with a diagonal (lumped) mass matrix. Written in the half-step velocity form
+
+        u_n       = u_{n-1} + dt v_{n-1/2}
+        a_n       = M⁻¹ (F_ext(t_n) - F_int(u_n) - C v_n),   v_n = v_{n-1/2} + dt/2 a_n
+        v_{n+1/2} = v_n + dt/2 a_n
+
+    every step needs one `Model.get_resistance_force` and a few vector operations,
+    no stiffness matrix and no linear solve. With a vectorized model
+    (`Model(..., vectorized=True)`) the element forces are recovered in batches.
+
+    P, a_g, r and the mass are those of `TransientIntegrator`. Of the Rayleigh
+    damping of the model (`model.damping`) the mass proportional term is treated
+    exactly (it is diagonal) and the initial stiffness term with the velocity of
+    the previous half step; damping proportional to the current tangent requires
+    an implicit scheme and is not supported.
+
+    The method is conditionally stable: dt must not exceed the critical time step
+    2 / ω_max (reduced by the damping). `critical_time_step` bounds ω_max² from
+    above by the largest row sum of |M⁻¹ K_0| over the free DOFs (Gershgorin), a
+    conservative element length/stiffness based estimate. If `dt` is None the
+    analysis uses `safety_factor` times this estimate.
+
+    Every free DOF needs mass: the lumped frame mass has no rotational inertia, so
+    rotational masses must be added with `Node.set_mass`.
+
+    The state is committed every step; the response is recorded every
+    `output_interval` steps (and at the last one), so long runs can be sub-cycled
+    with only a fraction of the steps stored (or streamed to `recorders` only, with
+    `store_history=False`). The load factors and ground
+    accelerations are pre-sampled for blocks of steps with `TimeSeries.sample`
+    (vectorized for a `PathTimeSeries`).
+
+    Parameters
+    ----------
+    model : Model
+        Model to analyse, starting from its committed state (velocities in
+        `model.v_committed`).
+    dt : float or None
+        Time step, None for `safety_factor` · `critical_time_step()`.
+    steps : int
+        Number of steps.
+    safety_factor : float
+        Fraction of the critical time step used when `dt` is None.
+    output_interval : int
+        Number of steps between recorded states.
+    ground_motion : TimeSeries, optional
+        Ground acceleration history (model units).
+    direction : int
+        Global direction of the ground motion.
+    verbose : bool
+        Print a summary line for every recorded step.
+    recorders : list[Recorder], optional
+        Recorders called at every recorded step (flushed at the end of `run`).
+    store_history : bool
+        Keep the u, v, a vectors of the recorded steps in memory.
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        dt: float | None,
+        steps: int,
+        safety_factor: float = 0.9,
+        output_interval: int = 1,
+        ground_motion: TimeSeries | None = None,
+        direction: int = 0,
+        verbose: bool = False,
+        recorders: List[Recorder] | None = None,
+        store_history: bool = True,
+    ):
+        if dt is not None and dt <= 0.0:
+            raise ValueError("The time step must be positive")
+        if not 0.0 < safety_factor <= 1.0:
+            raise ValueError("The safety factor must be in (0, 1]")
+        if output_interval < 1:
+            raise ValueError("The output interval must be a positive number of steps")
+        if direction not in range(model.ndof - 1):
+            raise ValueError(f"Unsupported ground motion direction: {direction}")
+        if model.damping is not None and model.damping.beta_k:
+            raise ValueError("Damping proportional to the current tangent requires an implicit integrator")
+
+        self.model = model
+        self.dt = dt
+        self.steps = steps
+        self.safety_factor = safety_factor
+        self.output_interval = output_interval
+        self.ground_motion = ground_motion
+        self.direction = direction
+        self.verbose = verbose
+        self.recorders = list(recorders) if recorders else []
+        self.store_history = store_history
+
+        self.reference_load = model.get_reference_load()
+        self.time: float = 0.0
+        self.critical_dt: float | None = None
+
+        self.u_history: List[np.ndarray] = []
+        self.v_history: List[np.ndarray] = []
+        self.a_history: List[np.ndarray] = []
+        self.time_history: List[float] = []
+        self.failed_steps: int = 0
+
+    # ---------------------------------------------------
+    # System terms
+    def _lumped_mass(self) -> np.ndarray:
+        """Diagonal of the model mass matrix, checked to be diagonal with mass on every free DOF."""
+        M = self.model.get_mass_matrix()
+        if sparse.issparse(M):
+            m = M.diagonal()
+            off_diagonal = abs(M - sparse.diags(m)).max()
+        else:
+            m = np.diag(M).copy()
+            off_diagonal = np.abs(M - np.diag(m)).max()
+        if off_diagonal > 0.0:
+            raise ValueError("The central difference integrator requires a diagonal (lumped) mass matrix")
+
+        massless = np.flatnonzero(m[self.model.free_indices] <= 0.0)
+        if len(massless):
+            raise ValueError(f"{len(massless)} free DOFs have no mass "
+                             f"(e.g. equation {self.model.free_indices[massless[0]]}), assign rotational masses with Node.set_mass")
+        return m.reshape(-1, 1)
+
+    def _external_force(self, t: float) -> np.ndarray:
+        """Nodal loads plus the effective earthquake force at time t."""
+        F = self.model.timeseries.get_factor(t) * self.reference_load
+        if self.ground_motion is not None:
+            F = F - self._m_r * self.ground_motion.get_factor(t)
+        return F
+
+    def _sample_excitation(self, times: np.ndarray) -> tuple[np.ndarray, np.ndarray | None]:
+        """Load factors and ground accelerations (None without ground motion) at all `times`."""
+        load_factors = self.model.timeseries.sample(times)
+        ground = None if self.ground_motion is None else self.ground_motion.sample(times)
+        return load_factors, ground
+
+    def critical_time_step(self) -> float:
+        """
+        Conservative estimate of the critical time step from the initial tangent
+        (committed state) and the lumped mass:
+
+            ω_max² ≤ max_i Σ_j |K_ij| / m_i,    dt_cr = 2 / ω_max (√(1 + ξ²) - ξ)
+
+        over the free DOFs, with ξ the Rayleigh damping ratio at ω_max.
+        """
+        model = self.model
+        free = model.free_indices
+        model.reset_trial()
+        K = model.get_stiffness_matrix()
+        if sparse.issparse(K):
+            K_ff = abs(K.tocsr()[free][:, free])
+            row_sums = np.asarray(K_ff.sum(axis=1)).ravel()
+        else:
+            row_sums = np.abs(K[np.ix_(free, free)]).sum(axis=1)
+        m = self._lumped_mass()[free, 0]
+        omega_max = np.sqrt(np.max(row_sums / m))
+
+        alpha_m, beta_k_init = self._damping_coefficients()
+        xi = alpha_m / (2 * omega_max) + beta_k_init * omega_max / 2
+        return 2.0 / omega_max * (np.sqrt(1.0 + xi**2) - xi)
+
+    def _damping_coefficients(self) -> tuple[float, float]:
+        damping = self.model.damping
+        if damping is None:
+            return 0.0, 0.0
+        return damping.alpha_m, damping.beta_k_init
+
+    # ---------------------------------------------------
+    # Analysis
+    def initialize(self) -> None:
+        """
+        Prepare the analysis from the committed state of the model: lumped mass,
+        time step, initial stiffness for damping and the initial accelerations.
+        """
+        model = self.model
+        model.reset_trial()
+
+        m = self._lumped_mass()
+        self._inv_m = np.zeros_like(m)
+        self._inv_m[model.free_indices] = 1.0 / m[model.free_indices]
+        r = np.zeros((model.system_ndof, 1))
+        r[[node.idx[self.direction] for node in model.nodes]] = 1.0
+        self._m_r = m * r
+
+        self.critical_dt = self.critical_time_step()
+        if self.dt is None:
+            self.dt = self.safety_factor * self.critical_dt
+        if self.verbose:
+            print(f"Critical time step estimate: {self.critical_dt:.4e} | dt = {self.dt:.4e}")
+
+        alpha_m, beta_k_init = self._damping_coefficients()
+        self._K0 = model.get_stiffness_matrix() if beta_k_init else None
+
+        model.reset_trial()
+        v = model.v_committed
+        a = self._acceleration(self._external_force(self.time), v) - alpha_m * v
+        model.a_committed[:] = a
+        model.a_trial[:] = a
+
+    def _acceleration(self, F_ext: np.ndarray, v: np.ndarray) -> np.ndarray:
+        """
+        Accelerations at the trial state under the external force `F_ext`, for the
+        velocity `v` of the damping terms, without the mass proportional damping
+        (applied by the caller).
+        """
+        R = F_ext - self.model.get_resistance_force()
+        if self._K0 is not None:
+            R -= self._damping_coefficients()[1] * (self._K0 @ v)
+        return self._inv_m * R
+
+    def _record(self) -> None:
+        model = self.model
+        if self.store_history:
+            self.u_history.append(model.u_committed.copy())
+            self.v_history.append(model.v_committed.copy())
+            self.a_history.append(model.a_committed.copy())
+        self.time_history.append(self.time)
+        for recorder in self.recorders:
+            recorder.record(self.time)
+
+        if self.verbose:
+            print(f"t = {self.time:.6f} | max |u| = {np.abs(model.u_committed).max():.3e}"
+                  f" | max |v| = {np.abs(model.v_committed).max():.3e}")
+
+    def run(self) -> None:
+        """Execute the analysis from the committed state of the model."""
+        self.initialize()
+        self._record()
+
+        model, dt = self.model, self.dt
+        alpha_m = self._damping_coefficients()[0]
+        damping_scale = 1.0 / (1.0 + alpha_m * dt / 2)
+        t0 = self.time
+
+        # Half-step velocity v_{n+1/2}
+        v_half = model.v_committed + dt / 2 * model.a_committed
+
+        for i in range(1, self.steps + 1):
+            j = (i - 1) % _SAMPLE_CHUNK
+            if j == 0:
+                load_factors, ground = self._sample_excitation(t0 + dt * np.arange(i, min(i + _SAMPLE_CHUNK, self.steps + 1)))
+            F_ext = load_factors[j] * self.reference_load
+            if ground is not None:
+                F_ext -= self._m_r * ground[j]
+
+            t = t0 + i * dt
+            model.u_trial += dt * v_half
+
+            a = self._acceleration(F_ext, v_half)
+            if alpha_m:
+                a -= alpha_m * v_half
+                a *= damping_scale
+            if not np.isfinite(a).all():
+                model.reset_trial()
+                print(f"Step {i} (t = {t:.6f}) failed: non-finite accelerations, "
+                      f"dt = {dt:.4e} exceeds the stability limit (estimate {self.critical_dt:.4e})")
+                self.failed_steps += 1
+                break
+
+            model.a_trial[:] = a
+            model.v_trial[:] = v_half + dt / 2 * a
+            v_half = model.v_trial + dt / 2 * a
+            model.commit_state()
+            self.time = t
+
+            if i % self.output_interval == 0 or i == self.steps:
+                self._record()
+
+        for recorder in self.recorders:
+            recorder.flush()
+
+    def plot_response(self, node, dof: int, quantity: str = 'u') -> tuple:
+        """Plot the displacement ('u'), velocity ('v') or acceleration ('a') history of `node` in direction `dof`."""
+        histories = {'u': self.u_history, 'v': self.v_history, 'a': self.a_history}
+        if quantity not in histories:
+            raise ValueError(f"Unsupported response quantity: {quantity}")
+        eq = node.idx[dof]
+        fig, ax = plt.subplots(figsize=(8, 4))
+        ax.plot(self.time_history, [x[eq, 0] for x in histories[quantity]])
+        ax.set_xlabel("Time")
+        ax.set_ylabel(f"Node {node.id} {quantity} (DOF {dof})")
+        ax.grid(True)
+        plt.tight_layout()
+        plt.show()
+
+        return fig, ax
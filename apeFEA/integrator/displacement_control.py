@@ -0,0 +1,99 @@
+import numpy as np
+
+from apeFEA.core.model import Model
+from apeFEA.core.node import Node
+from apeFEA.recorder.recorder_abstraction import Recorder
+from apeFEA.solver.newton_raphson import NewtonRaphsonSolver
+from .path_following import PathFollowingIntegrator
+
+
+class DisplacementControl(PathFollowingIntegrator):
+    """
+    Static analysis controlled by the displacement of one DOF.
+
+    Every step prescribes the increment `increment` of the controlled DOF and solves
+    for the displacements and the load factor λ of the model's nodal loads, so the
+    path can be followed through load limit points (softening, snap-through).
+    The constraint of the bordered system gives, per iteration,
+
+        δλ = (Δu_target - Δu_c - δu_R,c) / δu_P,c
+
+    The analysis stops once the controlled DOF has moved `steps * increment`
+    (smaller steps are used after a failed step).
+
+    Parameters
+    ----------
+    model : Model
+        Model to analyse.
+    solver : NewtonRaphsonSolver
+        Solver providing the tolerance, iteration limit and tangent factorizations.
+    node : Node
+        Controlled node.
+    dof : int
+        Controlled DOF of the node (0: ux, 1: uy, 2: θ).
+    increment : float
+        Displacement increment per step.
+    steps : int
+        Number of steps.
+    cutback, growth, min_scale : float
+        Step size control after failed and converged steps (see `PathFollowingIntegrator`).
+    recorders : list[Recorder], optional
+        Recorders called after every converged step (see `PathFollowingIntegrator`).
+    store_history : bool
+        Keep the full per-step histories in memory (see `PathFollowingIntegrator`).
+
+    Raises
+    ------
+    ValueError
+        If the node is not in the model or the DOF is restrained.
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        solver: NewtonRaphsonSolver,
+        node: Node,
+        dof: int,
+        increment: float,
+        steps: int,
+        cutback: float = 0.5,
+        growth: float = 2.0,
+        min_scale: float = 1 / 1024,
+        recorders: list[Recorder] | None = None,
+        store_history: bool = True,
+    ):
+        super().__init__(model, solver, steps, cutback, growth, min_scale, recorders, store_history)
+
+        if not any(n is node for n in model.nodes):
+            raise ValueError(f"Node {node.id} is not part of the model")
+        if not 0 <= dof < model.ndof:
+            raise ValueError(f"Invalid DOF {dof} for a node with {model.ndof} DOFs")
+        position = np.flatnonzero(model.free_indices == node.idx[dof])
+        if len(position) == 0:
+            raise ValueError(f"DOF {dof} of node {node.id} is restrained")
+
+        self.node = node
+        self.dof = dof
+        self.increment = increment
+        self._control = int(position[0])
+        self.displacement: float = 0.0
+
+    def _load_factor_increment(self, scale, du_step, dlam_step, du_R, du_P):
+        c = self._control
+        if du_P[c, 0] == 0.0:
+            raise np.linalg.LinAlgError("Controlled DOF is not excited by the reference load")
+        target = scale * self.increment
+        return float((target - du_step[c, 0] - du_R[c, 0]) / du_P[c, 0])
+
+    def _accept_step(self, du_step, dlam_step):
+        self.displacement += du_step[self._control, 0]
+
+    def _finished(self) -> bool:
+        target = self.steps * self.increment
+        return abs(self.displacement) >= abs(target) * (1 - 1e-9)
+
+    def _solve_step(self, scale: float) -> int:
+        # Do not overshoot the final displacement
+        remaining = self.steps * self.increment - self.displacement
+        scale = min(scale, remaining / self.increment)
+        return super()._solve_step(scale)
@@ -3,15 +3,73 @@ import matplotlib.pyplot as plt
 from typing import List, Tuple
 
 from apeFEA.core.model import Model
+from apeFEA.recorder.recorder_abstraction import Recorder
 from apeFEA.solver.newton_raphson import NewtonRaphsonSolver
 
 class LoadControl:
     """
     Perform static nonlinear analysis using a load-controlled Newton–Raphson scheme.
-    Tracks displacement, residuals, and iteration history.
+    Tracks displacement, residuals, and iteration history, plus the solver's per-step
+    statistics (factorizations, back-substitutions) in `step_info_history`.
+
+    By default the pseudo-time grid is fixed (`steps` equal increments) and the
+    analysis stops at the first failed step. With `adaptive=True` the increment
+    starts at `t_end / steps` and is adapted:
+
+    - after a failed step the increment is multiplied by `cutback` and the step is
+      retried from the committed state, down to `dt_min`;
+    - after a converged step it is scaled by sqrt(target_iterations / n_iter),
+      limited to `growth` and to `dt_max`.
+
+    The realized pseudo-time of every stored state is kept in `time_history`.
+
+    Every converged step is passed to the `recorders`, which stream the selected
+    results to disk. With `store_history=False` the full displacement vectors,
+    residual histories and solver statistics of the steps are not kept in memory
+    (`time_history` and `iteration_counts` are), so long analyses of large models
+    run in constant memory.
+
+    Parameters
+    ----------
+    model : Model
+        Model to analyse.
+    solver : NewtonRaphsonSolver
+        Solver used for every step.
+    t_end : float
+        Final pseudo-time.
+    steps : int
+        Number of steps of the fixed grid (initial increment when adaptive).
+    adaptive : bool
+        Enable automatic cutback and step growth.
+    dt_min, dt_max : float, optional
+        Increment bounds (defaults: t_end / steps / 1024 and t_end).
+    cutback : float
+        Increment reduction factor after a failed step.
+    growth : float
+        Maximum increment growth factor after a converged step.
+    target_iterations : int
+        Iteration count at which the increment is kept unchanged.
+    recorders : list[Recorder], optional
+        Recorders called after every converged step (flushed at the end of `run`).
+    store_history : bool
+        Keep `u_history`, `residual_history_per_step` and `step_info_history`.
     """
 
-    def __init__(self, model: Model, solver: NewtonRaphsonSolver, t_end: float, steps: int):
+    def __init__(
+        self,
+        model: Model,
+        solver: NewtonRaphsonSolver,
+        t_end: float,
+        steps: int,
+        adaptive: bool = False,
+        dt_min: float | None = None,
+        dt_max: float | None = None,
+        cutback: float = 0.5,
+        growth: float = 2.0,
+        target_iterations: int = 5,
+        recorders: List[Recorder] | None = None,
+        store_history: bool = True,
+    ):
         self.model = model
         self.solver = solver
         self.t_end = t_end
@@ -19,26 +77,97 @@ class LoadControl:
 
         self.time_values = np.linspace(0, t_end, steps + 1)
 
+        self.adaptive = adaptive
+        self.dt_min = dt_min if dt_min is not None else t_end / steps / 1024
+        self.dt_max = dt_max if dt_max is not None else t_end
+        self.cutback = cutback
+        self.growth = growth
+        self.target_iterations = target_iterations
+        self.recorders = list(recorders) if recorders else []
+        self.store_history = store_history
+
         self.u_history: List[np.ndarray] = []
+        self.time_history: List[float] = []
         self.residual_history_per_step: List[List[float]] = []
         self.iteration_counts: List[int] = []
+        self.step_info_history: List[dict] = []
+        self.failed_steps: int = 0
+
+    def _solve_step(self, t: float) -> int:
+        """Solve and record one step, returns the number of iterations (raises RuntimeError)."""
+        u, residuals, n_iter = self.solver.solve(t)
+        if self.store_history:
+            self.u_history.append(u.copy())
+            self.residual_history_per_step.append(residuals)
+            self.step_info_history.append(dict(self.solver.step_info))
+        self.time_history.append(t)
+        self.iteration_counts.append(n_iter)
+        self._update_recorders(t, residuals, n_iter)
+
+        final_residual = residuals[-1] if residuals else float('nan')
+        print(f" → Iterations: {n_iter:2d} | Final Residual Norm: {final_residual:.3e}"
+              f" | Factorizations: {self.solver.step_info['factorizations']}"
+              f" | Back-substitutions: {self.solver.step_info['back_substitutions']}")
+        return n_iter
+
+    def _update_recorders(self, t: float, residuals: List[float], n_iter: int) -> None:
+        step_info = {'iterations': n_iter, 'residual': residuals[-1] if residuals else float('nan'), **self.solver.step_info}
+        for recorder in self.recorders:
+            recorder.record(t, step_info)
 
     def run(self) -> None:
         """Execute the static analysis across load steps."""
-        for i, t in enumerate(self.time_values):
-            print(f"\n=== Load Step {i}/{self.steps} – Pseudo-time: {t:.3f} === ")
-            try:
-                u, residuals, n_iter = self.solver.solve(t)
-                self.u_history.append(u.copy())
-                self.residual_history_per_step.append(residuals)
-                self.iteration_counts.append(n_iter)
+        if self.adaptive:
+            self._run_adaptive()
+        else:
+            for i, t in enumerate(self.time_values):
+                print(f"\n=== Load Step {i}/{self.steps} – Pseudo-time: {t:.3f} === ")
+                try:
+                    self._solve_step(t)
+
+                except RuntimeError as e:
+                    print(f"Step {i} failed: {e}")
+                    self.failed_steps += 1
+                    break
+
+        for recorder in self.recorders:
+            recorder.flush()
 
-                final_residual = residuals[-1] if residuals else float('nan')
-                print(f" → Iterations: {n_iter:2d} | Final Residual Norm: {final_residual:.3e}")
+    def _run_adaptive(self) -> None:
+        """Adaptive pseudo-time stepping with cutback on failure and growth on fast convergence."""
+        t = 0.0
+        dt = min(self.t_end / self.steps, self.dt_max)
+        i = 0
+
+        print(f"\n=== Load Step {i} – Pseudo-time: {t:.3f} === ")
+        try:
+            self._solve_step(t)
+        except RuntimeError as e:
+            print(f"Step {i} failed: {e}")
+            self.failed_steps += 1
+            return
+
+        while self.t_end - t > 1e-12 * self.t_end:
+            dt = min(dt, self.t_end - t)
+            t_trial = t + dt
+            i += 1
+            print(f"\n=== Load Step {i} – Pseudo-time: {t_trial:.3f} (Δt = {dt:.3e}) === ")
+            try:
+                n_iter = self._solve_step(t_trial)
 
             except RuntimeError as e:
-                print(f"Step {i} failed: {e}")
-                break
+                self.failed_steps += 1
+                i -= 1
+                if dt <= self.dt_min * (1 + 1e-12):
+                    print(f"Step failed at minimum increment: {e}")
+                    break
+                dt = max(dt * self.cutback, self.dt_min)
+                print(f"Step failed: {e} – cutting back to Δt = {dt:.3e}")
+                continue
+
+            t = t_trial
+            factor = min(self.growth, np.sqrt(self.target_iterations / max(n_iter, 1)))
+            dt = float(np.clip(dt * factor, self.dt_min, self.dt_max))
 
     def plot_convergence(self) -> None:
         """Plot convergence history and iteration counts."""
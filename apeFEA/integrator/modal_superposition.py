@@ -0,0 +1,328 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from scipy.signal import lfilter
+from typing import List
+
+from apeFEA.analysis.modal_analysis import ModalAnalysis
+from apeFEA.core.model import Model
+from apeFEA.elements.one_dimension.transformations.linear_transformation import LinearTransformation
+from apeFEA.materials.linear_elastic import LinearElastic
+from apeFEA.timeseries.timeseries_abstraction import TimeSeries
+
+
+def _damped_root(zeta: np.ndarray) -> np.ndarray:
+    """√(1 - ξ²) as a complex number (imaginary for overdamped oscillators), kept away from 0."""
+    root = np.sqrt((1.0 - zeta**2).astype(complex))
+    # Critical damping is the (continuous) limit, taken at a ratio within 1e-8 of 1
+    return np.where(np.abs(root) < 1e-4, 1e-4, root)
+
+
+def _decay(omega: np.ndarray, zeta: np.ndarray, root: np.ndarray, t) -> tuple[np.ndarray, np.ndarray]:
+    """
+    e^{-ξωt} cos(ω_D t) and e^{-ξωt} sin(ω_D t), from the exponentials of the two
+    roots so that overdamped oscillators (complex ω_D) do not overflow.
+    """
+    omega_d = omega * root
+    E1 = np.exp((-zeta * omega + 1j * omega_d) * t)
+    E2 = np.exp((-zeta * omega - 1j * omega_d) * t)
+    return (E1 + E2) / 2, (E1 - E2) / 2j
+
+
+def nigam_jennings_coefficients(omega: np.ndarray, zeta: np.ndarray, dt: float) -> tuple[np.ndarray, ...]:
+    """
+    Coefficients of the exact recurrence of unit-mass oscillators under a load p
+    varying linearly over each step (Nigam & Jennings, 1969),
+
+        q_{i+1} = A  q_i + B  q̇_i + C  p_i + D  p_{i+1}
+        q̇_{i+1} = A' q_i + B' q̇_i + C' p_i + D' p_{i+1}
+
+    for circular frequencies `omega` > 0 and damping ratios `zeta` ≥ 0 (arrays of
+    the same shape, one oscillator per entry). Overdamped oscillators (ξ > 1, e.g.
+    high modes under stiffness proportional damping) are included.
+
+    Returns
+    -------
+    A, B, C, D, A', B', C', D' : ndarray
+    """
+    k = omega**2
+    root = _damped_root(zeta)
+    omega_d = omega * root
+    c, s = _decay(omega, zeta, root, dt)
+    ratio = zeta / root
+
+    A = ratio * s + c
+    B = s / omega_d
+    C = (2 * zeta / (omega * dt) + ((1 - 2 * zeta**2) / (omega_d * dt) - ratio) * s - (1 + 2 * zeta / (omega * dt)) * c) / k
+    D = (1 - 2 * zeta / (omega * dt) + (2 * zeta**2 - 1) / (omega_d * dt) * s + 2 * zeta / (omega * dt) * c) / k
+    A_v = -omega / root * s
+    B_v = c - ratio * s
+    C_v = (-1 / dt + (omega / root + ratio / dt) * s + c / dt) / k
+    D_v = (1 - (ratio * s + c)) / (k * dt)
+    return tuple(coefficient.real for coefficient in (A, B, C, D, A_v, B_v, C_v, D_v))
+
+
+class ModalSuperposition:
+    """
+    Linear response history by modal superposition,
+
+        u(t) = Σ_k φ_k q_k(t),    q̈_k + 2 ξ_k ω_k q̇_k + ω_k² q_k = φ_kᵀ (λ(t) P - M r a_g(t))
+
+    over the first `n_modes` mass-normalized modes of a `ModalAnalysis`. The load
+    is taken as linear between the steps, for which the decoupled oscillators are
+    integrated exactly (Nigam–Jennings recurrence): the result does not depend on
+    the time step beyond the sampling of the excitation, so a record is best
+    integrated at its own time step.
+
+    The recurrence is evaluated for all steps of a mode at once as a second order
+    recursive filter (`scipy.signal.lfilter`), starting from rest under the load
+    increments p(t) - p(0); the static response to p(0) and the free vibration from
+    the initial state (the committed displacements and velocities of the model
+    projected onto the modes) are added in closed form. Displacements, velocities,
+    accelerations and element basic forces are then recovered only at the output
+    steps, the latter from the basic forces of the modes, evaluated once.
+
+    The modes, damping ratios and modal element forces are kept after the first
+    `run`, so a suite of records is analysed by assigning `ground_motion` and
+    calling `run` again, at the cost of the modal recurrences and the outputs only.
+    The state of the model is not changed.
+
+    Only models of `LinearElastic` sections and `LinearTransformation`s are
+    accepted, for which the superposition is exact up to the modal truncation.
+
+    Parameters
+    ----------
+    model : Model
+        Linear model to analyse.
+    dt : float
+        Time step.
+    steps : int
+        Number of steps.
+    n_modes : int
+        Number of modes superposed (ignored if `modal` is given).
+    modal : ModalAnalysis, optional
+        Modes to use, run if not yet done; computed for the model if None.
+    damping_ratios : float or array_like, optional
+        Modal damping ratios (one value or one per mode). If None, the ratios of
+        the Rayleigh damping of the model, ξ_k = α_m / (2 ω_k) + (β_k + β_k,init) ω_k / 2.
+    ground_motion : TimeSeries, optional
+        Ground acceleration history (model units).
+    direction : int
+        Global direction of the ground motion.
+    output_interval : int
+        Number of steps between recorded states (the last step is always recorded).
+    output_times : array_like, optional
+        Times to record instead, rounded to the nearest step.
+    element_forces : bool
+        Recover the element basic forces at the output steps.
+    verbose : bool
+        Print a summary line for every recorded step.
+
+    Attributes
+    ----------
+    q, q_dot : ndarray
+        (n_modes, steps + 1) modal displacements and velocities of the last run.
+    u_history, v_history, a_history : list[ndarray]
+        (system_ndof, 1) displacements, velocities and accelerations (relative to
+        the ground) at the output steps.
+    element_force_history : list[ndarray]
+        (number_of_elements, 3) basic forces (N, M_i, M_j) at the output steps, in
+        the order of `model.elements`.
+    time_history : list[float]
+        Output times.
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        dt: float,
+        steps: int,
+        n_modes: int = 10,
+        modal: ModalAnalysis | None = None,
+        damping_ratios=None,
+        ground_motion: TimeSeries | None = None,
+        direction: int = 0,
+        output_interval: int = 1,
+        output_times=None,
+        element_forces: bool = True,
+        verbose: bool = False,
+    ):
+        if dt <= 0.0:
+            raise ValueError("The time step must be positive")
+        if output_interval < 1:
+            raise ValueError("The output interval must be a positive number of steps")
+        if direction not in range(model.ndof - 1):
+            raise ValueError(f"Unsupported ground motion direction: {direction}")
+        self._check_linear(model)
+
+        self.model = model
+        self.dt = dt
+        self.steps = steps
+        self.modal = modal if modal is not None else ModalAnalysis(model, n_modes=n_modes)
+        self.damping_ratios = damping_ratios
+        self.ground_motion = ground_motion
+        self.direction = direction
+        self.output_interval = output_interval
+        self.output_times = output_times
+        self.element_forces = element_forces
+        self.verbose = verbose
+
+        self.reference_load = model.get_reference_load()
+        self.time: float = 0.0
+        self.zeta: np.ndarray | None = None
+        self._coefficients: tuple | None = None
+        self._modal_basic_forces: np.ndarray | None = None
+
+        self.q: np.ndarray | None = None
+        self.q_dot: np.ndarray | None = None
+        self.u_history: List[np.ndarray] = []
+        self.v_history: List[np.ndarray] = []
+        self.a_history: List[np.ndarray] = []
+        self.element_force_history: List[np.ndarray] = []
+        self.time_history: List[float] = []
+
+    @staticmethod
+    def _check_linear(model: Model) -> None:
+        for element in model.elements:
+            sections = getattr(element, 'sections', None) or [element.section]
+            if type(element.transformation) is not LinearTransformation or \
+                    not all(isinstance(getattr(section, 'material', None), LinearElastic) for section in sections):
+                raise ValueError(f"Modal superposition requires LinearElastic sections and LinearTransformation, "
+                                 f"element {element.id} is not linear")
+
+    # ---------------------------------------------------
+    # Modal system
+    def initialize(self) -> None:
+        """Compute the modes (if needed), damping ratios, recurrence coefficients and modal element forces."""
+        modal = self.modal
+        if modal.shapes is None:
+            modal.run()
+        if np.any(modal.eigenvalues <= 0.0):
+            raise ValueError("Modal superposition requires positive eigenvalues (no rigid-body or unstable modes)")
+        omega = modal.omega
+
+        if self.damping_ratios is None:
+            damping = self.model.damping
+            if damping is None:
+                zeta = np.zeros_like(omega)
+            else:
+                zeta = damping.alpha_m / (2 * omega) + (damping.beta_k + damping.beta_k_init) * omega / 2
+        else:
+            zeta = np.broadcast_to(np.asarray(self.damping_ratios, dtype=float), omega.shape).copy()
+        if np.any(zeta < 0.0):
+            raise ValueError("Modal damping ratios must not be negative")
+        self.zeta = zeta
+
+        A, B, C, D, A_v, B_v, C_v, D_v = nigam_jennings_coefficients(omega, zeta, self.dt)
+        # Transfer functions p -> q and p -> q̇ of the recurrence, for lfilter
+        self._denominator = np.column_stack([np.ones_like(A), -(A + B_v), A * B_v - B * A_v])
+        self._numerator_u = np.column_stack([D, C - B_v * D + B * D_v, -B_v * C + B * C_v])
+        self._numerator_v = np.column_stack([D_v, C_v + A_v * D - A * D_v, A_v * C - A * C_v])
+        self._coefficients = (A, B, C, D, A_v, B_v, C_v, D_v)
+
+        if self.element_forces:
+            self._modal_basic_forces = self._get_modal_basic_forces()
+
+    def _get_modal_basic_forces(self) -> np.ndarray:
+        """(n_modes, number_of_elements, 3) element basic forces of the mode shapes."""
+        model = self.model
+        position = {id(element): k for k, element in enumerate(model.elements)}
+        forces = np.zeros((self.modal.n_modes, model.number_of_elements, 3))
+        for mode in range(self.modal.n_modes):
+            model.u_trial[:, 0] = self.modal.shapes[:, mode]
+            for element in model._scalar_elements:
+                forces[mode, position[id(element)]] = np.ravel(element.force_recovery()[1]['Fb'])
+            for block in model.element_blocks:
+                block.update_trial(model.u_trial)
+                rows = [position[id(element)] for element in block.elements]
+                forces[mode, rows] = block.force_recovery()[1]['Fb']
+        model.reset_trial()
+        return forces
+
+    def _output_steps(self) -> np.ndarray:
+        if self.output_times is not None:
+            steps = np.rint((np.asarray(self.output_times, dtype=float) - self.time) / self.dt).astype(int)
+            return np.unique(np.clip(steps, 0, self.steps))
+        steps = np.arange(0, self.steps + 1, self.output_interval)
+        if steps[-1] != self.steps:
+            steps = np.append(steps, self.steps)
+        return steps
+
+    # ---------------------------------------------------
+    # Analysis
+    def run(self) -> None:
+        """Execute the analysis from the committed state of the model (previous outputs are cleared)."""
+        if self._coefficients is None:
+            self.initialize()
+        model, modal, dt = self.model, self.modal, self.dt
+        phi, omega, zeta = modal.shapes, modal.omega, self.zeta
+        M = model.get_mass_matrix()
+
+        # Modal loads at all steps
+        times = self.time + dt * np.arange(self.steps + 1)
+        p = np.zeros((modal.n_modes, self.steps + 1))
+        modal_load = phi.T @ self.reference_load[:, 0]
+        if np.any(modal_load):
+            p += np.outer(modal_load, model.timeseries.sample(times))
+        if self.ground_motion is not None:
+            # Rigid-body translation of all nodes, supports included: a consistent
+            # mass couples the restrained DOFs to the free ones (as TransientIntegrator)
+            r = np.zeros(model.system_ndof)
+            r[[node.idx[self.direction] for node in model.nodes]] = 1.0
+            p -= np.outer(phi.T @ (M @ r), self.ground_motion.sample(times))
+
+        # Initial state projected onto the modes
+        q0 = phi.T @ (M @ model.u_committed)[:, 0]
+        v0 = phi.T @ (M @ model.v_committed)[:, 0]
+
+        # Static response to p(0) plus free vibration about it, in closed form
+        p0 = p[:, :1]
+        static = p0[:, 0] / omega**2
+        h0, hv0 = (q0 - static)[:, None], v0[:, None]
+        q = np.repeat(static[:, None], self.steps + 1, axis=1)
+        q_dot = np.zeros_like(q)
+        if np.any(h0) or np.any(hv0):
+            root = _damped_root(zeta)[:, None]
+            w, wd = (zeta * omega)[:, None], omega[:, None] * root
+            c, s = _decay(omega[:, None], zeta[:, None], root, times[None, :] - self.time)
+            q += (h0 * c + (hv0 + w * h0) / wd * s).real
+            q_dot += (hv0 * c - (omega[:, None]**2 * h0 + w * hv0) / wd * s).real
+
+        # Response to the load increments from rest: the recurrence as a recursive filter
+        increments = p - p0
+        for k in range(modal.n_modes):
+            q[k] += lfilter(self._numerator_u[k], self._denominator[k], increments[k])
+            q_dot[k] += lfilter(self._numerator_v[k], self._denominator[k], increments[k])
+        self.q, self.q_dot = q, q_dot
+
+        # Recovery at the output steps only
+        out = self._output_steps()
+        q_out, v_out = q[:, out], q_dot[:, out]
+        a_out = p[:, out] - 2 * (zeta * omega)[:, None] * v_out - (omega**2)[:, None] * q_out
+        U, V, A = phi @ q_out, phi @ v_out, phi @ a_out
+
+        self.u_history = [U[:, [j]] for j in range(len(out))]
+        self.v_history = [V[:, [j]] for j in range(len(out))]
+        self.a_history = [A[:, [j]] for j in range(len(out))]
+        self.time_history = times[out].tolist()
+        if self.element_forces:
+            self.element_force_history = list(np.tensordot(q_out.T, self._modal_basic_forces, axes=1))
+
+        if self.verbose:
+            for j, step in enumerate(out):
+                print(f"t = {times[step]:.6f} | max |u| = {np.abs(U[:, j]).max():.3e} | max |v| = {np.abs(V[:, j]).max():.3e}")
+
+    def plot_response(self, node, dof: int, quantity: str = 'u') -> tuple:
+        """Plot the displacement ('u'), velocity ('v') or acceleration ('a') history of `node` in direction `dof`."""
+        histories = {'u': self.u_history, 'v': self.v_history, 'a': self.a_history}
+        if quantity not in histories:
+            raise ValueError(f"Unsupported response quantity: {quantity}")
+        eq = node.idx[dof]
+        fig, ax = plt.subplots(figsize=(8, 4))
+        ax.plot(self.time_history, [x[eq, 0] for x in histories[quantity]])
+        ax.set_xlabel("Time")
+        ax.set_ylabel(f"Node {node.id} {quantity} (DOF {dof})")
+        ax.grid(True)
+        plt.tight_layout()
+        plt.show()
+
+        return fig, ax
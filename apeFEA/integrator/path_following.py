@@ -0,0 +1,232 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from abc import ABC, abstractmethod
+from typing import List
+
+from apeFEA.core.model import Model
+from apeFEA.recorder.recorder_abstraction import Recorder
+from apeFEA.solver.newton_raphson import NewtonRaphsonSolver
+
+
+class PathFollowingIntegrator(ABC):
+    """
+    Base class for static integrators that solve for the load factor λ together with
+    the displacements, so the equilibrium path can be followed past limit points.
+
+    The external load is λ P, with P the unscaled nodal loads of the model (the time
+    series is not used). Every iteration solves the bordered system
+
+        K δu = R + δλ P,    g(Δu + δu, Δλ + δλ) = 0
+
+    by back-substituting both right-hand sides, δu_R = K⁻¹ R and δu_P = K⁻¹ P, with
+    the same factorization and then choosing δλ from the constraint g:
+
+        δu = δu_R + δλ δu_P
+
+    so the constraint costs no extra factorization. Subclasses define g through
+    `_load_factor_increment`. The tangent is refactored according to the solver's
+    strategy ('newton', 'modified', 'initial', 'divergence'); the solver's line search
+    is not used. A failed step is retried from the committed state with the step size
+    multiplied by `cutback`, and the step size grows back by `growth` after every
+    converged step.
+
+    Parameters
+    ----------
+    model : Model
+        Model to analyse.
+    solver : NewtonRaphsonSolver
+        Solver providing the tolerance, iteration limit and tangent factorizations.
+    steps : int
+        Number of steps.
+    cutback : float
+        Step size reduction factor after a failed step.
+    growth : float
+        Step size growth factor after a converged step (up to the nominal size).
+    min_scale : float
+        Smallest step size, relative to the nominal one, before the analysis stops.
+    recorders : list[Recorder], optional
+        Recorders called after every converged step with the load factor as time
+        (flushed at the end of `run`).
+    store_history : bool
+        Keep `u_history`, `residual_history_per_step` and `step_info_history`
+        (`load_factor_history` and `iteration_counts` are always kept).
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        solver: NewtonRaphsonSolver,
+        steps: int,
+        cutback: float = 0.5,
+        growth: float = 2.0,
+        min_scale: float = 1 / 1024,
+        recorders: List[Recorder] | None = None,
+        store_history: bool = True,
+    ):
+        self.model = model
+        self.solver = solver
+        self.steps = steps
+        self.cutback = cutback
+        self.growth = growth
+        self.min_scale = min_scale
+        self.recorders = list(recorders) if recorders else []
+        self.store_history = store_history
+
+        self.reference_load = model.get_reference_load()
+        self.load_factor: float = 0.0
+
+        self.u_history: List[np.ndarray] = []
+        self.load_factor_history: List[float] = []
+        self.residual_history_per_step: List[List[float]] = []
+        self.iteration_counts: List[int] = []
+        self.step_info_history: List[dict] = []
+        self.failed_steps: int = 0
+
+    @abstractmethod
+    def _load_factor_increment(
+        self,
+        scale: float,
+        du_step: np.ndarray,
+        dlam_step: float,
+        du_R: np.ndarray,
+        du_P: np.ndarray,
+    ) -> float:
+        """
+        Return the iterative load factor increment δλ from the constraint.
+
+        Parameters
+        ----------
+        scale : float
+            Current step size relative to the nominal one.
+        du_step, dlam_step : ndarray, float
+            Free-DOF displacement and load factor increments accumulated in the step.
+        du_R, du_P : ndarray
+            Free-DOF solutions K⁻¹ R and K⁻¹ P.
+        """
+        ...
+
+    def _accept_step(self, du_step: np.ndarray, dlam_step: float) -> None:
+        """Hook called with the increments of a converged step."""
+        pass
+
+    def _finished(self) -> bool:
+        """Return True once the analysis is complete."""
+        return len(self.iteration_counts) > self.steps
+
+    def _solve_step(self, scale: float) -> int:
+        """Iterate one constrained step, returns the number of iterations (raises RuntimeError)."""
+        model, solver = self.model, self.solver
+        free = model.free_indices
+        P_free = self.reference_load[free]
+
+        u = model._assemble_displacement_vector_committed()
+        model.reset_trial()
+        solver.begin_step()
+
+        du_step = np.zeros((len(free), 1))
+        dlam_step = 0.0
+        residual = []
+
+        for i in range(solver.max_iter):
+            refactor = solver._needs_factorization(i)
+            R, K, norm_R = model.evaluate(0.0, tangent=refactor, load_factor=self.load_factor + dlam_step)
+
+            if not refactor and solver._refactor_after_evaluation(norm_R, residual):
+                refactor = True
+                K = model.get_stiffness_matrix()
+
+            residual.append(norm_R)
+
+            if np.isnan(norm_R) or np.isinf(norm_R):
+                self._fail("Residual norm is NaN or Inf – possible numerical instability.")
+
+            # The first iteration is the predictor, the step always moves along the path
+            if i > 0 and norm_R < solver.tol:
+                model.commit_state()
+                self.load_factor += dlam_step
+                self._accept_step(du_step, dlam_step)
+                self._record(u, residual, i + 1)
+                return i + 1
+
+            try:
+                if refactor:
+                    solver._factorize(K)
+                x = solver._back_substitute(np.hstack([R[free], P_free]))
+                dlam = self._load_factor_increment(scale, du_step, dlam_step, x[:, :1], x[:, 1:])
+            except np.linalg.LinAlgError as e:
+                self._fail(f"Linear solve failed: {e}")
+
+            du_free = x[:, :1] + dlam * x[:, 1:]
+            du_step += du_free
+            dlam_step += dlam
+
+            u[free] += du_free
+            model.update_trial_state(u, update_elements=False)
+
+        self._fail("Newton–Raphson did not converge.")
+
+    def _fail(self, message: str) -> None:
+        self.model.reset_trial()
+        self.solver.reset()
+        raise RuntimeError(message)
+
+    def _record(self, u: np.ndarray, residuals: List[float], n_iter: int) -> None:
+        if self.store_history:
+            self.u_history.append(u.copy())
+            self.residual_history_per_step.append(residuals)
+            self.step_info_history.append(dict(self.solver.step_info))
+        self.load_factor_history.append(self.load_factor)
+        self.iteration_counts.append(n_iter)
+
+        step_info = {'iterations': n_iter, 'residual': residuals[-1], **self.solver.step_info}
+        for recorder in self.recorders:
+            recorder.record(self.load_factor, step_info)
+
+        print(f" → λ = {self.load_factor:.6g} | Iterations: {n_iter:2d} | Final Residual Norm: {residuals[-1]:.3e}"
+              f" | Factorizations: {self.solver.step_info['factorizations']}"
+              f" | Back-substitutions: {self.solver.step_info['back_substitutions']}")
+
+    def run(self) -> None:
+        """Execute the analysis, starting from the committed state of the model."""
+        if self.store_history:
+            self.u_history.append(self.model._assemble_displacement_vector_committed())
+            self.residual_history_per_step.append([])
+            self.step_info_history.append({})
+        self.load_factor_history.append(self.load_factor)
+        self.iteration_counts.append(0)
+        for recorder in self.recorders:
+            recorder.record(self.load_factor, {'iterations': 0})
+
+        scale = 1.0
+        while not self._finished():
+            i = len(self.iteration_counts)
+            print(f"\n=== Step {i} – step size {scale:.3g} === ")
+            try:
+                self._solve_step(scale)
+
+            except RuntimeError as e:
+                self.failed_steps += 1
+                if scale * self.cutback < self.min_scale:
+                    print(f"Step {i} failed at minimum step size: {e}")
+                    break
+                scale *= self.cutback
+                print(f"Step {i} failed: {e} – cutting back to step size {scale:.3g}")
+                continue
+
+            scale = min(1.0, scale * self.growth)
+
+        for recorder in self.recorders:
+            recorder.flush()
+
+    def plot_load_displacement(self, node, dof: int) -> tuple:
+        """Plot the load factor against the displacement of `node` in direction `dof`."""
+        eq = node.idx[dof]
+        fig, ax = plt.subplots(figsize=(6, 4))
+        ax.plot([u[eq, 0] for u in self.u_history], self.load_factor_history, marker='o', ms=3)
+        ax.set_xlabel(f"Node {node.id} displacement (DOF {dof})")
+        ax.set_ylabel("Load factor λ")
+        ax.grid(True)
+        plt.tight_layout()
+        plt.show()
+
+        return fig, ax
@@ -0,0 +1,432 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from scipy import sparse
+from scipy.sparse.linalg import spsolve
+from typing import List
+
+from apeFEA.core.model import Model
+from apeFEA.recorder.recorder_abstraction import Recorder
+from apeFEA.solver.newton_raphson import NewtonRaphsonSolver
+from apeFEA.timeseries.timeseries_abstraction import TimeSeries
+
+
+def _same_matrix(A, B) -> bool:
+    """Whether two dense or CSR matrices (with the model's fixed pattern) are equal."""
+    if A is None or B is None:
+        return False
+    if sparse.issparse(A):
+        return sparse.issparse(B) and A.nnz == B.nnz and np.array_equal(A.data, B.data) and np.array_equal(A.indices, B.indices)
+    return not sparse.issparse(B) and np.array_equal(A, B)
+
+
+class _StepResidual:
+    """
+    The dynamic residual of a time step seen through the model interface used by
+    `LineSearch.search` (trial displacements in, residual out).
+    """
+
+    def __init__(self, model: Model, residual):
+        self.model = model
+        self.residual = residual
+        self.free_indices = model.free_indices
+        self.u = None
+
+    def update_trial_state(self, u: np.ndarray, update_elements: bool = True) -> None:
+        self.u = u
+        self.model.update_trial_state(u, update_elements=update_elements)
+
+    def evaluate(self, t: float, tangent: bool = False) -> tuple[np.ndarray, None, float]:
+        R_int, _, _ = self.model.evaluate(t, tangent=False, load_factor=0.0)
+        R = self.residual(self.u, -R_int)
+        return R, None, float(np.linalg.norm(R[self.free_indices]))
+
+
+class TransientIntegrator:
+    """
+    Implicit direct integration of the equations of motion
+
+        M a + C v + F_int(u) = λ(t) P - M r a_g(t)
+
+    with the generalized-α family: every step solves for u_{n+1} the balance
+
+        M a_{n+1-αm} + C v_{n+1-αf} + F_int,{n+1-αf} = F_ext(t_{n+1-αf}),
+        x_{n+1-α} = (1 - α) x_{n+1} + α x_n
+
+    with the Newmark relations between u, v and a (parameters γ, β). The internal
+    force is interpolated between the committed and the trial state, so the model
+    state is always the end-of-step one. αm = αf = 0 gives the Newmark method.
+
+    P are the nodal loads of the model scaled by its time series (t is real time),
+    a_g is the optional ground acceleration `ground_motion.get_factor(t)` acting in
+    the global direction `direction` (0: x, 1: y) and displacements are relative
+    to the ground. C is the Rayleigh damping of the model (`model.damping`), the
+    mass is `model.get_mass_matrix()` (element and nodal masses).
+
+    Every iteration solves K_eff δu = R with
+
+        K_eff = (1 - αm) / (β dt²) M + (1 - αf) γ / (β dt) C + (1 - αf) K_t
+
+    through the solver's linear solver. The factored K_eff is kept across iterations
+    and steps while the tangent does not change: after a tangent equal to the factored
+    one, the following evaluations only recover forces and ask the model whether any
+    element tangent changed (`Model.tangent_changed`). A linear model therefore
+    costs one factorization for the whole record. With the solver strategies
+    'modified', 'initial' and 'divergence', and with the quasi-Newton solvers, the
+    solver decides when to refactor; the increments go through the solver, so
+    quasi-Newton updates are built on the factored K_eff. The solver's line search,
+    if any, scales the increments on the energy of the dynamic residual R.
+
+    The step is accepted once the L2 norm of R over the free DOFs is below the
+    solver tolerance; the analysis stops at the first failed step.
+
+    Parameters
+    ----------
+    model : Model
+        Model to analyse, starting from its committed state (velocities and
+        accelerations in `model.v_committed` / `model.a_committed`).
+    solver : NewtonRaphsonSolver
+        Solver providing the tolerance, iteration limit, strategy, linear solver and
+        line search (a quasi-Newton solver also provides the increments).
+    dt : float
+        Time step.
+    steps : int
+        Number of steps.
+    alpha_m, alpha_f : float
+        Generalized-α weights of the inertia and of the internal/damping/external forces.
+    gamma, beta : float
+        Newmark parameters.
+    ground_motion : TimeSeries, optional
+        Ground acceleration history (model units).
+    direction : int
+        Global direction of the ground motion.
+    verbose : bool
+        Print a summary line for every step.
+    recorders : list[Recorder], optional
+        Recorders called with the initial state and after every converged step
+        (flushed at the end of `run`).
+    store_history : bool
+        Keep the full u, v, a vectors, residual histories and solver statistics of
+        every step in memory (`time_history` and `iteration_counts` are always kept).
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        solver: NewtonRaphsonSolver,
+        dt: float,
+        steps: int,
+        alpha_m: float = 0.0,
+        alpha_f: float = 0.0,
+        gamma: float = 0.5,
+        beta: float = 0.25,
+        ground_motion: TimeSeries | None = None,
+        direction: int = 0,
+        verbose: bool = False,
+        recorders: List[Recorder] | None = None,
+        store_history: bool = True,
+    ):
+        if dt <= 0.0:
+            raise ValueError("The time step must be positive")
+        if direction not in range(model.ndof - 1):
+            raise ValueError(f"Unsupported ground motion direction: {direction}")
+
+        self.model = model
+        self.solver = solver
+        self.dt = dt
+        self.steps = steps
+        self.alpha_m = alpha_m
+        self.alpha_f = alpha_f
+        self.gamma = gamma
+        self.beta = beta
+        self.ground_motion = ground_motion
+        self.direction = direction
+        self.verbose = verbose
+        self.recorders = list(recorders) if recorders else []
+        self.store_history = store_history
+
+        self.reference_load = model.get_reference_load()
+        self.time: float = 0.0
+
+        self.u_history: List[np.ndarray] = []
+        self.v_history: List[np.ndarray] = []
+        self.a_history: List[np.ndarray] = []
+        self.time_history: List[float] = []
+        self.residual_history_per_step: List[List[float]] = []
+        self.iteration_counts: List[int] = []
+        self.step_info_history: List[dict] = []
+        self.failed_steps: int = 0
+
+    # ---------------------------------------------------
+    # System terms
+    def _external_force(self, t: float) -> np.ndarray:
+        """Nodal loads plus the effective earthquake force at time t."""
+        F = self.model.timeseries.get_factor(t) * self.reference_load
+        if self.ground_motion is not None:
+            F = F - self._M_r * self.ground_motion.get_factor(t)
+        return F
+
+    def _damping_coefficients(self) -> tuple[float, float, float]:
+        damping = self.model.damping
+        if damping is None:
+            return 0.0, 0.0, 0.0
+        return damping.alpha_m, damping.beta_k, damping.beta_k_init
+
+    def _damping_force(self, v: np.ndarray) -> np.ndarray:
+        alpha_m, beta_k, beta_k_init = self._damping_coefficients()
+        F = np.zeros_like(v)
+        if alpha_m:
+            F += alpha_m * (self._M @ v)
+        if beta_k:
+            F += beta_k * (self._K @ v)
+        if beta_k_init:
+            F += beta_k_init * (self._K0 @ v)
+        return F
+
+    def _effective_stiffness(self):
+        """K_eff for the current tangent `_K`."""
+        alpha_m, beta_k, beta_k_init = self._damping_coefficients()
+        c_m = (1 - self.alpha_m) / (self.beta * self.dt**2)
+        c_c = (1 - self.alpha_f) * self.gamma / (self.beta * self.dt)
+        K_eff = (c_m + c_c * alpha_m) * self._M + ((1 - self.alpha_f) + c_c * beta_k) * self._K
+        if beta_k_init:
+            K_eff = K_eff + c_c * beta_k_init * self._K0
+        return K_eff
+
+    def _kinematics(self, u: np.ndarray, u0: np.ndarray, v0: np.ndarray, a0: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Newmark velocity and acceleration for the end-of-step displacement u."""
+        dt, gamma, beta = self.dt, self.gamma, self.beta
+        a = (u - u0 - dt * v0) / (beta * dt**2) - (1 / (2 * beta) - 1) * a0
+        v = v0 + dt * ((1 - gamma) * a0 + gamma * a)
+        return v, a
+
+    # ---------------------------------------------------
+    # Analysis
+    def initialize(self) -> None:
+        """
+        Prepare the analysis from the committed state of the model: assemble the mass,
+        evaluate the initial tangent and forces, and solve the initial accelerations
+        on the DOFs with mass from M a_0 = F_ext(t_0) - C v_0 - F_int(u_0).
+        """
+        model = self.model
+        model.reset_trial()
+        self.solver.reset()
+
+        self._M = model.get_mass_matrix()
+        r = np.zeros((model.system_ndof, 1))
+        r[[node.idx[self.direction] for node in model.nodes]] = 1.0
+        self._M_r = self._M @ r
+
+        R, K, _ = model.evaluate(self.time, tangent=True, load_factor=0.0)
+        self._K = self._K0 = K
+        self._tangent_stable = False
+        self._F_int_n = -R
+        self._F_ext_n = self._external_force(self.time)
+
+        free = model.free_indices
+        R0 = (self._F_ext_n - self._damping_force(model.v_committed) - self._F_int_n)[free]
+        a0 = np.zeros_like(R0)
+        diagonal = self._M.diagonal()[free]
+        massive = np.flatnonzero(diagonal > 0.0)
+        if len(massive) and np.any(R0[massive]):
+            M_mm = self._M[free[massive]][:, free[massive]]
+            if sparse.issparse(M_mm):
+                a0[massive, 0] = spsolve(M_mm.tocsc(), R0[massive, 0])
+            else:
+                a0[massive] = np.linalg.solve(M_mm, R0[massive])
+        model.a_committed[:] = 0.0
+        model.a_committed[free] = a0
+        model.a_trial[:] = model.a_committed
+
+    def _internal_force(self, iteration: int) -> tuple[np.ndarray, bool]:
+        """
+        Evaluate the internal force at the trial state and, when needed, a new
+        tangent `_K`. Returns (F_int, refactor).
+        """
+        model, solver = self.model, self.solver
+        factored = solver.factorization is not None
+
+        if factored and not solver._needs_factorization(iteration):
+            R, _, _ = model.evaluate(self.time, tangent=False, load_factor=0.0)
+            return -R, False
+
+        if factored and self._tangent_stable:
+            R, _, _ = model.evaluate(self.time, tangent=False, load_factor=0.0)
+            if not model.tangent_changed():
+                return -R, False
+
+        R, K, _ = model.evaluate(self.time, tangent=True, load_factor=0.0)
+        self._tangent_stable = factored and _same_matrix(K, self._K)
+        if self._tangent_stable:
+            return -R, False
+        self._K = K
+        return -R, True
+
+    def _solve_step(self) -> int:
+        """Iterate one time step, returns the number of iterations (raises RuntimeError)."""
+        model, solver = self.model, self.solver
+        free = model.free_indices
+        alpha_m, alpha_f = self.alpha_m, self.alpha_f
+        t = self.time + self.dt
+
+        u0 = model.u_committed.copy()
+        v0 = model.v_committed.copy()
+        a0 = model.a_committed.copy()
+        model.reset_trial()
+        solver.begin_step()
+
+        F_ext = self._external_force(t)
+        F_ext_avg = (1 - alpha_f) * F_ext + alpha_f * self._F_ext_n
+
+        def residual(u: np.ndarray, F_int: np.ndarray) -> np.ndarray:
+            v, a = self._kinematics(u, u0, v0, a0)
+            return (F_ext_avg
+                    - self._M @ ((1 - alpha_m) * a + alpha_m * a0)
+                    - self._damping_force((1 - alpha_f) * v + alpha_f * v0)
+                    - ((1 - alpha_f) * F_int + alpha_f * self._F_int_n))
+
+        u = u0.copy()
+        residuals = []
+
+        for i in range(solver.max_iter):
+            F_int, refactor = self._internal_force(i)
+            R = residual(u, F_int)
+            norm_R = float(np.linalg.norm(R[free]))
+
+            if not refactor and solver._refactor_after_evaluation(norm_R, residuals):
+                _, self._K, _ = model.evaluate(self.time, tangent=True, load_factor=0.0)
+                refactor = True
+
+            residuals.append(norm_R)
+
+            if not np.isfinite(norm_R):
+                self._fail("Residual norm is NaN or Inf – possible numerical instability.")
+
+            if norm_R < solver.tol:
+                model.v_trial[:], model.a_trial[:] = self._kinematics(u, u0, v0, a0)
+                model.commit_state()
+                self.time = t
+                self._F_int_n = F_int
+                self._F_ext_n = F_ext
+                self._record(residuals, i + 1)
+                return i + 1
+
+            du = np.zeros_like(u)
+            try:
+                K_eff = self._effective_stiffness() if refactor else None
+                du[free] = solver._compute_increment(R[free], K_eff, refactor)
+            except np.linalg.LinAlgError as e:
+                self._fail(f"Linear solve failed: {e}")
+
+            if solver.line_search is not None:
+                eta, evaluations = solver.line_search.search(_StepResidual(model, residual), self.time, u, du, R)
+                solver.step_info['line_search_evaluations'] += evaluations
+                du *= eta
+
+            u += du
+            solver._accept_increment(du[free])
+            model.update_trial_state(u, update_elements=False)
+
+        self._fail("Newton–Raphson did not converge.")
+
+    def _fail(self, message: str) -> None:
+        self.model.reset_trial()
+        self.solver.reset()
+        raise RuntimeError(message)
+
+    def _record(self, residuals: List[float], n_iter: int, step_info: dict | None = None) -> None:
+        model = self.model
+        step_info = dict(self.solver.step_info) if step_info is None else step_info
+        if self.store_history:
+            self.u_history.append(model.u_committed.copy())
+            self.v_history.append(model.v_committed.copy())
+            self.a_history.append(model.a_committed.copy())
+            self.residual_history_per_step.append(residuals)
+            self.step_info_history.append(step_info)
+        self.time_history.append(self.time)
+        self.iteration_counts.append(n_iter)
+
+        recorded = {'iterations': n_iter, 'residual': residuals[-1] if residuals else float('nan'), **step_info}
+        for recorder in self.recorders:
+            recorder.record(self.time, recorded)
+
+        if self.verbose and residuals:
+            print(f"t = {self.time:.4f} | Iterations: {n_iter:2d} | Final Residual Norm: {residuals[-1]:.3e}"
+                  f" | Factorizations: {self.solver.step_info['factorizations']}"
+                  f" | Back-substitutions: {self.solver.step_info['back_substitutions']}")
+
+    def run(self) -> None:
+        """Execute the analysis from the committed state of the model."""
+        self.initialize()
+        self._record([], 0, {})
+
+        for i in range(1, self.steps + 1):
+            try:
+                self._solve_step()
+            except RuntimeError as e:
+                print(f"Step {i} (t = {self.time + self.dt:.4f}) failed: {e}")
+                self.failed_steps += 1
+                break
+
+        for recorder in self.recorders:
+            recorder.flush()
+
+    def plot_response(self, node, dof: int, quantity: str = 'u') -> tuple:
+        """Plot the displacement ('u'), velocity ('v') or acceleration ('a') history of `node` in direction `dof`."""
+        histories = {'u': self.u_history, 'v': self.v_history, 'a': self.a_history}
+        if quantity not in histories:
+            raise ValueError(f"Unsupported response quantity: {quantity}")
+        eq = node.idx[dof]
+        fig, ax = plt.subplots(figsize=(8, 4))
+        ax.plot(self.time_history, [x[eq, 0] for x in histories[quantity]])
+        ax.set_xlabel("Time")
+        ax.set_ylabel(f"Node {node.id} {quantity} (DOF {dof})")
+        ax.grid(True)
+        plt.tight_layout()
+        plt.show()
+
+        return fig, ax
+
+
+class Newmark(TransientIntegrator):
+    """
+    Newmark method, by default the unconditionally stable average acceleration
+    (trapezoidal) rule γ = 1/2, β = 1/4. See `TransientIntegrator`.
+    """
+
+    def __init__(self, model: Model, solver: NewtonRaphsonSolver, dt: float, steps: int,
+                 gamma: float = 0.5, beta: float = 0.25, **kwargs):
+        super().__init__(model, solver, dt, steps, gamma=gamma, beta=beta, **kwargs)
+
+
+class HHT(TransientIntegrator):
+    """
+    Hilber–Hughes–Taylor α method: αm = 0, αf = alpha, γ = 1/2 + alpha,
+    β = (1 + alpha)² / 4, second order accurate with numerical damping of the
+    high frequencies growing with alpha (0 gives the average acceleration rule).
+
+    Note that `alpha` is the weight of the previous state, i.e. -α of Hilber et al.
+    """
+
+    def __init__(self, model: Model, solver: NewtonRaphsonSolver, dt: float, steps: int,
+                 alpha: float = 0.05, **kwargs):
+        if not 0.0 <= alpha <= 1 / 3:
+            raise ValueError("HHT alpha must be in [0, 1/3]")
+        super().__init__(model, solver, dt, steps, alpha_m=0.0, alpha_f=alpha,
+                         gamma=0.5 + alpha, beta=(1 + alpha)**2 / 4, **kwargs)
+
+
+class GeneralizedAlpha(TransientIntegrator):
+    """
+    Generalized-α method of Chung and Hulbert with the parameters chosen from the
+    spectral radius at infinite frequency `rho_inf` (1: no numerical damping,
+    0: asymptotic annihilation), second order accurate and unconditionally stable.
+    """
+
+    def __init__(self, model: Model, solver: NewtonRaphsonSolver, dt: float, steps: int,
+                 rho_inf: float = 0.8, **kwargs):
+        if not 0.0 <= rho_inf <= 1.0:
+            raise ValueError("rho_inf must be in [0, 1]")
+        alpha_m = (2 * rho_inf - 1) / (rho_inf + 1)
+        alpha_f = rho_inf / (rho_inf + 1)
+        super().__init__(model, solver, dt, steps, alpha_m=alpha_m, alpha_f=alpha_f,
+                         gamma=0.5 - alpha_m + alpha_f, beta=(1 - alpha_m + alpha_f)**2 / 4, **kwargs)
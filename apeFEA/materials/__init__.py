@@ -2,10 +2,16 @@ from .linear_elastic import LinearElastic
 from .elasto_plastic import EPP
 from .concrete01 import Concrete01
 from .material import Material
+from .batch import MaterialBatch, LinearElasticBatch, EPPBatch, Concrete01Batch, make_material_batch
 
 __all__ = [
     "Material",
-    "LinearElastic"
+    "LinearElastic",
     "EPP",
-    "Concrete01"
+    "Concrete01",
+    "MaterialBatch",
+    "LinearElasticBatch",
+    "EPPBatch",
+    "Concrete01Batch",
+    "make_material_batch"
 ]
@@ -0,0 +1,272 @@
+import numpy as np
+from numpy import ndarray
+from abc import ABC, abstractmethod
+
+from .material import Material
+from .linear_elastic import LinearElastic
+from .elasto_plastic import EPP
+from .concrete01 import Concrete01
+
+
+class MaterialBatch(ABC):
+    """
+    Abstract base class for N material points of the same uniaxial model,
+    evaluated together with array-backed state.
+
+    Parameters are stored as arrays of length N (one value per point, so points
+    may differ in parameters), trial/committed strain and stress and the history
+    variables as arrays of the same length. `set_trial_strain` updates all points
+    in one vectorized call following exactly the rules of the scalar class, and
+    `commit_state`, `reset_trial` and `revert_to_start` act on the whole batch.
+
+    The getters return the internal arrays (no copies).
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of points. If omitted, it is taken from the parameter arrays.
+    **params : float or array_like
+        Model parameters (see `parameters`), broadcast to N points.
+    """
+
+    #: Names of the model parameters (constructor keywords and attributes)
+    parameters: tuple[str, ...] = ()
+    #: Names of the history variables kept as trial/committed pairs
+    history: tuple[str, ...] = ()
+    #: Scalar material class evaluated by the batch
+    material_class: type[Material] = Material
+
+    def __init__(self, n: int | None = None, **params):
+        missing = set(self.parameters) - set(params)
+        if missing:
+            raise ValueError(f"Missing material parameters: {sorted(missing)}")
+
+        values = [np.atleast_1d(np.asarray(params[name], dtype=float)) for name in self.parameters]
+        shape = (n,) if n is not None else np.broadcast_shapes(*[v.shape for v in values])
+        for name, value in zip(self.parameters, values):
+            setattr(self, name, np.broadcast_to(value, shape).astype(float))
+        self.n = shape[0]
+
+        self.eps_trial = np.zeros(self.n)
+        self.eps_commit = np.zeros(self.n)
+        self.sig_trial = np.zeros(self.n)
+        self.sig_commit = np.zeros(self.n)
+        self.history_trial = self._initial_history()
+        self.history_commit = self._initial_history()
+        self.tangent = np.zeros(self.n)
+        self.set_trial_strain(self.eps_trial)
+        self.tangent_commit = self.tangent.copy()
+
+    @classmethod
+    def from_materials(cls, materials: list[Material]) -> "MaterialBatch":
+        """
+        Build a batch from scalar materials of `material_class`, one point per material.
+        The state of the materials is not copied (the batch starts unstrained).
+        """
+        if any(type(m) is not cls.material_class for m in materials):
+            raise ValueError(f"{cls.__name__} requires {cls.material_class.__name__} materials")
+        return cls(**{name: [getattr(m, name) for m in materials] for name in cls.parameters})
+
+    @classmethod
+    def concatenate(cls, batches: list["MaterialBatch"]) -> "MaterialBatch":
+        """Join batches of the same type into one, keeping parameters and state."""
+        if any(type(b) is not cls for b in batches):
+            raise ValueError(f"Only {cls.__name__} batches can be concatenated")
+        joined = cls(**{name: np.concatenate([getattr(b, name) for b in batches]) for name in cls.parameters})
+        for name in ('eps_trial', 'eps_commit', 'sig_trial', 'sig_commit', 'tangent', 'tangent_commit'):
+            setattr(joined, name, np.concatenate([getattr(b, name) for b in batches]))
+        for name in cls.history:
+            joined.history_trial[name] = np.concatenate([b.history_trial[name] for b in batches])
+            joined.history_commit[name] = np.concatenate([b.history_commit[name] for b in batches])
+        return joined
+
+    def _initial_history(self) -> dict[str, ndarray]:
+        """History variables of the unstrained state (zeros unless overridden)."""
+        return {name: np.zeros(self.n) for name in self.history}
+
+    @abstractmethod
+    def _update(self, eps: ndarray) -> tuple[ndarray, ndarray, dict[str, ndarray]]:
+        """Return trial stress, tangent and trial history variables at strains `eps`."""
+        ...
+
+    def set_trial_strain(self, eps: ndarray) -> None:
+        """Set the trial strain of all points (array of length N, or a scalar)."""
+        self.eps_trial = np.broadcast_to(np.asarray(eps, dtype=float), (self.n,)).copy()
+        self.sig_trial, self.tangent, history = self._update(self.eps_trial)
+        self.history_trial.update(history)
+
+    def get_trial_stress(self) -> ndarray:
+        return self.sig_trial
+
+    def get_tangent(self) -> ndarray:
+        return self.tangent
+
+    def commit_state(self) -> None:
+        self.eps_commit = self.eps_trial.copy()
+        self.sig_commit = self.sig_trial.copy()
+        self.tangent_commit = self.tangent.copy()
+        for name in self.history:
+            self.history_commit[name] = self.history_trial[name].copy()
+
+    def reset_trial(self) -> None:
+        self.eps_trial = self.eps_commit.copy()
+        self.sig_trial = self.sig_commit.copy()
+        self.tangent = self.tangent_commit.copy()
+        for name in self.history:
+            self.history_trial[name] = self.history_commit[name].copy()
+
+    def revert_to_start(self) -> None:
+        self.history_commit = self._initial_history()
+        self.eps_commit = np.zeros(self.n)
+        self.sig_commit = np.zeros(self.n)
+        self.set_trial_strain(np.zeros(self.n))
+        self.commit_state()
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(n={self.n})"
+
+
+class LinearElasticBatch(MaterialBatch):
+    """
+    Batch of `LinearElastic` points: σ = E ε.
+    """
+    parameters = ('E',)
+    material_class = LinearElastic
+
+    def _update(self, eps):
+        return self.E * eps, self.E.copy(), {}
+
+
+class EPPBatch(MaterialBatch):
+    """
+    Batch of `EPP` points (elastic-perfectly plastic, radial return, consistent tangent).
+    History variable: plastic strain `eps_p`.
+    """
+    parameters = ('E', 'fy')
+    history = ('eps_p',)
+    material_class = EPP
+
+    def _update(self, eps):
+        eps_p_c = self.history_commit['eps_p']
+        trial = self.E * (eps - eps_p_c)
+        f = np.abs(trial) - self.fy
+        plastic = f > 0.0
+        sign = np.sign(trial)
+
+        sig = np.where(plastic, sign * self.fy, trial)
+        eps_p = np.where(plastic, eps_p_c + sign * f / self.E, eps_p_c)
+        Et = np.where(plastic, 0.0, self.E)
+        return sig, Et, {'eps_p': eps_p}
+
+
+class Concrete01Batch(MaterialBatch):
+    """
+    Batch of `Concrete01` points (envelope, linear unloading/reloading, consistent tangent).
+    History variables: minimum strain `eps_min`, end strain of the unloading line
+    `eps_end` and unloading slope `E_unload`.
+    """
+    parameters = ('E0', 'fc', 'eps_c0', 'fcu', 'eps_u')
+    history = ('eps_min', 'eps_end', 'E_unload')
+    material_class = Concrete01
+
+    @property
+    def Ec0(self) -> ndarray:
+        return 2.0 * self.fc / self.eps_c0
+
+    def _initial_history(self):
+        history = super()._initial_history()
+        history['E_unload'] = self.Ec0
+        return history
+
+    def _envelope(self, eps):
+        eta = eps / self.eps_c0
+        slope = (self.fc - self.fcu) / (self.eps_c0 - self.eps_u)
+        ascending, descending = eps > self.eps_c0, eps > self.eps_u
+        sig = np.select(
+            [eps > 0.0, ascending, descending],
+            [0.0, self.fc * eta * (2 - eta), self.fc + slope * (eps - self.eps_c0)],
+            default=self.fcu,
+        )
+        Et = np.select([eps > 0.0, ascending, descending], [0.0, self.Ec0 * (1 - eta), slope], default=0.0)
+        return sig, Et
+
+    def _unload(self, eps_min, sig_min):
+        eta = np.maximum(eps_min, self.eps_u) / self.eps_c0
+        ratio = np.where(eta < 2.0, 0.145 * eta**2 + 0.13 * eta, 0.707 * (eta - 2.0) + 0.834)
+        eps_end = ratio * self.eps_c0
+
+        # The unloading slope is bounded by Ec0
+        dx = eps_min - eps_end
+        dx_Ec0 = sig_min / self.Ec0
+        secant = (dx <= -np.finfo(float).eps) & (dx <= dx_Ec0)
+        bounded = (dx <= -np.finfo(float).eps) & ~secant
+        with np.errstate(divide='ignore', invalid='ignore'):
+            E_unload = np.where(secant, sig_min / dx, self.Ec0)
+        eps_end = np.where(bounded, eps_min - dx_Ec0, eps_end)
+        return eps_end, E_unload
+
+    def _update(self, eps):
+        committed = self.history_commit
+        eps_min_c, eps_end_c, E_unload_c = committed['eps_min'], committed['eps_end'], committed['E_unload']
+
+        # Further into compression: envelope (new minimum) or reloading line
+        new_min = eps <= eps_min_c
+        sig_env, Et_env = self._envelope(eps)
+        eps_end_env, E_unload_env = self._unload(eps, sig_env)
+        on_line = ~new_min & (eps <= eps_end_c)
+        sig_reload = np.select([new_min, on_line], [sig_env, E_unload_c * (eps - eps_end_c)], default=0.0)
+        Et_reload = np.select([new_min, on_line], [Et_env, E_unload_c], default=0.0)
+
+        sig_unload = self.sig_commit + E_unload_c * (eps - self.eps_commit)
+        loading = eps <= self.eps_commit
+        use_unload = np.where(loading, sig_unload > sig_reload, sig_unload <= 0.0)
+        sig = np.where(use_unload, sig_unload, np.where(loading, sig_reload, 0.0))
+        Et = np.where(use_unload, E_unload_c, np.where(loading, Et_reload, 0.0))
+
+        tension = eps > 0.0
+        sig = np.where(tension, 0.0, sig)
+        Et = np.where(tension, 0.0, Et)
+
+        update = new_min & loading & ~tension
+        history = {
+            'eps_min': np.where(update, eps, eps_min_c),
+            'eps_end': np.where(update, eps_end_env, eps_end_c),
+            'E_unload': np.where(update, E_unload_env, E_unload_c),
+        }
+        return sig, Et, history
+
+
+_BATCHES: dict[type, type[MaterialBatch]] = {
+    LinearElastic: LinearElasticBatch,
+    EPP: EPPBatch,
+    Concrete01: Concrete01Batch,
+}
+
+
+def make_material_batch(material: Material | list[Material], n: int | None = None) -> MaterialBatch:
+    """
+    Return the batch equivalent of scalar materials.
+
+    Parameters
+    ----------
+    material : Material or list[Material]
+        A single material (replicated `n` times) or a list of materials of one type.
+    n : int, optional
+        Number of points for a single material (default 1).
+
+    Raises
+    ------
+    ValueError
+        If the material type has no batch implementation or the list mixes types.
+    """
+    materials = material if isinstance(material, (list, tuple)) else [material] * (n or 1)
+    if not materials:
+        raise ValueError("At least one material is required")
+    try:
+        cls = _BATCHES[type(materials[0])]
+    except KeyError:
+        raise ValueError(f"Unsupported batched material: {type(materials[0]).__name__}")
+    return cls.from_materials(list(materials))
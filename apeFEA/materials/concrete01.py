@@ -1,3 +1,6 @@
+import sys
+import math
+import warnings
 from dataclasses import dataclass, field
 from .material import Material
 
@@ -5,21 +8,37 @@ from .material import Material
 @dataclass
 class Concrete01(Material):
     """
-    Compressive-only concrete model (similar to OpenSees Concrete01).
-    Only covers the loading envelope (no unloading/reloading paths).
+    Compressive-only concrete model following OpenSees Concrete01
+    (Kent–Scott–Park envelope, degraded linear unloading/reloading).
+
+    Envelope (compression negative), with Ec0 = 2 fc / eps_c0:
+        eps_c0 < eps <= 0  : σ = fc η (2 - η),  η = eps / eps_c0
+        eps_u  < eps <= eps_c0 : linear from (eps_c0, fc) to (eps_u, fcu)
+        eps <= eps_u       : σ = fcu
+    No tensile resistance.
+
+    Unloading from the envelope point (eps_min, σ_min) follows a straight line to
+    the strain eps_end at zero stress (Karsan–Jirsa rule), reloading follows the
+    same line back to the envelope. Between eps_end and zero strain the stress is 0.
+    History variables are the minimum strain reached, eps_end and the unloading slope.
+
+    `get_tangent` returns the slope of the branch used for the trial stress, i.e.
+    the consistent tangent (the secant is never used).
 
     Parameters
     ----------
     E0 : float
-        Initial elastic stiffness (secant modulus).
+        Initial modulus. The response uses the initial slope of the envelope,
+        Ec0 = 2 fc / eps_c0, for loading and unloading, so E0 must match it; a
+        `UserWarning` is issued (and E0 ignored) otherwise.
     fc : float
         Peak compressive strength (negative).
     eps_c0 : float
-        Strain at peak strength.
+        Strain at peak strength (negative).
     fcu : float
-        Residual crushing strength (more negative than fc).
+        Residual crushing strength (negative).
     eps_u : float
-        Strain at ultimate crushing strength.
+        Strain at ultimate crushing strength (negative).
     """
     E0: float
     fc: float
@@ -31,39 +50,114 @@ class Concrete01(Material):
     _sig_c: float = field(default=0.0, init=False)
     _eps_t: float = field(default=0.0, init=False)
     _sig_t: float = field(default=0.0, init=False)
+    _Et_c: float = field(default=0.0, init=False)
+    _Et_t: float = field(default=0.0, init=False)
+
+    # History: minimum strain, end strain of the unloading line, unloading slope
+    _eps_min_c: float = field(default=0.0, init=False)
+    _eps_end_c: float = field(default=0.0, init=False)
+    _E_unload_c: float = field(default=0.0, init=False)
+    _eps_min_t: float = field(default=0.0, init=False)
+    _eps_end_t: float = field(default=0.0, init=False)
+    _E_unload_t: float = field(default=0.0, init=False)
+
+    def __post_init__(self):
+        if not math.isclose(self.E0, self.Ec0, rel_tol=1e-3):
+            warnings.warn(f"Concrete01 uses the envelope initial slope 2 fc / eps_c0 = {self.Ec0:g}, "
+                          f"E0 = {self.E0:g} is ignored", UserWarning, stacklevel=3)
+        self._E_unload_c = self._E_unload_t = self.Ec0
+        self._Et_c = self._Et_t = self.Ec0
+
+    @property
+    def Ec0(self) -> float:
+        """Initial slope of the envelope, 2 fc / eps_c0."""
+        return 2.0 * self.fc / self.eps_c0
 
-    def _envelope(self, eps: float) -> float:
+    def _envelope(self, eps: float) -> tuple[float, float]:
         """
-        Stress-strain envelope curve: ascending and descending compressive branches.
-        No tensile resistance.
+        Stress and tangent of the envelope curve: ascending and descending
+        compressive branches. No tensile resistance.
         """
-        if eps >= 0:
-            return 0.0
+        if eps > 0.0:
+            return 0.0, 0.0
         if eps > self.eps_c0:
             # Ascending parabolic branch
-            return self.fc * (eps / self.eps_c0) * (2 - eps / self.eps_c0)
+            eta = eps / self.eps_c0
+            return self.fc * eta * (2 - eta), self.Ec0 * (1 - eta)
         if eps > self.eps_u:
             # Linear descending branch
-            return (self.fc - self.fcu) * ((eps - self.eps_c0) / (self.eps_u - self.eps_c0)) + self.fc
-        return self.fcu  # Crushed state
+            slope = (self.fc - self.fcu) / (self.eps_c0 - self.eps_u)
+            return self.fc + slope * (eps - self.eps_c0), slope
+        return self.fcu, 0.0  # Crushed state
+
+    def _unload(self, sig_min: float) -> None:
+        """Unloading line from the envelope point (eps_min, sig_min)."""
+        eps_min = self._eps_min_t
+        eta = max(eps_min, self.eps_u) / self.eps_c0
+        ratio = 0.145 * eta**2 + 0.13 * eta if eta < 2.0 else 0.707 * (eta - 2.0) + 0.834
+        eps_end = ratio * self.eps_c0
+
+        # The unloading slope is bounded by Ec0
+        dx = eps_min - eps_end
+        dx_Ec0 = sig_min / self.Ec0
+        if dx > -sys.float_info.epsilon:
+            self._eps_end_t, self._E_unload_t = eps_end, self.Ec0
+        elif dx <= dx_Ec0:
+            self._eps_end_t, self._E_unload_t = eps_end, sig_min / dx
+        else:
+            self._eps_end_t, self._E_unload_t = eps_min - dx_Ec0, self.Ec0
+
+    def _reload(self, eps: float) -> tuple[float, float]:
+        """Stress and tangent when the strain moves further into compression."""
+        if eps <= self._eps_min_t:
+            self._eps_min_t = eps
+            sig, Et = self._envelope(eps)
+            self._unload(sig)
+            return sig, Et
+        if eps <= self._eps_end_t:
+            return self._E_unload_t * (eps - self._eps_end_t), self._E_unload_t
+        return 0.0, 0.0
 
     def set_trial_strain(self, eps: float) -> None:
         self._eps_t = eps
-        self._sig_t = self._envelope(eps)
+        self._eps_min_t = self._eps_min_c
+        self._eps_end_t = self._eps_end_c
+        self._E_unload_t = self._E_unload_c
+
+        if eps > 0.0:
+            self._sig_t, self._Et_t = 0.0, 0.0
+            return
+
+        E_unload = self._E_unload_c
+        sig_unload = self._sig_c + E_unload * (eps - self._eps_c)
+
+        if eps <= self._eps_c:  # Further into compression
+            self._sig_t, self._Et_t = self._reload(eps)
+            if sig_unload > self._sig_t:
+                self._sig_t, self._Et_t = sig_unload, E_unload
+        elif sig_unload <= 0.0:  # Unloading towards tension
+            self._sig_t, self._Et_t = sig_unload, E_unload
+        else:  # Unloaded past eps_end
+            self._sig_t, self._Et_t = 0.0, 0.0
 
     def get_trial_stress(self) -> float:
         return self._sig_t
 
     def get_tangent(self) -> float:
-        # Return secant stiffness as a simple approximation
-        if self._eps_t == 0.0:
-            return self.E0
-        return self._sig_t / self._eps_t
+        return self._Et_t
 
     def commit_state(self) -> None:
         self._eps_c = self._eps_t
         self._sig_c = self._sig_t
+        self._Et_c = self._Et_t
+        self._eps_min_c = self._eps_min_t
+        self._eps_end_c = self._eps_end_t
+        self._E_unload_c = self._E_unload_t
 
     def reset_trial(self) -> None:
         self._eps_t = self._eps_c
         self._sig_t = self._sig_c
+        self._Et_t = self._Et_c
+        self._eps_min_t = self._eps_min_c
+        self._eps_end_t = self._eps_end_c
+        self._E_unload_t = self._E_unload_c
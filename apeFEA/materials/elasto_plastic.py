@@ -8,6 +8,9 @@ from .material import Material
 class EPP(Material):
     """
     Elastic-perfectly plastic 1D material model (symmetric tension/compression).
+
+    The tangent is the consistent (algorithmic) tangent of the radial return:
+    E for an elastic step and 0 for a step with plastic correction.
     """
     E: float               # Young's modulus
     fy: float              # Yield stress
@@ -17,6 +20,11 @@ class EPP(Material):
     _eps_t: float = field(default=0.0, init=False)
     _sig_t: float = field(default=0.0, init=False)
     _eps_p_c: float = field(default=0.0, init=False)  # Committed plastic strain
+    _Et_c: float = field(default=0.0, init=False)     # Committed tangent
+    _Et_t: float = field(default=0.0, init=False)     # Trial tangent
+
+    def __post_init__(self):
+        self._Et_c = self._Et_t = self.E
 
     def _yield_f(self, sigma: float) -> float:
         return abs(sigma) - self.fy
@@ -28,20 +36,24 @@ class EPP(Material):
 
         if f <= 0.0:  # Elastic
             self._sig_t = trial_stress
+            self._eps_p_inc = 0.0
+            self._Et_t = self.E
         else:  # Plastic correction (radial return)
             sign = np.sign(trial_stress)
             self._sig_t = sign * self.fy
             self._eps_p_inc = (f / self.E) * sign
+            self._Et_t = 0.0
 
     def get_trial_stress(self) -> float:
         return self._sig_t
 
     def get_tangent(self) -> float:
-        return self.E if self._yield_f(self._sig_t) < 0.0 else 0.0
+        return self._Et_t
 
     def commit_state(self) -> None:
         self._eps_c = self._eps_t
         self._sig_c = self._sig_t
+        self._Et_c = self._Et_t
         if hasattr(self, "_eps_p_inc"):
             self._eps_p_c += self._eps_p_inc
             del self._eps_p_inc
@@ -49,3 +61,5 @@ class EPP(Material):
     def reset_trial(self) -> None:
         self._eps_t = self._eps_c
         self._sig_t = self._sig_c
+        self._Et_t = self._Et_c
+        self._eps_p_inc = 0.0
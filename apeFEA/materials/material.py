@@ -30,6 +30,47 @@ class Material(ABC):
     @abstractmethod
     def reset_trial(self) -> None: ...
 
+    def check_tangent(self, eps: float, h: float | None = None) -> tuple[float, float, float]:
+        """
+        Compare the tangent at the trial strain `eps` with a central finite
+        difference of the trial stress, both from the committed state.
+
+        The trial state is left at `eps`. At a kink of the response (e.g. at the
+        committed strain of a path-dependent model, or at a branch limit) the
+        one-sided slopes differ and the comparison is not meaningful.
+
+        Parameters
+        ----------
+        eps : float
+            Trial strain.
+        h : float, optional
+            Strain perturbation, default 1e-6 · max(|eps|, 1e-3).
+
+        Returns
+        -------
+        tangent : float
+            Tangent returned by `get_tangent`.
+        fd_tangent : float
+            Finite difference tangent.
+        error : float
+            |tangent - fd_tangent| relative to the larger of the two (0 if both vanish).
+        """
+        if h is None:
+            h = 1e-6 * max(abs(eps), 1e-3)
+
+        self.set_trial_strain(eps + h)
+        sig_plus = self.get_trial_stress()
+        self.set_trial_strain(eps - h)
+        sig_minus = self.get_trial_stress()
+        fd_tangent = (sig_plus - sig_minus) / (2 * h)
+
+        self.set_trial_strain(eps)
+        tangent = self.get_tangent()
+
+        scale = max(abs(tangent), abs(fd_tangent))
+        error = abs(tangent - fd_tangent) / scale if scale > 0.0 else 0.0
+        return tangent, fd_tangent, error
+
     def plot(
         self,
         strain_range: np.ndarray,
@@ -0,0 +1,9 @@
+from .dof_numberer import DOFNumberer, PlainNumberer, RCMNumberer, MinimumDegreeNumberer, make_numberer
+
+__all__ = [
+    "DOFNumberer",
+    "PlainNumberer",
+    "RCMNumberer",
+    "MinimumDegreeNumberer",
+    "make_numberer"
+]
\ No newline at end of file
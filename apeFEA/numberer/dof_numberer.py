@@ -0,0 +1,228 @@
+import heapq
+import numpy as np
+from numpy import ndarray
+from abc import ABC, abstractmethod
+from scipy import sparse
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from apeFEA.core.node import Node
+
+
+class DOFNumberer(ABC):
+    """
+    Abstract base class for global equation numbering.
+
+    A numberer assigns compact, consecutive global DOF indices to the nodes that
+    are actually connected by elements, independently of the node ids, so gapped
+    ids (e.g. after merging meshes) do not create empty equations. Subclasses only
+    decide the node order; DOFs of one node are always numbered consecutively.
+
+    The reordering is node-based: restrained DOFs keep their equations next to the
+    free DOFs of their node, so the assembled system has n_nodes * ndof equations
+    (`Model.system_ndof`) and restrained equations sit inside its band. They are
+    removed before factorization, which works on the free-DOF matrix K_ff in the
+    same relative order.
+
+    After `number` the element DOF indices are re-derived from the nodes and the
+    bandwidth/profile is stored in `report`, before (node ids order) and after
+    reordering, both for the free-DOF matrix K_ff that is factored and for the
+    assembled system including the restrained equations.
+
+    Attributes
+    ----------
+    report : dict
+        Number of equations (including restrained DOFs), free equations, and
+        bandwidth/profile before and after: 'bandwidth_*'/'profile_*' for K_ff,
+        'system_bandwidth_*'/'system_profile_*' for the assembled system.
+    """
+
+    def __init__(self):
+        self.report: dict = {}
+
+    @abstractmethod
+    def _order_nodes(self, adjacency: sparse.csr_matrix) -> ndarray:
+        """
+        Return the new node order as a permutation of `range(n_nodes)`.
+
+        Parameters
+        ----------
+        adjacency : csr_matrix
+            Node connectivity graph, nodes sorted by id.
+        """
+        ...
+
+    def number(self, nodes: list["Node"], elements: list, ndof: int = 3) -> list["Node"]:
+        """
+        Number the global DOFs of `nodes` and refresh the element DOF indices.
+
+        Parameters
+        ----------
+        nodes : list[Node]
+            Nodes of the model (any order).
+        elements : list[Element]
+            Elements connecting the nodes.
+        ndof : int
+            Degrees of freedom per node.
+
+        Returns
+        -------
+        list[Node]
+            Nodes in equation order.
+        """
+        nodes = sorted(nodes, key=lambda node: node.id)
+        position = {id(node): k for k, node in enumerate(nodes)}
+        connectivity = [np.array([position[id(node)] for node in element.nodes]) for element in elements]
+        free = ~np.concatenate([node.restraints.restrained for node in nodes])
+
+        adjacency = self._adjacency(connectivity, len(nodes))
+        order = np.asarray(self._order_nodes(adjacency), dtype=int)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+
+        figures = {}
+        every = np.ones_like(free)
+        for prefix, dofs in (('', free), ('system_', every)):
+            for suffix, ranking in (('before', np.arange(len(nodes))), ('after', rank)):
+                bandwidth, profile = self._bandwidth_profile(connectivity, ranking, dofs, ndof)
+                figures[f'{prefix}bandwidth_{suffix}'] = bandwidth
+                figures[f'{prefix}profile_{suffix}'] = profile
+
+        ordered_nodes = [nodes[k] for k in order]
+        for k, node in enumerate(ordered_nodes):
+            node.idx = node.set_indices(start_index=k + 1)
+        for element in elements:
+            element.update_indices()
+
+        self.report = {
+            'numberer': type(self).__name__,
+            'n_equations': len(nodes) * ndof,
+            'n_free': int(free.sum()),
+            **figures,
+        }
+        return ordered_nodes
+
+    @staticmethod
+    def _adjacency(connectivity: list[ndarray], n_nodes: int) -> sparse.csr_matrix:
+        rows = np.concatenate([np.repeat(conn, len(conn)) for conn in connectivity])
+        cols = np.concatenate([np.tile(conn, len(conn)) for conn in connectivity])
+        graph = sparse.coo_matrix((np.ones(len(rows)), (rows, cols)), shape=(n_nodes, n_nodes)).tocsr()
+        graph.setdiag(0)
+        graph.eliminate_zeros()
+        return graph
+
+    @staticmethod
+    def _bandwidth_profile(connectivity: list[ndarray], rank: ndarray, free: ndarray, ndof: int) -> tuple[int, int]:
+        """
+        Half-bandwidth and (lower) profile of the stiffness pattern restricted to the
+        DOFs selected by the mask `free`, for a node ranking.
+        """
+        n_free = int(free.sum())
+        if n_free == 0:
+            return 0, 0
+
+        # Equation number of every DOF (node-major, in ranked order) restricted to free DOFs
+        dof_rank = (rank[:, None] * ndof + np.arange(ndof)).ravel()
+        equation = np.full(len(dof_rank), -1)
+        free_dofs = np.flatnonzero(free)
+        equation[free_dofs[np.argsort(dof_rank[free_dofs])]] = np.arange(n_free)
+
+        first = np.arange(n_free)
+        bandwidth = 0
+        for conn in connectivity:
+            eq = equation[(conn[:, None] * ndof + np.arange(ndof)).ravel()]
+            eq = eq[eq >= 0]
+            if len(eq) == 0:
+                continue
+            np.minimum.at(first, eq, eq.min())
+            bandwidth = max(bandwidth, int(eq.max() - eq.min()))
+
+        profile = int(np.sum(np.arange(n_free) - first))
+        return bandwidth, profile
+
+    def print_report(self) -> None:
+        """Print the bandwidth/profile report of the last numbering."""
+        if not self.report:
+            print("DOF numbering has not been performed yet.")
+            return
+        r = self.report
+        print(f"DOF Numberer: {r['numberer']} (node-based ordering)")
+        print(f"Equations: {r['n_equations']} ({r['n_free']} free)")
+        print(f"{'Free DOFs (K_ff)':<30} bandwidth: {r['bandwidth_before']} → {r['bandwidth_after']}, "
+              f"profile: {r['profile_before']} → {r['profile_after']}")
+        print(f"{'System (incl. restrained DOFs)':<30} bandwidth: {r['system_bandwidth_before']} → {r['system_bandwidth_after']}, "
+              f"profile: {r['system_profile_before']} → {r['system_profile_after']}")
+
+
+class PlainNumberer(DOFNumberer):
+    """
+    Number nodes in increasing id order (compact, no reordering).
+    """
+
+    def _order_nodes(self, adjacency: sparse.csr_matrix) -> ndarray:
+        return np.arange(adjacency.shape[0])
+
+
+class RCMNumberer(DOFNumberer):
+    """
+    Reverse Cuthill–McKee ordering of the node graph (bandwidth/profile reduction).
+    """
+
+    def _order_nodes(self, adjacency: sparse.csr_matrix) -> ndarray:
+        return reverse_cuthill_mckee(adjacency, symmetric_mode=True)
+
+
+class MinimumDegreeNumberer(DOFNumberer):
+    """
+    Minimum-degree ordering of the node graph (fill reduction for direct factorization).
+
+    Nodes are eliminated greedily by smallest current degree; eliminating a node
+    connects all of its remaining neighbours, which models the fill-in. The
+    bandwidth is not a target and may grow; use `RCMNumberer` for banded storage.
+    """
+
+    def _order_nodes(self, adjacency: sparse.csr_matrix) -> ndarray:
+        n = adjacency.shape[0]
+        graph = [set(adjacency.indices[adjacency.indptr[k]:adjacency.indptr[k + 1]]) for k in range(n)]
+        heap = [(len(graph[k]), k) for k in range(n)]
+        heapq.heapify(heap)
+
+        eliminated = np.zeros(n, dtype=bool)
+        order = []
+        while heap:
+            degree, k = heapq.heappop(heap)
+            if eliminated[k] or degree != len(graph[k]):
+                continue
+            eliminated[k] = True
+            order.append(k)
+
+            neighbours = graph[k]
+            for m in neighbours:
+                graph[m].discard(k)
+                graph[m] |= neighbours - {m}
+                heapq.heappush(heap, (len(graph[m]), m))
+            graph[k] = set()
+
+        return np.array(order, dtype=int)
+
+
+_NUMBERERS = {
+    'plain': PlainNumberer,
+    'rcm': RCMNumberer,
+    'amd': MinimumDegreeNumberer,
+    'minimum_degree': MinimumDegreeNumberer,
+}
+
+
+def make_numberer(numberer: "str | DOFNumberer") -> DOFNumberer:
+    """
+    Return a `DOFNumberer` instance from a name ('plain', 'rcm', 'amd'/'minimum_degree')
+    or pass an existing instance through.
+    """
+    if isinstance(numberer, DOFNumberer):
+        return numberer
+    try:
+        return _NUMBERERS[numberer]()
+    except KeyError:
+        raise ValueError(f"Unsupported numberer: {numberer}")
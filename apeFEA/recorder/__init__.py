@@ -0,0 +1,15 @@
+"""
+Recorder module — streams analysis results to disk in fixed-size chunks.
+"""
+
+from .recorder_abstraction import Recorder
+from .recorders import NodeRecorder, ElementForceRecorder, ConvergenceRecorder
+from .storage import read_recorder
+
+__all__ = [
+    "Recorder",
+    "NodeRecorder",
+    "ElementForceRecorder",
+    "ConvergenceRecorder",
+    "read_recorder",
+]
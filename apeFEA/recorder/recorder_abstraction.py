@@ -0,0 +1,159 @@
+import queue
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import numpy as np
+from numpy import ndarray
+
+from .storage import open_writer, read_recorder
+
+
+class Recorder(ABC):
+    """
+    Abstract base class of the recorders, which stream one row per recorded step
+    (time followed by the recorded values) to a file instead of keeping the
+    history in memory.
+
+    Rows are written into a preallocated (chunk_size, columns) buffer; a full
+    buffer is appended to the file as one block (see `open_writer` for the
+    .npy, .npz and HDF5 formats), so memory use does not grow with the number of
+    steps. With `background=True` a second buffer is allocated and full buffers
+    are written by a worker thread while the analysis fills the other one; the
+    analysis only waits if the disk falls a whole chunk behind. Errors of the
+    worker are raised by the next `record`, `flush` or `close`.
+
+    Integrators call `record(time, step_info)` after every converged step, with
+    the convergence statistics of the step in `step_info`, and `flush` at the end
+    of `run`. Call `close` (or use the recorder as a context manager) once the
+    analyses are done to finish the file.
+
+    Subclasses define the recorded `columns` and write the values of a row in
+    `_values`.
+
+    Parameters
+    ----------
+    path : str or Path
+        Output file, the format follows the suffix (.npy, .npz, .h5 or .hdf5).
+    columns : list[str]
+        Names of the recorded values (the time column is added in front).
+    chunk_size : int
+        Number of rows per buffer and per block written.
+    background : bool
+        Write full buffers on a worker thread.
+    """
+
+    def __init__(self, path: str | Path, columns: list[str], chunk_size: int = 1024, background: bool = False):
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be a positive number of rows")
+
+        self.path = Path(path)
+        self.columns = ['time'] + list(columns)
+        self.chunk_size = chunk_size
+        self.background = background
+        self.rows: int = 0
+        self.closed: bool = False
+
+        self._writer = open_writer(self.path, self.columns, chunk_size=chunk_size)
+        self._buffer = np.empty((chunk_size, len(self.columns)))
+        self._fill = 0
+
+        self._thread: threading.Thread | None = None
+        self._error: BaseException | None = None
+        if background:
+            self._free: queue.Queue = queue.Queue()
+            self._free.put(np.empty_like(self._buffer))
+            self._pending: queue.Queue = queue.Queue()
+            self._thread = threading.Thread(target=self._write_loop, name=f"Recorder({self.path.name})", daemon=True)
+            self._thread.start()
+
+    @abstractmethod
+    def _values(self, out: ndarray, step_info: dict) -> None:
+        """Write the recorded values of the current step into `out` (one row without the time)."""
+        ...
+
+    # ---------------------------------------------------
+    # Recording
+    def record(self, time: float, step_info: dict | None = None) -> None:
+        """Record the current (committed) state at `time`."""
+        if self.closed:
+            raise ValueError(f"Recorder {self.path} is closed")
+        row = self._buffer[self._fill]
+        row[0] = time
+        self._values(row[1:], step_info or {})
+        self._fill += 1
+        self.rows += 1
+        if self._fill == self.chunk_size:
+            self._write_buffer()
+
+    def _write_buffer(self) -> None:
+        self._raise_worker_error()
+        if self._fill == 0:
+            return
+        if self._thread is None:
+            self._writer.append(self._buffer[:self._fill])
+        else:
+            self._pending.put((self._buffer, self._fill))
+            self._buffer = self._free.get()
+        self._fill = 0
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is None:
+                self._pending.task_done()
+                return
+            buffer, n = item
+            try:
+                if self._error is None:
+                    self._writer.append(buffer[:n])
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._free.put(buffer)
+                self._pending.task_done()
+
+    def _raise_worker_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(f"Recorder {self.path}: writing failed") from error
+
+    # ---------------------------------------------------
+    # File
+    def flush(self) -> None:
+        """Write the buffered rows (and wait for the worker thread)."""
+        if self.closed:
+            return
+        self._write_buffer()
+        if self._thread is not None:
+            self._pending.join()
+        self._raise_worker_error()
+
+    def close(self) -> None:
+        """Write the buffered rows, stop the worker thread and close the file."""
+        if self.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            if self._thread is not None:
+                self._pending.put(None)
+                self._thread.join()
+            self._writer.close()
+            self.closed = True
+
+    def read(self, mmap: bool = True) -> ndarray:
+        """Return the recorded rows (flushed first; a .npz archive must be closed)."""
+        self.flush()
+        if self.path.suffix.lower() == '.npz' and not self.closed:
+            raise ValueError(f"Recorder {self.path}: a .npz archive can only be read once closed")
+        return read_recorder(self.path, mmap=mmap)
+
+    def __enter__(self) -> "Recorder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path}, {len(self.columns) - 1} values, {self.rows} rows)"
@@ -0,0 +1,179 @@
+from pathlib import Path
+
+import numpy as np
+from numpy import ndarray
+
+from apeFEA.core.model import Model
+from apeFEA.core.node import Node
+from .recorder_abstraction import Recorder
+
+
+class NodeRecorder(Recorder):
+    """
+    Records a nodal response at selected nodes and DOFs, one column per (node, DOF).
+
+    Responses are read from the committed global vectors of the model:
+
+    - 'displacement', 'velocity', 'acceleration': `model.u_committed`,
+      `model.v_committed`, `model.a_committed` (the latter two from transient analyses);
+    - 'reaction': resisting minus external force of the last evaluation,
+      `model.f_internal - model.f_external` (inertia and damping forces excluded),
+      by default at the nodes with restrained DOFs.
+
+    Parameters
+    ----------
+    model : Model
+        Recorded model.
+    path : str or Path
+        Output file (see `Recorder`).
+    nodes : list[Node], optional
+        Recorded nodes (default: all nodes, or the restrained ones for reactions).
+    dofs : list[int], optional
+        Recorded DOFs of every node (default: all).
+    response : str
+        'displacement', 'velocity', 'acceleration' or 'reaction'.
+    chunk_size, background :
+        See `Recorder`.
+    """
+
+    RESPONSES = ('displacement', 'velocity', 'acceleration', 'reaction')
+
+    def __init__(
+        self,
+        model: Model,
+        path: str | Path,
+        nodes: list[Node] | None = None,
+        dofs: list[int] | None = None,
+        response: str = 'displacement',
+        chunk_size: int = 1024,
+        background: bool = False,
+    ):
+        if response not in self.RESPONSES:
+            raise ValueError(f"Unsupported node response: {response}")
+        if nodes is None:
+            nodes = model.nodes
+            if response == 'reaction':
+                restrained = set(model.restrained_indices.tolist())
+                nodes = [node for node in nodes if restrained.intersection(node.idx.tolist())]
+        dofs = list(range(model.ndof)) if dofs is None else list(dofs)
+        for node in nodes:
+            if not any(n is node for n in model.nodes):
+                raise ValueError(f"Node {node.id} is not part of the model")
+        if any(not 0 <= dof < model.ndof for dof in dofs):
+            raise ValueError(f"Invalid DOFs {dofs} for nodes with {model.ndof} DOFs")
+
+        self.model = model
+        self.nodes = list(nodes)
+        self.dofs = dofs
+        self.response = response
+        self._equations = np.array([node.idx[dof] for node in self.nodes for dof in dofs], dtype=int)
+        columns = [f"node{node.id}_dof{dof}" for node in self.nodes for dof in dofs]
+        super().__init__(path, columns, chunk_size, background)
+
+    def _values(self, out: ndarray, step_info: dict) -> None:
+        model, eq = self.model, self._equations
+        if self.response == 'displacement':
+            out[:] = model.u_committed[eq, 0]
+        elif self.response == 'velocity':
+            out[:] = model.v_committed[eq, 0]
+        elif self.response == 'acceleration':
+            out[:] = model.a_committed[eq, 0]
+        else:
+            out[:] = model.f_internal[eq, 0] - model.f_external[eq, 0]
+
+
+class ElementForceRecorder(Recorder):
+    """
+    Records the end forces of selected elements at the committed state, in the
+    basic system (N, M_i, M_j), the local or the global system (6 per element).
+
+    Elements of the batched blocks of a vectorized model are recovered with one
+    block evaluation per recorded step; other elements one at a time.
+
+    Parameters
+    ----------
+    model : Model
+        Recorded model.
+    path : str or Path
+        Output file (see `Recorder`).
+    elements : list, optional
+        Recorded elements (default: all).
+    forces : str
+        'basic', 'local' or 'global'.
+    chunk_size, background :
+        See `Recorder`.
+    """
+
+    FORCES = {
+        'basic': ('Fb', ('N', 'Mi', 'Mj')),
+        'local': ('Fl', ('Ni', 'Vi', 'Mi', 'Nj', 'Vj', 'Mj')),
+        'global': ('Fg', ('Fxi', 'Fyi', 'Mi', 'Fxj', 'Fyj', 'Mj')),
+    }
+
+    def __init__(
+        self,
+        model: Model,
+        path: str | Path,
+        elements: list | None = None,
+        forces: str = 'basic',
+        chunk_size: int = 1024,
+        background: bool = False,
+    ):
+        if forces not in self.FORCES:
+            raise ValueError(f"Unsupported element forces: {forces}")
+        elements = model.elements if elements is None else list(elements)
+        in_model = {id(element) for element in model.elements}
+        for element in elements:
+            if id(element) not in in_model:
+                raise ValueError(f"Element {element.id} is not part of the model")
+
+        self.model = model
+        self.elements = elements
+        self.forces = forces
+        self._key, labels = self.FORCES[forces]
+        self._width = len(labels)
+
+        # Output position of every element, grouped by the block that recovers it
+        position = {id(element): k for k, element in enumerate(elements)}
+        self._blocks = []
+        blocked = set()
+        for block in model.element_blocks:
+            rows = [r for r, element in enumerate(block.elements) if id(element) in position]
+            if rows:
+                self._blocks.append((block, np.array(rows), np.array([position[id(block.elements[r])] for r in rows])))
+                blocked.update(id(block.elements[r]) for r in rows)
+        self._scalars = [(element, k) for k, element in enumerate(elements) if id(element) not in blocked]
+
+        columns = [f"ele{element.id}_{label}" for element in elements for label in labels]
+        super().__init__(path, columns, chunk_size, background)
+
+    def _values(self, out: ndarray, step_info: dict) -> None:
+        out = out.reshape(len(self.elements), self._width)
+        for block, rows, positions in self._blocks:
+            out[positions] = block.force_recovery()[1][self._key][rows]
+        for element, k in self._scalars:
+            out[k] = np.ravel(element.force_recovery()[1][self._key])
+
+
+class ConvergenceRecorder(Recorder):
+    """
+    Records the convergence statistics of every step: iterations, final residual
+    norm, tangent factorizations and back-substitutions (NaN when an integrator
+    does not report them, e.g. for explicit steps).
+
+    Parameters
+    ----------
+    path : str or Path
+        Output file (see `Recorder`).
+    chunk_size, background :
+        See `Recorder`.
+    """
+
+    STATISTICS = ('iterations', 'residual', 'factorizations', 'back_substitutions')
+
+    def __init__(self, path: str | Path, chunk_size: int = 1024, background: bool = False):
+        super().__init__(path, list(self.STATISTICS), chunk_size, background)
+
+    def _values(self, out: ndarray, step_info: dict) -> None:
+        for k, name in enumerate(self.STATISTICS):
+            out[k] = step_info.get(name, np.nan)
@@ -0,0 +1,152 @@
+import zipfile
+from pathlib import Path
+
+import numpy as np
+from numpy import ndarray
+
+
+# ----------------------------------------------------------------------------- #
+#                                  Writers                                      #
+# ----------------------------------------------------------------------------- #
+
+# Fixed size of the .npy header, rewritten with the row count after every append
+_NPY_HEADER_BYTES = 128
+
+
+class NpyWriter:
+    """
+    Appends rows to a .npy file: the data is written as it comes and the header
+    (fixed size) is rewritten with the new number of rows after every append, so
+    the file is a valid (memory-mappable) array at any time.
+    """
+
+    def __init__(self, path: Path, columns: list[str], dtype=np.float64):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.n_columns = len(columns)
+        self.rows = 0
+        self._file = open(path, 'wb')
+        self._write_header()
+
+    def _write_header(self) -> None:
+        header = repr({'descr': np.lib.format.dtype_to_descr(self.dtype), 'fortran_order': False,
+                       'shape': (self.rows, self.n_columns)})
+        length = _NPY_HEADER_BYTES - 10
+        self._file.seek(0)
+        self._file.write(b'\x93NUMPY\x01\x00' + length.to_bytes(2, 'little') + header.ljust(length - 1).encode('latin1') + b'\n')
+        self._file.seek(0, 2)
+
+    def append(self, block: ndarray) -> None:
+        self._file.write(np.ascontiguousarray(block, dtype=self.dtype).tobytes())
+        self.rows += len(block)
+        self._write_header()
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+
+class NpzWriter:
+    """
+    Appends every block as a member "chunk_<k>.npy" of an uncompressed .npz
+    archive (plus the column names in "columns.npy" on close). The archive can only
+    be read once it is closed.
+    """
+
+    def __init__(self, path: Path, columns: list[str], dtype=np.float64):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.columns = columns
+        self.rows = 0
+        self._chunks = 0
+        self._zip = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_STORED, allowZip64=True)
+
+    def append(self, block: ndarray) -> None:
+        with self._zip.open(f"chunk_{self._chunks:06d}.npy", 'w', force_zip64=True) as member:
+            np.lib.format.write_array(member, np.ascontiguousarray(block, dtype=self.dtype))
+        self._chunks += 1
+        self.rows += len(block)
+
+    def close(self) -> None:
+        if self._zip.fp is None:
+            return
+        with self._zip.open("columns.npy", 'w') as member:
+            np.lib.format.write_array(member, np.array(self.columns))
+        self._zip.close()
+
+
+class HDF5Writer:
+    """
+    Appends rows to a resizable, chunked dataset "data" of an HDF5 file (requires
+    h5py), with the column names in its "columns" attribute. The file is flushed
+    after every append.
+    """
+
+    def __init__(self, path: Path, columns: list[str], dtype=np.float64, chunk_size: int = 1024):
+        try:
+            import h5py
+        except ImportError as e:
+            raise ImportError("HDF5 recorders require h5py (pip install h5py), or record to a .npy/.npz file") from e
+
+        self.path = path
+        self.rows = 0
+        self._file = h5py.File(path, 'w')
+        self._data = self._file.create_dataset('data', shape=(0, len(columns)), maxshape=(None, len(columns)),
+                                               chunks=(chunk_size, len(columns)), dtype=dtype)
+        self._data.attrs['columns'] = columns
+
+    def append(self, block: ndarray) -> None:
+        self._data.resize(self.rows + len(block), axis=0)
+        self._data[self.rows:] = block
+        self.rows += len(block)
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file.id.valid:
+            self._file.close()
+
+
+def open_writer(path: str | Path, columns: list[str], dtype=np.float64, chunk_size: int = 1024):
+    """Return the writer for the suffix of `path`: .npy, .npz, or .h5/.hdf5."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == '.npy':
+        return NpyWriter(path, columns, dtype)
+    if suffix == '.npz':
+        return NpzWriter(path, columns, dtype)
+    if suffix in ('.h5', '.hdf5'):
+        return HDF5Writer(path, columns, dtype, chunk_size)
+    raise ValueError(f"Unsupported recorder file type: {path.suffix} (use .npy, .npz, .h5 or .hdf5)")
+
+
+# ----------------------------------------------------------------------------- #
+#                                  Reader                                       #
+# ----------------------------------------------------------------------------- #
+
+def read_recorder(path: str | Path, mmap: bool = True) -> ndarray:
+    """
+    Read the (rows, columns) array written by a recorder (first column: time).
+
+    .npy files are memory-mapped if `mmap`, the chunks of a .npz archive are
+    concatenated, and the "data" dataset of an HDF5 file is read into memory.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == '.npy':
+        return np.load(path, mmap_mode='r' if mmap else None)
+    if suffix == '.npz':
+        with np.load(path) as archive:
+            chunks = sorted(name for name in archive.files if name.startswith('chunk_'))
+            if not chunks:
+                columns = archive['columns'] if 'columns' in archive.files else ()
+                return np.empty((0, len(columns)))
+            return np.concatenate([archive[name] for name in chunks])
+    if suffix in ('.h5', '.hdf5'):
+        try:
+            import h5py
+        except ImportError as e:
+            raise ImportError("Reading HDF5 recorders requires h5py (pip install h5py)") from e
+        with h5py.File(path, 'r') as f:
+            return f['data'][...]
+    raise ValueError(f"Unsupported recorder file type: {path.suffix} (use .npy, .npz, .h5 or .hdf5)")
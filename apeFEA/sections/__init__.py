@@ -1,3 +1,4 @@
 from .section import Section
+from .fiber_section import FiberSection
 
-__all__ = ["Section"]
\ No newline at end of file
+__all__ = ["Section", "FiberSection"]
\ No newline at end of file
@@ -0,0 +1,204 @@
+import numpy as np
+from numpy import ndarray
+
+from apeFEA.materials import Material
+from apeFEA.materials.batch import MaterialBatch, make_material_batch
+
+
+class FiberSection:
+    """
+    2D fiber section with array-backed fiber state.
+
+    The section is discretized into fibers at heights `fiber_y` (measured from the
+    element reference axis) with areas `fiber_A`. Fiber positions, areas, material
+    parameters and trial/committed strains and stresses are stored in contiguous arrays,
+    grouped by material type, so the state update and the integration of the
+    resultants and tangent are vectorized over fibers (thousands of fibers per
+    section, no per-fiber Python objects).
+
+    For the section deformations e = [ε0, κ] the fiber strains are
+        ε = ε0 - y κ
+    and the resultants and tangent are
+        s  = [N, M] = Σ σ A [1, -y]
+        ks = Σ Et A [[1, -y], [-y, y²]]
+
+    Supported fiber materials are those with a batch implementation (`LinearElastic`,
+    `EPP`, `Concrete01`). The material objects are only read for their parameters
+    when fibers are added.
+
+    The section is `deformation_driven`: `FrameElement` and `ForceBasedFrameElement`
+    copy it to their integration points and drive it through `set_trial_deformation`,
+    using the resultants and the full 2×2 tangent (including the axial-flexure
+    coupling of unsymmetric or yielded sections). `get_stiffness_matrix` only
+    returns the diagonal EA and EI of the tangent; `A` and `I` give the total area
+    and the second moment of area about the reference axis.
+
+    Methods
+    -------
+    add_fibers(material, y, A)
+        Add fibers with positions `y` and areas `A`.
+    add_rect_patch(material, y_bottom, y_top, b, n_fibers)
+        Add a rectangular patch of `n_fibers` layers.
+    set_trial_deformation(e)
+        Set the trial section deformations [ε0, κ].
+    get_resultants() -> ndarray
+        Section forces [N, M] at the trial state.
+    get_tangent_matrix() -> ndarray
+        2×2 section tangent at the trial state.
+    get_stiffness_matrix() -> tuple[float, float]
+        EA and EI at the trial state.
+    """
+
+    deformation_driven = True
+
+    def __init__(self):
+        self.fiber_y = np.zeros(0)
+        self.fiber_A = np.zeros(0)
+
+        self.eps_trial = np.zeros(0)
+        self.eps_commit = np.zeros(0)
+        self.sig_trial = np.zeros(0)
+        self.sig_commit = np.zeros(0)
+        self.Et = np.zeros(0)
+
+        # Per material batch type: fiber indices and the batch holding their state
+        self._groups: dict[type[MaterialBatch], dict] = {}
+
+    @property
+    def n_fibers(self) -> int:
+        return len(self.fiber_y)
+
+    @property
+    def A(self) -> float:
+        """Total fiber area."""
+        return float(self.fiber_A.sum())
+
+    @property
+    def I(self) -> float:
+        """Second moment of the fiber areas about the reference axis."""
+        return float(np.dot(self.fiber_A, self.fiber_y ** 2))
+
+    @property
+    def centroid(self) -> float:
+        return float(np.dot(self.fiber_A, self.fiber_y) / self.fiber_A.sum())
+
+    def add_fibers(self, material: Material, y: ndarray, A: ndarray) -> None:
+        """
+        Add fibers of `material` at heights `y` with areas `A`.
+
+        Parameters
+        ----------
+        material : Material
+            Uniaxial material (parameters are copied into the fiber arrays).
+        y : array_like
+            Fiber positions relative to the element reference axis.
+        A : array_like
+            Fiber areas (broadcast against `y`).
+
+        Raises
+        ------
+        ValueError
+            If the material type is not supported for fibers.
+        """
+        y, A = np.broadcast_arrays(np.atleast_1d(np.asarray(y, dtype=float)),
+                                   np.atleast_1d(np.asarray(A, dtype=float)))
+        n_new = len(y)
+        batch = make_material_batch(material, n_new)
+        start = self.n_fibers
+
+        self.fiber_y = np.concatenate([self.fiber_y, y])
+        self.fiber_A = np.concatenate([self.fiber_A, A])
+        for name in ('eps_trial', 'eps_commit', 'sig_trial', 'sig_commit', 'Et'):
+            setattr(self, name, np.concatenate([getattr(self, name), np.zeros(n_new)]))
+
+        idx = np.arange(start, start + n_new)
+        group = self._groups.get(type(batch))
+        if group is None:
+            self._groups[type(batch)] = {'idx': idx, 'batch': batch}
+        else:
+            group['idx'] = np.concatenate([group['idx'], idx])
+            group['batch'] = type(batch).concatenate([group['batch'], batch])
+
+        self._gather()
+
+    def add_rect_patch(self, material: Material, y_bottom: float, y_top: float, b: float, n_fibers: int) -> None:
+        """
+        Add a rectangular patch of width `b` between `y_bottom` and `y_top`,
+        discretized into `n_fibers` layers of equal thickness.
+        """
+        h = (y_top - y_bottom) / n_fibers
+        y = y_bottom + h * (np.arange(n_fibers) + 0.5)
+        self.add_fibers(material, y, b * h)
+
+    def _gather(self) -> None:
+        """Copy the trial stresses and tangents of the batches into the fiber arrays."""
+        for group in self._groups.values():
+            idx, batch = group['idx'], group['batch']
+            self.sig_trial[idx] = batch.get_trial_stress()
+            self.Et[idx] = batch.get_tangent()
+
+    def set_trial_deformation(self, e: ndarray) -> None:
+        """
+        Set the trial section deformations and update all fibers.
+
+        Parameters
+        ----------
+        e : array_like
+            Section deformations [ε0, κ] (axial strain at y = 0 and curvature).
+        """
+        e = np.asarray(e, dtype=float).ravel()
+        self.eps_trial[:] = e[0] - self.fiber_y * e[1]
+        for group in self._groups.values():
+            group['batch'].set_trial_strain(self.eps_trial[group['idx']])
+        self._gather()
+
+    def get_resultants(self) -> ndarray:
+        """Section forces [N, M] at the trial state."""
+        force = self.sig_trial * self.fiber_A
+        return np.array([force.sum(), -np.dot(force, self.fiber_y)])
+
+    def get_tangent_matrix(self) -> ndarray:
+        """2×2 section tangent d[N, M]/d[ε0, κ] at the trial state."""
+        EtA = self.Et * self.fiber_A
+        EA = EtA.sum()
+        ES = np.dot(EtA, self.fiber_y)
+        EI = np.dot(EtA, self.fiber_y ** 2)
+        return np.array([[EA, -ES], [-ES, EI]])
+
+    def get_stiffness_matrix(self) -> tuple[float, float]:
+        """
+        Compute section axial and flexural stiffness from the fiber tangents.
+
+        Returns
+        -------
+        EA : float
+            Axial stiffness
+        EI : float
+            Flexural stiffness about the reference axis
+        """
+        ks = self.get_tangent_matrix()
+        return float(ks[0, 0]), float(ks[1, 1])
+
+    def commit_state(self) -> None:
+        self.eps_commit[:] = self.eps_trial
+        self.sig_commit[:] = self.sig_trial
+        for group in self._groups.values():
+            group['batch'].commit_state()
+
+    def reset_trial(self) -> None:
+        self.eps_trial[:] = self.eps_commit
+        for group in self._groups.values():
+            group['batch'].reset_trial()
+        self._gather()
+
+    def revert_to_start(self) -> None:
+        self.eps_trial[:] = 0.0
+        self.eps_commit[:] = 0.0
+        self.sig_commit[:] = 0.0
+        for group in self._groups.values():
+            group['batch'].revert_to_start()
+        self._gather()
+
+    def __repr__(self) -> str:
+        kinds = ", ".join(f"{cls.material_class.__name__}: {len(group['idx'])}" for cls, group in self._groups.items())
+        return f"FiberSection({self.n_fibers} fibers; {kinds})"
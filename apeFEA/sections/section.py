@@ -1,3 +1,4 @@
+import numpy as np
 from numpy import ndarray
 from apeFEA.materials import Material  # adjust if your structure changes
 
@@ -6,6 +7,14 @@ class Section:
     """
     Represents a uniaxial section with a material model and geometric properties.
 
+    The section does not drive its material: EA and EI are the material's current
+    tangent modulus times A and I, and the section deformations are never turned
+    into a material strain. A `FrameElement` with a `Section` is therefore elastic
+    with whatever modulus the material reports (the initial one unless the material
+    is updated elsewhere), and consistent material tangents (`EPP`, `Concrete01`)
+    only matter through elements that drive fibers, e.g. `FrameElement` or
+    `ForceBasedFrameElement` with a `FiberSection`.
+
     Parameters
     ----------
     material : Material
@@ -19,13 +28,24 @@ class Section:
     -------
     get_stiffness_matrix() -> tuple[float, float]
         Returns EA and EI values at the current tangent modulus.
+    set_trial_deformation(e)
+        Sets the trial section deformations [ε0, κ].
+    get_resultants() -> ndarray
+        Section forces [N, M] = diag(EA, EI) e.
+    get_tangent_matrix() -> ndarray
+        2×2 section tangent diag(EA, EI).
     """
 
+    deformation_driven = False
+
     def __init__(self, material: Material, A: float, I: float):
         self.material = material
         self.A = A
         self.I = I
 
+        self.e_trial = np.zeros(2)
+        self.e_commit = np.zeros(2)
+
     def get_stiffness_matrix(self) -> tuple[float, float]:
         """
         Compute section axial and flexural stiffness using current tangent modulus.
@@ -41,3 +61,28 @@ class Section:
         EA = Et * self.A
         EI = Et * self.I
         return EA, EI
+
+    def set_trial_deformation(self, e: ndarray) -> None:
+        """
+        Set the trial section deformations [ε0, κ]. The section responds elastically
+        with the current tangent modulus of the material.
+        """
+        self.e_trial = np.asarray(e, dtype=float).ravel().copy()
+
+    def get_resultants(self) -> ndarray:
+        """Section forces [N, M] at the trial state."""
+        return self.get_tangent_matrix() @ self.e_trial
+
+    def get_tangent_matrix(self) -> ndarray:
+        """2×2 section tangent d[N, M]/d[ε0, κ]."""
+        return np.diag(self.get_stiffness_matrix())
+
+    def commit_state(self) -> None:
+        self.e_commit = self.e_trial.copy()
+
+    def reset_trial(self) -> None:
+        self.e_trial = self.e_commit.copy()
+
+    def revert_to_start(self) -> None:
+        self.e_trial = np.zeros(2)
+        self.e_commit = np.zeros(2)
@@ -1,3 +1,22 @@
 from .newton_raphson import NewtonRaphsonSolver
+from .quasi_newton import BFGSSolver, BroydenSolver, KrylovNewtonSolver
+from .line_search import LineSearch, BisectionLineSearch, SecantLineSearch, RegulaFalsiLineSearch
+from .linear_solver import (LinearSolver, DenseLinearSolver, SparseDirectSolver, IterativeLinearSolver,
+                            AutoLinearSolver, make_linear_solver)
 
-__all__ = ["NewtonRaphsonSolver"]
\ No newline at end of file
+__all__ = [
+    "NewtonRaphsonSolver",
+    "BFGSSolver",
+    "BroydenSolver",
+    "KrylovNewtonSolver",
+    "LineSearch",
+    "BisectionLineSearch",
+    "SecantLineSearch",
+    "RegulaFalsiLineSearch",
+    "LinearSolver",
+    "DenseLinearSolver",
+    "SparseDirectSolver",
+    "IterativeLinearSolver",
+    "AutoLinearSolver",
+    "make_linear_solver"
+]
\ No newline at end of file
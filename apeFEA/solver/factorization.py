@@ -0,0 +1,138 @@
+import numpy as np
+from numpy import ndarray
+from scipy import sparse
+from scipy.linalg import lu_factor, lu_solve
+from scipy.linalg.lapack import dgecon
+from scipy.sparse.linalg import splu, onenormest, LinearOperator, norm as sparse_norm
+
+
+class Factorization:
+    """
+    Reusable LU factorization of the free-DOF tangent stiffness matrix.
+
+    Dense matrices are factored with LAPACK (`getrf`), sparse matrices with
+    SuperLU. The object can be kept across iterations and load steps and used
+    for any number of back-substitutions. The factors also give cheap stability
+    diagnostics (pivot ratio, determinant sign, 1-norm condition estimate)
+    without any extra decomposition.
+
+    For sparse matrices the fill-reducing column ordering can be passed in
+    (`perm_c`, e.g. the `perm_c` of a previous factorization with the same sparsity
+    pattern), in which case SuperLU factors the column-permuted matrix with its
+    natural ordering and the ordering analysis is skipped.
+
+    Parameters
+    ----------
+    K_ff : ndarray or sparse matrix
+        Square free-free partition of the tangent stiffness.
+    perm_c : ndarray, optional
+        Column ordering to reuse (sparse matrices only).
+    permc_spec : str
+        SuperLU ordering used when `perm_c` is not given.
+
+    Attributes
+    ----------
+    perm_c : ndarray or None
+        Column ordering of the sparse factorization (None for dense matrices).
+
+    Raises
+    ------
+    np.linalg.LinAlgError
+        If the matrix is exactly singular.
+    """
+
+    def __init__(self, K_ff, perm_c: ndarray | None = None, permc_spec: str = 'COLAMD'):
+        self.is_sparse = sparse.issparse(K_ff)
+        self.n = K_ff.shape[0]
+        self._norm1 = sparse_norm(K_ff, 1) if self.is_sparse else np.linalg.norm(K_ff, 1)
+        self._reordered = perm_c is not None
+        self.perm_c = None
+
+        if self.is_sparse:
+            K_ff = K_ff.tocsc()
+            try:
+                if self._reordered:
+                    # SuperLU convention: K Pc = Prᵀ L U with Pc[i, perm_c[i]] = 1
+                    self.perm_c = np.asarray(perm_c)
+                    self._columns = np.argsort(self.perm_c)
+                    self._lu = splu(K_ff[:, self._columns], permc_spec='NATURAL')
+                else:
+                    self._lu = splu(K_ff, permc_spec=permc_spec)
+                    self.perm_c = self._lu.perm_c
+            except RuntimeError as e:
+                raise np.linalg.LinAlgError(str(e))
+        else:
+            self._lu = lu_factor(K_ff, check_finite=False)
+            if np.any(np.diag(self._lu[0]) == 0.0):
+                raise np.linalg.LinAlgError("Singular matrix")
+
+    def solve(self, b: ndarray) -> ndarray:
+        """Back-substitute for the right-hand side `b` (same shape returned)."""
+        if self.is_sparse:
+            if not self._reordered:
+                return self._lu.solve(b)
+            # (K Pc) y = b  →  x = Pc y
+            x = np.empty_like(b, dtype=float)
+            x[self._columns] = self._lu.solve(b)
+            return x
+        return lu_solve(self._lu, b, check_finite=False)
+
+    def pivots(self) -> ndarray:
+        """Diagonal of the U factor."""
+        if self.is_sparse:
+            return self._lu.U.diagonal()
+        return np.diag(self._lu[0])
+
+    def pivot_ratio(self) -> float:
+        """min |u_ii| / max |u_ii|, a cheap indicator of (near) singularity."""
+        d = np.abs(self.pivots())
+        if len(d) == 0 or d.max() == 0.0:
+            return 0.0
+        return float(d.min() / d.max())
+
+    def determinant_sign(self) -> int:
+        """
+        Sign of det(K_ff) from the LU factors. A sign change between two tangents
+        indicates that a limit or bifurcation point has been passed.
+        """
+        sign = int(np.prod(np.sign(self.pivots())))
+        if self.is_sparse:
+            sign *= _permutation_sign(self._lu.perm_r) * _permutation_sign(self.perm_c)
+        else:
+            swaps = np.count_nonzero(self._lu[1] != np.arange(self.n))
+            sign *= -1 if swaps % 2 else 1
+        return sign
+
+    def condition_estimate(self) -> float:
+        """1-norm condition number estimate (LAPACK `gecon` / Higham's `onenormest`)."""
+        if self.n == 0:
+            return 1.0
+        if self.is_sparse:
+            inverse = LinearOperator(
+                (self.n, self.n),
+                matvec=lambda x: self._lu.solve(np.asarray(x, dtype=float)),
+                rmatvec=lambda x: self._lu.solve(np.asarray(x, dtype=float), trans='T'),
+                dtype=float,
+            )
+            return float(self._norm1 * onenormest(inverse))
+        rcond, _ = dgecon(self._lu[0], self._norm1, norm='1')
+        return float(np.inf) if rcond == 0.0 else float(1.0 / rcond)
+
+
+def _permutation_sign(perm: ndarray) -> int:
+    """Sign (+1/-1) of a permutation given as an index array."""
+    perm = np.asarray(perm)
+    visited = np.zeros(len(perm), dtype=bool)
+    sign = 1
+    for start in range(len(perm)):
+        if visited[start]:
+            continue
+        length = 0
+        k = start
+        while not visited[k]:
+            visited[k] = True
+            k = perm[k]
+            length += 1
+        if length % 2 == 0:
+            sign = -sign
+    return sign
@@ -0,0 +1,183 @@
+import numpy as np
+from numpy import ndarray
+from abc import ABC, abstractmethod
+from typing import Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from apeFEA.core.model import Model
+
+
+class LineSearch(ABC):
+    """
+    Abstract base class for line searches on the Newton increment.
+
+    The increment Δu is scaled by η so that the residual energy
+        s(η) = Δuᵀ R(u + η Δu)      (free DOFs only)
+    is reduced to `tolerance` times its initial value s(0) = Δuᵀ R(u).
+    The full step (η = 1) is always tried first and accepted when it already
+    satisfies the energy criterion, so converging Newton steps cost one extra
+    residual evaluation.
+
+    If the full step gives a non-finite residual energy (NaN or Inf), η is halved
+    until the energy is finite again and the largest such η is taken; when none is
+    found down to `min_eta`, `min_eta` is returned and the solver reports the
+    non-finite residual.
+
+    Parameters
+    ----------
+    tolerance : float
+        Accept η when |s(η)| <= tolerance * |s(0)|.
+    max_iterations : int
+        Maximum number of trial η values after the full step.
+    min_eta, max_eta : float
+        Bounds on the step scale.
+    """
+
+    def __init__(
+        self,
+        tolerance: float = 0.8,
+        max_iterations: int = 10,
+        min_eta: float = 0.1,
+        max_eta: float = 10.0,
+    ):
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.min_eta = min_eta
+        self.max_eta = max_eta
+
+    def search(self, model: "Model", t: float, u: ndarray, du: ndarray, R: ndarray) -> tuple[float, int]:
+        """
+        Find the step scale η for the increment `du` from `u`.
+
+        Parameters
+        ----------
+        model : Model
+            Model evaluated at the trial displacements u + η du.
+        t : float
+            Current pseudo-time.
+        u : ndarray
+            Displacement vector at the start of the increment.
+        du : ndarray
+            Newton (or quasi-Newton) increment.
+        R : ndarray
+            Residual at `u`.
+
+        Returns
+        -------
+        eta : float
+            Step scale. The model is left at the last trial state evaluated.
+        evaluations : int
+            Number of residual evaluations spent.
+        """
+        free = model.free_indices
+        du_free = du[free]
+        evaluations = 0
+
+        def energy(eta: float) -> float:
+            nonlocal evaluations
+            evaluations += 1
+            model.update_trial_state(u + eta * du, update_elements=False)
+            R_eta, _, _ = model.evaluate(t, tangent=False)
+            return float(np.vdot(du_free, R_eta[free]))
+
+        s0 = float(np.vdot(du_free, R[free]))
+        s1 = energy(1.0)
+        if not np.isfinite(s1):
+            return self._backtrack(energy), evaluations
+        if s0 == 0.0 or abs(s1) <= self.tolerance * abs(s0):
+            return 1.0, evaluations
+
+        eta = self._search(energy, s0, s1)
+        return float(np.clip(eta, self.min_eta, self.max_eta)), evaluations
+
+    def _backtrack(self, energy: Callable[[float], float]) -> float:
+        """Halve η from 1 until s(η) is finite (at most down to min_eta)."""
+        eta = 1.0
+        while eta > self.min_eta:
+            eta = max(0.5 * eta, self.min_eta)
+            if np.isfinite(energy(eta)):
+                break
+        return eta
+
+    def _bracket(self, energy: Callable[[float], float], s0: float, s1: float) -> tuple[float, float, float, float]:
+        """Expand η from 1 until s(η) changes sign with respect to s(0) (or max_eta is reached)."""
+        eta_L, s_L = 0.0, s0
+        eta_U, s_U = 1.0, s1
+        while s_U * s0 > 0.0 and eta_U < self.max_eta:
+            eta_L, s_L = eta_U, s_U
+            eta_U = min(2.0 * eta_U, self.max_eta)
+            s_U = energy(eta_U)
+        return eta_L, s_L, eta_U, s_U
+
+    @abstractmethod
+    def _search(self, energy: Callable[[float], float], s0: float, s1: float) -> float:
+        """Return η given the residual energy function and its values at η = 0 and η = 1."""
+        ...
+
+
+class BisectionLineSearch(LineSearch):
+    """
+    Bisection on a bracket [η_L, η_U] where the residual energy changes sign.
+    """
+
+    def _search(self, energy, s0, s1):
+        eta_L, s_L, eta_U, s_U = self._bracket(energy, s0, s1)
+        if s_U * s0 > 0.0:
+            return eta_U
+
+        eta = eta_U
+        for _ in range(self.max_iterations):
+            eta = 0.5 * (eta_L + eta_U)
+            s = energy(eta)
+            if abs(s) <= self.tolerance * abs(s0):
+                break
+            if s * s_U < 0.0:
+                eta_L, s_L = eta, s
+            else:
+                eta_U, s_U = eta, s
+        return eta
+
+
+class SecantLineSearch(LineSearch):
+    """
+    Secant iterations on s(η) starting from (0, s0) and (1, s1).
+    """
+
+    def _search(self, energy, s0, s1):
+        eta_prev, s_prev = 0.0, s0
+        eta, s = 1.0, s1
+        for _ in range(self.max_iterations):
+            if s == s_prev:
+                break
+            eta_new = eta - s * (eta - eta_prev) / (s - s_prev)
+            eta_new = float(np.clip(eta_new, self.min_eta, self.max_eta))
+            eta_prev, s_prev = eta, s
+            eta = eta_new
+            s = energy(eta)
+            if abs(s) <= self.tolerance * abs(s0):
+                break
+        return eta
+
+
+class RegulaFalsiLineSearch(LineSearch):
+    """
+    Interpolated line search (regula falsi): linear interpolation of s(η)
+    inside a bracket that is kept around the sign change.
+    """
+
+    def _search(self, energy, s0, s1):
+        eta_L, s_L, eta_U, s_U = self._bracket(energy, s0, s1)
+        if s_U * s0 > 0.0:
+            return eta_U
+
+        eta = eta_U
+        for _ in range(self.max_iterations):
+            eta = eta_U - s_U * (eta_L - eta_U) / (s_L - s_U)
+            s = energy(eta)
+            if abs(s) <= self.tolerance * abs(s0):
+                break
+            if s * s_U < 0.0:
+                eta_L, s_L = eta, s
+            else:
+                eta_U, s_U = eta, s
+        return eta
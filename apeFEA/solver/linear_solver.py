@@ -0,0 +1,417 @@
+import numpy as np
+from numpy import ndarray
+from abc import ABC, abstractmethod
+from scipy import sparse
+from scipy.linalg import cho_factor, cho_solve
+from scipy.linalg.lapack import dpocon
+from scipy.sparse.linalg import LinearOperator, cg, gmres, spilu
+
+from .factorization import Factorization
+
+
+class LinearSolver(ABC):
+    """
+    Abstract base class for the solution of the free-DOF tangent system K_ff x = b.
+
+    `factorize` prepares the solver for a new tangent (factorization or
+    preconditioner), after which `solve` can be called any number of times, with
+    one or several right-hand side columns. Both dense arrays and sparse matrices
+    are accepted; each backend converts to the format it works with.
+
+    Direct backends also expose the stability diagnostics used by
+    `StiffnessMonitor` (pivot ratio, determinant sign, condition estimate);
+    backends without them return None, which the monitor skips.
+
+    Raises
+    ------
+    np.linalg.LinAlgError
+        From `factorize` or `solve` if the system cannot be solved.
+    """
+
+    #: True if the backend provides the factorization diagnostics
+    direct: bool = True
+
+    @abstractmethod
+    def factorize(self, K_ff) -> None:
+        """Prepare the solution of systems with the matrix `K_ff`."""
+        ...
+
+    @abstractmethod
+    def solve(self, b: ndarray) -> ndarray:
+        """Solve K_ff x = b for the last factorized matrix (same shape as `b`)."""
+        ...
+
+    def pivot_ratio(self) -> float | None:
+        """Smallest over largest pivot magnitude of the last factorization (None if not available)."""
+        return None
+
+    def determinant_sign(self) -> int | None:
+        """Sign of det(K_ff) of the last factorization (None if not available)."""
+        return None
+
+    def condition_estimate(self) -> float | None:
+        """1-norm condition number estimate of the last matrix (None if not available)."""
+        return None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class DenseLinearSolver(LinearSolver):
+    """
+    Dense LAPACK backend: Cholesky (`potrf`) or LU with partial pivoting (`getrf`).
+
+    - 'cholesky' : symmetric positive definite matrices only.
+    - 'lu'       : general matrices.
+    - 'auto'     : Cholesky for symmetric matrices, falling back to LU when the
+                   matrix is unsymmetric or not positive definite (e.g. past a
+                   limit point).
+
+    Parameters
+    ----------
+    method : str
+        Factorization, one of 'auto', 'cholesky', 'lu'.
+
+    Attributes
+    ----------
+    method_used : str or None
+        Factorization used for the last matrix ('cholesky' or 'lu').
+    """
+
+    METHODS = ('auto', 'cholesky', 'lu')
+
+    def __init__(self, method: str = 'auto'):
+        if method not in self.METHODS:
+            raise ValueError(f"Unsupported dense factorization: {method}")
+        self.method = method
+        self.method_used: str | None = None
+        self._cholesky = None
+        self._lu: Factorization | None = None
+
+    def factorize(self, K_ff) -> None:
+        K_ff = K_ff.toarray() if sparse.issparse(K_ff) else np.asarray(K_ff, dtype=float)
+        self._cholesky = self._lu = None
+
+        if self.method == 'cholesky' or (self.method == 'auto' and is_symmetric(K_ff)):
+            try:
+                self._cholesky = cho_factor(K_ff, lower=False, check_finite=False)
+                self._norm1 = np.linalg.norm(K_ff, 1)
+                self.method_used = 'cholesky'
+                return
+            except np.linalg.LinAlgError:
+                if self.method == 'cholesky':
+                    raise
+
+        self._lu = Factorization(K_ff)
+        self.method_used = 'lu'
+
+    def solve(self, b: ndarray) -> ndarray:
+        if self._cholesky is not None:
+            return cho_solve(self._cholesky, b, check_finite=False)
+        return self._lu.solve(b)
+
+    def pivot_ratio(self) -> float:
+        if self._cholesky is None:
+            return self._lu.pivot_ratio()
+        d = np.diag(self._cholesky[0]) ** 2
+        return float(d.min() / d.max()) if len(d) else 0.0
+
+    def determinant_sign(self) -> int:
+        # A successful Cholesky factorization implies a positive definite matrix
+        return 1 if self._cholesky is not None else self._lu.determinant_sign()
+
+    def condition_estimate(self) -> float:
+        if self._cholesky is None:
+            return self._lu.condition_estimate()
+        if len(self._cholesky[0]) == 0:
+            return 1.0
+        rcond, _ = dpocon(self._cholesky[0], self._norm1, uplo='U')
+        return float(np.inf) if rcond == 0.0 else float(1.0 / rcond)
+
+    def __repr__(self) -> str:
+        return f"DenseLinearSolver(method='{self.method}')"
+
+
+class SparseDirectSolver(LinearSolver):
+    """
+    Sparse direct backend (SciPy SuperLU).
+
+    The fill-reducing column ordering is the expensive symbolic part of the
+    factorization and depends only on the sparsity pattern, which does not change
+    during an analysis. It is computed with the first matrix and reused for every
+    later factorization with the same pattern (recomputed if the pattern changes).
+
+    Parameters
+    ----------
+    ordering : str
+        SuperLU column ordering ('COLAMD', 'MMD_AT_PLUS_A', 'MMD_ATA', 'NATURAL').
+    reuse_ordering : bool
+        Reuse the ordering of the first factorization.
+
+    Attributes
+    ----------
+    orderings : int
+        Number of ordering analyses performed.
+    """
+
+    ORDERINGS = ('COLAMD', 'MMD_AT_PLUS_A', 'MMD_ATA', 'NATURAL')
+
+    def __init__(self, ordering: str = 'COLAMD', reuse_ordering: bool = True):
+        if ordering not in self.ORDERINGS:
+            raise ValueError(f"Unsupported sparse ordering: {ordering}")
+        self.ordering = ordering
+        self.reuse_ordering = reuse_ordering
+        self.orderings = 0
+        self._lu: Factorization | None = None
+        self._perm_c: ndarray | None = None
+        self._pattern: tuple[ndarray, ndarray] | None = None
+
+    def factorize(self, K_ff) -> None:
+        K_ff = sparse.csc_matrix(K_ff)
+        K_ff.sort_indices()
+        same_pattern = (self._pattern is not None
+                        and np.array_equal(self._pattern[0], K_ff.indptr)
+                        and np.array_equal(self._pattern[1], K_ff.indices))
+
+        if self.reuse_ordering and same_pattern:
+            self._lu = Factorization(K_ff, perm_c=self._perm_c)
+        else:
+            self._lu = Factorization(K_ff, permc_spec=self.ordering)
+            self._perm_c = self._lu.perm_c
+            self._pattern = (K_ff.indptr.copy(), K_ff.indices.copy())
+            self.orderings += 1
+
+    def solve(self, b: ndarray) -> ndarray:
+        return self._lu.solve(b)
+
+    def pivot_ratio(self) -> float:
+        return self._lu.pivot_ratio()
+
+    def determinant_sign(self) -> int:
+        return self._lu.determinant_sign()
+
+    def condition_estimate(self) -> float:
+        return self._lu.condition_estimate()
+
+    def __repr__(self) -> str:
+        return f"SparseDirectSolver(ordering='{self.ordering}')"
+
+
+class IterativeLinearSolver(LinearSolver):
+    """
+    Preconditioned Krylov backend: conjugate gradients or restarted GMRES.
+
+    `factorize` only builds the preconditioner, every `solve` runs the Krylov
+    iterations (one run per right-hand side column).
+
+    - 'cg'    : symmetric positive definite matrices, with a symmetric
+                preconditioner ('jacobi' or None).
+    - 'gmres' : general matrices, any preconditioner.
+
+    Preconditioners: 'jacobi' (inverse diagonal), 'ilu' (incomplete LU, SuperLU
+    `spilu`) or None. The incomplete LU factors are not symmetric, so ILU is meant
+    for GMRES. Frame stiffness matrices mix axial and bending terms and are poorly
+    conditioned; Jacobi-preconditioned CG typically needs many iterations.
+
+    Parameters
+    ----------
+    method : str
+        Krylov method, 'cg' or 'gmres'.
+    preconditioner : str or None
+        'jacobi', 'ilu' or None.
+    rtol : float
+        Relative residual tolerance of the Krylov iterations.
+    maxiter : int, optional
+        Maximum number of Krylov iterations (GMRES: restart cycles; SciPy default if None).
+    drop_tol, fill_factor : float
+        Incomplete LU parameters.
+    restart : int
+        GMRES restart length.
+
+    Attributes
+    ----------
+    iterations : int
+        Krylov iterations used by the last `solve` (all columns).
+    """
+
+    direct = False
+    METHODS = ('cg', 'gmres')
+    PRECONDITIONERS = ('jacobi', 'ilu', None)
+
+    def __init__(
+        self,
+        method: str = 'gmres',
+        preconditioner: str | None = 'ilu',
+        rtol: float = 1e-10,
+        maxiter: int | None = 1000,
+        drop_tol: float = 1e-4,
+        fill_factor: float = 10.0,
+        restart: int = 50,
+    ):
+        if method not in self.METHODS:
+            raise ValueError(f"Unsupported iterative method: {method}")
+        if preconditioner not in self.PRECONDITIONERS:
+            raise ValueError(f"Unsupported preconditioner: {preconditioner}")
+        self.method = method
+        self.preconditioner = preconditioner
+        self.rtol = rtol
+        self.maxiter = maxiter
+        self.drop_tol = drop_tol
+        self.fill_factor = fill_factor
+        self.restart = restart
+        self.iterations = 0
+
+    def factorize(self, K_ff) -> None:
+        self._K = sparse.csr_matrix(K_ff)
+        n = self._K.shape[0]
+        self._M = None
+
+        if self.preconditioner == 'jacobi':
+            d = self._K.diagonal()
+            if np.any(d == 0.0):
+                raise np.linalg.LinAlgError("Zero diagonal entry, Jacobi preconditioner undefined")
+            inv_d = 1.0 / d
+            self._M = LinearOperator((n, n), matvec=lambda x: inv_d * x, dtype=float)
+        elif self.preconditioner == 'ilu':
+            try:
+                ilu = spilu(self._K.tocsc(), drop_tol=self.drop_tol, fill_factor=self.fill_factor)
+            except RuntimeError as e:
+                raise np.linalg.LinAlgError(str(e))
+            self._M = LinearOperator((n, n), matvec=ilu.solve, dtype=float)
+
+    def _solve_column(self, b: ndarray) -> ndarray:
+        count = [0]
+
+        def callback(_):
+            count[0] += 1
+
+        if self.method == 'cg':
+            x, info = cg(self._K, b, rtol=self.rtol, atol=0.0, maxiter=self.maxiter, M=self._M, callback=callback)
+        else:
+            x, info = gmres(self._K, b, rtol=self.rtol, atol=0.0, restart=self.restart, maxiter=self.maxiter,
+                            M=self._M, callback=callback, callback_type='pr_norm')
+        self.iterations += count[0]
+        if info != 0:
+            raise np.linalg.LinAlgError(f"{self.method.upper()} did not converge ({count[0]} iterations)")
+        return x
+
+    def solve(self, b: ndarray) -> ndarray:
+        self.iterations = 0
+        b = np.asarray(b, dtype=float)
+        columns = b.reshape(len(b), -1)
+        x = np.column_stack([self._solve_column(column) for column in columns.T])
+        return x.reshape(b.shape)
+
+    def __repr__(self) -> str:
+        return f"IterativeLinearSolver(method='{self.method}', preconditioner={self.preconditioner!r})"
+
+
+class AutoLinearSolver(LinearSolver):
+    """
+    Backend chosen from the first matrix it factorizes:
+
+    - n <= `dense_max` and a dense matrix : `DenseLinearSolver` ('auto', i.e.
+      Cholesky with LU fallback).
+    - larger or sparse matrices : `SparseDirectSolver`.
+    - n > `iterative_min` (and `allow_iterative`) : `IterativeLinearSolver`,
+      ILU-preconditioned GMRES (symmetric or not; on frame tangents it needs
+      far fewer iterations than Jacobi-preconditioned CG).
+
+    The choice is kept for the rest of the analysis (the ordering reuse of the
+    sparse backend depends on it).
+
+    Parameters
+    ----------
+    dense_max : int
+        Largest system solved with a dense factorization.
+    iterative_min : int
+        Smallest system solved iteratively.
+    allow_iterative : bool
+        Permit the iterative backend (it provides no factorization diagnostics).
+
+    Attributes
+    ----------
+    backend : LinearSolver or None
+        The selected backend.
+    """
+
+    def __init__(self, dense_max: int = 1000, iterative_min: int = 200_000, allow_iterative: bool = True):
+        self.dense_max = dense_max
+        self.iterative_min = iterative_min
+        self.allow_iterative = allow_iterative
+        self.backend: LinearSolver | None = None
+
+    @property
+    def direct(self) -> bool:
+        return self.backend is None or self.backend.direct
+
+    def _select(self, K_ff) -> LinearSolver:
+        n = K_ff.shape[0]
+        if n <= self.dense_max and not sparse.issparse(K_ff):
+            return DenseLinearSolver('auto')
+        if self.allow_iterative and n > self.iterative_min:
+            return IterativeLinearSolver('gmres', 'ilu')
+        return SparseDirectSolver()
+
+    def factorize(self, K_ff) -> None:
+        if self.backend is None:
+            self.backend = self._select(K_ff)
+        self.backend.factorize(K_ff)
+
+    def solve(self, b: ndarray) -> ndarray:
+        return self.backend.solve(b)
+
+    def pivot_ratio(self) -> float:
+        return self.backend.pivot_ratio()
+
+    def determinant_sign(self) -> int:
+        return self.backend.determinant_sign()
+
+    def condition_estimate(self) -> float:
+        return self.backend.condition_estimate()
+
+    def __repr__(self) -> str:
+        return f"AutoLinearSolver(backend={self.backend!r})"
+
+
+def is_symmetric(K, rtol: float = 1e-10) -> bool:
+    """True if max |K - Kᵀ| <= rtol · max |K| (dense or sparse K)."""
+    if sparse.issparse(K):
+        diff, scale = abs(K - K.T).max(), abs(K).max()
+    else:
+        K = np.asarray(K)
+        diff, scale = np.max(np.abs(K - K.T), initial=0.0), np.max(np.abs(K), initial=0.0)
+    return bool(diff <= rtol * scale)
+
+
+_BACKENDS = {
+    'auto': AutoLinearSolver,
+    'dense': DenseLinearSolver,
+    'sparse': SparseDirectSolver,
+    'iterative': IterativeLinearSolver,
+}
+
+
+def make_linear_solver(linear_solver: "str | LinearSolver" = 'auto', **options) -> LinearSolver:
+    """
+    Return a `LinearSolver` from a backend name or pass an instance through.
+
+    Parameters
+    ----------
+    linear_solver : str or LinearSolver
+        'auto', 'dense', 'sparse', 'iterative' or a `LinearSolver` instance.
+    **options
+        Keyword arguments of the backend constructor.
+
+    Raises
+    ------
+    ValueError
+        If the backend name is unknown.
+    """
+    if isinstance(linear_solver, LinearSolver):
+        return linear_solver
+    try:
+        cls = _BACKENDS[linear_solver]
+    except KeyError:
+        raise ValueError(f"Unsupported linear solver: {linear_solver}")
+    return cls(**options)
@@ -1,29 +1,186 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from scipy import sparse
 from typing import Tuple, List, TYPE_CHECKING
 
+from .linear_solver import LinearSolver, AutoLinearSolver, make_linear_solver
+from .stiffness_monitor import StiffnessMonitor
+from .line_search import LineSearch
+
 if TYPE_CHECKING:
     from apeFEA.core.model import Model
 
 
+def _free_block(K, free: np.ndarray):
+    """Extract the free-free partition of a dense or sparse stiffness matrix."""
+    if sparse.issparse(K):
+        return K[free][:, free].tocsc()
+    return K[np.ix_(free, free)]
+
+
 class NewtonRaphsonSolver:
+    """
+    Newton–Raphson solver for the static equilibrium R(u, t) = F_ext(t) - F_int(u) = 0.
+
+    The factorization of the free-DOF tangent is cached and reused according to the
+    selected solution strategy:
+
+    - 'newton'     : full Newton, a fresh tangent is factored every iteration.
+    - 'modified'   : modified Newton, refactor every `refactor_interval` iterations
+                     (always at the first iteration of a step).
+    - 'initial'    : initial stiffness, the first tangent of the analysis is factored
+                     once and reused for every iteration of every step.
+    - 'divergence' : keep the last factorization across iterations and steps and
+                     refactor only when the residual norm grows.
+
+    The free-DOF systems are solved by a `LinearSolver` backend: dense LAPACK
+    (Cholesky/LU), sparse direct SuperLU with the ordering computed once, or
+    preconditioned CG/GMRES; 'auto' chooses from the size and symmetry of the
+    first tangent. For an iterative backend a "factorization" is the construction
+    of the preconditioner.
+
+    The number of factorizations and back-substitutions used by the last step is
+    stored in `step_info`. With `monitor=True` a `StiffnessMonitor` also records the
+    pivot ratio, the determinant sign (limit point detection) and, optionally, a
+    1-norm condition estimate of every factorization, all from the LU factors.
+    An optional `LineSearch` scales each increment; its residual evaluations are
+    counted in `step_info['line_search_evaluations']`.
+
+    If a step fails (no convergence, NaN residual or singular tangent) the trial
+    state is reset to the last committed state before the RuntimeError is raised,
+    so the caller can retry the step, e.g. with a smaller increment.
+
+    Parameters
+    ----------
+    model : Model
+        Model providing `evaluate` (residual, tangent and norm).
+    tolerance : float
+        Convergence tolerance on the L2 norm of the free-DOF residual.
+    max_iterations : int
+        Maximum number of iterations per step.
+    verbose : bool
+        Print iteration details.
+    strategy : str
+        Solution strategy, one of 'newton', 'modified', 'initial', 'divergence'.
+    refactor_interval : int
+        Iterations between refactorizations for the 'modified' strategy.
+    monitor : bool
+        Record singularity diagnostics of the factorizations in `step_info`.
+    estimate_condition : bool
+        With `monitor`, also record a 1-norm condition number estimate.
+    line_search : LineSearch, optional
+        Line search applied to every increment (None for full steps).
+    linear_solver : str or LinearSolver
+        Linear solver backend: 'auto', 'dense', 'sparse', 'iterative' or an instance.
+        With `monitor`, 'auto' (or an `AutoLinearSolver`) only selects direct backends.
+    """
+
+    STRATEGIES = ('newton', 'modified', 'initial', 'divergence')
+
     def __init__(
         self,
         model: "Model",
         tolerance: float = 1e-6,
         max_iterations: int = 20,
         verbose: bool = False,
+        strategy: str = 'newton',
+        refactor_interval: int = 1,
+        monitor: bool = False,
+        estimate_condition: bool = False,
+        line_search: LineSearch | None = None,
+        linear_solver: str | LinearSolver = 'auto',
     ):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unsupported solution strategy: {strategy}")
+        if refactor_interval < 1:
+            raise ValueError("refactor_interval must be >= 1")
+
         self.model = model
         self.tol = tolerance
         self.max_iter = max_iterations
         self.verbose = verbose
+        self.strategy = strategy
+        self.refactor_interval = refactor_interval
         self.residual_history = []
 
+        self.linear_solver = make_linear_solver(linear_solver)
+        if monitor:
+            if isinstance(self.linear_solver, AutoLinearSolver):
+                self.linear_solver.allow_iterative = False
+            if not self.linear_solver.direct:
+                raise ValueError("The stiffness monitor requires a direct linear solver")
+
+        # The linear solver while it holds a valid factorization, else None
+        self.factorization: LinearSolver | None = None
+        self.monitor = StiffnessMonitor(estimate_condition) if monitor else None
+        self.line_search = line_search
+        self.step_info: dict = {}
+
+    def _needs_factorization(self, iteration: int) -> bool:
+        """Decide, before evaluating the model, whether this iteration refactors the tangent."""
+        if self.factorization is None or self.strategy == 'newton':
+            return True
+        if self.strategy == 'modified':
+            return iteration % self.refactor_interval == 0
+        return False
+
+    def _refactor_after_evaluation(self, norm_R: float, residual: list[float]) -> bool:
+        """Decide, once the residual is known, whether a fresh tangent is needed after all."""
+        # Refactor-on-divergence: the tangent is only assembled when the residual grows
+        return self.strategy == 'divergence' and bool(residual) and norm_R > residual[-1]
+
+    def _begin_step(self) -> None:
+        """Hook called at the start of every step."""
+        pass
+
+    def _compute_increment(self, R_free: np.ndarray, K, refactor: bool) -> np.ndarray:
+        """Return the free-DOF displacement increment for the free residual `R_free`."""
+        if refactor:
+            self._factorize(K)
+        return self._back_substitute(R_free)
+
+    def _accept_increment(self, du_free: np.ndarray) -> None:
+        """Hook called with the free-DOF increment actually applied to the displacements."""
+        pass
+
+    def _factorize(self, K) -> None:
+        K_ff = _free_block(K, self.model.free_indices)
+
+        if self.verbose:
+            print(f"Stiffness submatrix (free DOFs):\n{K_ff}")
+
+        self.linear_solver.factorize(K_ff)
+        self.factorization = self.linear_solver
+        self.step_info['factorizations'] += 1
+
+        if self.monitor is not None:
+            self.monitor.record(self.factorization, self.step_info)
+
+    def _back_substitute(self, R_free: np.ndarray) -> np.ndarray:
+        x = self.factorization.solve(R_free)
+        self.step_info['back_substitutions'] += 1
+        if not np.all(np.isfinite(x)):
+            raise np.linalg.LinAlgError("Singular stiffness matrix")
+        return x
+
+    def reset(self) -> None:
+        """Discard the cached factorization (e.g. after the model is reverted)."""
+        self.factorization = None
+        if self.monitor is not None:
+            self.monitor.reset()
+
+    def begin_step(self) -> None:
+        """Reset the per-step statistics and start a new step (also used by path-following integrators)."""
+        self.step_info = {'factorizations': 0, 'back_substitutions': 0, 'line_search_evaluations': 0}
+        if self.monitor is not None:
+            self.monitor.begin_step(self.step_info)
+        self._begin_step()
+
     def solve(self, t: float) -> tuple[np.ndarray, list[float], int]:
         u = self.model._assemble_displacement_vector_committed()
         self.model.reset_trial()
         residual = []
+        self.begin_step()
 
         if self.verbose:
             print(f"Initial committed displacement u_committed:\n{u.T}")
@@ -33,20 +190,23 @@ class NewtonRaphsonSolver:
                 print("="*60)
                 print(f"Iteration {i}")
 
-            R = self.model.calculate_residual(t)
-            K = self.model.get_stiffness_matrix()
+            refactor = self._needs_factorization(i)
+            R, K, norm_R = self.model.evaluate(t, norm_type='L2', tangent=refactor)
             free = self.model.free_indices
 
-            norm_R = self.model.residual_norm(t, norm_type='L2')
+            if not refactor and self._refactor_after_evaluation(norm_R, residual):
+                refactor = True
+                K = self.model.get_stiffness_matrix()
+
             residual.append(norm_R)
 
             if self.verbose:
                 print(f"Residual vector R.T:\n{R.T}")
                 print(f"Residual norm = {norm_R:.3e}")
-                print(f"Stiffness submatrix (free DOFs):\n{K[np.ix_(free, free)]}")
 
             if np.isnan(norm_R) or np.isinf(norm_R):
-                self.model.revert_to_start()
+                self.model.reset_trial()
+                self.reset()
                 raise RuntimeError("Residual norm is NaN or Inf – possible numerical instability.")
 
             if norm_R < self.tol:
@@ -59,16 +219,22 @@ class NewtonRaphsonSolver:
             du = np.zeros_like(u)
 
             try:
-                cond_K = np.linalg.cond(K[np.ix_(free, free)])
-                if self.verbose and cond_K > 1e12:
-                    print(f"Warning: Ill-conditioned stiffness matrix (cond={cond_K:.3e})")
-                du[free] = np.linalg.solve(K[np.ix_(free, free)], R[free])
+                du[free] = self._compute_increment(R[free], K, refactor)
             except np.linalg.LinAlgError as e:
-                self.model.revert_to_start()
+                self.model.reset_trial()
+                self.reset()
                 raise RuntimeError(f"Linear solve failed: {e}")
 
+            if self.line_search is not None:
+                eta, evaluations = self.line_search.search(self.model, t, u, du, R)
+                self.step_info['line_search_evaluations'] += evaluations
+                du *= eta
+                if self.verbose:
+                    print(f"Line search: η = {eta:.4f} ({evaluations} residual evaluations)")
+
             u += du
-            self.model.update_trial_state(u, verbose=self.verbose, print_elements=self.verbose)
+            self._accept_increment(du[free])
+            self.model.update_trial_state(u, verbose=self.verbose, update_elements=False)
 
             if self.verbose:
                 print(f"Δu.T =\n{du.T}")
@@ -77,7 +243,8 @@ class NewtonRaphsonSolver:
                 for node in self.model.nodes:
                     print(f"Node {node.id} Trial Displacement: {node.u_trial.flatten()}")
 
-        self.model.revert_to_start()
+        self.model.reset_trial()
+        self.reset()
         raise RuntimeError("Newton–Raphson did not converge.")
 
     def plot_residual_convergence(self):
@@ -0,0 +1,207 @@
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from .newton_raphson import NewtonRaphsonSolver
+from .line_search import LineSearch
+from .linear_solver import LinearSolver
+
+if TYPE_CHECKING:
+    from apeFEA.core.model import Model
+
+
+class QuasiNewtonSolver(NewtonRaphsonSolver, ABC):
+    """
+    Base class for quasi-Newton solvers built on a cached tangent factorization.
+
+    The factored tangent K0 acts as the initial inverse approximation and is kept
+    across iterations and load steps; subclasses correct it with low-rank updates
+    built from the previous increments and residuals. A fresh tangent is assembled
+    and factored only when there is no factorization yet or when convergence stalls,
+    i.e. the residual norm does not drop below `stall_ratio` times the previous one.
+    The update memory is cleared at every step and after every refactorization.
+
+    Solvers plug into `LoadControl` exactly like `NewtonRaphsonSolver` and return
+    `(u, residuals, n_iter)` from `solve(t)`.
+
+    Parameters
+    ----------
+    model : Model
+        Model providing `evaluate` (residual, tangent and norm).
+    tolerance : float
+        Convergence tolerance on the L2 norm of the free-DOF residual.
+    max_iterations : int
+        Maximum number of iterations per step.
+    verbose : bool
+        Print iteration details.
+    max_updates : int
+        Number of stored updates; the memory restarts once it is exceeded.
+    stall_ratio : float
+        Refactor when norm(R_k) > stall_ratio * norm(R_k-1).
+    line_search : LineSearch, optional
+        Line search applied to every increment (None for full steps).
+    linear_solver : str or LinearSolver
+        Linear solver backend for the factored tangent (see `NewtonRaphsonSolver`).
+    """
+
+    def __init__(
+        self,
+        model: "Model",
+        tolerance: float = 1e-6,
+        max_iterations: int = 20,
+        verbose: bool = False,
+        max_updates: int = 10,
+        stall_ratio: float = 0.9,
+        line_search: LineSearch | None = None,
+        linear_solver: str | LinearSolver = 'auto',
+    ):
+        super().__init__(model, tolerance, max_iterations, verbose, line_search=line_search,
+                         linear_solver=linear_solver)
+        self.max_updates = max_updates
+        self.stall_ratio = stall_ratio
+        self._clear_updates()
+
+    @abstractmethod
+    def _clear_updates(self) -> None:
+        """Discard the stored low-rank updates."""
+        ...
+
+    @abstractmethod
+    def _quasi_newton_increment(self, R_free: np.ndarray) -> np.ndarray:
+        """Return the increment for `R_free` using the factored tangent and the updates."""
+        ...
+
+    def _begin_step(self) -> None:
+        self._clear_updates()
+
+    def _needs_factorization(self, iteration: int) -> bool:
+        return self.factorization is None
+
+    def _refactor_after_evaluation(self, norm_R: float, residual: list[float]) -> bool:
+        return bool(residual) and norm_R > self.stall_ratio * residual[-1]
+
+    def _compute_increment(self, R_free: np.ndarray, K, refactor: bool) -> np.ndarray:
+        if refactor:
+            self._factorize(K)
+            self._clear_updates()
+        return self._quasi_newton_increment(R_free)
+
+
+class BFGSSolver(QuasiNewtonSolver):
+    """
+    BFGS solver with rank-two updates of the inverse tangent (limited memory).
+
+    With s = Δu and y = R_k - R_k+1 (≈ K s), the inverse is updated as
+        H+ = (I - ρ s yᵀ) H (I - ρ y sᵀ) + ρ s sᵀ,   ρ = 1 / (sᵀ y)
+    and applied with the two-loop recursion, using the factored tangent as H0.
+    Only the `max_updates` most recent pairs are kept.
+    """
+
+    def _clear_updates(self) -> None:
+        self._pairs: list[tuple[np.ndarray, np.ndarray, float]] = []
+        self._last_residual: np.ndarray | None = None
+        self._last_step: np.ndarray | None = None
+
+    def _quasi_newton_increment(self, R_free: np.ndarray) -> np.ndarray:
+        if self._last_step is not None:
+            s = self._last_step
+            y = self._last_residual - R_free
+            sy = float(np.vdot(s, y))
+            if sy > np.finfo(float).eps * np.linalg.norm(s) * np.linalg.norm(y):
+                self._pairs.append((s, y, 1.0 / sy))
+                if len(self._pairs) > self.max_updates:
+                    self._pairs.pop(0)
+
+        q = R_free.copy()
+        alphas = []
+        for s, y, rho in reversed(self._pairs):
+            alpha = rho * float(np.vdot(s, q))
+            q -= alpha * y
+            alphas.append(alpha)
+
+        z = self._back_substitute(q)
+        for (s, y, rho), alpha in zip(self._pairs, reversed(alphas)):
+            beta = rho * float(np.vdot(y, z))
+            z += (alpha - beta) * s
+
+        self._last_residual = R_free.copy()
+        return z
+
+    def _accept_increment(self, du_free: np.ndarray) -> None:
+        self._last_step = du_free.copy()
+
+
+class BroydenSolver(QuasiNewtonSolver):
+    """
+    Broyden solver with rank-one ("good" Broyden) updates of the inverse tangent.
+
+    With s = Δu, y = R_k - R_k+1 and q = H y, the inverse is updated as
+        H+ = H + (s - q) sᵀ H / (sᵀ q)
+    and applied recursively on top of the factored tangent, H0 = K0⁻¹.
+    The memory restarts after `max_updates` updates.
+    """
+
+    def _clear_updates(self) -> None:
+        self._updates: list[tuple[np.ndarray, np.ndarray, float]] = []
+        self._last_residual: np.ndarray | None = None
+        self._last_step: np.ndarray | None = None
+
+    def _apply_inverse(self, r: np.ndarray) -> np.ndarray:
+        z = self._back_substitute(r)
+        for s, q, denom in self._updates:
+            z += (s - q) * (float(np.vdot(s, z)) / denom)
+        return z
+
+    def _quasi_newton_increment(self, R_free: np.ndarray) -> np.ndarray:
+        if self._last_step is not None:
+            if len(self._updates) >= self.max_updates:
+                self._updates = []
+            s = self._last_step
+            q = self._apply_inverse(self._last_residual - R_free)
+            denom = float(np.vdot(s, q))
+            if abs(denom) > np.finfo(float).eps * np.linalg.norm(s) * np.linalg.norm(q):
+                self._updates.append((s, q, denom))
+
+        self._last_residual = R_free.copy()
+        return self._apply_inverse(R_free)
+
+    def _accept_increment(self, du_free: np.ndarray) -> None:
+        self._last_step = du_free.copy()
+
+
+class KrylovNewtonSolver(QuasiNewtonSolver):
+    """
+    Krylov subspace accelerated Newton (Carlson & Miller), as in OpenSees `KrylovNewton`.
+
+    Each iteration back-substitutes the residual with the factored tangent,
+    r_k = K0⁻¹ R_k, and accelerates it over the subspace of previous increments V
+    and their preconditioned residual changes AV (AV_j = r_j - r_j+1):
+        c  = argmin ‖AV c - r_k‖
+        Δu = r_k + (V - AV) c
+    The subspace restarts after `max_updates` vectors.
+    """
+
+    def _clear_updates(self) -> None:
+        self._V: list[np.ndarray] = []
+        self._AV: list[np.ndarray] = []
+        self._last_r: np.ndarray | None = None
+
+    def _quasi_newton_increment(self, R_free: np.ndarray) -> np.ndarray:
+        r = self._back_substitute(R_free)
+
+        if self._last_r is not None and len(self._V) > len(self._AV):
+            self._AV.append(self._last_r - r)
+            if len(self._AV) > self.max_updates:
+                self._V, self._AV = [], []
+
+        self._last_r = r.copy()
+        if not self._AV:
+            return r
+
+        V = np.hstack(self._V)
+        AV = np.hstack(self._AV)
+        c, *_ = np.linalg.lstsq(AV, r, rcond=None)
+        return r + (V - AV) @ c
+
+    def _accept_increment(self, du_free: np.ndarray) -> None:
+        self._V.append(du_free.copy())
@@ -0,0 +1,56 @@
+from .linear_solver import LinearSolver
+
+
+class StiffnessMonitor:
+    """
+    Singularity / ill-conditioning monitor built on the tangent factorizations.
+
+    Every factorization of a step is inspected through its factors only
+    (LU or Cholesky, so a direct `LinearSolver` backend is required):
+
+    - min_pivot_ratio       : smallest min|u_ii|/max|u_ii| of the step.
+    - determinant_sign      : sign of det(K_ff) of the last factorization.
+    - determinant_sign_change : True if the sign differs from the previous
+                                factorization (passage through a limit point).
+    - condition_estimate    : largest 1-norm condition estimate of the step
+                              (only with `estimate_condition=True`).
+
+    The values are written into the solver's `step_info` dictionary. Diagnostics a
+    backend does not provide (None) are skipped and stay None.
+
+    Parameters
+    ----------
+    estimate_condition : bool
+        Also compute the 1-norm condition estimate (a few extra back-substitutions).
+    """
+
+    def __init__(self, estimate_condition: bool = False):
+        self.estimate_condition = estimate_condition
+        self._last_sign: int | None = None
+
+    def begin_step(self, step_info: dict) -> None:
+        step_info['min_pivot_ratio'] = None
+        step_info['determinant_sign'] = self._last_sign
+        step_info['determinant_sign_change'] = False
+        if self.estimate_condition:
+            step_info['condition_estimate'] = None
+
+    def record(self, factorization: LinearSolver, step_info: dict) -> None:
+        ratio = factorization.pivot_ratio()
+        if ratio is not None and (step_info['min_pivot_ratio'] is None or ratio < step_info['min_pivot_ratio']):
+            step_info['min_pivot_ratio'] = ratio
+
+        sign = factorization.determinant_sign()
+        if sign is not None:
+            if self._last_sign is not None and sign != self._last_sign:
+                step_info['determinant_sign_change'] = True
+            step_info['determinant_sign'] = sign
+            self._last_sign = sign
+
+        if self.estimate_condition:
+            cond = factorization.condition_estimate()
+            if cond is not None and (step_info['condition_estimate'] is None or cond > step_info['condition_estimate']):
+                step_info['condition_estimate'] = cond
+
+    def reset(self) -> None:
+        self._last_sign = None
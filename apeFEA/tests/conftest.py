@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from apeFEA import Node, FrameElement, Model, Section, LinearElastic, LinearTransformation, CorotationalTransformation2D
+
+E, A, I, H = 200000.0, 1e4, 1e8, 3000.0
+
+
+def build_column(n=4, transformation=LinearTransformation, section=None, load=(1000.0, -5000.0, 0.0),
+                 element=FrameElement, mass=0.0, mass_type='lumped', **model_options):
+    """Cantilever column of `n` elements along y, fixed at the base and loaded at the tip."""
+    section = section or Section(LinearElastic(E=E), A=A, I=I)
+    nodes = [Node(k + 1, [0.0, H * k / n]) for k in range(n + 1)]
+    nodes[0].set_restraints(['r', 'r', 'r'])
+    if load is not None:
+        nodes[-1].add_load(list(load))
+    elements = [element(k + 1, [nodes[k], nodes[k + 1]], section, transformation, mass=mass, mass_type=mass_type)
+                for k in range(n)]
+    return Model(elements, **model_options), nodes
+
+
+def build_frame(storeys=3, bays=2, transformation=LinearTransformation, mass=0.0, mass_type='lumped', **model_options):
+    """Regular moment frame with fixed bases and a lateral load at the top left node."""
+    width = 6000.0
+    nodes = [[Node(s * (bays + 1) + b + 1, [b * width, s * H]) for b in range(bays + 1)] for s in range(storeys + 1)]
+    for node in nodes[0]:
+        node.set_restraints(['r', 'r', 'r'])
+    nodes[-1][0].add_load([1e4, 0.0, 0.0])
+
+    column = Section(LinearElastic(E=E), A=2e4, I=4e8)
+    beam = Section(LinearElastic(E=E), A=1e4, I=2e8)
+    elements = []
+    for s in range(storeys):
+        for b in range(bays + 1):
+            elements.append(FrameElement(len(elements) + 1, [nodes[s][b], nodes[s + 1][b]], column, transformation,
+                                         mass=mass, mass_type=mass_type))
+        for b in range(bays):
+            elements.append(FrameElement(len(elements) + 1, [nodes[s + 1][b], nodes[s + 1][b + 1]], beam, transformation,
+                                         mass=mass, mass_type=mass_type))
+    return Model(elements, **model_options), [node for row in nodes for node in row]
+
+
+def build_arch(span=2000.0, rise=50.0, n=4, I=3e3, **model_options):
+    """Pinned shallow two-bar arch of `n` corotational elements per half with a unit load down at the apex."""
+    section = Section(LinearElastic(E=E), A=100.0, I=I)
+    half = span / 2
+    points = [(half * k / n, rise * k / n) for k in range(n + 1)] + \
+             [(half + half * k / n, rise - rise * k / n) for k in range(1, n + 1)]
+    nodes = [Node(k + 1, list(point)) for k, point in enumerate(points)]
+    nodes[0].set_restraints(['r', 'r', 'f'])
+    nodes[-1].set_restraints(['r', 'r', 'f'])
+    apex = nodes[n]
+    apex.add_load([0.0, -1.0, 0.0])
+    elements = [FrameElement(k + 1, [nodes[k], nodes[k + 1]], section, CorotationalTransformation2D)
+                for k in range(len(nodes) - 1)]
+    return Model(elements, **model_options), apex
+
+
+@pytest.fixture
+def column():
+    return build_column
+
+
+@pytest.fixture
+def frame():
+    return build_frame
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
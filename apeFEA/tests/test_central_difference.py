@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+import scipy.linalg as sl
+from scipy import sparse
+
+from apeFEA import CentralDifference, Newmark, NewtonRaphsonSolver, ConstantTimeSeries
+
+
+def lumped_column(column, load=(1000.0, 0.0, 0.0), **model_options):
+    """Cantilever with lumped translational and rotational masses at every free node."""
+    model, nodes = column(n=4, load=load, timeseries=ConstantTimeSeries, **model_options)
+    for node in nodes[1:]:
+        node.set_mass([0.01, 0.01, 1e3])
+    return model, nodes
+
+
+def exact_frequencies(model):
+    free = model.free_indices
+    K = model.get_stiffness_matrix()
+    M = model.get_mass_matrix()
+    if sparse.issparse(K):
+        K, M = K.toarray(), M.toarray()
+    K, M = K[np.ix_(free, free)], M[np.ix_(free, free)]
+    return np.sqrt(sl.eigh(K, M, eigvals_only=True))
+
+
+def tip_history(analysis, node):
+    return np.array([u[node.idx[0], 0] for u in analysis.u_history])
+
+
+def test_critical_time_step_is_conservative(column):
+    model, _ = lumped_column(column)
+    omega = exact_frequencies(model)
+
+    assert CentralDifference(model, None, 1).critical_time_step() <= 2 / omega[-1]
+
+
+@pytest.mark.parametrize("model_options", [dict(), dict(assembly='sparse', vectorized=True)])
+def test_step_load_matches_newmark(column, model_options):
+    model, nodes = lumped_column(column, **model_options)
+    omega = exact_frequencies(model)
+    dt = 0.9 * CentralDifference(model, None, 1).critical_time_step()
+    steps = 10 * int(0.2 * np.pi / omega[0] / dt)  # one period
+    analysis = CentralDifference(model, dt, steps, output_interval=10)
+    analysis.run()
+
+    reference_model, reference_nodes = lumped_column(column)
+    reference = Newmark(reference_model, NewtonRaphsonSolver(reference_model, tolerance=1e-3), dt, steps)
+    reference.run()
+
+    assert not analysis.failed_steps and not reference.failed_steps
+    expected = tip_history(reference, reference_nodes[-1])[::10]
+    np.testing.assert_allclose(tip_history(analysis, nodes[-1]), expected, rtol=0.0, atol=1e-3 * np.abs(expected).max())
+
+
+@pytest.mark.filterwarnings("ignore:overflow:RuntimeWarning")
+def test_unstable_time_step_fails(column):
+    # Axial and lateral load, so that the highest (axial) mode is excited
+    model, _ = lumped_column(column, load=(1000.0, -1000.0, 0.0))
+    omega = exact_frequencies(model)
+    analysis = CentralDifference(model, 1.05 * 2 / omega[-1], 5000, output_interval=100)
+    analysis.run()
+
+    assert analysis.failed_steps == 1
+    assert analysis.time_history[-1] < 5000 * analysis.dt
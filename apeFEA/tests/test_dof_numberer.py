@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from apeFEA import (Node, FrameElement, Model, Section, LinearElastic, LoadControl, NewtonRaphsonSolver, RCMNumberer,
+                    MinimumDegreeNumberer)
+from apeFEA.numberer import make_numberer
+
+from .conftest import H
+
+NUMBERERS = ['plain', 'rcm', 'amd']
+
+
+def shuffled_frame(rng, numberer, storeys=6, bays=2):
+    """Moment frame whose node ids are a random permutation, so that id order is a poor numbering."""
+    width = 6000.0
+    ids = rng.permutation((storeys + 1) * (bays + 1)) * 7 + 3
+    nodes = [[Node(int(ids[s * (bays + 1) + b]), [b * width, s * H]) for b in range(bays + 1)]
+             for s in range(storeys + 1)]
+    for node in nodes[0]:
+        node.set_restraints(['r', 'r', 'r'])
+    nodes[-1][0].add_load([1e4, 0.0, 0.0])
+
+    section = Section(LinearElastic(E=200000.0), A=1e4, I=2e8)
+    elements = []
+    for s in range(storeys):
+        for b in range(bays + 1):
+            elements.append(FrameElement(len(elements) + 1, [nodes[s][b], nodes[s + 1][b]], section))
+        for b in range(bays):
+            elements.append(FrameElement(len(elements) + 1, [nodes[s + 1][b], nodes[s + 1][b + 1]], section))
+    return Model(elements, numberer=numberer), [node for row in nodes for node in row]
+
+
+@pytest.mark.parametrize("numberer", NUMBERERS)
+def test_gapped_ids_are_numbered_compactly(rng, numberer):
+    model, nodes = shuffled_frame(rng, numberer)
+
+    assert model.system_ndof == 3 * len(nodes)
+    assert sorted(np.concatenate([node.idx for node in nodes]).tolist()) == list(range(model.system_ndof))
+    for element in model.elements:
+        np.testing.assert_array_equal(element.idx, np.concatenate([node.idx for node in element.nodes]))
+
+
+def cholesky_fill(model):
+    """Number of nonzeros of the Cholesky factor of K_ff in the equation order of the model."""
+    free = model.free_indices
+    L = np.linalg.cholesky(model.get_stiffness_matrix()[np.ix_(free, free)])
+    return np.count_nonzero(np.abs(L) > 1e-9 * np.abs(L).max())
+
+
+@pytest.mark.parametrize("numberer", [RCMNumberer, MinimumDegreeNumberer])
+def test_reordering_reduces_profile(rng, numberer):
+    model, _ = shuffled_frame(rng, numberer())
+    report = model.numberer.report
+
+    for prefix in ('', 'system_'):
+        assert report[f'{prefix}profile_after'] < report[f'{prefix}profile_before']
+    assert report['n_equations'] == model.system_ndof
+    assert report['n_free'] == len(model.free_indices)
+
+
+def test_rcm_reduces_bandwidth(rng):
+    model, _ = shuffled_frame(rng, RCMNumberer())
+    report = model.numberer.report
+
+    for prefix in ('', 'system_'):
+        assert report[f'{prefix}bandwidth_after'] < report[f'{prefix}bandwidth_before'] / 2
+
+
+def test_minimum_degree_reduces_fill():
+    # Minimum degree targets the fill of the factors, not the bandwidth
+    fill = {numberer: cholesky_fill(shuffled_frame(np.random.default_rng(0), numberer)[0]) for numberer in NUMBERERS}
+
+    assert fill['amd'] < fill['rcm'] < fill['plain']
+
+
+def test_displacements_do_not_depend_on_the_ordering():
+    displacements = []
+    for numberer in NUMBERERS:
+        model, nodes = shuffled_frame(np.random.default_rng(0), numberer)
+        LoadControl(model, NewtonRaphsonSolver(model, tolerance=1e-6), 1.0, 1).run()
+        displacements.append({node.id: node.u_trial.ravel().copy() for node in nodes})
+
+    for other in displacements[1:]:
+        for node_id, u in displacements[0].items():
+            np.testing.assert_allclose(other[node_id], u, rtol=1e-9, atol=1e-12)
+
+
+def test_make_numberer():
+    numberer = RCMNumberer()
+    assert make_numberer(numberer) is numberer
+    assert isinstance(make_numberer('minimum_degree'), MinimumDegreeNumberer)
+    with pytest.raises(ValueError):
+        make_numberer('metis')
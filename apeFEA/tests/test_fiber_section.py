@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from apeFEA import (FiberSection, EPP, LinearElastic, LoadControl, DisplacementControl,
+                    NewtonRaphsonSolver)
+
+from .conftest import H
+
+FY, B, D = 250.0, 100.0, 200.0
+
+
+def rectangle(material, n_fibers=40, y_bottom=-D / 2):
+    section = FiberSection()
+    section.add_rect_patch(material, y_bottom, y_bottom + D, B, n_fibers)
+    return section
+
+
+def test_pushover_reaches_plastic_mechanism(column):
+    model, nodes = column(n=6, section=rectangle(EPP(E=200000.0, fy=FY)), load=(1.0, 0.0, 0.0))
+    analysis = DisplacementControl(model, NewtonRaphsonSolver(model, tolerance=1e-3), nodes[-1], 0, 4.0, 25)
+    analysis.run()
+
+    # Base shear at the plastic moment of the fixed end; displacement-based
+    # elements approach it from above under mesh refinement
+    Mp = FY * B * D ** 2 / 4
+    assert not analysis.failed_steps
+    assert Mp / H < max(analysis.load_factor_history) < 1.05 * Mp / H
+
+
+@pytest.mark.filterwarnings("ignore::scipy.linalg.LinAlgWarning")
+def test_load_control_fails_beyond_capacity(column):
+    Mp = FY * B * D ** 2 / 4
+    model, _ = column(n=4, section=rectangle(EPP(E=200000.0, fy=FY)), load=(1.5 * Mp / H, 0.0, 0.0))
+    analysis = LoadControl(model, NewtonRaphsonSolver(model, tolerance=1e-3), 1.0, 10)
+    analysis.run()
+
+    assert analysis.failed_steps
+    assert analysis.time_history[-1] < 1.0
+
+
+def test_unsymmetric_section_couples_axial_and_bending(column):
+    # Elastic section with the reference axis at the bottom fibre
+    section = rectangle(LinearElastic(E=200000.0), y_bottom=0.0)
+    N, M = -5e4, 2e6
+    model, nodes = column(n=2, section=section, load=(0.0, N, M))
+    analysis = LoadControl(model, NewtonRaphsonSolver(model, tolerance=1e-3), 1.0, 1)
+    analysis.run()
+
+    # Uniform section deformations from the coupled stiffness [[EA, ES], [ES, EI]]
+    eps, kappa = np.linalg.solve(section.get_tangent_matrix(), [N, M])
+    expected = [-kappa * H ** 2 / 2, eps * H, kappa * H]
+    np.testing.assert_allclose(nodes[-1].u_trial.ravel(), expected, rtol=1e-9)
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from apeFEA import (Node, FrameElement, ForceBasedFrameElement, Model, Section, FiberSection, LinearElastic, EPP,
+                    LinearTransformation, PDeltaTransformation2D_OP, PDeltaTransformation2D, CorotationalTransformation2D)
+from apeFEA.elements.one_dimension import FrameElementBlock, build_element_blocks
+
+TRANSFORMATIONS = [LinearTransformation, PDeltaTransformation2D_OP, PDeltaTransformation2D, CorotationalTransformation2D]
+
+
+def deformed_chain(rng, transformation, sections):
+    """Inclined chain of elements (one per section) with random trial displacements."""
+    coords = np.cumsum(rng.normal([1000.0, 2000.0], 400.0, (len(sections) + 1, 2)), axis=0)
+    nodes = [Node(k + 1, list(xy)) for k, xy in enumerate(coords)]
+    nodes[0].set_restraints(['r', 'r', 'r'])
+    elements = [FrameElement(k + 1, [nodes[k], nodes[k + 1]], section, transformation)
+                for k, section in enumerate(sections)]
+    model = Model(elements)
+    model.u_trial[:] = rng.normal(0.0, 20.0, model.u_trial.shape)
+    model.u_trial[2::3] *= 1e-3
+    return model, elements
+
+
+@pytest.mark.parametrize("transformation", TRANSFORMATIONS)
+def test_block_matches_element_forces_and_tangents(rng, transformation):
+    sections = [Section(LinearElastic(E=200000.0), A=1e4, I=1e8), Section(LinearElastic(E=30000.0), A=9e4, I=6.75e8)]
+    model, elements = deformed_chain(rng, transformation, sections * 3)
+
+    block = FrameElementBlock(elements)
+    block.update_trial(model.u_trial)
+    Fg, results = block.force_recovery()
+    Kg = block.get_global_stiffness_matrix(results['Fb'])
+
+    for k, element in enumerate(elements):
+        F, _ = element.force_recovery()
+        np.testing.assert_allclose(Fg[k], F.ravel(), rtol=1e-10, atol=1e-8 * np.abs(F).max())
+        K = element.get_global_stiffness_matrix()
+        np.testing.assert_allclose(Kg[k], K, rtol=1e-10, atol=1e-12 * np.abs(K).max())
+
+
+@pytest.mark.parametrize("transformation", [LinearTransformation, CorotationalTransformation2D])
+def test_block_integrates_fiber_sections_like_elements(rng, transformation):
+    fibers = FiberSection()
+    fibers.add_rect_patch(EPP(E=200000.0, fy=250.0), -100.0, 150.0, 100.0, 20)
+    elastic = Section(LinearElastic(E=200000.0), A=2.5e4, I=1.3e8)
+    model, elements = deformed_chain(rng, transformation, [fibers, elastic, fibers])
+    # Mostly flexural deformations, so that part of the fibers yield
+    model.u_trial[0::3] *= 0.05
+    model.u_trial[1::3] *= 0.05
+
+    block = FrameElementBlock(elements)
+    block.update_trial(model.u_trial)
+    _, results = block.force_recovery()
+    kb = block.get_basic_stiffness_matrix()
+
+    for k, element in enumerate(elements):
+        _, element_results = element.force_recovery()
+        np.testing.assert_allclose(results['Fb'][k], element_results['Fb'].ravel(), rtol=1e-9,
+                                   atol=1e-9 * np.abs(element_results['Fb']).max())
+        np.testing.assert_allclose(kb[k], element.get_basic_stiffness_matrix(), rtol=1e-9)
+
+
+def test_build_element_blocks_groups_by_transformation():
+    nodes = [Node(k + 1, [0.0, 1000.0 * k]) for k in range(5)]
+    section = Section(LinearElastic(E=200000.0), A=1e4, I=1e8)
+    elements = [
+        FrameElement(1, nodes[0:2], section, LinearTransformation),
+        FrameElement(2, nodes[1:3], section, CorotationalTransformation2D),
+        FrameElement(3, nodes[2:4], section, LinearTransformation),
+        ForceBasedFrameElement(4, nodes[3:5], section, LinearTransformation),
+    ]
+
+    blocks, remaining = build_element_blocks(elements)
+
+    assert {block.transformation_type: [e.id for e in block.elements] for block in blocks} == {
+        LinearTransformation: [1, 3],
+        CorotationalTransformation2D: [2],
+    }
+    assert remaining == [elements[3]]
+
+
+def test_block_rejects_mixed_transformations():
+    nodes = [Node(k + 1, [0.0, 1000.0 * k]) for k in range(3)]
+    section = Section(LinearElastic(E=200000.0), A=1e4, I=1e8)
+    elements = [FrameElement(1, nodes[0:2], section, LinearTransformation),
+                FrameElement(2, nodes[1:3], section, CorotationalTransformation2D)]
+
+    with pytest.raises(ValueError):
+        FrameElementBlock(elements)
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from apeFEA import (BisectionLineSearch, SecantLineSearch, RegulaFalsiLineSearch, LoadControl, NewtonRaphsonSolver,
+                    CorotationalTransformation2D)
+
+LINE_SEARCHES = [BisectionLineSearch, SecantLineSearch, RegulaFalsiLineSearch]
+
+
+class Spring:
+    """One-DOF model with internal force `force(u)` against the load `load`, counting residual evaluations."""
+
+    free_indices = np.array([0])
+
+    def __init__(self, force, load):
+        self.force = force
+        self.load = load
+        self.u = np.zeros((1, 1))
+        self.evaluations = 0
+
+    def update_trial_state(self, u, update_elements=True):
+        self.u = u.copy()
+
+    def evaluate(self, t, tangent=True):
+        self.evaluations += 1
+        with np.errstate(invalid='ignore'):
+            R = self.load - self.force(self.u)
+        return R, None, float(np.linalg.norm(R))
+
+    def search(self, line_search, du):
+        u = np.zeros((1, 1))
+        R = self.load - self.force(u)
+        return line_search.search(self, 1.0, u, np.array([[du]]), R)
+
+
+@pytest.mark.parametrize("line_search", LINE_SEARCHES)
+def test_full_step_is_accepted_without_searching(line_search):
+    # Exact Newton step on a linear spring: s(1) = 0
+    spring = Spring(lambda u: 2.0 * u, 3.0)
+
+    eta, evaluations = spring.search(line_search(), 1.5)
+
+    assert eta == 1.0
+    assert evaluations == spring.evaluations == 1
+
+
+@pytest.mark.parametrize("line_search", LINE_SEARCHES)
+def test_overshooting_step_is_scaled_back(line_search):
+    # Hardening spring u + u³ = 3 (root u = 1.2134), the initial tangent overshoots to u = 3
+    spring = Spring(lambda u: u + u ** 3, 3.0)
+    search = line_search(tolerance=0.1)
+
+    eta, evaluations = spring.search(search, 3.0)
+
+    u = 3.0 * eta
+    assert 0.0 < eta < 1.0
+    assert abs(3.0 * (3.0 - u - u ** 3)) <= 0.1 * 9.0
+    assert evaluations == spring.evaluations
+    assert evaluations <= 2 + search.max_iterations
+
+
+@pytest.mark.parametrize("line_search", LINE_SEARCHES)
+def test_non_finite_residual_energy_backtracks(line_search):
+    # The internal force is undefined beyond u = 1.5: the full step u = 4 gives NaN
+    spring = Spring(lambda u: u + np.sqrt(1.5 - u), 2.0)
+
+    eta, evaluations = spring.search(line_search(), 4.0)
+
+    # η = 1 and 0.5 are NaN, η = 0.25 (u = 1) is the largest finite halving
+    assert eta == 0.25
+    assert evaluations == spring.evaluations == 3
+
+
+@pytest.mark.parametrize("line_search", LINE_SEARCHES)
+def test_backtracking_stops_at_min_eta(line_search):
+    spring = Spring(lambda u: np.full_like(u, np.nan), 1.0)
+
+    eta, evaluations = spring.search(line_search(min_eta=0.1), 1.0)
+
+    # η = 1, 0.5, 0.25, 0.125, then min_eta
+    assert eta == 0.1
+    assert evaluations == spring.evaluations == 5
+
+
+@pytest.mark.parametrize("line_search", LINE_SEARCHES)
+def test_evaluations_are_counted_in_step_info(column, line_search):
+    class Counting(line_search):
+        def search(self, *args):
+            eta, evaluations = super().search(*args)
+            self.calls.append(evaluations)
+            return eta, evaluations
+
+    model, _ = column(transformation=CorotationalTransformation2D, load=(2e4, -1e5, 0.0))
+    search = Counting()
+    search.calls = []
+    solver = NewtonRaphsonSolver(model, tolerance=1e-6, max_iterations=50, line_search=search)
+    analysis = LoadControl(model, solver, 1.0, 4)
+    analysis.run()
+
+    assert not analysis.failed_steps
+    counts = [info['line_search_evaluations'] for info in analysis.step_info_history]
+    # One search per increment, i.e. per iteration but the converged one
+    assert len(search.calls) == sum(n - 1 for n in analysis.iteration_counts)
+    assert sum(counts) == sum(search.calls) >= len(search.calls)
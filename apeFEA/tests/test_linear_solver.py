@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+from scipy import sparse
+
+from apeFEA import DenseLinearSolver, SparseDirectSolver, IterativeLinearSolver, AutoLinearSolver
+from apeFEA.solver import make_linear_solver
+
+
+@pytest.fixture
+def systems(frame, rng):
+    """SPD frame tangent (sparse) and an unsymmetric matrix with the same pattern, with two right-hand sides."""
+    model, _ = frame(assembly='sparse')
+    free = model.free_indices
+    K = model.get_stiffness_matrix()[free][:, free].tocsr()
+
+    # Skew-symmetric perturbation on the pattern of K
+    skew = K.copy()
+    skew.data = rng.normal(0.0, 1.0, skew.nnz) * np.abs(K.data).max() * 1e-2
+    unsymmetric = (K + skew - skew.T).tocsr()
+    unsymmetric.sort_indices()
+    b = rng.normal(0.0, 1.0, (K.shape[0], 2))
+    return {'spd': K, 'unsymmetric': unsymmetric}, b
+
+
+SOLVERS = {
+    'dense-cholesky': (lambda: DenseLinearSolver('cholesky'), ['spd']),
+    'dense-lu': (lambda: DenseLinearSolver('lu'), ['spd', 'unsymmetric']),
+    'dense-auto': (lambda: DenseLinearSolver('auto'), ['spd', 'unsymmetric']),
+    **{f'sparse-{ordering}': (lambda ordering=ordering: SparseDirectSolver(ordering), ['spd', 'unsymmetric'])
+       for ordering in SparseDirectSolver.ORDERINGS},
+    'cg-jacobi': (lambda: IterativeLinearSolver('cg', 'jacobi'), ['spd']),
+    'gmres-ilu': (lambda: IterativeLinearSolver('gmres', 'ilu'), ['spd', 'unsymmetric']),
+    'gmres-jacobi': (lambda: IterativeLinearSolver('gmres', 'jacobi'), ['spd', 'unsymmetric']),
+}
+
+
+@pytest.mark.parametrize("name, matrix", [(name, matrix) for name, (_, matrices) in SOLVERS.items()
+                                          for matrix in matrices])
+@pytest.mark.parametrize("dense_input", [False, True])
+def test_backend_matches_dense_reference(systems, name, matrix, dense_input):
+    factory, _ = SOLVERS[name]
+    matrices, b = systems
+    K = matrices[matrix]
+    reference = np.linalg.solve(K.toarray(), b)
+
+    solver = factory()
+    solver.factorize(K.toarray() if dense_input else K)
+
+    # Several columns at once, a single column and a 1D vector
+    np.testing.assert_allclose(solver.solve(b), reference, rtol=1e-7, atol=1e-9 * np.abs(reference).max())
+    np.testing.assert_allclose(solver.solve(b[:, :1]), reference[:, :1], rtol=1e-7,
+                               atol=1e-9 * np.abs(reference).max())
+    assert solver.solve(b[:, 0]).shape == (K.shape[0],)
+
+
+def test_dense_auto_falls_back_to_lu(systems):
+    matrices, b = systems
+    solver = DenseLinearSolver('auto')
+
+    solver.factorize(matrices['spd'])
+    assert solver.method_used == 'cholesky'
+    solver.factorize(matrices['unsymmetric'])
+    assert solver.method_used == 'lu'
+
+    # Symmetric indefinite (past a limit point)
+    indefinite = matrices['spd'].toarray()
+    indefinite[0, 0] = -indefinite[0, 0]
+    solver.factorize(indefinite)
+    assert solver.method_used == 'lu'
+    assert solver.determinant_sign() == np.sign(np.linalg.det(indefinite))
+    np.testing.assert_allclose(indefinite @ solver.solve(b), b, atol=1e-8 * np.abs(b).max())
+
+    with pytest.raises(np.linalg.LinAlgError):
+        DenseLinearSolver('cholesky').factorize(indefinite)
+
+
+def test_sparse_ordering_is_reused_across_refactorizations(systems, rng):
+    matrices, b = systems
+    K = matrices['spd']
+    solver = SparseDirectSolver()
+
+    for scale in (1.0, 2.0, 0.5):
+        # Same pattern, new values
+        K_new = K.copy()
+        K_new.data = K.data * scale * (1.0 + 0.1 * rng.random(K.nnz))
+        K_new = (K_new + K_new.T).tocsr()
+        solver.factorize(K_new)
+        np.testing.assert_allclose(K_new @ solver.solve(b), b, atol=1e-8 * np.abs(b).max())
+    assert solver.orderings == 1
+
+    # A new sparsity pattern needs a new ordering
+    solver.factorize(matrices['spd'] + sparse.eye(K.shape[0], k=K.shape[0] - 1) * 1e-3)
+    assert solver.orderings == 2
+
+    no_reuse = SparseDirectSolver(reuse_ordering=False)
+    for _ in range(3):
+        no_reuse.factorize(K)
+    assert no_reuse.orderings == 3
+
+
+@pytest.mark.parametrize("n, is_sparse, allow_iterative, expected", [
+    (10, False, True, DenseLinearSolver),
+    (100, False, True, DenseLinearSolver),
+    (101, False, True, SparseDirectSolver),
+    (10, True, True, SparseDirectSolver),
+    (1000, True, True, SparseDirectSolver),
+    (1001, True, True, IterativeLinearSolver),
+    (1001, False, True, IterativeLinearSolver),
+    (1001, True, False, SparseDirectSolver),
+])
+def test_auto_selects_backend_at_size_thresholds(n, is_sparse, allow_iterative, expected):
+    solver = AutoLinearSolver(dense_max=100, iterative_min=1000, allow_iterative=allow_iterative)
+    K = sparse.identity(n, format='csr') if is_sparse else np.eye(n)
+
+    backend = solver._select(K)
+
+    assert type(backend) is expected
+    if expected is DenseLinearSolver:
+        assert backend.method == 'auto'
+
+
+def test_auto_keeps_its_first_choice(systems):
+    matrices, b = systems
+    solver = AutoLinearSolver()
+
+    solver.factorize(matrices['spd'])
+    backend = solver.backend
+    assert isinstance(backend, SparseDirectSolver) and solver.direct
+    solver.factorize(matrices['spd'].toarray())
+    assert solver.backend is backend
+    np.testing.assert_allclose(matrices['spd'] @ solver.solve(b), b, atol=1e-8 * np.abs(b).max())
+
+
+def test_make_linear_solver():
+    assert isinstance(make_linear_solver('dense'), DenseLinearSolver)
+    assert isinstance(make_linear_solver('sparse'), SparseDirectSolver)
+    assert isinstance(make_linear_solver('iterative'), IterativeLinearSolver)
+    solver = SparseDirectSolver()
+    assert make_linear_solver(solver) is solver
+    with pytest.raises(ValueError):
+        make_linear_solver('cholmod')
+    with pytest.raises(ValueError):
+        DenseLinearSolver('qr')
+    with pytest.raises(ValueError):
+        IterativeLinearSolver('bicgstab')
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from apeFEA import LoadControl, NewtonRaphsonSolver, CorotationalTransformation2D
+
+
+class FailingSolver(NewtonRaphsonSolver):
+    """Newton solver that fails the attempts at pseudo-times in `fail_after` (all of them if `always`)."""
+
+    def __init__(self, model, fail_after, always=False, **kwargs):
+        super().__init__(model, **kwargs)
+        self.fail_after = fail_after
+        self.always = always
+        self.attempts = []
+
+    def solve(self, t):
+        self.attempts.append((t, self.model.u_committed.copy()))
+        if t > self.fail_after and (self.always or len([a for a, _ in self.attempts if a > self.fail_after]) == 1):
+            # Leave a dirty trial state behind, as a diverged iteration would
+            self.model.update_trial_state(self.model.u_trial + 1.0)
+            raise RuntimeError("forced failure")
+        return super().solve(t)
+
+
+def test_failed_step_is_cut_back_and_retried_from_committed_state(column):
+    model, nodes = column(n=4, transformation=CorotationalTransformation2D)
+    solver = FailingSolver(model, 0.5, tolerance=1e-6)
+    analysis = LoadControl(model, solver, 1.0, 4, adaptive=True, dt_max=0.3)
+    analysis.run()
+
+    assert analysis.failed_steps == 1
+    times = np.array(analysis.time_history)
+    assert times[-1] == pytest.approx(1.0)
+    assert len(analysis.u_history) == len(times) == len(analysis.iteration_counts)
+
+    # Realized grid: growth after converged steps (capped by dt_max), one cutback after the failure
+    failed = next(t for t, _ in solver.attempts if t > 0.5)
+    assert failed not in analysis.time_history
+    dt = 0.25
+    expected = [0.0]
+    for n_iter in analysis.iteration_counts[1:]:
+        dt = min(dt, 1.0 - expected[-1])
+        if np.isclose(expected[-1] + dt, failed):
+            dt *= 0.5
+        expected.append(expected[-1] + dt)
+        dt = float(np.clip(dt * min(2.0, np.sqrt(5 / n_iter)), analysis.dt_min, 0.3))
+    np.testing.assert_allclose(times, expected, rtol=1e-12)
+
+    # The retry starts from the last committed state, not from the failed trial
+    retry = solver.attempts[[t for t, _ in solver.attempts].index(failed) + 1]
+    np.testing.assert_array_equal(retry[1], analysis.u_history[list(times).index(retry[0]) - 1])
+
+    reference_model, reference_nodes = column(n=4, transformation=CorotationalTransformation2D)
+    LoadControl(reference_model, NewtonRaphsonSolver(reference_model, tolerance=1e-6), 1.0, 4).run()
+    np.testing.assert_allclose(nodes[-1].u_trial, reference_nodes[-1].u_trial, rtol=1e-8)
+
+
+def test_analysis_stops_at_minimum_increment(column):
+    model, _ = column(n=2)
+    solver = FailingSolver(model, 0.5, always=True)
+    analysis = LoadControl(model, solver, 1.0, 4, adaptive=True)
+    analysis.run()
+
+    # Every attempt past 0.5 fails: the increment is halved down to dt_min, then the analysis stops
+    t_last = analysis.time_history[-1]
+    assert t_last <= 0.5
+    assert analysis.failed_steps >= 11
+    assert solver.attempts[-1][0] - t_last == pytest.approx(analysis.dt_min)
+    assert analysis.dt_min == pytest.approx(0.25 / 1024)
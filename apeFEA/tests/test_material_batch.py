@@ -0,0 +1,61 @@
+import copy
+
+import numpy as np
+import pytest
+
+from apeFEA import LinearElastic, EPP, Concrete01
+from apeFEA.materials import make_material_batch, EPPBatch
+
+MATERIALS = {
+    'LinearElastic': [LinearElastic(E=200000.0), LinearElastic(E=30000.0)],
+    'EPP': [EPP(E=200000.0, fy=250.0), EPP(E=210000.0, fy=355.0)],
+    'Concrete01': [Concrete01(E0=30000.0, fc=-30.0, eps_c0=-0.002, fcu=-6.0, eps_u=-0.0035),
+                   Concrete01(E0=25000.0, fc=-25.0, eps_c0=-0.002, fcu=-5.0, eps_u=-0.004)],
+}
+
+
+@pytest.mark.parametrize("name", MATERIALS)
+def test_batch_follows_scalar_cyclic_history(rng, name):
+    materials = [copy.deepcopy(m) for m in MATERIALS[name] for _ in range(4)]
+    batch = make_material_batch(materials)
+
+    # Random walk of growing amplitude, so that points load, unload and reverse
+    # at different times; some trial states are discarded instead of committed
+    n_steps = 300
+    amplitude = np.linspace(0.0, 0.006, n_steps)[:, None]
+    increments = rng.normal(0.0, 1.0, (n_steps, len(materials)))
+    strains = amplitude * np.sin(np.cumsum(0.2 * increments, axis=0)) - 0.3 * amplitude
+
+    for eps, commit in zip(strains, rng.random(n_steps) < 0.8):
+        batch.set_trial_strain(eps)
+        for k, material in enumerate(materials):
+            material.set_trial_strain(float(eps[k]))
+        np.testing.assert_allclose(batch.get_trial_stress(), [m.get_trial_stress() for m in materials],
+                                   rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(batch.get_tangent(), [m.get_tangent() for m in materials], rtol=1e-12)
+
+        if commit:
+            batch.commit_state()
+            for material in materials:
+                material.commit_state()
+        else:
+            batch.reset_trial()
+            for material in materials:
+                material.reset_trial()
+
+
+def test_single_material_is_replicated():
+    batch = make_material_batch(EPP(E=200000.0, fy=250.0), 5)
+
+    batch.set_trial_strain(np.linspace(-0.004, 0.004, 5))
+
+    assert isinstance(batch, EPPBatch)
+    np.testing.assert_allclose(batch.get_trial_stress(), [-250.0, -250.0, 0.0, 250.0, 250.0])
+    np.testing.assert_allclose(batch.get_tangent(), [0.0, 0.0, 200000.0, 0.0, 0.0])
+
+
+def test_mixed_or_unsupported_materials_raise():
+    with pytest.raises(ValueError):
+        make_material_batch([EPP(E=200000.0, fy=250.0), LinearElastic(E=200000.0)])
+    with pytest.raises(ValueError):
+        make_material_batch(object())
@@ -0,0 +1,128 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from apeFEA import EPP, Concrete01, FiberSection, LinearTransformation, CorotationalTransformation2D
+
+CONCRETE = dict(fc=-30.0, eps_c0=-0.002, fcu=-6.0, eps_u=-0.0035)
+
+
+def concrete():
+    return Concrete01(E0=2 * CONCRETE['fc'] / CONCRETE['eps_c0'], **CONCRETE)
+
+
+def cyclic_path(amplitude, shift=0.0, n=120):
+    """Strain cycles of growing amplitude, so that the path loads, unloads and reverses."""
+    s = np.linspace(0.0, 1.0, n)
+    return amplitude * s * np.sin(6 * np.pi * s) + shift * s
+
+
+@pytest.mark.parametrize("material, path, n_branches", [
+    (EPP(E=200000.0, fy=250.0), cyclic_path(0.006), 2),
+    (concrete(), cyclic_path(0.003, shift=-0.004), 4),
+], ids=['EPP', 'Concrete01'])
+def test_material_tangent_matches_finite_differences(material, path, n_branches):
+    branches = set()
+    for eps, eps_next in zip(path[:-1], path[1:]):
+        material.set_trial_strain(eps)
+        material.commit_state()
+        # Halfway to the next point: away from the kink at the committed strain
+        tangent, fd_tangent, error = material.check_tangent(0.5 * (eps + eps_next))
+        assert error < 1e-6, (eps, tangent, fd_tangent)
+        branches.add(round(tangent, 6))
+
+    # The path visits the elastic/plastic (EPP) or the envelope, softening,
+    # unloading and zero-stiffness branches (Concrete01)
+    assert len(branches) >= n_branches
+
+
+def test_concrete_descending_branch_reaches_residual_strength():
+    material = concrete()
+    slope = (CONCRETE['fc'] - CONCRETE['fcu']) / (CONCRETE['eps_c0'] - CONCRETE['eps_u'])
+
+    for eps, stress, tangent in [(CONCRETE['eps_c0'], CONCRETE['fc'], slope),
+                                 (0.5 * (CONCRETE['eps_c0'] + CONCRETE['eps_u']), 0.5 * (CONCRETE['fc'] + CONCRETE['fcu']),
+                                  slope),
+                                 (CONCRETE['eps_u'], CONCRETE['fcu'], 0.0),
+                                 (2 * CONCRETE['eps_u'], CONCRETE['fcu'], 0.0)]:
+        material.set_trial_strain(eps)
+        assert material.get_trial_stress() == pytest.approx(stress, rel=1e-12)
+        assert material.get_tangent() == pytest.approx(tangent, rel=1e-12)
+        material.commit_state()
+
+
+def test_concrete_warns_when_E0_is_ignored():
+    with pytest.warns(UserWarning, match="E0"):
+        material = Concrete01(E0=25000.0, **CONCRETE)
+    assert material.Ec0 == pytest.approx(30000.0)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        concrete()
+
+
+def near_kink(element, delta):
+    """True if a fiber strain of the element lies within `delta` of a kink of its stress-strain response."""
+    for section in element.ip_sections:
+        # Shift all fiber strains of the section uniformly by ±delta
+        e = np.linalg.lstsq(np.column_stack([np.ones(section.n_fibers), -section.fiber_y]), section.eps_trial,
+                            rcond=None)[0]
+        stresses = []
+        for shift in (-delta, 0.0, delta):
+            section.set_trial_deformation(e + [shift, 0.0])
+            stresses.append(section.sig_trial.copy())
+        section.set_trial_deformation(e)
+        jump = np.abs(stresses[2] - 2 * stresses[1] + stresses[0]) / delta
+        if np.any(jump > 1e-3 * np.abs(section.Et).max()):
+            return True
+    return False
+
+
+def concrete_section():
+    section = FiberSection()
+    section.add_rect_patch(concrete(), -200.0, 200.0, 300.0, 20)
+    return section
+
+
+def steel_section():
+    section = FiberSection()
+    section.add_rect_patch(EPP(E=200000.0, fy=400.0), -200.0, 200.0, 300.0, 20)
+    return section
+
+
+S = cyclic_path(1.0, n=60)
+RAMP = np.linspace(0.0, 1.0, len(S))
+
+
+@pytest.mark.parametrize("section, path", [
+    # Tip drift, shortening and rotation cycles; the concrete is precompressed so
+    # that no fiber cycles around zero strain
+    (steel_section, np.column_stack([30.0 * S, -2.0 * RAMP, 0.01 * S])),
+    (concrete_section, np.column_stack([3.0 * S, -4.5 * np.minimum(4 * RAMP, 1.0), 0.001 * S])),
+], ids=['EPP', 'Concrete01'])
+@pytest.mark.parametrize("transformation", [LinearTransformation, CorotationalTransformation2D])
+def test_fiber_element_tangent_matches_finite_differences(column, section, path, transformation):
+    model, _ = column(n=1, section=section(), transformation=transformation, load=None)
+    element = model.elements[0]
+    tip = model.nodes[-1].idx
+    u = np.zeros((model.system_ndof, 1))
+
+    checked = 0
+    for step, step_next in zip(path[:-1], path[1:]):
+        u[tip, 0] = step
+        model.update_trial_state(u.copy())
+        model.get_resistance_force()
+        model.commit_state()
+
+        u[tip, 0] = 0.5 * (step + step_next)
+        model.update_trial_state(u.copy())
+        _, _, error = element.check_tangent(h=1e-6)
+        # Fibers whose strain barely changes in the step sit at the loading/unloading
+        # kink of their committed strain, where the central difference is not meaningful
+        if near_kink(element, 3e-7):
+            continue
+        assert error < 1e-8, step
+        checked += 1
+
+    assert checked > len(path) / 3
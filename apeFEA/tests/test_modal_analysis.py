@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from scipy import sparse
+
+from apeFEA import ModalAnalysis
+
+from .conftest import E, I, H
+
+MASS = 0.01
+
+
+def mass_matrix(model):
+    M = model.get_mass_matrix()
+    M = M.toarray() if sparse.issparse(M) else M
+    return M[np.ix_(model.free_indices, model.free_indices)]
+
+
+@pytest.mark.parametrize("mass_type", ['lumped', 'consistent'])
+def test_sparse_matches_dense(frame, mass_type):
+    modes = []
+    for method in ('dense', 'sparse'):
+        model, _ = frame(storeys=4, mass=MASS, mass_type=mass_type, assembly='sparse')
+        modal = ModalAnalysis(model, n_modes=6, method=method)
+        modal.run()
+        assert modal.method_used == method
+        modes.append(modal)
+
+    dense, sparse_ = modes
+    np.testing.assert_allclose(sparse_.eigenvalues, dense.eigenvalues, rtol=1e-8)
+    # Equal up to sign: symmetric frames have shapes with two largest components
+    signs = np.sign(np.einsum('ij,ij->j', sparse_.shapes, dense.shapes))
+    np.testing.assert_allclose(sparse_.shapes * signs, dense.shapes, atol=1e-6 * np.abs(dense.shapes).max())
+
+
+@pytest.mark.parametrize("method", ['dense', 'sparse'])
+def test_shapes_are_mass_orthonormal(column, method):
+    model, _ = column(n=10, load=None, mass=MASS, mass_type='consistent')
+    modal = ModalAnalysis(model, n_modes=5, method=method)
+    modal.run()
+
+    phi = modal.shapes[model.free_indices]
+    np.testing.assert_allclose(phi.T @ mass_matrix(model) @ phi, np.eye(5), atol=1e-10)
+
+
+def test_cantilever_matches_euler_bernoulli(column):
+    # Lumped mass: the rotations are condensed out of the dense problem
+    model, nodes = column(n=20, load=None, mass=MASS)
+    modal = ModalAnalysis(model, n_modes=6, method='dense')
+    modal.run()
+
+    flexural = modal.omega[modal.effective_mass_ratios[:, 0] > 1e-6][:3]
+    beta_L = np.array([1.875104, 4.694091, 7.854757])
+    np.testing.assert_allclose(flexural, beta_L ** 2 * np.sqrt(E * I / (MASS * H ** 4)), rtol=1e-2)
+    np.testing.assert_allclose(modal.node_shapes[0, -1], modal.get_mode_shape(0, nodes[-1]))
+
+
+def test_invalid_options_raise(column):
+    model, _ = column(load=None, mass=MASS)
+    with pytest.raises(ValueError):
+        ModalAnalysis(model, method='eig')
+    with pytest.raises(ValueError):
+        ModalAnalysis(model, n_modes=0)
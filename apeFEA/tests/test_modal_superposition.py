@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from apeFEA import (ModalAnalysis, ModalSuperposition, RayleighDamping, Newmark, NewtonRaphsonSolver, ConstantTimeSeries, PathTimeSeries, FiberSection,
+                    EPP, CorotationalTransformation2D)
+
+from .conftest import E, I, H
+
+MASS, LOAD = 10.0, 1000.0
+STIFFNESS = 3 * E * I / H ** 3
+OMEGA = np.sqrt(STIFFNESS / MASS)
+
+
+def ground_motion(dt, steps):
+    """Smooth ground acceleration record: two sine pulses of different periods."""
+    t = dt * np.arange(steps + 1)
+    return PathTimeSeries(2000.0 * np.sin(2 * np.pi * t / 0.3) + 1000.0 * np.sin(2 * np.pi * t / 0.07), dt=dt)
+
+
+def test_step_load_is_exact_at_any_time_step(column):
+    model, nodes = column(n=1, load=(LOAD, 0.0, 0.0), timeseries=ConstantTimeSeries)
+    nodes[-1].set_mass([MASS, MASS, 0.0])
+    dt = 0.37 * 2 * np.pi / OMEGA
+    analysis = ModalSuperposition(model, dt, 20, n_modes=2)
+    analysis.run()
+
+    t = np.array(analysis.time_history)
+    tip = np.array([u[nodes[-1].idx[0], 0] for u in analysis.u_history])
+    np.testing.assert_allclose(tip, LOAD / STIFFNESS * (1 - np.cos(OMEGA * t)), rtol=0.0, atol=1e-10 * LOAD / STIFFNESS)
+
+
+def test_all_modes_match_newmark(frame):
+    dt, steps = 0.001, 1000
+    # Classical damping, so that the high modes Newmark does not resolve at dt die out
+    modal = ModalAnalysis(frame(storeys=2, mass=0.02, mass_type='consistent')[0], n_modes=3)
+    modal.run()
+    damping = RayleighDamping.from_frequencies(0.05, modal.omega[0], modal.omega[2])
+    options = dict(storeys=2, mass=0.02, mass_type='consistent', timeseries=ConstantTimeSeries, damping=damping)
+
+    model, _ = frame(**options)
+    analysis = ModalSuperposition(model, dt, steps, n_modes=len(model.free_indices),
+                                  ground_motion=ground_motion(dt, steps), output_interval=10)
+    analysis.run()
+
+    reference_model, _ = frame(**options)
+    reference = Newmark(reference_model, NewtonRaphsonSolver(reference_model, tolerance=1e-3), dt, steps,
+                        ground_motion=ground_motion(dt, steps))
+    reference.run()
+
+    assert not reference.failed_steps
+    expected = np.hstack(reference.u_history[::10])
+    np.testing.assert_allclose(np.hstack(analysis.u_history), expected, rtol=0.0, atol=1e-3 * np.abs(expected).max())
+    np.testing.assert_allclose(analysis.time_history, reference.time_history[::10])
+
+
+def test_element_forces_and_output_times(frame):
+    dt, steps = 0.005, 200
+    model, _ = frame(storeys=2, mass=0.02, mass_type='consistent', timeseries=ConstantTimeSeries)
+    analysis = ModalSuperposition(model, dt, steps, n_modes=5, ground_motion=ground_motion(dt, steps),
+                                  output_times=[0.1, 0.5012, 0.73, 5.0])
+    analysis.run()
+
+    assert np.allclose(analysis.time_history, [0.1, 0.5, 0.73, 1.0])
+    for u, forces in zip(analysis.u_history, analysis.element_force_history):
+        model.u_trial[:] = u
+        model.update_trial_state(model.u_trial.copy())
+        expected = np.array([element.force_recovery()[1]['Fb'].ravel() for element in model.elements])
+        np.testing.assert_allclose(forces, expected, rtol=0.0, atol=1e-8 * np.abs(expected).max())
+
+
+def test_nonlinear_models_raise(column):
+    fibers = FiberSection()
+    fibers.add_rect_patch(EPP(E=200000.0, fy=250.0), -100.0, 100.0, 100.0, 10)
+    for options in (dict(section=fibers), dict(transformation=CorotationalTransformation2D)):
+        model, _ = column(mass=0.01, **options)
+        with pytest.raises(ValueError):
+            ModalSuperposition(model, 0.01, 10)
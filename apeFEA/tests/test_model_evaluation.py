@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from apeFEA import (Node, FrameElement, Model, Section, FiberSection, LinearElastic, EPP, LoadControl,
+                    DisplacementControl, NewtonRaphsonSolver, LinearTransformation, PDeltaTransformation2D,
+                    CorotationalTransformation2D)
+
+from .conftest import E, H
+
+TRANSFORMATIONS = [LinearTransformation, PDeltaTransformation2D, CorotationalTransformation2D]
+
+
+@pytest.mark.parametrize("transformation", TRANSFORMATIONS)
+def test_evaluate_is_bit_identical_to_separate_passes(column, rng, transformation):
+    model, _ = column(n=5, transformation=transformation)
+    model.u_trial[model.free_indices] = rng.normal(0.0, 5.0, (len(model.free_indices), 1)) * 1e-2
+    model.update_trial_state(model.u_trial.copy())
+
+    R, K, norm = model.evaluate(0.5)
+
+    np.testing.assert_array_equal(R, model.calculate_residual(0.5))
+    np.testing.assert_array_equal(K, model.get_stiffness_matrix())
+    assert norm == model.residual_norm(0.5)
+
+
+@pytest.mark.parametrize("transformation", TRANSFORMATIONS)
+def test_load_control_agrees_across_assembly_modes(frame, transformation):
+    histories = []
+    for options in (dict(assembly='dense'), dict(assembly='sparse'), dict(assembly='sparse', vectorized=True)):
+        model, _ = frame(transformation=transformation, **options)
+        analysis = LoadControl(model, NewtonRaphsonSolver(model, tolerance=1e-4), 1.0, 4)
+        analysis.run()
+        histories.append(np.hstack(analysis.u_history))
+
+    scale = np.abs(histories[0]).max()
+    for history in histories[1:]:
+        np.testing.assert_allclose(history, histories[0], rtol=0.0, atol=1e-9 * scale)
+
+
+
+def build_portal(n=4, **model_options):
+    """Portal frame with elastic-core/EPP-flange fiber columns and an elastic beam, `n` elements per member."""
+    columns = FiberSection()
+    columns.add_rect_patch(EPP(E=E, fy=250.0), -150.0, -120.0, 200.0, 4)
+    columns.add_rect_patch(LinearElastic(E=E), -120.0, 120.0, 10.0, 8)
+    columns.add_rect_patch(EPP(E=E, fy=250.0), 120.0, 150.0, 200.0, 4)
+    beam = Section(LinearElastic(E=E), A=2e4, I=1e9)
+
+    width = 6000.0
+    points = ([[0.0, H * k / n] for k in range(n + 1)] + [[width * k / n, H] for k in range(1, n + 1)]
+              + [[width, H * (n - k) / n] for k in range(1, n + 1)])
+    nodes = [Node(k + 1, point) for k, point in enumerate(points)]
+    for node in (nodes[0], nodes[-1]):
+        node.set_restraints(['r', 'r', 'r'])
+    nodes[n].add_load([1.0, 0.0, 0.0])
+    elements = [FrameElement(k + 1, [nodes[k], nodes[k + 1]], beam if n <= k < 2 * n else columns, LinearTransformation)
+                for k in range(3 * n)]
+    return Model(elements, **model_options), nodes[n]
+
+
+def portal_pushover(**model_options):
+    model, top = build_portal(**model_options)
+    analysis = DisplacementControl(model, NewtonRaphsonSolver(model, tolerance=1e-3), top, 0, 5.0, 20)
+    analysis.run()
+    assert not analysis.failed_steps
+    return model, analysis
+
+
+@pytest.mark.parametrize("assembly", ['dense', 'sparse'])
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_incremental_assembly_is_bit_identical_through_yielding(assembly, vectorized):
+    _, full = portal_pushover(assembly=assembly, vectorized=vectorized)
+    model, incremental = portal_pushover(assembly=assembly, vectorized=vectorized, incremental=True)
+
+    # The columns yield: the base shear drops well below the initial stiffness line
+    shear = np.array(full.load_factor_history)
+    assert shear[-1] < 0.5 * 20 * shear[1]
+    np.testing.assert_array_equal(np.hstack(incremental.u_history), np.hstack(full.u_history))
+    np.testing.assert_array_equal(incremental.load_factor_history, full.load_factor_history)
+
+
+def test_reevaluation_fractions_drop_while_most_elements_stay_elastic():
+    model, _ = portal_pushover(incremental=True)
+    forces, tangents = model.get_reevaluation_fractions()
+
+    assert len(forces) == len(model.assembly_history)
+    assert np.all(forces <= 1.0)
+    # Only the yielding column elements reassemble their tangents
+    assert np.nanmax(tangents[1:]) < 1.0
+    assert np.nanmean(tangents) < 0.5
+
+
+@pytest.mark.parametrize("reset", ['reset_trial', 'revert_to_start'])
+def test_state_resets_invalidate_the_incremental_cache(reset):
+    model, _ = portal_pushover(incremental=True)
+    reference, _ = portal_pushover()
+    results = []
+    for m in (model, reference):
+        u = m.u_trial.copy()
+        u[m.free_indices] *= 1.1
+        m.update_trial_state(u.copy())
+        m.evaluate(1.0)
+        getattr(m, reset)()
+        # Same displacements, but the element states were reset underneath
+        m.update_trial_state(u.copy())
+        results.append(m.evaluate(1.0))
+
+    assert model.assembly_history[-1]['forces'] == len(model.elements)
+    np.testing.assert_array_equal(results[0][0], results[1][0])
+    np.testing.assert_array_equal(results[0][1], results[1][1])
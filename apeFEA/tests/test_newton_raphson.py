@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from apeFEA import LoadControl, NewtonRaphsonSolver, CorotationalTransformation2D
+
+STRATEGIES = [('newton', {}), ('modified', dict(refactor_interval=2)), ('initial', {}), ('divergence', {})]
+
+
+def pushover(column, **solver_options):
+    """Corotational cantilever under lateral and axial load, about 2% stiffer than linear."""
+    model, nodes = column(n=4, transformation=CorotationalTransformation2D, load=(2e4, -1e5, 0.0))
+    analysis = LoadControl(model, NewtonRaphsonSolver(model, tolerance=1e-6, max_iterations=50, **solver_options), 1.0, 4)
+    analysis.run()
+    assert not analysis.failed_steps
+    return analysis, nodes[-1].u_trial.ravel().copy()
+
+
+@pytest.mark.parametrize("strategy, options", STRATEGIES)
+def test_strategies_reach_the_newton_solution(column, strategy, options):
+    _, expected = pushover(column)
+    analysis, u = pushover(column, strategy=strategy, **options)
+
+    np.testing.assert_allclose(u, expected, rtol=1e-8)
+    for n_iter, info in zip(analysis.iteration_counts, analysis.step_info_history):
+        # Every iteration but the converged one solves for an increment
+        assert info['back_substitutions'] == n_iter - 1
+
+
+def test_factorization_counts_follow_the_strategy(column):
+    counts = {}
+    for strategy, options in STRATEGIES:
+        analysis, _ = pushover(column, strategy=strategy, **options)
+        counts[strategy] = [info['factorizations'] for info in analysis.step_info_history]
+        iterations = analysis.iteration_counts
+
+        if strategy == 'newton':
+            assert counts[strategy] == [n - 1 for n in iterations]
+        elif strategy == 'modified':
+            # Iterations 0, 2, 4, ... of the n - 1 solving ones
+            assert counts[strategy] == [n // 2 for n in iterations]
+        elif strategy == 'initial':
+            assert sum(counts[strategy]) == 1
+        else:
+            # First tangent in the first loaded step, then one per growing residual
+            grown = [sum(r[j] > r[j - 1] for j in range(1, len(r) - 1)) for r in analysis.residual_history_per_step]
+            assert counts[strategy] == [g + (k == 1) for k, g in enumerate(grown)]
+
+    assert sum(counts['initial']) < sum(counts['divergence']) < sum(counts['modified']) < sum(counts['newton'])
+
+
+def test_invalid_options_raise(column):
+    model, _ = column()
+    with pytest.raises(ValueError):
+        NewtonRaphsonSolver(model, strategy='secant')
+    with pytest.raises(ValueError):
+        NewtonRaphsonSolver(model, strategy='modified', refactor_interval=0)
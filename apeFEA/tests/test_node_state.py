@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from apeFEA import Model
+
+
+def node_values(model, name):
+    return np.vstack([getattr(node, name) for node in model.nodes])
+
+
+def test_node_states_alias_the_model_vectors(frame, rng):
+    model, nodes = frame()
+
+    for node in nodes:
+        assert node.is_bound
+        for name in ('u_trial', 'u_committed', 'f_internal', 'f_external'):
+            assert np.shares_memory(getattr(node, name), getattr(model, name))
+
+    # Writes through the model are seen by the nodes, and the other way round
+    model.u_trial[:] = rng.normal(size=model.u_trial.shape)
+    np.testing.assert_array_equal(node_values(model, 'u_trial'), model.u_trial)
+    nodes[4].u_trial = [[1.0], [2.0], [3.0]]
+    np.testing.assert_array_equal(model.u_trial[nodes[4].idx, 0], [1.0, 2.0, 3.0])
+
+
+def test_state_transitions_update_nodes_and_model(frame, rng):
+    model, nodes = frame()
+    u = np.zeros_like(model.u_trial)
+    u[model.free_indices] = rng.normal(0.0, 1.0, (len(model.free_indices), 1))
+    model.update_trial_state(u.copy())
+    model.get_resistance_force()
+
+    model.commit_state()
+    np.testing.assert_array_equal(model.u_committed, u)
+    np.testing.assert_array_equal(node_values(model, 'u_committed'), u)
+
+    for node in nodes:
+        node.u_trial[:] += 1.0
+    model.reset_trial()
+    np.testing.assert_array_equal(model.u_trial, u)
+    np.testing.assert_array_equal(node_values(model, 'u_trial'), u)
+
+    assert np.any(model.f_internal)
+    model.revert_to_start()
+    for name in ('u_trial', 'u_committed', 'f_internal', 'f_external'):
+        assert not np.any(getattr(model, name))
+        assert not np.any(node_values(model, name))
+
+
+def test_second_model_on_the_same_nodes_is_rejected(frame, rng):
+    model, nodes = frame()
+    indices = [node.idx.copy() for node in nodes]
+    model.u_trial[:] = rng.normal(size=model.u_trial.shape)
+
+    with pytest.raises(ValueError, match="already belong to another Model"):
+        Model(model.elements[:3], numberer='rcm')
+
+    # The first model keeps its numbering and its state
+    for node, idx in zip(nodes, indices):
+        np.testing.assert_array_equal(node.idx, idx)
+        assert np.shares_memory(node.u_trial, model.u_trial)
+        np.testing.assert_array_equal(node.u_trial[:, 0], model.u_trial[idx, 0])
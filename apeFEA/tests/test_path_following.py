@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from apeFEA import ArcLength, DisplacementControl, NewtonRaphsonSolver
+
+from .conftest import build_arch
+
+
+def path(analysis, apex):
+    """Apex deflection (positive down) and load factor of the converged states."""
+    return -np.array([u[apex.idx[1], 0] for u in analysis.u_history]), np.array(analysis.load_factor_history)
+
+
+@pytest.fixture(scope='module')
+def reference_path():
+    model, apex = build_arch()
+    analysis = DisplacementControl(model, NewtonRaphsonSolver(model, tolerance=1e-6, max_iterations=30), apex, 1,
+                                   -4.0, 75)
+    analysis.run()
+    assert not analysis.failed_steps
+    return path(analysis, apex)
+
+
+def test_displacement_control_follows_snap_through(reference_path):
+    v, lam = reference_path
+
+    np.testing.assert_allclose(np.diff(v), 4.0)
+    peak = np.argmax(lam[:25])
+    # Limit point, then a branch of negative stiffness down to a negative load, then restiffening
+    assert 0 < peak < 25 and lam[peak] > 0.0
+    assert lam.min() < 0.0
+    assert lam[-1] > lam[peak]
+
+
+@pytest.mark.parametrize("constraint", ['cylindrical', 'spherical'])
+def test_arc_length_passes_the_limit_point(reference_path, constraint):
+    model, apex = build_arch()
+    analysis = ArcLength(model, NewtonRaphsonSolver(model, tolerance=1e-6, max_iterations=30), 8.0, 40,
+                         constraint=constraint, psi=1e-3)
+    analysis.run()
+    v, lam = path(analysis, apex)
+
+    assert not analysis.failed_steps
+    # The root selection keeps moving forward along the path: the apex goes down
+    # monotonically while λ rises, falls below zero past the limit point and rises again
+    assert np.all(np.diff(v) > 0.0)
+    assert lam.min() < 0.0 < lam[-1]
+    assert np.count_nonzero(np.diff(np.sign(np.diff(lam)))) == 2
+    # Every state lies on the displacement-controlled equilibrium path
+    np.testing.assert_allclose(lam, np.interp(v, *reference_path), atol=2e-3 * np.abs(reference_path[1]).max())
+
+
+def test_arc_length_recovers_from_cutbacks(reference_path):
+    # Too few iterations for the nominal arc length: steps fail, are cut back and grow again
+    model, apex = build_arch()
+    analysis = ArcLength(model, NewtonRaphsonSolver(model, tolerance=1e-6, max_iterations=5), 16.0, 30)
+    analysis.run()
+    v, lam = path(analysis, apex)
+
+    assert analysis.failed_steps > 0
+    assert len(analysis.load_factor_history) == 31
+    assert np.all(np.diff(v) > 0.0) and lam.min() < 0.0
+    np.testing.assert_allclose(lam, np.interp(v, *reference_path), atol=2e-3 * np.abs(reference_path[1]).max())
+
+
+def test_crisfield_root_selection():
+    model, _ = build_arch()
+    analysis = ArcLength(model, NewtonRaphsonSolver(model), 1.0, 1)
+    n = len(model.free_indices)
+    du_P = np.zeros((n, 1))
+    du_P[0] = 1.0
+    zero = np.zeros((n, 1))
+
+    # Predictor: the sign of the previous step, then the direction of the previous increment
+    assert analysis._load_factor_increment(1.0, zero, 0.0, zero, du_P) == pytest.approx(1.0)
+    analysis._accept_step(-du_P, 1.0)
+    assert analysis._load_factor_increment(1.0, zero, 0.0, zero, du_P) == pytest.approx(-1.0)
+
+    # Corrector: of the two roots on the constraint, the one keeping the step
+    # closest to the current increment, here against the direction of du_P
+    du_step = np.zeros((n, 1))
+    du_step[1] = 1.0
+    du_P = du_P - du_step
+    dlam = analysis._load_factor_increment(2.0, du_step, 0.0, zero, du_P)
+    assert dlam == pytest.approx((1 - np.sqrt(7.0)) / 2)
+    assert np.linalg.norm(du_step + dlam * du_P) == pytest.approx(2.0)
+
+
+def test_invalid_options_raise():
+    model, apex = build_arch()
+    solver = NewtonRaphsonSolver(model)
+    with pytest.raises(ValueError):
+        ArcLength(model, solver, 1.0, 10, constraint='elliptic')
+    with pytest.raises(ValueError):
+        DisplacementControl(model, solver, model.nodes[0], 0, 1.0, 10)
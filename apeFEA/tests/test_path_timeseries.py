@@ -0,0 +1,155 @@
+import os
+
+import numpy as np
+import pytest
+
+from apeFEA import PathTimeSeries
+from apeFEA.timeseries import path_timeseries, read_peer_at2
+
+
+AT2_HEADERS = {
+    'nga': "NPTS=    7, DT=   .0050 SEC",
+    'legacy': "      7    0.0050    NPTS, DT",
+}
+AT2_VALUES = [0.1, -0.2, 0.3, 0.25, -0.05, 0.0, 0.125]
+
+
+def write_at2(path, header):
+    lines = ["PEER NGA STRONG MOTION DATABASE RECORD", "TEST EVENT, STATION", "ACCELERATION TIME SERIES IN UNITS OF G",
+             header, "  ".join(f"{v:.7E}" for v in AT2_VALUES[:5]), "  ".join(f"{v:.7E}" for v in AT2_VALUES[5:]),
+             "  9.9000000E+00"]
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.mark.parametrize("header", AT2_HEADERS.values(), ids=AT2_HEADERS.keys())
+def test_read_peer_at2_header_formats(tmp_path, header):
+    path = write_at2(tmp_path / "record.AT2", header)
+
+    values, dt = read_peer_at2(path)
+
+    # Values beyond NPTS are ignored
+    assert dt == 0.005
+    np.testing.assert_array_equal(values, AT2_VALUES)
+
+    ts = PathTimeSeries.from_file(path, cache=False)
+    assert ts.uniform and ts.dt == pytest.approx(0.005)
+    assert ts.get_factor(0.015) == pytest.approx(0.25)
+
+
+def test_read_peer_at2_rejects_bad_headers(tmp_path):
+    path = write_at2(tmp_path / "record.AT2", "NO STEP INFORMATION HERE")
+    with pytest.raises(ValueError, match="NPTS and DT"):
+        read_peer_at2(path)
+
+    path.write_text("too\nshort\n")
+    with pytest.raises(ValueError, match="missing header"):
+        read_peer_at2(path)
+
+
+def test_cache_is_created_and_reused(tmp_path, monkeypatch):
+    path = write_at2(tmp_path / "record.AT2", AT2_HEADERS['nga'])
+    cached = tmp_path / "record.AT2.npy"
+
+    first = PathTimeSeries.from_file(path)
+    assert cached.exists()
+    np.testing.assert_array_equal(np.load(cached), np.column_stack([0.005 * np.arange(7), AT2_VALUES]))
+
+    # A fresh cache is loaded without parsing the source again
+    def no_parsing(*args):
+        raise AssertionError("the record was parsed again")
+
+    monkeypatch.setattr(path_timeseries, 'read_record', no_parsing)
+    second = PathTimeSeries.from_file(path)
+    np.testing.assert_array_equal(second.values, first.values)
+    monkeypatch.undo()
+
+    # An edited source is newer than its cache and is parsed again
+    path.write_text(path.read_text().replace(f"{AT2_VALUES[0]:.7E}", f"{2 * AT2_VALUES[0]:.7E}"))
+    os.utime(path, (cached.stat().st_mtime + 10, cached.stat().st_mtime + 10))
+    third = PathTimeSeries.from_file(path)
+    assert third.values[0] == pytest.approx(0.2)
+    assert np.load(cached)[0, 1] == pytest.approx(0.2)
+
+
+def test_cache_is_regenerated_when_dt_changes(tmp_path):
+    path = tmp_path / "record.txt"
+    np.savetxt(path, AT2_VALUES)
+    cached = tmp_path / "record.txt.npy"
+
+    ts = PathTimeSeries.from_file(path, dt=0.01)
+    assert ts.end_time == pytest.approx(0.06)
+    np.testing.assert_allclose(np.load(cached)[:, 0], 0.01 * np.arange(7))
+
+    ts = PathTimeSeries.from_file(path, dt=0.02)
+    assert ts.end_time == pytest.approx(0.12)
+    np.testing.assert_allclose(np.load(cached)[:, 0], 0.02 * np.arange(7))
+    assert ts.get_factor(0.03) == pytest.approx(0.5 * (AT2_VALUES[1] + AT2_VALUES[2]))
+
+    with pytest.raises(ValueError, match="requires dt"):
+        PathTimeSeries.from_file(path, cache=False)
+
+
+def test_unwritable_cache_falls_back_to_parsing(tmp_path, monkeypatch):
+    path = write_at2(tmp_path / "record.AT2", AT2_HEADERS['nga'])
+
+    # A read-only directory (chmod alone does not stop root)
+    def read_only(file, *args, **kwargs):
+        raise PermissionError(13, "Permission denied", str(file))
+
+    monkeypatch.setattr(path_timeseries.np, 'save', read_only)
+    ts = PathTimeSeries.from_file(path)
+
+    assert not (tmp_path / "record.AT2.npy").exists()
+    np.testing.assert_array_equal(ts.values, AT2_VALUES)
+    assert ts.uniform and ts.dt == pytest.approx(0.005)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_binary_records_are_memory_mapped(tmp_path, mmap):
+    path = tmp_path / "record.npy"
+    rows = np.column_stack([0.01 * np.arange(1000), np.sin(np.arange(1000))])
+    np.save(path, rows)
+
+    ts = PathTimeSeries.from_file(path, mmap=mmap)
+
+    base = ts.values
+    while base.base is not None and not isinstance(base, np.memmap):
+        base = base.base
+    assert isinstance(base, np.memmap) == mmap
+    np.testing.assert_array_equal(ts.values, rows[:, 1])
+    assert ts.get_factor(0.015) == pytest.approx(0.5 * (rows[1, 1] + rows[2, 1]))
+
+    # Single column binary records need dt
+    np.save(path, rows[:, 1])
+    ts = PathTimeSeries.from_file(path, dt=0.01, mmap=mmap)
+    assert ts.uniform and ts.end_time == pytest.approx(9.99)
+
+
+@pytest.mark.parametrize("uniform", [True, False], ids=['uniform', 'non-uniform'])
+@pytest.mark.parametrize("use_last", [False, True])
+def test_scalar_lookup_matches_vectorized(rng, uniform, use_last):
+    n = 50
+    if uniform:
+        ts = PathTimeSeries(rng.normal(size=n), dt=0.02, factor=1.5, start_time=0.1, use_last=use_last)
+    else:
+        time = 0.1 + np.cumsum(np.r_[0.0, rng.uniform(0.005, 0.05, n - 1)])
+        ts = PathTimeSeries(rng.normal(size=n), time=time, factor=1.5, use_last=use_last)
+    assert ts.uniform == uniform
+    grid = ts.start_time + np.arange(n) * ts.dt if uniform else ts.time
+
+    # Grid points, the ends, points just outside and random times (out of order,
+    # so that the cached interval is missed and searched again)
+    times = np.concatenate([
+        grid, [ts.start_time, ts.end_time, ts.start_time - 1e-9, ts.end_time + 1e-9, ts.end_time + 1.0],
+        rng.uniform(ts.start_time - 0.1, ts.end_time + 0.1, 200),
+        np.sort(rng.uniform(ts.start_time, ts.end_time, 100)),
+    ])
+    vectorized = ts.get_factor(times)
+    scalar = np.array([ts.get_factor(t) for t in times])
+
+    np.testing.assert_allclose(scalar, vectorized, rtol=1e-12, atol=1e-12)
+    np.testing.assert_array_equal(ts.sample(times), vectorized)
+    assert ts.get_factor(ts.end_time) == pytest.approx(1.5 * ts.values[-1])
+    assert ts.get_factor(ts.end_time + 1.0) == (pytest.approx(1.5 * ts.values[-1]) if use_last else 0.0)
+    assert ts.get_factor(ts.start_time - 1e-9) == 0.0
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from apeFEA import (LoadControl, NewtonRaphsonSolver, BFGSSolver, BroydenSolver, KrylovNewtonSolver,
+                    CorotationalTransformation2D)
+
+SOLVERS = [BFGSSolver, BroydenSolver, KrylovNewtonSolver]
+
+
+def pushover(column, solver, **solver_options):
+    """Corotational cantilever under lateral and axial load, about 2% stiffer than linear."""
+    model, nodes = column(n=4, transformation=CorotationalTransformation2D, load=(2e4, -1e5, 0.0))
+    analysis = LoadControl(model, solver(model, tolerance=1e-6, max_iterations=50, **solver_options), 1.0, 4)
+    analysis.run()
+    assert not analysis.failed_steps
+    return analysis, nodes[-1].u_trial.ravel().copy()
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_solver_matches_newton_in_load_control(column, solver):
+    newton, expected = pushover(column, NewtonRaphsonSolver)
+    analysis, u = pushover(column, solver)
+
+    np.testing.assert_allclose(u, expected, rtol=1e-8)
+    assert len(analysis.u_history) == len(newton.u_history)
+    assert analysis.u_history[-1].shape == newton.u_history[-1].shape
+    # The tangent of the first loaded step is reused by the later ones
+    assert sum(info['factorizations'] for info in analysis.step_info_history) < \
+        sum(info['factorizations'] for info in newton.step_info_history)
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_solve_returns_like_newton(column, solver):
+    model, _ = column(n=2, transformation=CorotationalTransformation2D)
+    u, residuals, n_iter = solver(model, tolerance=1e-6).solve(1.0)
+
+    assert u.shape == model.u_trial.shape
+    assert isinstance(residuals, list) and len(residuals) == n_iter
+    assert residuals[-1] < 1e-6
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+@pytest.mark.parametrize("stall_ratio", [0.0, 0.9])
+def test_refactors_after_a_stall(column, solver, stall_ratio):
+    analysis, _ = pushover(column, solver, stall_ratio=stall_ratio)
+
+    for k, (residuals, info) in enumerate(zip(analysis.residual_history_per_step, analysis.step_info_history)):
+        stalls = sum(residuals[j] > stall_ratio * residuals[j - 1] for j in range(1, len(residuals) - 1))
+        assert info['factorizations'] == stalls + (k == 1)
+    if stall_ratio == 0.0:
+        # Every iteration after the first of a step stalls
+        assert all(info['factorizations'] >= n - 2 for n, info in
+                   zip(analysis.iteration_counts[1:], analysis.step_info_history[1:]))
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from apeFEA import (LoadControl, Newmark, NewtonRaphsonSolver, ConstantTimeSeries, NodeRecorder, ElementForceRecorder,
+                    ConvergenceRecorder, read_recorder)
+
+SUFFIXES = ['.npy', '.npz', '.h5']
+
+
+@pytest.fixture(params=SUFFIXES)
+def suffix(request):
+    if request.param == '.h5':
+        pytest.importorskip('h5py')
+    return request.param
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_round_trip_matches_history(frame, tmp_path, suffix, background):
+    model, nodes = frame(assembly='sparse', vectorized=True)
+    displacements = NodeRecorder(model, tmp_path / f"u{suffix}", chunk_size=2, background=background)
+    reactions = NodeRecorder(model, tmp_path / f"r{suffix}", response='reaction', chunk_size=2, background=background)
+    forces = ElementForceRecorder(model, tmp_path / f"f{suffix}", forces='global', chunk_size=2, background=background)
+    convergence = ConvergenceRecorder(tmp_path / f"c{suffix}", chunk_size=2, background=background)
+    analysis = LoadControl(model, NewtonRaphsonSolver(model, tolerance=1e-4), 1.0, 5,
+                           recorders=[displacements, reactions, forces, convergence])
+    analysis.run()
+    for recorder in (displacements, reactions, forces, convergence):
+        recorder.close()
+
+    u = read_recorder(displacements.path)
+    assert u.shape == (len(analysis.time_history), 1 + model.system_ndof)
+    np.testing.assert_array_equal(u[:, 0], analysis.time_history)
+    np.testing.assert_array_equal(u[:, 1:], np.hstack(analysis.u_history).T)
+
+    # The support reactions balance the lateral load at every step
+    r = read_recorder(reactions.path)
+    np.testing.assert_allclose(r[:, 1::3].sum(axis=1), -1e4 * r[:, 0], atol=1e-6)
+
+    # Global end forces of the last step, as recovered by the elements
+    last = np.concatenate([element.force_recovery()[0].ravel() for element in model.elements])
+    np.testing.assert_allclose(read_recorder(forces.path)[-1, 1:], last, rtol=1e-12, atol=1e-9)
+
+    c = read_recorder(convergence.path)
+    np.testing.assert_array_equal(c[:, 1], analysis.iteration_counts)
+
+
+def test_transient_responses_are_recorded(column, tmp_path):
+    model, nodes = column(n=1, load=(1000.0, 0.0, 0.0), timeseries=ConstantTimeSeries)
+    nodes[-1].set_mass([10.0, 10.0, 0.0])
+    recorders = [NodeRecorder(model, tmp_path / f"{response}.npy", nodes=[nodes[-1]], dofs=[0], response=response)
+                 for response in ('displacement', 'velocity', 'acceleration')]
+    analysis = Newmark(model, NewtonRaphsonSolver(model, tolerance=1e-4), 0.001, 20, recorders=recorders)
+    analysis.run()
+
+    eq = nodes[-1].idx[0]
+    for recorder, history in zip(recorders, (analysis.u_history, analysis.v_history, analysis.a_history)):
+        recorder.close()
+        np.testing.assert_array_equal(read_recorder(recorder.path)[:, 1], [x[eq, 0] for x in history])
+
+
+def test_invalid_options_raise(frame, tmp_path):
+    model, nodes = frame()
+    with pytest.raises(ValueError):
+        NodeRecorder(model, tmp_path / "u.npy", response='strain')
+    with pytest.raises(ValueError):
+        NodeRecorder(model, tmp_path / "u.npy", dofs=[3])
+    with pytest.raises(ValueError):
+        ElementForceRecorder(model, tmp_path / "f.npy", forces='section')
+    with pytest.raises(ValueError):
+        NodeRecorder(model, tmp_path / "u.csv")
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from apeFEA import Node
+
+
+@pytest.mark.parametrize("flags", [['f', 'f', 'f'], ['r', 'r', 'r'], ['r', 'f', 'r'], ['f', 'r', 'f']])
+def test_restraints_round_trip_through_the_mask(flags):
+    node = Node(1, [0.0, 0.0], restrain_list=flags)
+    np.testing.assert_array_equal(node.restraints.restraints, flags)
+    np.testing.assert_array_equal(node.restraints.restrained, [flag == 'r' for flag in flags])
+
+    # Setting the restraints again, from the derived 'r'/'f' array, gives the same mask
+    other = Node(2, [1.0, 0.0])
+    np.testing.assert_array_equal(other.restraints.restraints, ['f', 'f', 'f'])
+    other.set_restraints(list(node.restraints.restraints))
+    np.testing.assert_array_equal(other.restraints.restraints, flags)
+    assert other.restraints.restrained is node.restraints.restrained
+
+
+def test_restraint_masks_are_shared_and_read_only():
+    nodes = [Node(k + 1, [float(k), 0.0]) for k in range(4)]
+    nodes[0].set_restraints(['r', 'r', 'r'])
+    nodes[1].set_restraints(['r', 'r', 'r'])
+    nodes[2].set_restraints(['r', 'r', 'f'])
+
+    fixed = nodes[0].restraints.restrained
+    assert nodes[1].restraints.restrained is fixed
+    assert nodes[2].restraints.restrained is not fixed
+    assert nodes[3].restraints.restrained is not fixed
+
+    with pytest.raises(ValueError, match="read-only"):
+        fixed[2] = False
+    # The derived 'r'/'f' array is a copy: editing it does not change the mask
+    nodes[0].restraints.restraints[2] = 'f'
+    np.testing.assert_array_equal(fixed, [True, True, True])
+
+    # Changing the restraints of one node swaps its mask, the others keep theirs
+    nodes[0].set_restraints(['r', 'f', 'f'])
+    np.testing.assert_array_equal(nodes[0].restraints.restraints, ['r', 'f', 'f'])
+    assert nodes[1].restraints.restrained is fixed
+    np.testing.assert_array_equal(nodes[1].restraints.restraints, ['r', 'r', 'r'])
+
+
+def test_model_uses_the_restraint_mask(frame):
+    model, nodes = frame()
+
+    restrained = np.concatenate([node.restraints.restrained for node in model.nodes])
+    idx = np.concatenate([node.idx for node in model.nodes])
+    free = np.sort(idx[~restrained])
+    np.testing.assert_array_equal(np.sort(model.free_indices), free)
+    assert all(node.restraints.restrained is nodes[0].restraints.restrained
+               for node in nodes if node.coords[1] == 0.0)
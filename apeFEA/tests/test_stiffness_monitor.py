@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from apeFEA import (DisplacementControl, LoadControl, NewtonRaphsonSolver, IterativeLinearSolver, AutoLinearSolver,
+                    SparseDirectSolver)
+
+from .conftest import build_arch
+
+
+@pytest.mark.parametrize("assembly", ['dense', 'sparse'])
+def test_determinant_sign_flips_across_the_limit_points(assembly):
+    model, apex = build_arch(I=1e4, assembly=assembly)
+    solver = NewtonRaphsonSolver(model, tolerance=1e-6, max_iterations=30, monitor=True)
+    analysis = DisplacementControl(model, solver, apex, 1, -4.0, 30)
+    analysis.run()
+    assert not analysis.failed_steps
+
+    steps = analysis.step_info_history[1:]
+    signs = np.array([info['determinant_sign'] for info in steps])
+    changes = np.flatnonzero([info['determinant_sign_change'] for info in steps]) + 1
+
+    # Snap-through: the load factor peaks, drops and rises again past a second limit point
+    lam = np.array(analysis.load_factor_history)
+    assert len(changes) == 2
+    assert signs[0] == 1 and signs[-1] == 1
+    np.testing.assert_array_equal(signs[changes[0] - 1:changes[1] - 1], -1)
+    assert abs(np.argmax(lam[:changes[1]]) - changes[0]) <= 1
+    assert abs(np.argmin(lam[changes[0]:]) + changes[0] - changes[1]) <= 1
+
+    # The sign is the one of det(K_ff) at the converged states
+    free = model.free_indices
+    reference, _ = build_arch(I=1e4)
+    for u, sign in zip(analysis.u_history[1:], signs):
+        reference.update_trial_state(u.copy())
+        K_ff = reference.get_stiffness_matrix()[np.ix_(free, free)]
+        assert np.sign(np.linalg.det(K_ff)) == sign
+
+
+def test_diagnostics_are_recorded_not_printed(column, capsys):
+    model, _ = column()
+    solver = NewtonRaphsonSolver(model, monitor=True, estimate_condition=True)
+    analysis = LoadControl(model, solver, 1.0, 3)
+    analysis.run()
+    output = capsys.readouterr().out
+
+    # The initial state converges without a factorization, its diagnostics stay None
+    assert analysis.step_info_history[0]['min_pivot_ratio'] is None
+    for info in analysis.step_info_history[1:]:
+        assert 0.0 < info['min_pivot_ratio'] <= 1.0
+        assert info['condition_estimate'] >= 1.0
+        assert info['determinant_sign'] == 1 and not info['determinant_sign_change']
+        assert f"{info['min_pivot_ratio']}" not in output
+        assert f"{info['condition_estimate']}" not in output
+    assert 'pivot' not in output.lower() and 'condition' not in output.lower()
+
+    # Without the condition estimate the entry is not recorded at all
+    solver = NewtonRaphsonSolver(model, monitor=True)
+    solver.solve(1.0)
+    assert 'condition_estimate' not in solver.step_info
+
+
+def test_monitor_rejects_iterative_backends(column):
+    model, _ = column(assembly='sparse')
+
+    for backend in ('iterative', IterativeLinearSolver('gmres', 'ilu')):
+        with pytest.raises(ValueError):
+            NewtonRaphsonSolver(model, monitor=True, linear_solver=backend)
+
+    # 'auto' falls back to the sparse direct backend where it would go iterative
+    auto = AutoLinearSolver(iterative_min=0)
+    solver = NewtonRaphsonSolver(model, monitor=True, linear_solver=auto)
+    solver.solve(1.0)
+    assert isinstance(auto.backend, SparseDirectSolver)
+    assert solver.step_info['determinant_sign'] == 1
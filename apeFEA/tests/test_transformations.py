@@ -0,0 +1,146 @@
+import numpy as np
+import pytest
+
+from apeFEA import (Node, FrameElement, Section, LinearElastic, LinearTransformation, CorotationalTransformation2D,
+                    PDeltaTransformation2D, PDeltaTransformation2D_OP)
+from apeFEA.elements.one_dimension.transformations.transformation import global_to_local_matrix, linear_basic_matrix
+
+from .conftest import E, A, I
+
+TRANSFORMATIONS = [LinearTransformation, CorotationalTransformation2D, PDeltaTransformation2D,
+                   PDeltaTransformation2D_OP]
+SECTION = Section(LinearElastic(E=E), A=A, I=I)
+
+
+def build_element(transformation, start=(0.0, 0.0), end=(3000.0, 1000.0)):
+    """Single inclined element on its own (unbound) nodes."""
+    nodes = [Node(1, list(start)), Node(2, list(end))]
+    return FrameElement(1, nodes, SECTION, transformation)
+
+
+def set_displacements(element, u):
+    element.node_i.u_trial = np.asarray(u[:3], dtype=float).reshape(3, 1)
+    element.node_j.u_trial = np.asarray(u[3:], dtype=float).reshape(3, 1)
+
+
+def geometry(transformation):
+    """Copy of every cached quantity of the deformed configuration."""
+    T1, T2 = transformation.geometric_transformation_matrix()
+    return {
+        'length': transformation.get_length(),
+        'Tbl': transformation.get_Tbl().copy(),
+        'T_geo_Fb1': T1.copy(),
+        'T_geo_Fb2': T2.copy(),
+        'ub_trial': transformation.ub_trial.copy(),
+    }
+
+
+def fresh_geometry(transformation, u):
+    """Geometry computed by a new element at the displacements `u`."""
+    element = build_element(transformation)
+    set_displacements(element, u)
+    element.transformation.update_trial()
+    return geometry(element.transformation)
+
+
+def assert_same_geometry(actual, expected):
+    for key in expected:
+        np.testing.assert_allclose(actual[key], expected[key], rtol=1e-14, atol=1e-14, err_msg=key)
+
+
+@pytest.mark.parametrize("transformation", TRANSFORMATIONS)
+def test_cached_geometry_matches_fresh_computation(transformation, rng):
+    element = build_element(transformation)
+    t = element.transformation
+    u1 = np.r_[rng.normal(0.0, 50.0, 2), 0.05, rng.normal(0.0, 50.0, 2), -0.03]
+    u2 = u1 + np.r_[rng.normal(0.0, 50.0, 2), 0.1, rng.normal(0.0, 50.0, 2), 0.2]
+
+    set_displacements(element, u1)
+    t.update_trial()
+    assert_same_geometry(geometry(t), fresh_geometry(transformation, u1))
+    element.node_i.commit_state()
+    element.node_j.commit_state()
+    t.commit_state()
+
+    set_displacements(element, u2)
+    t.update_trial()
+    assert_same_geometry(geometry(t), fresh_geometry(transformation, u2))
+
+    # Back to the committed state: the geometry is the one of u1 again
+    element.node_i.reset_trial()
+    element.node_j.reset_trial()
+    t.reset_trial()
+    assert_same_geometry(geometry(t), fresh_geometry(transformation, u1))
+
+    element.node_i.revert_to_start()
+    element.node_j.revert_to_start()
+    t.revert_to_start()
+    assert_same_geometry(geometry(t), fresh_geometry(transformation, np.zeros(6)))
+    assert not np.any(t.ub_commit) and not np.any(t.ub_previous)
+
+
+def test_shared_matrices_are_read_only():
+    pairs = {transformation: [build_element(transformation, start, end).transformation
+                              for start, end in [((0.0, 0.0), (3000.0, 1000.0)), ((500.0, 200.0), (3500.0, 1200.0))]]
+             for transformation in TRANSFORMATIONS}
+
+    # Parallel elements of equal length share Tlg and their constant matrices
+    Tlg = pairs[LinearTransformation][0].get_Tlg()
+    assert all(t.get_Tlg() is Tlg for pair in pairs.values() for t in pair)
+    assert Tlg is global_to_local_matrix(*Tlg[0, :2])
+    shared = [Tlg]
+    for transformation in (LinearTransformation, PDeltaTransformation2D_OP):
+        first, second = pairs[transformation]
+        assert first.get_Tbl() is second.get_Tbl() is linear_basic_matrix(first.get_L0())
+        shared.append(first.get_Tbl())
+    for transformation in (LinearTransformation, PDeltaTransformation2D, PDeltaTransformation2D_OP):
+        first, second = pairs[transformation]
+        for matrix, other in zip(first.geometric_transformation_matrix(), second.geometric_transformation_matrix()):
+            assert matrix is other
+            shared.append(matrix)
+
+    for matrix in shared:
+        before = matrix.copy()
+        with pytest.raises(ValueError, match="read-only"):
+            matrix[0, 0] = 1.0
+        with pytest.raises(ValueError, match="read-only"):
+            matrix += 1.0
+        np.testing.assert_array_equal(matrix, before)
+
+    # The matrices of the deformed configuration are per element
+    first, second = pairs[CorotationalTransformation2D]
+    assert first.get_Tbl() is not second.get_Tbl()
+
+
+def rigid_motion(element, rotation, translation, deformation=(0.0, 0.0, 0.0)):
+    """
+    Global displacements of a rigid rotation about node i plus a translation, with the
+    basic deformation (elongation, θ_i, θ_j) superposed in the rotated frame.
+    """
+    xi = np.asarray(element.node_i.coords, dtype=float)
+    xj = np.asarray(element.node_j.coords, dtype=float)
+    L0 = np.linalg.norm(xj - xi)
+    c, s = np.cos(rotation), np.sin(rotation)
+    chord = np.array([[c, -s], [s, c]]) @ (xj - xi) * (L0 + deformation[0]) / L0
+    return np.r_[translation, rotation + deformation[1], translation + xi + chord - xj, rotation + deformation[2]]
+
+
+@pytest.mark.parametrize("rotation", [-3.0, -2.0, -np.pi / 2, -0.3, 0.3, 1.0, np.pi / 2, 2.0, 3.0])
+def test_corotational_rigid_rotation_has_no_basic_deformation(rotation):
+    element = build_element(CorotationalTransformation2D)
+    t = element.transformation
+
+    set_displacements(element, rigid_motion(element, rotation, [120.0, -40.0]))
+    t.update_trial()
+    np.testing.assert_allclose(t.ub_trial[:, 0], 0.0, atol=1e-12 * t.get_L0())
+    assert t.get_length() == pytest.approx(t.get_L0(), rel=1e-14)
+    assert t._get_corrotational_parameters()[0] == pytest.approx(rotation, rel=1e-12)
+    # No end forces beyond round-off of the bending stiffness 4EI/L
+    force, _ = element.state_determination()
+    np.testing.assert_allclose(force, 0.0, atol=1e-12 * 4 * E * I / t.get_L0())
+
+    # With a deformation superposed in the rotated frame, ub is that deformation
+    deformation = (2.5, 0.004, -0.007)
+    set_displacements(element, rigid_motion(element, rotation, [120.0, -40.0], deformation))
+    t.update_trial()
+    np.testing.assert_allclose(t.ub_trial[:, 0], deformation, rtol=1e-9, atol=1e-12)
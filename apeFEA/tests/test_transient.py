@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from apeFEA import (Newmark, HHT, GeneralizedAlpha, NewtonRaphsonSolver, BFGSSolver, BroydenSolver, KrylovNewtonSolver,
+                    BisectionLineSearch, ConstantTimeSeries, CorotationalTransformation2D)
+
+from .conftest import E, I, H
+
+MASS, LOAD = 10.0, 1000.0
+STIFFNESS = 3 * E * I / H ** 3
+OMEGA = np.sqrt(STIFFNESS / MASS)
+PERIOD = 2 * np.pi / OMEGA
+
+INTEGRATORS = [(Newmark, {}), (HHT, dict(alpha=0.05)), (GeneralizedAlpha, dict(rho_inf=0.8))]
+
+
+def oscillator(column, section=None):
+    """Massless cantilever with a tip mass under a suddenly applied lateral load."""
+    model, nodes = column(n=1, section=section, load=(LOAD, 0.0, 0.0), timeseries=ConstantTimeSeries)
+    nodes[-1].set_mass([MASS, MASS, 0.0])
+    return model, nodes
+
+
+def tip_history(integrator, node):
+    return np.array([u[node.idx[0], 0] for u in integrator.u_history])
+
+
+@pytest.mark.parametrize("integrator, options", INTEGRATORS)
+def test_step_load_matches_sdof_closed_form(column, integrator, options):
+    model, nodes = oscillator(column)
+    analysis = integrator(model, NewtonRaphsonSolver(model, tolerance=1e-4), PERIOD / 200, 400, **options)
+    analysis.run()
+
+    t = np.array(analysis.time_history)
+    exact = LOAD / STIFFNESS * (1 - np.cos(OMEGA * t))
+    np.testing.assert_allclose(tip_history(analysis, nodes[-1]), exact, rtol=0.0, atol=2e-3 * LOAD / STIFFNESS)
+
+
+@pytest.mark.parametrize("integrator, options", INTEGRATORS)
+def test_linear_model_factorizes_once(column, integrator, options):
+    model, _ = oscillator(column)
+    analysis = integrator(model, NewtonRaphsonSolver(model, tolerance=1e-4), PERIOD / 50, 50, **options)
+    analysis.run()
+
+    assert sum(info.get('factorizations', 0) for info in analysis.step_info_history) == 1
+
+
+def test_generalized_alpha_damps_high_frequencies(column):
+    # With a coarse step the response is dominated by the algorithmic damping:
+    # ρ∞ = 0 removes the oscillation within a few steps, ρ∞ = 1 keeps it
+    amplitudes = {}
+    for rho_inf in (0.0, 1.0):
+        model, nodes = oscillator(column)
+        analysis = GeneralizedAlpha(model, NewtonRaphsonSolver(model, tolerance=1e-4), 10 * PERIOD, 20,
+                                    rho_inf=rho_inf)
+        analysis.run()
+        amplitudes[rho_inf] = np.ptp(tip_history(analysis, nodes[-1])[-5:]) / (LOAD / STIFFNESS)
+
+    assert amplitudes[0.0] < 1e-3
+    assert amplitudes[1.0] > 0.1
+
+
+def swaying_column(column):
+    """Corotational cantilever with a tip mass under a large, suddenly applied lateral and axial load."""
+    model, nodes = column(transformation=CorotationalTransformation2D, load=(3e5, -1e6, 0.0),
+                          timeseries=ConstantTimeSeries)
+    nodes[-1].set_mass([MASS, MASS, 0.0])
+    return model, nodes
+
+
+def run_swaying_column(column, solver_type, **solver_options):
+    model, nodes = swaying_column(column)
+    analysis = Newmark(model, solver_type(model, tolerance=1e-3, max_iterations=30, **solver_options), 0.01, 60)
+    analysis.run()
+    assert not analysis.failed_steps
+    return analysis, tip_history(analysis, nodes[-1])
+
+
+@pytest.mark.parametrize("solver_type", [BFGSSolver, BroydenSolver, KrylovNewtonSolver])
+def test_quasi_newton_solvers_update_the_effective_stiffness(column, solver_type):
+    newton, reference = run_swaying_column(column, NewtonRaphsonSolver)
+    analysis, tip = run_swaying_column(column, solver_type)
+
+    # Same response, with the factored K_eff kept across iterations and steps
+    np.testing.assert_allclose(tip, reference, rtol=0.0, atol=1e-6 * np.abs(reference).max())
+    factorizations = sum(info.get('factorizations', 0) for info in analysis.step_info_history)
+    assert factorizations < sum(info.get('factorizations', 0) for info in newton.step_info_history) / 4
+    assert sum(analysis.iteration_counts) > sum(newton.iteration_counts)
+
+
+def test_line_search_scales_the_dynamic_increments(column):
+    _, reference = run_swaying_column(column, NewtonRaphsonSolver)
+    analysis, tip = run_swaying_column(column, NewtonRaphsonSolver, line_search=BisectionLineSearch())
+
+    np.testing.assert_allclose(tip, reference, rtol=0.0, atol=1e-6 * np.abs(reference).max())
+    # One search per increment, i.e. per iteration but the converged one
+    evaluations = [info.get('line_search_evaluations', 0) for info in analysis.step_info_history]
+    assert sum(evaluations) >= sum(n - 1 for n in analysis.iteration_counts) > 0
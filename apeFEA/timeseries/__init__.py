@@ -3,8 +3,12 @@ TimeSeries module — provides time-dependent scaling functions for loads or oth
 """
 
 from .timeseries import ConstantTimeSeries, LinearRampTimeSeries
+from .path_timeseries import PathTimeSeries, read_peer_at2, read_record
 
 __all__ = [
     "ConstantTimeSeries",
     "LinearRampTimeSeries",
+    "PathTimeSeries",
+    "read_peer_at2",
+    "read_record",
 ]
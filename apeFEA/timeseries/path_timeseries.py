@@ -0,0 +1,299 @@
+import re
+from pathlib import Path
+
+import numpy as np
+from numpy import ndarray
+
+from .timeseries_abstraction import TimeSeries
+
+
+# ----------------------------------------------------------------------------- #
+#                                Record readers                                 #
+# ----------------------------------------------------------------------------- #
+
+_AT2_HEADER = re.compile(r"NPTS\s*=\s*(\d+)\s*,?\s*DT\s*=\s*([-+.\dEe]+)", re.IGNORECASE)
+
+
+def read_peer_at2(path: str | Path) -> tuple[ndarray, float]:
+    """
+    Read a PEER strong motion record (.AT2).
+
+    The fourth header line gives the number of points and the time step, either
+    as "NPTS= 5590, DT= .0050 SEC" (NGA) or as "5590 0.0050 NPTS, DT" (older
+    format); the values follow in free format.
+
+    Returns
+    -------
+    values : ndarray
+        (npts,) acceleration values, in the units of the record (usually g).
+    dt : float
+        Time step.
+    """
+    with open(path) as f:
+        lines = f.readlines()
+    if len(lines) < 4:
+        raise ValueError(f"{path} is not a PEER AT2 record: missing header")
+
+    match = _AT2_HEADER.search(lines[3])
+    if match:
+        npts, dt = int(match.group(1)), float(match.group(2))
+    else:
+        try:
+            first, second = lines[3].replace(',', ' ').split()[:2]
+            npts, dt = int(float(first)), float(second)
+        except ValueError:
+            raise ValueError(f"{path} is not a PEER AT2 record: cannot read NPTS and DT from '{lines[3].strip()}'")
+
+    values = np.array(" ".join(lines[4:]).split(), dtype=float)
+    if len(values) < npts:
+        raise ValueError(f"{path}: {len(values)} values found, NPTS = {npts}")
+    return values[:npts], dt
+
+
+def read_record(path: str | Path, dt: float | None = None) -> ndarray:
+    """
+    Read an acceleration record as an (n, 2) array of (time, value) rows.
+
+    Supported formats, by suffix:
+
+    - .AT2 : PEER strong motion record.
+    - .npy : (n, 2) array of (time, value) rows, or (n,) values with `dt`.
+    - any other : text with two columns (time, value), or one column with `dt`.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == '.at2':
+        values, dt = read_peer_at2(path)
+    elif suffix == '.npy':
+        values = np.load(path)
+    else:
+        values = np.loadtxt(path, ndmin=1)
+
+    if values.ndim == 2 and values.shape[1] == 2:
+        return np.ascontiguousarray(values, dtype=float)
+    if values.ndim != 1 and not (values.ndim == 2 and values.shape[1] == 1):
+        raise ValueError(f"{path}: expected one column of values or two columns (time, value), got shape {values.shape}")
+    if dt is None:
+        raise ValueError(f"{path}: a record without a time column requires dt")
+    values = values.reshape(-1)
+    return np.column_stack([dt * np.arange(len(values)), values])
+
+
+# ----------------------------------------------------------------------------- #
+#                                Path time series                               #
+# ----------------------------------------------------------------------------- #
+
+class PathTimeSeries(TimeSeries):
+    """
+    A time series interpolated linearly from tabulated values, e.g. a ground
+    acceleration record.
+
+    Records with a constant time step are looked up in O(1) (the interval index
+    is computed from t); other records use a bisection that starts from the last
+    interval found, which is O(1) for the monotonic times of a time integration.
+    The factor is 0 outside the record, or the last value after it if `use_last`.
+
+    `get_factor` also accepts an array of times and then interpolates all of them
+    at once, so whole load histories can be pre-sampled (see `sample`).
+
+    Parameters
+    ----------
+    values : array_like
+        Tabulated values.
+    dt : float, optional
+        Constant time step of the values (starting at `start_time`).
+    time : array_like, optional
+        Increasing times of the values, instead of `dt` and `start_time`.
+    factor : float, optional
+        Scale factor applied to the values (e.g. g in model units), default 1.0.
+    start_time : float, optional
+        Time of the first value when `dt` is given, default 0.0.
+    use_last : bool, optional
+        Keep the last value after the end of the record instead of 0.
+
+    Example
+    -------
+    >>> ts = PathTimeSeries([0.0, 1.0, 0.0], dt=0.5, factor=2.0)
+    >>> ts.get_factor(0.25)
+    1.0
+    >>> ts.get_factor(np.array([0.5, 0.75, 2.0]))
+    array([2., 1., 0.])
+    """
+
+    def __init__(
+        self,
+        values,
+        dt: float | None = None,
+        time=None,
+        factor: float = 1.0,
+        start_time: float = 0.0,
+        use_last: bool = False,
+    ):
+        if (dt is None) == (time is None):
+            raise ValueError("Either dt or time must be given")
+
+        # asarray keeps memory-mapped records mapped (no copy)
+        self.values = np.asarray(values, dtype=float)
+        self.factor = factor
+        self.use_last = use_last
+        n = len(self.values)
+        if n < 2:
+            raise ValueError("A path time series needs at least two values")
+
+        if time is not None:
+            time = np.asarray(time, dtype=float)
+            if len(time) != n:
+                raise ValueError(f"{len(time)} times given for {n} values")
+            if np.any(np.diff(time) <= 0.0):
+                raise ValueError("The times of a path time series must be increasing")
+            start_time = float(time[0])
+            # Constant steps (to rounding of the tabulated times) are indexed directly
+            uniform_dt = float(time[-1] - time[0]) / (n - 1)
+            if np.max(np.abs(time - (start_time + uniform_dt * np.arange(n)))) <= 1e-6 * uniform_dt:
+                dt = uniform_dt
+                time = None
+        elif dt <= 0.0:
+            raise ValueError("The time step must be positive")
+
+        self.dt = dt
+        self.time = time
+        self.start_time = start_time
+        self.end_time = start_time + dt * (n - 1) if time is None else float(time[-1])
+        self._last_interval = 0
+
+    @property
+    def uniform(self) -> bool:
+        """Whether the values have a constant time step."""
+        return self.time is None
+
+    @property
+    def duration(self) -> float:
+        return self.end_time - self.start_time
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str | Path,
+        dt: float | None = None,
+        factor: float = 1.0,
+        use_last: bool = False,
+        cache: bool = True,
+        mmap: bool = True,
+    ) -> "PathTimeSeries":
+        """
+        Load a record (see `read_record` for the formats).
+
+        Text and AT2 records are parsed once and, if `cache`, stored next to the
+        source as a binary "<name>.npy" of (time, value) rows, which is reused
+        while it is newer than the source. If the cache cannot be written (e.g. a
+        read-only directory) the parsed record is used directly. Binary records are memory-mapped if
+        `mmap`, so a large suite of records is paged in on demand instead of
+        being read and held in memory.
+
+        Parameters
+        ----------
+        path : str or Path
+            Record file.
+        dt : float, optional
+            Time step of records with a single column of values (only).
+        factor, use_last :
+            See `PathTimeSeries`.
+        cache : bool
+            Write (or reuse) the binary conversion of text records.
+        mmap : bool
+            Memory-map binary records.
+        """
+        path = Path(path)
+        if path.suffix.lower() != '.npy':
+            cached = path.with_name(path.name + '.npy')
+            fresh = cache and cached.exists() and cached.stat().st_mtime >= path.stat().st_mtime
+            if fresh and dt is not None:
+                # A single column record cached with another time step is converted again
+                rows = np.load(cached, mmap_mode='r')
+                fresh = bool(np.isclose(rows[1, 0] - rows[0, 0], dt))
+            if fresh:
+                path = cached
+            else:
+                data = read_record(path, dt)
+                if cache:
+                    try:
+                        np.save(cached, data)
+                        path = cached
+                    except OSError:
+                        # Read-only record directory: use the parsed record without caching it
+                        cache = False
+                if not cache:
+                    return cls(data[:, 1], time=data[:, 0], factor=factor, use_last=use_last)
+
+        data = np.load(path, mmap_mode='r' if mmap else None)
+        if data.ndim == 1 or data.shape[1] == 1:
+            if dt is None:
+                raise ValueError(f"{path}: a record without a time column requires dt")
+            return cls(data.reshape(-1), dt=dt, factor=factor, use_last=use_last)
+        if data.ndim != 2 or data.shape[1] != 2:
+            raise ValueError(f"{path}: expected (n,) values or (n, 2) (time, value) rows, got shape {data.shape}")
+        return cls(data[:, 1], time=data[:, 0], factor=factor, use_last=use_last)
+
+    def get_factor(self, t: float | ndarray) -> float | ndarray:
+        """
+        Return the interpolated factor at time `t` (a float or an array of times).
+
+        Parameters
+        ----------
+        t : float or ndarray
+            Time value(s).
+
+        Returns
+        -------
+        float or ndarray
+            Scaled, linearly interpolated value(s), with the shape of `t`.
+        """
+        if np.ndim(t) > 0:
+            return self._get_factors(np.asarray(t, dtype=float))
+
+        t = float(t)
+        values = self.values
+        if t < self.start_time:
+            return 0.0
+        if t >= self.end_time:
+            return self.factor * float(values[-1]) if (self.use_last or t == self.end_time) else 0.0
+
+        if self.time is None:
+            x = (t - self.start_time) / self.dt
+            k = min(int(x), len(values) - 2)
+            w = x - k
+        else:
+            time = self.time
+            k = self._last_interval
+            if not time[k] <= t < time[k + 1]:
+                if time[k + 1] <= t < time[min(k + 2, len(time) - 1)]:
+                    k += 1
+                else:
+                    k = int(np.searchsorted(time, t, side='right')) - 1
+                self._last_interval = k
+            w = (t - time[k]) / (time[k + 1] - time[k])
+        return self.factor * ((1.0 - w) * float(values[k]) + w * float(values[k + 1]))
+
+    def _get_factors(self, t: ndarray) -> ndarray:
+        """Vectorized interpolation for an array of times."""
+        right = float(self.values[-1]) if self.use_last else 0.0
+        if self.time is None:
+            n = len(self.values)
+            x = (t - self.start_time) / self.dt
+            k = np.clip(np.floor(x).astype(np.intp), 0, n - 2)
+            w = x - k
+            values = self.values[k] * (1.0 - w) + self.values[k + 1] * w
+            # Bounds on the times, as in the scalar lookup: (end - start) / dt may round past n - 1
+            values = np.where(t < self.start_time, 0.0, values)
+            values = np.where(t > self.end_time, right, values)
+        else:
+            values = np.interp(t, self.time, self.values, left=0.0, right=right)
+        return self.factor * values
+
+    def sample(self, times: ndarray) -> ndarray:
+        """Return the factors at all `times` with one vectorized interpolation."""
+        return self._get_factors(np.asarray(times, dtype=float))
+
+    def __repr__(self) -> str:
+        step = f"dt={self.dt:g}" if self.uniform else "variable dt"
+        return f"PathTimeSeries({len(self.values)} values, {step}, t=[{self.start_time:g}, {self.end_time:g}], factor={self.factor:g})"
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+
 class TimeSeries(ABC):
     """
     Abstract base class for all time-dependent load profiles.
@@ -12,3 +15,11 @@ class TimeSeries(ABC):
         Return the scaling factor at time `t`.
         """
         ...
+
+    def sample(self, times: np.ndarray) -> np.ndarray:
+        """
+        Return the scaling factors at all `times` (e.g. the steps of a time
+        integration) as an array. Subclasses with a vectorized lookup override it.
+        """
+        times = np.asarray(times, dtype=float)
+        return np.array([self.get_factor(float(t)) for t in times.reshape(-1)]).reshape(times.shape)
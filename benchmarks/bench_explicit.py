@@ -0,0 +1,71 @@
+"""
+Throughput benchmark of the explicit `CentralDifference` integrator.
+
+Builds a multi-storey, multi-bay frame of about `n_elements` `FrameElement`s with
+lumped mass (and rotational nodal masses), subjected to a lateral step load, and
+reports for every transformation class the critical time step estimate and the
+wall time per step with batched (`vectorized=True`) and per-element force
+recovery, with the response recorded every 1000 steps.
+
+Run from the repository root:
+
+    python benchmarks/bench_explicit.py [n_elements] [steps]
+"""
+import contextlib
+import io
+import sys
+import time
+
+from apeFEA import (Node, FrameElement, Model, Section, LinearElastic, ConstantTimeSeries, CentralDifference,
+                    LinearTransformation, CorotationalTransformation2D, PDeltaTransformation2D)
+
+
+TRANSFORMATIONS = (
+    LinearTransformation,
+    PDeltaTransformation2D,
+    CorotationalTransformation2D,
+)
+
+
+def make_frame(n_elements: int, transformation, vectorized: bool) -> Model:
+    """Frame of 10 bays with storeys of 20 column and 10 beam elements."""
+    bays, height, width = 10, 3000.0, 6000.0
+    storeys = max(1, n_elements // (2 * bays + 1))
+    nodes = [[Node(s * (bays + 1) + b + 1, [b * width, s * height]) for b in range(bays + 1)] for s in range(storeys + 1)]
+    for node in nodes[0]:
+        node.set_restraints(['r', 'r', 'r'])
+    for row in nodes[1:]:
+        for node in row:
+            node.set_mass([0.0, 0.0, 1e3])
+    nodes[-1][0].add_load([1e4, 0.0, 0.0])
+
+    column = Section(LinearElastic(E=200000.0), A=2e4, I=4e8)
+    beam = Section(LinearElastic(E=200000.0), A=1e4, I=2e8)
+    elements = []
+    for s in range(storeys):
+        for b in range(bays + 1):
+            elements.append(FrameElement(len(elements) + 1, [nodes[s][b], nodes[s + 1][b]], column, transformation, mass=0.02))
+        for b in range(bays):
+            elements.append(FrameElement(len(elements) + 1, [nodes[s + 1][b], nodes[s + 1][b + 1]], beam, transformation, mass=0.05))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return Model(elements, timeseries=ConstantTimeSeries, assembly='sparse', vectorized=vectorized)
+
+
+def main(n_elements: int = 1000, steps: int = 20000) -> None:
+    print(f"{'transformation':<30} {'elements':>9} {'dt_cr':>11} {'batched':>12} {'per element':>14}")
+    for transformation in TRANSFORMATIONS:
+        timings = []
+        for vectorized in (True, False):
+            model = make_frame(n_elements, transformation, vectorized)
+            n = steps if vectorized else max(1, steps // 20)
+            integrator = CentralDifference(model, None, n, output_interval=1000)
+            start = time.perf_counter()
+            integrator.run()
+            timings.append((time.perf_counter() - start) / n)
+        print(f"{transformation.__name__:<30} {model.number_of_elements:>9} {integrator.critical_dt:>11.3e}"
+              f" {1e6 * timings[0]:>9.1f} µs {1e6 * timings[1]:>11.1f} µs")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,174 @@
+"""
+Memory benchmark of the object model.
+
+Builds a chain of nodes (every 10th one restrained and loaded) connected by
+`FrameElement`s sharing one section, and reports with `tracemalloc` the bytes
+allocated per node, per element (for every transformation class) and the extra
+bytes per node taken by the `Model` built on top of them.
+
+The 'baseline' column builds the same chain from plain-attribute mirrors of the
+layout before the slotted object model: nodes owning four (3, 1) state arrays,
+a 'r'/'f' string restraint array and load objects, and transformations owning
+their basic state vectors, Tlg, Tbl and geometric matrices per element. The
+mirrors only allocate that state (no behaviour), so the model row has no
+baseline figure.
+
+Run from the repository root:
+
+    python benchmarks/bench_memory.py [n_nodes]
+"""
+import contextlib
+import gc
+import io
+import sys
+import tracemalloc
+
+import numpy as np
+
+from apeFEA import (Node, FrameElement, Model, Section, LinearElastic, LinearTransformation,
+                    CorotationalTransformation2D, PDeltaTransformation2D, PDeltaTransformation2D_OP)
+
+
+TRANSFORMATIONS = (
+    LinearTransformation,
+    PDeltaTransformation2D_OP,
+    PDeltaTransformation2D,
+    CorotationalTransformation2D,
+)
+
+
+class BaselineRestraints:
+    def __init__(self, node: "BaselineNode"):
+        self.node = node
+        self.restraints = np.array(['f'] * node.ndof)
+        self.displacements = np.zeros(node.ndof)
+
+
+class BaselineNodalLoad:
+    def __init__(self, node: "BaselineNode", load_pattern: list[float]):
+        self.node = node
+        self.load_pattern = np.array(load_pattern, dtype=float)
+
+
+class BaselineNode:
+    """Plain-attribute mirror of the node layout before slotting."""
+
+    def __init__(self, id: int, coords: list[float], ndof: int = 3):
+        self.id = id
+        self.coords = np.array(coords, dtype=float)
+        self.ndof = ndof
+        self.u_trial = np.zeros((ndof, 1))
+        self.u_committed = np.zeros((ndof, 1))
+        self.f_internal = np.zeros((ndof, 1))
+        self.f_external = np.zeros((ndof, 1))
+        self.idx = np.arange(ndof) + ndof * (id - 1)
+        self.dof = []
+        self.restraints = BaselineRestraints(self)
+        self.loads = []
+
+    def set_restraints(self, restraints: list[str]) -> None:
+        self.restraints.restraints = np.array(restraints)
+
+    def add_load(self, load: list[float]) -> None:
+        self.loads.append(BaselineNodalLoad(self, load))
+
+
+class BaselineTransformation:
+    """Plain-attribute mirror of the per-element transformation state before slotting."""
+
+    def __init__(self, element: "BaselineElement", transformation):
+        self.element = element
+        self.node_i = element.node_i
+        self.node_j = element.node_j
+        self.ub_trial = np.zeros((3, 1))
+        self.ub_commit = np.zeros((3, 1))
+        self.ub_previous = np.zeros((3, 1))
+
+        delta = self.node_j.coords - self.node_i.coords
+        self._L0 = float(np.hypot(delta[0], delta[1]))
+        self._c, self._s = (float(x) for x in delta / self._L0)
+        self._Tlg = np.eye(6)
+        self._Tbl = np.zeros((3, 6))
+        if transformation is LinearTransformation:
+            self._T_geo = np.zeros((6, 6))
+            return
+
+        self._T_geo_Fb1 = np.zeros((6, 6))
+        self._T_geo_Fb2 = np.zeros((6, 6))
+        if transformation is PDeltaTransformation2D_OP:
+            self.L0, self.cos_theta, self.sin_theta, self.ul14 = self._L0, self._c, self._s, 0.0
+        else:
+            # Chord state cached by the nonlinear transformations
+            self._Delta_ul_x = self._L0 - self._L0
+            self._Delta_ul_y = self._L0 - self._L0
+            self._Ln = self._L0 + 0.0
+            self._beta = self._L0 * 0.0
+
+
+# One class per transformation, so instances share their attribute keys as before
+BASELINE_TRANSFORMATIONS = {
+    transformation: type(f"Baseline{transformation.__name__}", (BaselineTransformation,), {})
+    for transformation in TRANSFORMATIONS
+}
+
+
+class BaselineElement:
+    """Plain-attribute mirror of the frame element layout before slotting."""
+
+    def __init__(self, id: int, nodes: list[BaselineNode], section: Section, transformation):
+        self.id = id
+        self.nodes = nodes
+        self.node_i = nodes[0]
+        self.node_j = nodes[1]
+        self.section = section
+        self.idx = np.concatenate([self.node_i.idx, self.node_j.idx])
+        self.restraints = np.concatenate([self.node_i.restraints.restraints, self.node_j.restraints.restraints])
+        self.transformation = BASELINE_TRANSFORMATIONS[transformation](self, transformation)
+        self._kb_assembled = None
+
+
+def allocated(build):
+    """Return the object built by `build` and the bytes it keeps allocated."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, after - before
+
+
+def make_nodes(n: int, node_class=Node) -> list[Node]:
+    nodes = [node_class(k + 1, [0.0, 3000.0 * k]) for k in range(n)]
+    for node in nodes[::10]:
+        node.set_restraints(['r', 'r', 'r'])
+        node.add_load([1e3, -1e4, 0.0])
+    return nodes
+
+
+def make_elements(nodes: list[Node], transformation, element_class=FrameElement) -> list[FrameElement]:
+    section = Section(LinearElastic(E=200000.0), A=1e4, I=1e8)
+    return [element_class(k + 1, [nodes[k], nodes[k + 1]], section, transformation)
+            for k in range(len(nodes) - 1)]
+
+
+def main(n_nodes: int = 5000) -> None:
+    print(f"{'bytes per object':<36} {'baseline':>10} {'slotted':>10}")
+    base_nodes, base_node_bytes = allocated(lambda: make_nodes(n_nodes, BaselineNode))
+    nodes, node_bytes = allocated(lambda: make_nodes(n_nodes))
+    print(f"{'node':<36} {base_node_bytes / n_nodes:>10.0f} {node_bytes / n_nodes:>10.0f}")
+
+    for transformation in TRANSFORMATIONS:
+        _, base_bytes = allocated(lambda: make_elements(base_nodes, transformation, BaselineElement))
+        elements, element_bytes = allocated(lambda: make_elements(nodes, transformation))
+        print(f"{'element ' + transformation.__name__:<36} {base_bytes / len(elements):>10.0f} "
+              f"{element_bytes / len(elements):>10.0f}")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        _, model_bytes = allocated(lambda: Model(elements))
+    print(f"{'model (per node)':<36} {'-':>10} {model_bytes / n_nodes:>10.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,55 @@
+"""
+Scaling benchmark of the sparse `ModalAnalysis`.
+
+Builds multi-storey frames of 20 bays with lumped mass (no rotational inertia)
+and storeys for 1 %, 10 %, 33 % and 100 % of `max_dofs` free DOFs, and reports the number of free DOFs, the time to
+build the model (vectorized, sparse assembly) and the time to compute the first
+`n_modes` modes with shift-invert Lanczos.
+
+Run from the repository root:
+
+    python benchmarks/bench_modal.py [max_dofs] [n_modes]
+"""
+import contextlib
+import io
+import sys
+import time
+
+from apeFEA import Node, FrameElement, Model, Section, LinearElastic, LinearTransformation, ModalAnalysis
+
+
+def make_frame(storeys: int, bays: int = 20) -> Model:
+    height, width = 3000.0, 6000.0
+    nodes = [[Node(s * (bays + 1) + b + 1, [b * width, s * height]) for b in range(bays + 1)] for s in range(storeys + 1)]
+    for node in nodes[0]:
+        node.set_restraints(['r', 'r', 'r'])
+
+    column = Section(LinearElastic(E=200000.0), A=2e4, I=4e8)
+    beam = Section(LinearElastic(E=200000.0), A=1e4, I=2e8)
+    elements = []
+    for s in range(storeys):
+        for b in range(bays + 1):
+            elements.append(FrameElement(len(elements) + 1, [nodes[s][b], nodes[s + 1][b]], column, LinearTransformation, mass=0.02))
+        for b in range(bays):
+            elements.append(FrameElement(len(elements) + 1, [nodes[s + 1][b], nodes[s + 1][b + 1]], beam, LinearTransformation, mass=0.05))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return Model(elements, assembly='sparse', vectorized=True)
+
+
+def main(max_dofs: int = 100_000, n_modes: int = 20) -> None:
+    print(f"{'free DOFs':>10} {'model':>10} {'modes':>10}   T1")
+    for dofs in (max_dofs // 100, max_dofs // 10, max_dofs // 3, max_dofs):
+        start = time.perf_counter()
+        model = make_frame(max(1, round(dofs / (3 * 21))))
+        t_model = time.perf_counter() - start
+
+        modal = ModalAnalysis(model, n_modes=n_modes, method='sparse')
+        start = time.perf_counter()
+        modal.run()
+        t_modes = time.perf_counter() - start
+        print(f"{len(model.free_indices):>10} {t_model:>9.2f}s {t_modes:>9.2f}s   {modal.periods[0]:.4g}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
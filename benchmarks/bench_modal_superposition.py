@@ -0,0 +1,98 @@
+"""
+Linear record suite: `ModalSuperposition` against step-by-step `Newmark`.
+
+Builds a linear multi-storey frame (vectorized, sparse assembly, 5 % Rayleigh
+damping on the initial stiffness) and a suite of synthetic ground acceleration
+records (filtered white noise with an envelope, as `PathTimeSeries`). Reports
+the wall time of one Newmark analysis, the time per record of the modal
+superposition (with `n_modes` modes, the modes and modal element forces being
+computed once for the suite) and the largest roof drift difference of the first
+record relative to its peak.
+
+Run from the repository root:
+
+    python benchmarks/bench_modal_superposition.py [storeys] [records] [n_modes]
+"""
+import contextlib
+import io
+import sys
+import time
+
+import numpy as np
+
+from apeFEA import (Node, FrameElement, Model, Section, LinearElastic, LinearTransformation, RayleighDamping,
+                    PathTimeSeries, ModalAnalysis, ModalSuperposition, Newmark, NewtonRaphsonSolver)
+
+
+DT, STEPS = 0.01, 3000
+
+
+def make_frame(storeys: int, bays: int = 5, damping: RayleighDamping | None = None) -> tuple[Model, Node]:
+    height, width = 3000.0, 6000.0
+    nodes = [[Node(s * (bays + 1) + b + 1, [b * width, s * height]) for b in range(bays + 1)] for s in range(storeys + 1)]
+    for node in nodes[0]:
+        node.set_restraints(['r', 'r', 'r'])
+
+    column = Section(LinearElastic(E=200000.0), A=2e4, I=4e8)
+    beam = Section(LinearElastic(E=200000.0), A=1e4, I=2e8)
+    elements = []
+    for s in range(storeys):
+        for b in range(bays + 1):
+            elements.append(FrameElement(len(elements) + 1, [nodes[s][b], nodes[s + 1][b]], column, LinearTransformation, mass=0.02))
+        for b in range(bays):
+            elements.append(FrameElement(len(elements) + 1, [nodes[s + 1][b], nodes[s + 1][b + 1]], beam, LinearTransformation, mass=0.05))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        model = Model(elements, assembly='sparse', vectorized=True, damping=damping)
+    return model, nodes[-1][0]
+
+
+def make_records(n: int, seed: int = 0) -> list[PathTimeSeries]:
+    """Smoothed white noise under a trapezoidal envelope, peak 3000 mm/s²."""
+    rng = np.random.default_rng(seed)
+    t = DT * np.arange(STEPS + 1)
+    envelope = np.clip(np.minimum(t / 2.0, (t[-1] - t) / 10.0), 0.0, 1.0)
+    kernel = np.ones(5) / 5
+    records = []
+    for _ in range(n):
+        values = np.convolve(rng.normal(size=STEPS + 1), kernel, mode='same') * envelope
+        records.append(PathTimeSeries(3000.0 * values / np.abs(values).max(), dt=DT))
+    return records
+
+
+def main(storeys: int = 10, n_records: int = 50, n_modes: int = 20) -> None:
+    model, roof = make_frame(storeys)
+    modal = ModalAnalysis(model, n_modes=3)
+    modal.run()
+    damping = RayleighDamping.from_frequencies(0.05, modal.omega[0], modal.omega[2], initial_stiffness=True)
+    records = make_records(n_records)
+
+    model, roof = make_frame(storeys, damping=damping)
+    solver = NewtonRaphsonSolver(model, tolerance=1e-3)
+    newmark = Newmark(model, solver, DT, STEPS, ground_motion=records[0])
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        newmark.run()
+    t_newmark = time.perf_counter() - start
+
+    model, roof = make_frame(storeys, damping=damping)
+    start = time.perf_counter()
+    superposition = ModalSuperposition(model, DT, STEPS, n_modes=n_modes, output_interval=10)
+    roof_drifts = []
+    for record in records:
+        superposition.ground_motion = record
+        superposition.run()
+        roof_drifts.append(np.array([u[roof.idx[0], 0] for u in superposition.u_history]))
+    t_suite = time.perf_counter() - start
+
+    reference = np.array([u[roof.idx[0], 0] for u in newmark.u_history[::10]])
+    error = np.abs(roof_drifts[0] - reference).max() / np.abs(reference).max()
+    print(f"{len(model.free_indices)} free DOFs, {STEPS} steps, {n_records} records, {n_modes} modes")
+    print(f"Newmark:              {t_newmark:8.3f} s per record")
+    print(f"Modal superposition:  {t_suite / n_records:8.3f} s per record ({t_suite:.2f} s suite)"
+          f"  speedup {t_newmark * n_records / t_suite:.0f}x")
+    print(f"Roof drift difference (record 1): {error:.2e} of the peak")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,91 @@
+"""
+Memory and time of in-memory histories against streaming recorders.
+
+Runs a `LoadControl` analysis of a linear multi-storey frame (vectorized,
+sparse assembly) three times:
+
+- keeping the histories in memory (`store_history=True`, no recorders);
+- recording all displacements, the base reactions and the convergence to .npy
+  files with `store_history=False`, writing on the analysis thread;
+- the same with the writes on a background thread.
+
+and reports the wall time, the peak traced Python memory (tracemalloc) and the
+size of the written files.
+
+Run from the repository root:
+
+    python benchmarks/bench_recorders.py [storeys] [steps] [chunk_size]
+"""
+import contextlib
+import io
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from apeFEA import (Node, FrameElement, Model, Section, LinearElastic, LinearTransformation, LoadControl,
+                    NewtonRaphsonSolver, NodeRecorder, ConvergenceRecorder)
+
+
+def make_frame(storeys: int, bays: int = 20) -> Model:
+    height, width = 3000.0, 6000.0
+    nodes = [[Node(s * (bays + 1) + b + 1, [b * width, s * height]) for b in range(bays + 1)] for s in range(storeys + 1)]
+    for node in nodes[0]:
+        node.set_restraints(['r', 'r', 'r'])
+    for row in nodes[1:]:
+        row[0].add_load([1e3, 0.0, 0.0])
+
+    column = Section(LinearElastic(E=200000.0), A=2e4, I=4e8)
+    beam = Section(LinearElastic(E=200000.0), A=1e4, I=2e8)
+    elements = []
+    for s in range(storeys):
+        for b in range(bays + 1):
+            elements.append(FrameElement(len(elements) + 1, [nodes[s][b], nodes[s + 1][b]], column, LinearTransformation))
+        for b in range(bays):
+            elements.append(FrameElement(len(elements) + 1, [nodes[s + 1][b], nodes[s + 1][b + 1]], beam, LinearTransformation))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return Model(elements, assembly='sparse', vectorized=True)
+
+
+def run(storeys: int, steps: int, directory: Path | None, chunk_size: int, background: bool) -> tuple[float, int, int]:
+    model = make_frame(storeys)
+    recorders = []
+    if directory is not None:
+        recorders = [
+            NodeRecorder(model, directory / "displacements.npy", chunk_size=chunk_size, background=background),
+            NodeRecorder(model, directory / "reactions.npy", response='reaction', chunk_size=chunk_size, background=background),
+            ConvergenceRecorder(directory / "convergence.npy", chunk_size=chunk_size, background=background),
+        ]
+    solver = NewtonRaphsonSolver(model, tolerance=1e-3)
+    analysis = LoadControl(model, solver, 1.0, steps, recorders=recorders, store_history=not recorders)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        analysis.run()
+    for recorder in recorders:
+        recorder.close()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    written = sum(recorder.path.stat().st_size for recorder in recorders)
+    return elapsed, peak, written
+
+
+def main(storeys: int = 200, steps: int = 400, chunk_size: int = 64) -> None:
+    print(f"{'mode':<24} {'time':>9} {'peak memory':>13} {'written':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, directory, background in [
+            ("in-memory history", None, False),
+            ("recorders", Path(tmp), False),
+            ("recorders, background", Path(tmp), True),
+        ]:
+            elapsed, peak, written = run(storeys, steps, directory, chunk_size, background)
+            print(f"{label:<24} {elapsed:>8.2f}s {peak / 2**20:>10.1f} MB {written / 2**20:>8.1f} MB")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,53 @@
+"""
+Micro-benchmark of the per-element cost of the frame transformations.
+
+For every transformation class, times the transformation calls of one
+state determination (`update_trial`, `get_Tlg`, `get_Tbl`,
+`geometric_transformation_matrix`) and the full `FrameElement.state_determination`,
+on a single element with a non-zero trial displacement.
+
+Run from the repository root:
+
+    python benchmarks/bench_transformations.py [repeats]
+"""
+import sys
+import timeit
+
+from apeFEA import (Node, FrameElement, Section, LinearElastic, LinearTransformation,
+                    CorotationalTransformation2D, PDeltaTransformation2D, PDeltaTransformation2D_OP)
+
+
+TRANSFORMATIONS = (
+    LinearTransformation,
+    PDeltaTransformation2D_OP,
+    PDeltaTransformation2D,
+    CorotationalTransformation2D,
+)
+
+
+def make_element(transformation) -> FrameElement:
+    section = Section(LinearElastic(E=200000.0), A=1e4, I=1e8)
+    node_i = Node(1, [0.0, 0.0])
+    node_j = Node(2, [3000.0, 4000.0])
+    node_j.u_trial[:, 0] = [12.0, -30.0, 0.01]
+    return FrameElement(1, [node_i, node_j], section, transformation)
+
+
+def transformation_calls(transformation) -> None:
+    transformation.update_trial()
+    transformation.get_Tlg()
+    transformation.get_Tbl()
+    transformation.geometric_transformation_matrix()
+
+
+def main(repeats: int = 20000) -> None:
+    print(f"{'transformation':<30} {'transformation calls':>22} {'state determination':>22}")
+    for transformation in TRANSFORMATIONS:
+        element = make_element(transformation)
+        t_transf = min(timeit.repeat(lambda: transformation_calls(element.transformation), number=repeats, repeat=5))
+        t_state = min(timeit.repeat(element.state_determination, number=repeats, repeat=5))
+        print(f"{transformation.__name__:<30} {1e6 * t_transf / repeats:>19.2f} µs {1e6 * t_state / repeats:>19.2f} µs")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))